@@ -0,0 +1,95 @@
+"""Benchmark of the construction of the incidence matrices on the test data.
+
+The baseline builds the incidence matrix of every order from its own
+subhypergraph, as in the per-order construction. The single-pass builder produces
+the incidence matrices of all orders as column slices of one shared matrix.
+
+Run from the repository root with:
+
+    python benchmarks/incidence.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from hypergraphx import Hypergraph
+from hypergraphx.linalg import (
+    hye_list_to_binary_incidence,
+    incidence_matrices_all_orders,
+    incidence_matrix_blocks,
+)
+from hypergraphx.utils.labeling import LabelEncoder
+
+DATA_DIR = REPO_ROOT / "test_data"
+
+
+def load_justice() -> Hypergraph:
+    with open(DATA_DIR / "justice_data" / "hyperedges.txt") as file:
+        hye_list = [tuple(sorted(map(int, line.split()))) for line in file]
+    with open(DATA_DIR / "justice_data" / "weights.txt") as file:
+        weights = list(map(int, file))
+    return Hypergraph(hye_list, weighted=True, weights=weights)
+
+
+def load_random(num_nodes=2000, num_edges=50000, max_size=8, seed=0) -> Hypergraph:
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(2, max_size + 1, num_edges)
+    edges = {
+        tuple(sorted(rng.choice(num_nodes, size, replace=False).tolist()))
+        for size in sizes
+    }
+    return Hypergraph(sorted(edges))
+
+
+def per_order_baseline(hypergraph: Hypergraph):
+    """Incidence matrices built order by order, from the subhypergraphs."""
+    matrices = {}
+    for order in range(1, hypergraph.max_order() + 1):
+        subhypergraph = hypergraph.get_edges(order=order, subhypergraph=True)
+        edges = subhypergraph.get_edges()
+        encoder = LabelEncoder()
+        encoder.fit(subhypergraph.get_nodes())
+        hye_list = [tuple(encoder.transform(edge)) for edge in edges]
+        binary = hye_list_to_binary_incidence(
+            hye_list, shape=(subhypergraph.num_nodes(), len(edges))
+        )
+        matrices[order] = binary.multiply(subhypergraph.get_weights()).tocsr()
+    return matrices
+
+
+def main(repeat: int = 5):
+    datasets = {"justice": load_justice(), "random": load_random()}
+    print(f"{'dataset':>10} {'edges':>8} {'baseline (s)':>14} {'single-pass (s)':>16}")
+    for name, hypergraph in datasets.items():
+        baseline = min(
+            timeit.repeat(
+                lambda: per_order_baseline(hypergraph), number=1, repeat=repeat
+            )
+        )
+        single_pass = min(
+            timeit.repeat(
+                lambda: incidence_matrices_all_orders(hypergraph),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        blocks = min(
+            timeit.repeat(
+                lambda: incidence_matrix_blocks(hypergraph), number=1, repeat=repeat
+            )
+        )
+        print(
+            f"{name:>10} {hypergraph.num_edges():>8} {baseline:>14.4f} "
+            f"{single_pass:>16.4f}  (shared matrix only: {blocks:.4f}, "
+            f"speedup {baseline / single_pass:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
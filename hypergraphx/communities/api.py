@@ -22,6 +22,7 @@ def run_core_periphery(
     n_iter: int = 1000,
     seed: int | None = None,
     rng: np.random.Generator | None = None,
+    n_jobs: int = 1,
 ) -> CorePeripheryResult:
     """
     Core-periphery coreness scores.
@@ -39,6 +40,7 @@ def run_core_periphery(
         N_ITER=n_iter,
         seed=seed,
         rng=rng,
+        n_jobs=n_jobs,
     )
     return CorePeripheryResult(scores=scores)
 
@@ -48,6 +50,7 @@ def run_hyperlink_communities(
     *,
     load_distances: str | None = None,
     save_distances: str | None = None,
+    method: str = "average",
 ) -> HyperlinkCommunitiesResult:
     """
     Hyperlink communities (hierarchical clustering over edge distances).
@@ -62,7 +65,10 @@ def run_hyperlink_communities(
     )
 
     dendrogram = hyperlink_communities(
-        hypergraph, load_distances=load_distances, save_distances=save_distances
+        hypergraph,
+        load_distances=load_distances,
+        save_distances=save_distances,
+        method=method,
     )
     return HyperlinkCommunitiesResult(dendrogram=dendrogram)
 
@@ -76,6 +82,7 @@ def fit_hysc(
     out_inference: bool = False,
     out_folder: str = "../data/output/",
     end_file: str = "_sc.dat",
+    eigen_solver: str = "auto",
 ) -> HySCResult:
     """
     Hypergraph Spectral Clustering (HySC).
@@ -89,7 +96,11 @@ def fit_hysc(
     from hypergraphx.communities.hy_sc.model import HySC
 
     model = HySC(
-        seed=seed, out_inference=out_inference, out_folder=out_folder, end_file=end_file
+        seed=seed,
+        out_inference=out_inference,
+        out_folder=out_folder,
+        end_file=end_file,
+        eigen_solver=eigen_solver,
     )
     memberships = model.fit(hypergraph, K=k, weighted_L=weighted_laplacian)
     labels = hard_labels_from_memberships(np.asarray(memberships))
@@ -146,11 +157,17 @@ def fit_hy_mmsbm(
     n_iter: int = 500,
     tol: float | None = None,
     check_convergence_every: int = 10,
+    n_restarts: int = 1,
+    n_jobs: int | None = 1,
     **init_params: Any,
 ) -> HyMMSBMResult:
     """
     Hy-MMSBM Expectation-Maximization inference.
 
+    With `n_restarts > 1`, the model is fit from several random initializations,
+    optionally in `n_jobs` parallel processes, and the one with the highest
+    log-likelihood is kept.
+
     Returns
     -------
     HyMMSBMResult
@@ -158,15 +175,28 @@ def fit_hy_mmsbm(
         `affinity`: affinity matrix w (K x K)
         `labels`: argmax hard labels (N,)
     """
-    from hypergraphx.communities.hy_mmsbm.model import HyMMSBM
-
-    model = HyMMSBM(K=k, seed=seed, **init_params)
-    model.fit(
-        hypergraph,
-        n_iter=n_iter,
-        tolerance=tol,
-        check_convergence_every=check_convergence_every,
-    )
+    from hypergraphx.communities.hy_mmsbm.model import HyMMSBM, fit_restarts
+
+    if n_restarts > 1:
+        model, _ = fit_restarts(
+            hypergraph,
+            n_restarts=n_restarts,
+            n_jobs=n_jobs,
+            n_iter=n_iter,
+            tolerance=tol,
+            check_convergence_every=check_convergence_every,
+            seed=seed,
+            K=k,
+            **init_params,
+        )
+    else:
+        model = HyMMSBM(K=k, seed=seed, **init_params)
+        model.fit(
+            hypergraph,
+            n_iter=n_iter,
+            tolerance=tol,
+            check_convergence_every=check_convergence_every,
+        )
     if model.u is None or model.w is None:
         raise RuntimeError("HyMMSBM.fit() did not produce u/w parameters.")
     memberships = np.asarray(model.u)
@@ -1,7 +1,7 @@
+import logging
 import math
-import random
+from multiprocessing import Pool, cpu_count
 
-import logging
 import numpy as np
 
 from hypergraphx import Hypergraph
@@ -47,49 +47,62 @@ def transition_function(i, N_nodes, a, b):
         ) + (1 + a) / 2
 
 
-def aggregation_function(values):
-    return sum(values)
-
-
-def aggregate_local_core_values(nodes, order, local_core_values):
-    values = []
-    for n in nodes:
-        values.append(local_core_values[order[n]])
-    return aggregation_function(values)
+def local_core_values_array(N_nodes, a, b):
+    """Vectorized transition_function for the positions 1, ..., N_nodes."""
+    i = np.arange(1, N_nodes + 1, dtype=float)
+    fb = math.floor(b * N_nodes)
+    values = np.empty(N_nodes)
+    low = i <= fb
+    values[low] = i[low] * (1 - a) / (2 * fb) if fb > 0 else 0.0
+    values[~low] = (i[~low] - fb) * (1 - a) / (2 * (N_nodes - fb)) + (1 + a) / 2
+    return values
 
 
-def get_core_quality(edges, order, local_core_values):
-    R = 0
-    for e in edges:
-        R += aggregate_local_core_values(list(e), order, local_core_values)
-    return R
+def _core_periphery_iterations(args):
+    """Run independent label-switching iterations and sum their coreness scores.
 
+    With the sum as aggregation function, swapping the positions of nodes i and j
+    changes the quality by (v_j - v_i) * (s_i - s_j), where v are the local core values
+    of their positions and s_i = sum_{e : i in e} w_e / |e|. The hyperedges containing
+    both nodes do not contribute. Swaps of disjoint pairs are independent, so every
+    round evaluates a random matching of the nodes at once.
+    """
+    degree, strength, greedy_order, seeds = args
+    N_nodes = len(degree)
+    NUM_SWITCH = N_nodes * 10
+    n_pairs = N_nodes // 2
+    logger = logging.getLogger(__name__)
 
-def get_adj(d):
-    adj = {}
-    for e in d:
-        for n in e:
-            if n in adj:
-                adj[n].append(tuple(sorted(list(e))))
-            else:
-                adj[n] = [tuple(sorted(list(e)))]
-
-    return adj
+    cs = np.zeros(N_nodes)
+    for n_iter, seed in enumerate(seeds):
+        rng = np.random.default_rng(seed)
+        a, b = sample_params(rng=rng)
+        local_core_values = local_core_values_array(N_nodes, a, b)
 
+        # initial permutation
+        if greedy_order is not None:
+            order = greedy_order.copy()
+        else:
+            order = rng.permutation(N_nodes)
 
-def sort_by_degree(d):
-    deg = {}
-    for e in d:
-        for n in e:
-            if n not in deg:
-                deg[n] = 0
-            deg[n] += 1
-    deg_list = []
-    for k in deg:
-        deg_list.append((deg[k], k))
+        # As in the original formulation, the initial quality is not weighted.
+        R = np.dot(degree, local_core_values[order])
 
-    deg_list = list(sorted(deg_list))
-    return deg_list
+        # label switching
+        for start in range(0, NUM_SWITCH if n_pairs else 0, n_pairs):
+            pairs = rng.permutation(N_nodes)[: 2 * min(n_pairs, NUM_SWITCH - start)]
+            i, j = pairs[0::2], pairs[1::2]
+            delta = (local_core_values[order[j]] - local_core_values[order[i]]) * (
+                strength[i] - strength[j]
+            )
+            accept = delta >= 0
+            i, j = i[accept], j[accept]
+            order[i], order[j] = order[j], order[i].copy()
+            R += delta[accept].sum()
+
+        cs += local_core_values[order] * R
+        logger.info("%s of %s iter", n_iter, len(seeds))
+    return cs
 
 
 def core_periphery(
@@ -99,6 +112,7 @@ def core_periphery(
     *,
     seed: int | None = None,
     rng: np.random.Generator | None = None,
+    n_jobs: int = 1,
 ):
     """
     Implementation of the core-periphery model described in: https://arxiv.org/pdf/2202.12769.pdf
@@ -111,6 +125,9 @@ def core_periphery(
         If True, use a greedy approach to find the initial permutation of nodes (default: False)
     N_ITER: int
         Number of iterations (default: 1000)
+    n_jobs: int
+        Number of processes running the independent iterations. If None, use all the
+        available CPUs (default: 1)
 
     Returns
     -------
@@ -120,7 +137,6 @@ def core_periphery(
     if rng is not None and seed is not None:
         raise ValueError("Provide only one of seed= or rng=.")
     rng = rng if rng is not None else np.random.default_rng(seed)
-    pyrand = random.Random(None if seed is None else int(seed))
 
     if hypergraph.is_weighted():
         w = {}
@@ -134,94 +150,42 @@ def core_periphery(
     d = list(w.keys())
 
     N_nodes, node2id, d, w = relabel_nodes(d, w)
-    deg_list = sort_by_degree(d)
-
-    adj = get_adj(d)
-
-    cs = {i: 0 for i in range(N_nodes)}
-
-    NUM_SWITCH = N_nodes * 10
-
-    for n_iter in range(N_ITER):
-        a, b = sample_params(rng=rng)
-        local_core_values = {}
 
-        for i in range(1, N_nodes + 1):
-            local_core_values[i - 1] = transition_function(i, N_nodes, a, b)
-
-        order = {}
-
-        # initial permutation
-        if greedy_start:
-            for i, k in enumerate(deg_list):
-                order[k[1]] = i
-        else:
-            tmp = [i for i in range(N_nodes)]
-            pyrand.shuffle(tmp)
-            for i in range(N_nodes):
-                order[i] = tmp[i]
-
-        R = get_core_quality(d, order, local_core_values)
+    # Relabeled hyperedges in CSR format.
+    edges = list(d)
+    sizes = np.array([len(e) for e in edges], dtype=np.int64)
+    nodes = np.fromiter(
+        (n for e in edges for n in e), dtype=np.int64, count=int(sizes.sum())
+    )
+    weights = np.array([w[e] for e in edges], dtype=float)
+    degree = np.bincount(nodes, minlength=N_nodes)
+    strength = np.bincount(
+        nodes, weights=np.repeat(weights / sizes, sizes), minlength=N_nodes
+    )
+
+    greedy_order = None
+    if greedy_start:
+        # Positions by increasing degree, ties broken by node index.
+        greedy_order = np.empty(N_nodes, dtype=np.int64)
+        greedy_order[np.lexsort((np.arange(N_nodes), degree))] = np.arange(N_nodes)
+
+    # One seed per iteration, so that the result does not depend on n_jobs.
+    seeds = rng.integers(2**63, size=N_ITER)
+    n_jobs = cpu_count() if n_jobs is None else n_jobs
+    chunks = [
+        (degree, strength, greedy_order, chunk)
+        for chunk in np.array_split(seeds, max(1, min(n_jobs, N_ITER)))
+    ]
+    if n_jobs == 1:
+        cs = sum(_core_periphery_iterations(args) for args in chunks)
+    else:
+        with Pool(processes=n_jobs) as pool:
+            cs = sum(pool.map(_core_periphery_iterations, chunks))
 
-        # label switching
-        for _ in range(NUM_SWITCH):
-            i, j = pyrand.sample(range(N_nodes), 2)
-
-            new_R = R
-
-            for e in adj[i]:
-                new_R -= (
-                    w[e]
-                    / len(e)
-                    * aggregate_local_core_values(list(e), order, local_core_values)
-                )
-
-            for e in adj[j]:
-                new_R -= (
-                    w[e]
-                    / len(e)
-                    * aggregate_local_core_values(list(e), order, local_core_values)
-                )
-
-            s_tmp = order[i]
-            order[i] = order[j]
-            order[j] = s_tmp
-
-            for e in adj[i]:
-                new_R += (
-                    w[e]
-                    / len(e)
-                    * aggregate_local_core_values(list(e), order, local_core_values)
-                )
-
-            for e in adj[j]:
-                new_R += (
-                    w[e]
-                    / len(e)
-                    * aggregate_local_core_values(list(e), order, local_core_values)
-                )
-
-            if new_R < R:
-                s_tmp = order[i]
-                order[i] = order[j]
-                order[j] = s_tmp
-            else:
-                R = new_R
-
-        for node in range(N_nodes):
-            cs[node] = cs[node] + local_core_values[order[node]] * R
-
-        logger = logging.getLogger(__name__)
-        logger.info("%s of %s iter", n_iter, N_ITER)
-
-    max_node = max(cs, key=cs.get)
-    Z = 1 / cs[max_node]
-
-    for node in range(N_nodes):
-        cs[node] = Z * cs[node]
+    cs = cs / cs.max()
 
     id2node = {}
     for node in node2id:
         id2node[node2id[node]] = node
 
-    return {id2node[i]: cs[i] for i in cs}
+    return {id2node[i]: float(cs[i]) for i in range(N_nodes)}
@@ -26,7 +26,7 @@ def qf(u: np.ndarray, w: np.ndarray) -> np.ndarray:
     """
     K = u.shape[-1]
     assert w.shape == (K, K), "Shapes of u and w are incorrect."
-    return ((u @ w) * u).sum(axis=-1)
+    return np.einsum("...k,...k->...", u @ w, u)
 
 
 def bf(u: np.ndarray, v: np.ndarray, w: np.ndarray) -> np.ndarray:
@@ -1,10 +1,17 @@
-from typing import Dict, Optional, Tuple, Union
+import os
+import time
+from multiprocessing import Pool, cpu_count
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 from scipy import sparse
 
 from hypergraphx import Hypergraph
 from hypergraphx.communities.hy_mmsbm._linear_ops import bf, bf_and_sum, qf, qf_and_sum
+from hypergraphx.communities.hy_mmsbm.streaming import (
+    HyperedgeArrays,
+    batch_incidence,
+)
 from hypergraphx.linalg.linalg import binary_incidence_matrix
 
 
@@ -145,6 +152,8 @@ class HyMMSBM:
         n_iter: int = 500,
         tolerance: Optional[float] = None,
         check_convergence_every: int = 10,
+        dtype: np.dtype = np.float64,
+        callback: Optional[Callable[[int, float, float], bool]] = None,
     ) -> None:
         """Perform Expectation-Maximization inference on a hypergraph, as presented  in
 
@@ -162,10 +171,46 @@ class HyMMSBM:
         n_iter: maximum number of EM iterations.
         tolerance: tolerance for the stopping criterion.
         check_convergence_every: number of steps in between every convergence check.
+        dtype: floating point type utilized for the parameters during inference.
+            Using np.float32 halves the memory footprint and speeds up the matrix
+            products on large hypergraphs. The log-likelihood values are always
+            accumulated in double precision.
+        callback: optional function called after every EM iteration as
+            callback(iteration, log_likelihood, elapsed), with elapsed the time in
+            seconds since the start of the inference. The log-likelihood is the one of
+            the normalized parameters, i.e. the value log_likelihood would return if
+            the inference stopped at that iteration. If the callback returns True, the
+            inference is stopped.
+        """
+        binary_incidence = binary_incidence_matrix(hypergraph)
+        hye_weights = np.array(hypergraph.get_weights())
+        self._fit_incidence(
+            binary_incidence,
+            hye_weights,
+            n_iter=n_iter,
+            tolerance=tolerance,
+            check_convergence_every=check_convergence_every,
+            dtype=dtype,
+            callback=callback,
+        )
+
+    def _fit_incidence(
+        self,
+        binary_incidence: Union[np.ndarray, sparse.spmatrix],
+        hye_weights: np.ndarray,
+        n_iter: int = 500,
+        tolerance: Optional[float] = None,
+        check_convergence_every: int = 10,
+        dtype: np.dtype = np.float64,
+        callback: Optional[Callable[[int, float, float], bool]] = None,
+    ) -> None:
+        """EM inference from the binary incidence matrix and the hyperedge weights.
+        See the fit method for a description of the parameters.
         """
         # Initialize all the values needed for training.
         self.tolerance = tolerance
         self.tolerance_reached = False
+        N = binary_incidence.shape[0]
 
         if self.w is None:
             fixed_w = False
@@ -175,40 +220,48 @@ class HyMMSBM:
 
         if self.u is None:
             fixed_u = False
-            self._init_u(hypergraph.num_nodes())
+            self._init_u(N)
         else:
             fixed_u = True
 
-        # Infer the maximum hyperedge size if not already specified inside the model.
-        max_hye_size_data = max(len(hye) for hye in hypergraph)
-        if self.max_hye_size is None:
-            self.max_hye_size = max_hye_size_data
-        else:
-            if self.max_hye_size < max_hye_size_data:
-                raise ValueError(
-                    "The hypergraph contains hyperedges with size greater than that "
-                    "specified in the model. This will not influence training, but "
-                    "might cause other modeling problems. If you want max_hye_size to "
-                    "be detected automatically, set it to None."
-                )
+        self.w = np.asarray(self.w, dtype=dtype)
+        self.u = np.asarray(self.u, dtype=dtype)
 
-        binary_incidence = binary_incidence_matrix(hypergraph)
-        hye_weights = np.array(hypergraph.get_weights())
+        self._set_max_hye_size(int(np.max(binary_incidence.sum(axis=0))))
+
+        # Quantities derived from the incidence are constant during training.
+        incidence = sparse.csr_array(binary_incidence, dtype=dtype)
+        incidence_t = incidence.T.tocsr()
+        hye_weights = np.asarray(hye_weights, dtype=dtype)
+        C = self.C()
+        scale = 1.0 if (fixed_w and fixed_u) else C
+
+        # The edge sums only depend on u, hence they are shared by the w update and the
+        # u update following it.
+        edge_sum = incidence_t @ self.u
+        start = time.perf_counter()
 
         # Train.
         for it in range(n_iter):
             if not fixed_w:
-                self.w = self._w_update(binary_incidence, hye_weights)
+                self.w = self._w_update(incidence, hye_weights, edge_sum=edge_sum)
             if not fixed_u:
-                self.u = self._u_update(binary_incidence, hye_weights)
+                self.u = self._u_update(incidence, hye_weights, edge_sum=edge_sum)
+                edge_sum = incidence_t @ self.u
+
+            if callback is not None:
+                log_lik = self._scaled_log_likelihood(
+                    incidence, hye_weights, edge_sum, scale
+                )
+                if callback(it, log_lik, time.perf_counter() - start):
+                    break
 
             # Check for convergence.
             if tolerance is not None:
                 if (not it % check_convergence_every) and (it > 0):
                     converged = (
                         np.linalg.norm(self.w - old_w) / self.K < tolerance
-                        and np.linalg.norm(self.u - old_u) / hypergraph.num_nodes()
-                        < tolerance
+                        and np.linalg.norm(self.u - old_u) / N < tolerance
                     )
                     if converged:
                         self.tolerance_reached = True
@@ -218,13 +271,214 @@ class HyMMSBM:
         # parameter sets during inference, and simply be accounted for at the end of the
         # optimization procedure.
         if not fixed_w:
-            self.w = self.w / self.C()
+            self.w = self.w / self.w.dtype.type(C)
         elif not fixed_u:
-            self.u = self.u / np.sqrt(self.C())
+            self.u = self.u / self.u.dtype.type(np.sqrt(C))
 
         self.trained = True
         self.training_iter = it
 
+    def fit_stochastic(
+        self,
+        data: Union[Hypergraph, str, os.PathLike, HyperedgeArrays],
+        batch_size: int = 10000,
+        n_epochs: int = 1,
+        step_offset: float = 1.0,
+        step_decay: float = 0.6,
+        dtype: np.dtype = np.float64,
+        checkpoint_path: Optional[Union[str, os.PathLike]] = None,
+        checkpoint_every: int = 100,
+        resume: bool = False,
+        callback: Optional[Callable[[int, float, float], bool]] = None,
+    ) -> None:
+        r"""Perform stochastic Expectation-Maximization inference on mini-batches of
+        hyperedges, for hypergraphs too large for the full-batch fit method.
+
+        Every step reads a mini-batch of contiguous hyperedges and computes their
+        expected sufficient statistics, i.e. the numerators of the EM updates. These
+        are blended into running estimates with step size
+
+        .. math::
+            \rho_t = (t + \tau)^{-\kappa}
+
+        and the parameters are obtained from the running estimates with the same
+        M-step, priors and kappa normalization of fit. The statistics of w are rescaled
+        by E / batch size, the statistics of every node only change when the node
+        appears in the batch, with its own step counter, and are rescaled by its degree
+        over the number of its hyperedges in the batch.
+        Only the current batch of hyperedges is kept in memory, together with the
+        parameters and the node degrees.
+
+        Parameters
+        ----------
+        data: the hyperedges. Either a hypergraph, a HyperedgeArrays instance, or the
+            directory where the arrays were saved with save_hyperedge_arrays, in which
+            case they are memory-mapped. Mini-batches are made of contiguous hyperedges,
+            which should then be stored in random order.
+            Hypergraphs are shuffled before training.
+        batch_size: number of hyperedges per mini-batch.
+        n_epochs: number of passes over all the hyperedges. The mini-batches are
+            visited in a different random order in every epoch.
+        step_offset: the delay tau of the step size. It needs to be at least one.
+        step_decay: the forgetting rate kappa of the step size, in (0.5, 1].
+        dtype: floating point type utilized for the parameters during inference.
+        checkpoint_path: file where the training state is saved, every
+            checkpoint_every steps and at the end of the training.
+        checkpoint_every: number of steps in between checkpoints.
+        resume: if True and checkpoint_path exists, resume the training from the saved
+            state. The data and the training parameters need to be the same of the
+            interrupted run.
+        callback: optional function called after every step as
+            callback(step, log_likelihood, elapsed). The log-likelihood is the unbiased
+            estimate of the full log-likelihood of the normalized parameters computed
+            on the mini-batch, before the update. If the callback returns True, the
+            inference is stopped.
+        """
+        if not 0.5 < step_decay <= 1:
+            raise ValueError("step_decay must be in (0.5, 1].")
+        if step_offset < 1:
+            raise ValueError("step_offset must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        self.tolerance = None
+        self.tolerance_reached = False
+        fixed_w = self.w is not None
+        fixed_u = self.u is not None
+        if not fixed_w:
+            self._init_w()
+
+        if isinstance(data, Hypergraph):
+            if not fixed_u:
+                self._init_u(data.num_nodes())
+            data = HyperedgeArrays.from_hypergraph(
+                data, shuffle=True, seed=self._rng.integers(2**32)
+            )
+        else:
+            if not isinstance(data, HyperedgeArrays):
+                data = HyperedgeArrays.load(
+                    data, num_nodes=None if self.u is None else self.u.shape[0]
+                )
+            if not fixed_u:
+                self._init_u(data.num_nodes)
+        E = data.num_edges
+        degree = data.degree
+        n_batches = -(-E // batch_size)
+
+        self.w = np.asarray(self.w, dtype=dtype)
+        self.u = np.asarray(self.u, dtype=dtype)
+        self._set_max_hye_size(data.max_hye_size)
+
+        C = self.C()
+        scale = 1.0 if (fixed_w and fixed_u) else C
+
+        if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+            with np.load(checkpoint_path) as checkpoint:
+                self.u = checkpoint["u"].astype(dtype)
+                self.w = checkpoint["w"].astype(dtype)
+                stat_u = checkpoint["stat_u"].astype(dtype)
+                stat_w = checkpoint["stat_w"].astype(dtype)
+                node_steps = checkpoint["node_steps"]
+                step = int(checkpoint["step"])
+                order_seed = int(checkpoint["order_seed"])
+        else:
+            # Initial statistics reproducing the initial parameters through the M-step.
+            stat_u = self.u * (self._u_denominator() + self.u_prior)
+            stat_w = self.w * (self._w_denominator() + self.w_prior)
+            node_steps = np.zeros(len(degree), dtype=np.int64)
+            step = 0
+            order_seed = int(self._rng.integers(2**32))
+
+        def save_checkpoint():
+            # Write to a temporary file first, not to corrupt the last checkpoint.
+            tmp_path = f"{checkpoint_path}.tmp"
+            with open(tmp_path, "wb") as file:
+                np.savez(
+                    file,
+                    u=self.u,
+                    w=self.w,
+                    stat_u=stat_u,
+                    stat_w=stat_w,
+                    node_steps=node_steps,
+                    step=step,
+                    order_seed=order_seed,
+                )
+            os.replace(tmp_path, checkpoint_path)
+
+        start = time.perf_counter()
+        stop = False
+        while step < n_epochs * n_batches and not stop:
+            epoch, position = divmod(step, n_batches)
+            order = np.random.default_rng([order_seed, epoch]).permutation(n_batches)
+            for b in order[position:]:
+                nodes, sizes, hye_weights = data.batch(
+                    b * batch_size, min((b + 1) * batch_size, E)
+                )
+                batch_nodes, incidence = batch_incidence(nodes, sizes, dtype=dtype)
+                hye_weights = hye_weights.astype(dtype)
+                u_batch = self.u[batch_nodes]
+                edge_sum = incidence.T @ u_batch
+                edge_scale = E / len(sizes)
+
+                if callback is not None:
+                    log_params = np.log(
+                        self._poisson_params(incidence, edge_sum, u_batch).astype(
+                            np.float64
+                        )
+                    )
+                    log_lik = -float(
+                        bf_and_sum(self.u, self.w)
+                    ) / scale + edge_scale * (
+                        np.dot(
+                            hye_weights.astype(np.float64), log_params - np.log(scale)
+                        )
+                    )
+
+                # As in fit, w is updated first and the u update utilizes the new w.
+                if not fixed_w:
+                    batch_stat = self._w_numerator(
+                        u_batch, incidence, hye_weights, edge_sum
+                    )
+                    rho = (step + step_offset) ** -step_decay
+                    stat_w = (1 - rho) * stat_w + (rho * edge_scale) * batch_stat
+                    self.w = (stat_w / (self._w_denominator() + self.w_prior)).astype(
+                        dtype
+                    )
+                if not fixed_u:
+                    batch_stat = self._u_numerator(
+                        u_batch, incidence, hye_weights, edge_sum
+                    )
+                    node_rho = (node_steps[batch_nodes] + step_offset) ** -step_decay
+                    node_scale = degree[batch_nodes] / incidence.sum(axis=1)
+                    stat_u[batch_nodes] = (1 - node_rho)[:, None] * stat_u[
+                        batch_nodes
+                    ] + (node_rho * node_scale)[:, None] * batch_stat
+                    node_steps[batch_nodes] += 1
+                    self.u = (stat_u / (self._u_denominator() + self.u_prior)).astype(
+                        dtype
+                    )
+
+                step += 1
+                if checkpoint_path is not None and not step % checkpoint_every:
+                    save_checkpoint()
+                if callback is not None and callback(
+                    step - 1, log_lik, time.perf_counter() - start
+                ):
+                    stop = True
+                    break
+
+        if checkpoint_path is not None:
+            save_checkpoint()
+
+        # Account for the C constant absorbed in the parameters, as in fit.
+        if not fixed_w:
+            self.w = self.w / self.w.dtype.type(C)
+        elif not fixed_u:
+            self.u = self.u / self.u.dtype.type(np.sqrt(C))
+
+        self.trained = True
+        self.training_iter = step
+
     def poisson_params(
         self,
         binary_incidence: Union[np.ndarray, sparse.spmatrix],
@@ -259,13 +513,30 @@ class HyMMSBM:
         another vector of length E.
         """
         self._check_u_w_init()
-        u, w = self.u, self.w
+        edge_sum = self._edge_sum(binary_incidence)
+        poisson_params = self._poisson_params(binary_incidence, edge_sum)
+
+        if return_edge_sum:
+            return poisson_params, edge_sum
+        return poisson_params
+
+    def _poisson_params(
+        self,
+        binary_incidence: Union[np.ndarray, sparse.spmatrix],
+        edge_sum: np.ndarray,
+        u: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Compute the Poisson parameters from precomputed edge sums.
+        See the poisson_params method. The assignments u can be restricted to the nodes
+        appearing in the binary incidence, by default they are the ones of the model.
+        """
+        u = self.u if u is None else u
+        w = self.w
 
         E = binary_incidence.shape[1]
         K = w.shape[0]
 
         # First addend: for every hyperedge e: s_e^T w s_e .
-        edge_sum = self._edge_sum(binary_incidence)
         assert edge_sum.shape == (E, K)
 
         first_addend = qf(edge_sum, w)
@@ -275,11 +546,7 @@ class HyMMSBM:
         second_addend = binary_incidence.T @ qf(u, w)
         assert second_addend.shape == (E,)
 
-        poisson_params = 0.5 * (first_addend - second_addend)
-
-        if return_edge_sum:
-            return poisson_params, edge_sum
-        return poisson_params
+        return 0.5 * (first_addend - second_addend)
 
     def expected_degree(
         self,
@@ -348,17 +615,37 @@ class HyMMSBM:
         The log-likelihood value.
         """
         self._check_u_w_init()
-        u, w = self.u, self.w
 
         binary_incidence = binary_incidence_matrix(hypergraph)
         hye_weights = np.array(hypergraph.get_weights())
 
+        return self._scaled_log_likelihood(
+            binary_incidence, hye_weights, self._edge_sum(binary_incidence)
+        )
+
+    def _scaled_log_likelihood(
+        self,
+        binary_incidence: Union[np.ndarray, sparse.spmatrix],
+        hye_weights: np.ndarray,
+        edge_sum: np.ndarray,
+        scale: float = 1.0,
+    ) -> float:
+        """Log-likelihood of the parameters u, w rescaled as w / scale.
+        During inference the C constant is absorbed in the parameters, this allows to
+        evaluate the log-likelihood of the final, normalized, parameters without
+        rescaling u or w. The sums are accumulated in double precision.
+        """
+        u, w = self.u, self.w
+
         # First addend: all interactions u_i * w * u_j .
-        first_addend = bf_and_sum(u, w)
+        first_addend = float(bf_and_sum(u, w)) / scale
 
         # Second addend: interactions in the hypergraph A_e * log(lambda_e) .
+        log_params = np.log(
+            self._poisson_params(binary_incidence, edge_sum).astype(np.float64)
+        )
         second_addend = np.dot(
-            hye_weights, np.log(self.poisson_params(binary_incidence))
+            np.asarray(hye_weights, dtype=np.float64), log_params - np.log(scale)
         )
 
         return -first_addend + second_addend
@@ -474,18 +761,49 @@ class HyMMSBM:
         self,
         binary_incidence: Union[np.ndarray, sparse.spmatrix],
         hye_weights: np.ndarray,
+        edge_sum: Optional[np.ndarray] = None,
     ) -> np.ndarray:
-        """EM or MAP updates for the affinity matrix w."""
-        u, w = self.u, self.w
+        """EM or MAP updates for the affinity matrix w.
+        The edge sums of the current u can be provided to avoid recomputing them.
+        """
+        if edge_sum is None:
+            edge_sum = self._edge_sum(binary_incidence)
+        numerator = self._w_numerator(self.u, binary_incidence, hye_weights, edge_sum)
+        return numerator / (self._w_denominator() + self.w_prior)
+
+    def _u_update(
+        self,
+        binary_incidence: Union[np.ndarray, sparse.spmatrix],
+        hye_weights: np.ndarray,
+        edge_sum: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """EM or MAP updates for the community assignments u.
+        The edge sums of the current u can be provided to avoid recomputing them.
+        """
+        if edge_sum is None:
+            edge_sum = self._edge_sum(binary_incidence)
+        numerator = self._u_numerator(self.u, binary_incidence, hye_weights, edge_sum)
+        return numerator / (self._u_denominator() + self.u_prior)
+
+    def _w_numerator(
+        self,
+        u: np.ndarray,
+        binary_incidence: Union[np.ndarray, sparse.spmatrix],
+        hye_weights: np.ndarray,
+        edge_sum: np.ndarray,
+    ) -> np.ndarray:
+        """Numerator of the w update, i.e. the expected sufficient statistics of w.
+        The assignments u and the binary incidence can be restricted to the nodes of a
+        subset of the hyperedges, in which case the statistics of those hyperedges only
+        are returned.
+        """
+        w = self.w
 
         E = len(hye_weights)
         N = u.shape[0]
         K = self.K
 
-        poisson_params, edge_sum = self.poisson_params(
-            binary_incidence, return_edge_sum=True
-        )
-
+        poisson_params = self._poisson_params(binary_incidence, edge_sum, u)
         multiplier = hye_weights / poisson_params
         assert multiplier.shape == (E,)
 
@@ -494,71 +812,57 @@ class HyMMSBM:
         assert first_addend.shape == (K, K)
 
         # Numerator: second addend u_ia * u_ib .
-        if sparse.issparse(binary_incidence):
-            weighting = binary_incidence.multiply(multiplier[None, :]).sum(axis=1)
-            weighting = np.asarray(weighting).reshape(-1)
-        else:
-            weighting = (binary_incidence * multiplier[None, :]).sum(axis=1)
+        weighting = binary_incidence @ multiplier
         assert weighting.shape == (N,)
         second_addend = np.matmul(u.T, u * weighting[:, None])
         assert second_addend.shape == (K, K)
 
-        numerator = 0.5 * w * (first_addend - second_addend)
-
-        # Denominator.
-        u_sum = u.sum(axis=0)
-        assert u_sum.shape == (K,)
-        denominator = 0.5 * (np.outer(u_sum, u_sum) - np.matmul(u.T, u))
-        assert denominator.shape == (K, K)
+        return 0.5 * w * (first_addend - second_addend)
 
-        return numerator / (denominator + self.w_prior)
-
-    def _u_update(
+    def _u_numerator(
         self,
+        u: np.ndarray,
         binary_incidence: Union[np.ndarray, sparse.spmatrix],
         hye_weights: np.ndarray,
+        edge_sum: np.ndarray,
     ) -> np.ndarray:
-        """EM or MAP updates for the community assignments u."""
-        u, w = self.u, self.w
+        """Numerator of the u update, i.e. the expected sufficient statistics of u.
+        As for _w_numerator, the inputs can be restricted to a subset of hyperedges.
+        """
+        w = self.w
 
         E = len(hye_weights)
         N = u.shape[0]
         K = self.K
 
-        # Numerator.
-        poisson_params, edge_sum = self.poisson_params(
-            binary_incidence, return_edge_sum=True
-        )
-
+        poisson_params = self._poisson_params(binary_incidence, edge_sum, u)
         multiplier = hye_weights / poisson_params
         assert multiplier.shape == (E,)
 
-        if sparse.issparse(binary_incidence):
-            weighting = binary_incidence.multiply(multiplier[None, :])
-            assert sparse.issparse(weighting)
-        else:
-            weighting = binary_incidence * multiplier[None, :]
-        assert weighting.shape == (N, E)
-
-        first_addend = weighting @ edge_sum
+        # Rather than building the (N, E) matrix of weighted incidences, the
+        # multipliers are applied to the edge sums and then gathered on the nodes.
+        first_addend = binary_incidence @ (edge_sum * multiplier[:, None])
         assert first_addend.shape == (N, K)
 
-        if sparse.issparse(weighting):
-            weighting_sum = np.asarray(weighting.sum(axis=1)).reshape(-1, 1)
-        else:
-            weighting_sum = weighting.sum(axis=1, keepdims=True)
+        weighting_sum = (binary_incidence @ multiplier)[:, None]
         second_addend = weighting_sum * u
         assert second_addend.shape == (N, K)
 
-        numerator = u * np.matmul(first_addend - second_addend, w)
+        return u * np.matmul(first_addend - second_addend, w)
 
-        # Denominator.
+    def _w_denominator(self) -> np.ndarray:
+        """Denominator of the w update, without prior."""
+        u = self.u
         u_sum = u.sum(axis=0)
-        assert u_sum.shape == (K,)
-        denominator = np.matmul(w, u_sum)[None, :] - np.matmul(u, w)
-        assert denominator.shape == (N, K)
+        assert u_sum.shape == (self.K,)
+        return 0.5 * (np.outer(u_sum, u_sum) - np.matmul(u.T, u))
 
-        return numerator / (denominator + self.u_prior)
+    def _u_denominator(self) -> np.ndarray:
+        """Denominator of the u update, without prior."""
+        u, w = self.u, self.w
+        u_sum = u.sum(axis=0)
+        assert u_sum.shape == (self.K,)
+        return np.matmul(w, u_sum)[None, :] - np.matmul(u, w)
 
     def _C_prime(self, d: Union[str, int, np.ndarray] = "all") -> float:
         """Only utilized for computing the expected degree of single nodes.
@@ -614,6 +918,19 @@ class HyMMSBM:
 
         return d_vals
 
+    def _set_max_hye_size(self, max_hye_size_data: int) -> None:
+        """Infer the maximum hyperedge size if not already specified inside the model."""
+        if self.max_hye_size is None:
+            self.max_hye_size = max_hye_size_data
+        else:
+            if self.max_hye_size < max_hye_size_data:
+                raise ValueError(
+                    "The hypergraph contains hyperedges with size greater than that "
+                    "specified in the model. This will not influence training, but "
+                    "might cause other modeling problems. If you want max_hye_size to "
+                    "be detected automatically, set it to None."
+                )
+
     def _check_and_infer_param_consistency(self) -> None:
         if self.assortative is None:
             if self.w is None:
@@ -723,6 +1040,76 @@ class HyMMSBM:
         return binary_incidence.T @ self.u
 
 
+def fit_restarts(
+    hypergraph: Hypergraph,
+    n_restarts: int = 10,
+    n_jobs: Optional[int] = 1,
+    n_iter: int = 500,
+    tolerance: Optional[float] = None,
+    check_convergence_every: int = 10,
+    dtype: np.dtype = np.float64,
+    seed: Optional[int] = None,
+    **model_params: Any,
+) -> Tuple[HyMMSBM, float]:
+    """Fit several Hy-MMSBM models from different random initializations and keep the
+    one with the highest log-likelihood.
+    The incidence matrix is computed once and shared by all the restarts, which can be
+    run in parallel processes.
+
+    Parameters
+    ----------
+    hypergraph: the hypergraph to perform inference on.
+    n_restarts: number of random initializations.
+    n_jobs: number of worker processes. If None, all the available cores are utilized.
+        With n_jobs=1 the restarts are run sequentially in the current process.
+    n_iter: maximum number of EM iterations of every restart.
+    tolerance: tolerance for the stopping criterion.
+    check_convergence_every: number of steps in between every convergence check.
+    dtype: floating point type utilized for the parameters during inference.
+    seed: random seed. Independent seeds for the single restarts are derived from it.
+    model_params: additional keyword arguments for the HyMMSBM initialization, for
+        example K, assortative or the priors.
+
+    Returns
+    -------
+    The best fitted model and its log-likelihood.
+    """
+    if n_restarts < 1:
+        raise ValueError("n_restarts must be a positive integer.")
+
+    binary_incidence = binary_incidence_matrix(hypergraph)
+    hye_weights = np.array(hypergraph.get_weights())
+    fit_params = dict(
+        n_iter=n_iter,
+        tolerance=tolerance,
+        check_convergence_every=check_convergence_every,
+        dtype=dtype,
+    )
+    tasks = [
+        (binary_incidence, hye_weights, model_params, fit_params, child_seed)
+        for child_seed in np.random.SeedSequence(seed).spawn(n_restarts)
+    ]
+
+    if n_jobs == 1:
+        results = [_fit_restart(task) for task in tasks]
+    else:
+        with Pool(processes=cpu_count() if n_jobs is None else n_jobs) as pool:
+            results = pool.map(_fit_restart, tasks)
+
+    return max(results, key=lambda result: result[1])
+
+
+def _fit_restart(args) -> Tuple[HyMMSBM, float]:
+    """Fit a single model for fit_restarts."""
+    binary_incidence, hye_weights, model_params, fit_params, seed = args
+    model = HyMMSBM(seed=seed, **model_params)
+    model._fit_incidence(binary_incidence, hye_weights, **fit_params)
+    log_lik = model._scaled_log_likelihood(
+        binary_incidence, hye_weights, model._edge_sum(binary_incidence)
+    )
+    return model, log_lik
+
+
 def log_binomial(n: int, k: int) -> float:
     """Compute the logarithm of the binomial coefficient of n over k."""
     return np.log(np.arange(n - k + 1, n + 1)).sum() - np.log(np.arange(1, k + 1)).sum()
@@ -0,0 +1,180 @@
+"""Array storage of hyperedges for the stochastic inference of Hy-MMSBM.
+
+A hypergraph is stored as three flat arrays, saved as separate .npy files inside a
+directory:
+- nodes.npy: the integer node indices of all the hyperedges, concatenated;
+- offsets.npy: array of length E+1, hyperedge e has nodes
+  nodes[offsets[e]:offsets[e+1]];
+- weights.npy: the E hyperedge weights.
+Nodes are indexed from 0 to N-1, where N is inferred as the largest node index plus
+one unless given explicitly. The files are opened as memory maps, so that
+mini-batches of contiguous hyperedges are read from disk only when needed.
+"""
+
+import os
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from hypergraphx import Hypergraph
+
+NODES_FILE = "nodes.npy"
+OFFSETS_FILE = "offsets.npy"
+WEIGHTS_FILE = "weights.npy"
+
+# Number of node entries read at once when scanning the arrays.
+_SCAN_CHUNK = 2**24
+
+
+class HyperedgeArrays:
+    """Hyperedges stored as flat arrays of nodes and offsets.
+    The arrays can be in memory or memory-mapped from disk.
+    """
+
+    def __init__(
+        self,
+        nodes: np.ndarray,
+        offsets: np.ndarray,
+        weights: np.ndarray,
+        num_nodes: Optional[int] = None,
+    ):
+        if len(offsets) != len(weights) + 1:
+            raise ValueError("offsets must have one more entry than weights.")
+        self.nodes = nodes
+        self.offsets = offsets
+        self.weights = weights
+        self._num_nodes = num_nodes
+        self._degree: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_hypergraph(
+        cls,
+        hypergraph: Hypergraph,
+        shuffle: bool = False,
+        seed: Optional[int] = None,
+    ) -> "HyperedgeArrays":
+        """Build the arrays of a hypergraph in memory.
+        Nodes are indexed as in binary_incidence_matrix. If shuffle, the hyperedges are
+        stored in random order.
+        """
+        encoder = hypergraph.get_mapping()
+        hye_list = [np.unique(encoder.transform(hye)) for hye in hypergraph.get_edges()]
+        weights = np.array(hypergraph.get_weights(), dtype=float)
+
+        if shuffle:
+            order = np.random.default_rng(seed).permutation(len(hye_list))
+            hye_list = [hye_list[e] for e in order]
+            weights = weights[order]
+
+        offsets = np.zeros(len(hye_list) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(hye) for hye in hye_list])
+        nodes = (
+            np.concatenate(hye_list).astype(np.int64)
+            if hye_list
+            else np.zeros(0, dtype=np.int64)
+        )
+        return cls(nodes, offsets, weights, num_nodes=hypergraph.num_nodes())
+
+    @classmethod
+    def load(
+        cls, path: Union[str, os.PathLike], num_nodes: Optional[int] = None
+    ) -> "HyperedgeArrays":
+        """Memory-map the arrays saved in the directory path."""
+        return cls(
+            np.load(os.path.join(path, NODES_FILE), mmap_mode="r"),
+            np.load(os.path.join(path, OFFSETS_FILE), mmap_mode="r"),
+            np.load(os.path.join(path, WEIGHTS_FILE), mmap_mode="r"),
+            num_nodes=num_nodes,
+        )
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Save the arrays in the directory path, creating it if needed."""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, NODES_FILE), np.asarray(self.nodes))
+        np.save(os.path.join(path, OFFSETS_FILE), np.asarray(self.offsets))
+        np.save(os.path.join(path, WEIGHTS_FILE), np.asarray(self.weights))
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.weights)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.degree)
+
+    @property
+    def max_hye_size(self) -> int:
+        return int(np.diff(self.offsets).max())
+
+    @property
+    def degree(self) -> np.ndarray:
+        """Number of hyperedges every node belongs to.
+        Computed with a single chunked pass over the node array.
+        """
+        if self._degree is None:
+            degree = np.zeros(0, dtype=np.int64)
+            for start in range(0, len(self.nodes), _SCAN_CHUNK):
+                counts = np.bincount(self.nodes[start : start + _SCAN_CHUNK])
+                if len(counts) > len(degree):
+                    degree = np.pad(degree, (0, len(counts) - len(degree)))
+                degree[: len(counts)] += counts
+            if self._num_nodes is not None:
+                if self._num_nodes < len(degree):
+                    raise ValueError(
+                        "The hyperedges contain more than num_nodes nodes."
+                    )
+                degree = np.pad(degree, (0, self._num_nodes - len(degree)))
+            self._degree = degree
+        return self._degree
+
+    def batch(self, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the hyperedges start, ..., stop - 1.
+
+        Returns
+        -------
+        The node indices of the hyperedges in the batch, the hyperedge sizes and the
+        hyperedge weights.
+        """
+        offsets = np.asarray(self.offsets[start : stop + 1])
+        nodes = np.asarray(self.nodes[offsets[0] : offsets[-1]])
+        return nodes, np.diff(offsets), np.asarray(self.weights[start:stop])
+
+
+def save_hyperedge_arrays(
+    hypergraph: Hypergraph,
+    path: Union[str, os.PathLike],
+    shuffle: bool = True,
+    seed: Optional[int] = None,
+) -> None:
+    """Save a hypergraph in the array format read by HyMMSBM.fit_stochastic.
+    Since mini-batches are made of contiguous hyperedges, by default the hyperedges are
+    shuffled before saving.
+
+    Parameters
+    ----------
+    hypergraph: the hypergraph to save.
+    path: the directory where the arrays are saved.
+    shuffle: whether to store the hyperedges in random order.
+    seed: random seed for the shuffling.
+    """
+    HyperedgeArrays.from_hypergraph(hypergraph, shuffle=shuffle, seed=seed).save(path)
+
+
+def batch_incidence(
+    nodes: np.ndarray, sizes: np.ndarray, dtype: np.dtype = np.float64
+) -> Tuple[np.ndarray, sparse.csr_array]:
+    """Binary incidence restricted to the nodes appearing in a batch of hyperedges.
+
+    Returns
+    -------
+    The sorted unique nodes of the batch, of length n, and the binary incidence matrix
+    of shape (n, B), with B the number of hyperedges.
+    """
+    batch_nodes, rows = np.unique(nodes, return_inverse=True)
+    columns = np.repeat(np.arange(len(sizes)), sizes)
+    incidence = sparse.csr_array(
+        (np.ones(len(nodes), dtype=dtype), (rows.reshape(-1), columns)),
+        shape=(len(batch_nodes), len(sizes)),
+    )
+    return batch_nodes, incidence
@@ -1,7 +1,9 @@
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 import logging
 import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator, eigsh, lobpcg
 
 try:
     from sklearn.cluster import KMeans  # type: ignore
@@ -11,6 +13,10 @@ except ImportError:  # pragma: no cover
 from hypergraphx import Hypergraph
 from hypergraphx.linalg.linalg import binary_incidence_matrix, incidence_matrix
 
+# Below this number of non-isolated nodes, eigen_solver="auto" uses the dense solver.
+_DENSE_MAX_NODES = 500
+_EIGEN_SOLVERS = ("auto", "dense", "eigsh", "lobpcg")
+
 
 class HySC:
     """Implementation of Hypergraph Spectral Clustering from
@@ -26,6 +32,7 @@ class HySC:
         out_inference: bool = False,
         out_folder: str = "../data/output/",
         end_file: str = "_sc.dat",
+        eigen_solver: str = "auto",
     ) -> None:
         """Initialize the model.
 
@@ -37,11 +44,25 @@ class HySC:
         out_inference: flag to store the inferred parameters.
         out_folder: path to store the output.
         end_file: output file suffix.
+        eigen_solver: how to compute the eigenvectors of the Laplacian matrix.
+            "dense" builds the dense N x N Laplacian and computes its full spectrum.
+            "eigsh" (ARPACK) and "lobpcg" only compute the K eigenvectors needed, from
+            the sparse incidence matrix, without ever building the Laplacian. LOBPCG is
+            warm-started from the eigenvectors of the previous fit on the same nodes.
+            "auto" uses "dense" for small hypergraphs and "eigsh" otherwise.
         """
+        if eigen_solver not in _EIGEN_SOLVERS:
+            raise ValueError(
+                f"Unknown eigen_solver {eigen_solver!r}. Expected one of "
+                f"{_EIGEN_SOLVERS}."
+            )
         # Training related attributes.
         self.seed = seed
         self.inf = inf
         self.n_realizations = n_realizations
+        self.eigen_solver = eigen_solver
+        # Eigenvectors of the last fit, utilized to warm-start LOBPCG.
+        self._warm_start: Optional[np.array] = None
         # Output related attributes.
         self.out_inference = out_inference
         self.out_folder = out_folder
@@ -65,10 +86,8 @@ class HySC:
         # Initialize all the parameters needed for training.
         self._init_data(hypergraph=hypergraph, K=K)
 
-        # Get the Laplacian matrix.
-        self._extract_laplacian(weighted_L=weighted_L)
         # Get eigenvalues and eigenvectors of the Laplacian matrix.
-        e_vals, e_vecs = self.extract_eigenvectors()
+        e_vals, e_vecs = self._eigenvectors(weighted_L=weighted_L)
         # Extract hard-memberships by applying the K-Means algorithm to the eigenvectors.
         self.u = self.apply_kmeans(e_vecs.real, seed=self.seed)
 
@@ -78,6 +97,37 @@ class HySC:
 
         return self.u
 
+    def fit_multiple(
+        self, hypergraph: Hypergraph, Ks: Iterable[int], weighted_L: bool = False
+    ) -> Dict[int, np.array]:
+        """Perform spectral clustering for several numbers of communities.
+        The eigenvectors are computed once, for the largest K, and reused for all the
+        others.
+
+        Parameters
+        ----------
+        hypergraph: the hypergraph to perform inference on.
+        Ks: numbers of communities.
+        weighted_L: flag to use the weighted Laplacian.
+
+        Returns
+        -------
+        Dictionary mapping every K to the hard-membership matrix of dimension (N, K).
+        """
+        Ks = sorted(set(Ks))
+        if not Ks:
+            raise ValueError("Ks must contain at least one number of communities.")
+
+        self._init_data(hypergraph=hypergraph, K=Ks[-1])
+        _, e_vecs = self._eigenvectors(weighted_L=weighted_L)
+
+        memberships = {}
+        for K in Ks:
+            self.K = K
+            memberships[K] = self.apply_kmeans(e_vecs[:, : K - 1].real, seed=self.seed)
+        self.u = memberships[Ks[-1]]
+        return memberships
+
     def _init_data(
         self,
         hypergraph: Hypergraph,
@@ -137,6 +187,85 @@ class HySC:
                 np.eye(self.N) - invDV2 @ dense_binary_incidence @ invDE @ HT @ invDV2
             )
 
+    def _eigenvectors(self, weighted_L: bool = False) -> Tuple[np.array, np.array]:
+        """Eigenvalues and eigenvectors of the Laplacian matrix with the chosen solver."""
+        n = len(self.non_isolates)
+        solver = self.eigen_solver
+        if solver == "auto":
+            solver = "dense" if n <= _DENSE_MAX_NODES else "eigsh"
+        # The iterative solvers need less eigenvectors than nodes.
+        if solver == "dense" or self.K >= n - 1:
+            self._extract_laplacian(weighted_L=weighted_L)
+            return self.extract_eigenvectors()
+        return self.extract_eigenvectors_sparse(weighted_L=weighted_L, solver=solver)
+
+    def _normalized_adjacency(self, weighted_L: bool = False) -> LinearOperator:
+        """Operator I - L restricted to the non-isolated nodes.
+        It has the factorized form
+
+        .. math::
+            D_V^{-1/2} H D_E^{-1} H^T D_V^{-1/2}
+
+        and is applied through sparse products with the incidence matrix H, without
+        building the N x N matrix.
+        """
+        incidence = self.incidence if weighted_L else self.binary_incidence
+        incidence = sparse.csr_array(incidence)[self.non_isolates]
+        degree = np.asarray(self.node_degree).reshape(-1)[self.non_isolates]
+        incidence = sparse.diags_array(1.0 / np.sqrt(degree)) @ incidence
+        incidence_t = incidence.T.tocsr()
+        invDE = 1.0 / np.where(self.hye_size == 0, 1, self.hye_size)
+
+        def matmat(X):
+            X = X.reshape(incidence.shape[0], -1)
+            Y = incidence_t @ X
+            return incidence @ (invDE[:, None] * Y)
+
+        n = incidence.shape[0]
+        return LinearOperator(
+            (n, n), matvec=matmat, matmat=matmat, rmatvec=matmat, dtype=float
+        )
+
+    def extract_eigenvectors_sparse(
+        self, weighted_L: bool = False, solver: str = "eigsh"
+    ) -> Tuple[np.array, np.array]:
+        """Extract the K smallest eigenvalues of the Laplacian matrix, and the
+        corresponding eigenvectors but the first, with an iterative solver.
+        The smallest eigenvalues of the Laplacian are the largest of I - L, which is
+        the operator passed to the solver.
+
+        Parameters
+        ----------
+        weighted_L: flag to use the weighted Laplacian.
+        solver: "eigsh" or "lobpcg".
+        """
+        A = self._normalized_adjacency(weighted_L=weighted_L)
+        n = A.shape[0]
+        rng = np.random.default_rng(self.seed)
+
+        warm = self._warm_start
+        if warm is not None and warm.shape[0] != n:
+            warm = None
+
+        if solver == "eigsh":
+            v0 = warm.sum(axis=1) if warm is not None else rng.random(n)
+            e_vals, e_vecs = eigsh(A, k=self.K, which="LA", v0=v0)
+        elif solver == "lobpcg":
+            X = rng.random((n, self.K))
+            if warm is not None:
+                n_warm = min(warm.shape[1], self.K)
+                X[:, :n_warm] = warm[:, :n_warm]
+            e_vals, e_vecs = lobpcg(
+                A, X, largest=True, tol=1e-8, maxiter=max(200, 10 * self.K)
+            )
+        else:
+            raise ValueError(f"Unknown sparse eigen solver {solver!r}.")
+
+        sorted_indices = np.argsort(-e_vals)
+        e_vals, e_vecs = 1.0 - e_vals[sorted_indices], e_vecs[:, sorted_indices]
+        self._warm_start = e_vecs
+        return e_vals, e_vecs[:, 1:]
+
     def extract_eigenvectors(self) -> Tuple[np.array, np.array]:
         """Extract eigenvalues and eigenvectors of the Laplacian matrix."""
         e_vals, e_vecs = np.linalg.eig(self.L[self.non_isolates][:, self.non_isolates])
@@ -156,13 +285,12 @@ class HySC:
         X_pred: membership matrix.
         """
         if KMeans is None:
-            raise ImportError(
-                "HySC requires scikit-learn. Install hypergraphx with the appropriate extra "
-                "(e.g. `pip install hypergraphx[ml]`) or install scikit-learn manually."
-            )
-        y_pred = KMeans(
-            n_clusters=self.K, random_state=seed, n_init=self.n_realizations
-        ).fit_predict(X)
+            # Fall back on the NumPy implementation of mini-batch K-means.
+            y_pred = minibatch_kmeans(X, self.K, n_init=self.n_realizations, seed=seed)
+        else:
+            y_pred = KMeans(
+                n_clusters=self.K, random_state=seed, n_init=self.n_realizations
+            ).fit_predict(X)
         X_pred = np.zeros((self.N, self.K))
         for idx, i in enumerate(self.non_isolates):
             X_pred[i, y_pred[idx]] = 1
@@ -175,3 +303,90 @@ class HySC:
         logger = logging.getLogger(__name__)
         logger.info("Inferred parameters saved in: %s", outfile + ".npz")
         logger.info('To load: theta=np.load(filename), then e.g. theta["u"]')
+
+
+def minibatch_kmeans(
+    X: np.array,
+    K: int,
+    n_init: int = 10,
+    batch_size: int = 1024,
+    max_iter: int = 100,
+    tol: float = 1e-4,
+    seed: Optional[int] = None,
+) -> np.array:
+    """Cluster the rows of X with mini-batch K-means, from
+    "Web-scale k-means clustering", Sculley D.
+
+    The centers are initialized with k-means++, then moved towards the points of random
+    mini-batches with per-center learning rates. This is utilized by HySC when
+    scikit-learn is not available.
+
+    Parameters
+    ----------
+    X: array of shape (n, d) with the points to cluster.
+    K: number of clusters.
+    n_init: number of initializations. The one with the lowest inertia is kept.
+    batch_size: number of points per mini-batch.
+    max_iter: maximum number of mini-batches.
+    tol: the iterations stop when no center moves more than tol times the average
+        variance of the features.
+    seed: random seed.
+
+    Returns
+    -------
+    Array of length n with the cluster labels.
+    """
+    X = np.asarray(X, dtype=float).reshape(len(X), -1)
+    n = len(X)
+    if not 0 < K <= n:
+        raise ValueError("K must be between 1 and the number of points.")
+    rng = np.random.default_rng(seed)
+    threshold = tol * np.mean(np.var(X, axis=0))
+    sq_norms = np.einsum("ij,ij->i", X, X)
+
+    def distances(points, points_sq_norms, centers):
+        return np.maximum(
+            points_sq_norms[:, None]
+            - 2 * points @ centers.T
+            + np.einsum("ij,ij->i", centers, centers)[None, :],
+            0.0,
+        )
+
+    best_labels, best_inertia = None, np.inf
+    for _ in range(n_init):
+        # k-means++ initialization.
+        centers = np.empty((K, X.shape[1]))
+        centers[0] = X[rng.integers(n)]
+        closest = distances(X, sq_norms, centers[:1])[:, 0]
+        for k in range(1, K):
+            total = closest.sum()
+            idx = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+            centers[k] = X[idx]
+            closest = np.minimum(
+                closest, distances(X, sq_norms, centers[k : k + 1])[:, 0]
+            )
+
+        counts = np.zeros(K)
+        for _ in range(max_iter):
+            batch = rng.choice(n, size=min(batch_size, n), replace=False)
+            labels = distances(X[batch], sq_norms[batch], centers).argmin(axis=1)
+            old_centers = centers.copy()
+            batch_counts = np.bincount(labels, minlength=K)
+            batch_sums = np.zeros_like(centers)
+            np.add.at(batch_sums, labels, X[batch])
+            counts += batch_counts
+            moved = batch_counts > 0
+            # Gradient step with learning rate 1 / count for every point of the batch.
+            centers[moved] += (
+                batch_sums[moved] - batch_counts[moved, None] * centers[moved]
+            ) / counts[moved, None]
+            if np.max(np.sum((centers - old_centers) ** 2, axis=1)) <= threshold:
+                break
+
+        dist = distances(X, sq_norms, centers)
+        labels = dist.argmin(axis=1)
+        inertia = dist[np.arange(n), labels].sum()
+        if inertia < best_inertia:
+            best_labels, best_inertia = labels, inertia
+
+    return best_labels
@@ -1,5 +1,6 @@
 import os
 import time
+from multiprocessing import Pool, cpu_count
 from typing import List, Optional, Tuple, Union
 
 import logging
@@ -15,6 +16,7 @@ from hypergraphx.linalg.linalg import binary_incidence_matrix, incidence_matrix
 DEFAULT_SEED = 10
 DEFAULT_INF = 1e10  # infinite initial value for the log-likelihood
 DEFAULT_EPS = 1e-20  # epsilon for numerical stability
+_U_UPDATES = ("gauss-seidel", "block", "jacobi")
 
 
 class HypergraphMT:
@@ -40,6 +42,9 @@ class HypergraphMT:
         tolerance: float = 0.1,
         threshold_for_convergence: int = 15,
         verbose: bool = True,
+        u_update: str = "gauss-seidel",
+        n_blocks: int = 32,
+        n_jobs: Optional[int] = 1,
     ) -> None:
         """Initialize the probabilistic model.
 
@@ -54,7 +59,25 @@ class HypergraphMT:
         tolerance: tolerance parameter for convergence of the log-likelihood.
         threshold_for_convergence: number of consecutive convergences for the EM to stop.
         verbose: flag to print details.
+        u_update: scheme for the update of the membership matrix u.
+            "gauss-seidel" updates one node at a time, in random order.
+            "block" splits the nodes in n_blocks random blocks, and updates all the nodes
+            of a block at once with vectorized operations.
+            "jacobi" updates all the nodes at once from the values of the previous
+            iteration.
+        n_blocks: number of blocks of nodes for u_update="block".
+        n_jobs: number of processes the realizations are run on. If None, all the
+            available cores are utilized. With n_jobs different from 1, the seeds of
+            the realizations are drawn before running them, hence they differ from the
+            ones of the sequential run.
         """
+        if u_update not in _U_UPDATES:
+            raise ValueError(
+                f"Unknown u_update {u_update!r}. Expected one of {_U_UPDATES}."
+            )
+        if n_blocks < 1:
+            raise ValueError("n_blocks must be a positive integer.")
+
         # Parameters related attributes.
         self.noise_input_par = noise_input_par
         self.min_value_par = min_value_par
@@ -67,6 +90,10 @@ class HypergraphMT:
         self.threshold_for_convergence = threshold_for_convergence
         # Attribute to print details.
         self.verbose = verbose
+        # Update scheme of u, and parallelization of the realizations.
+        self.u_update = u_update
+        self.n_blocks = n_blocks
+        self.n_jobs = n_jobs
 
         # Initial value for the maximum log-likelihood.
         self.maxL = -DEFAULT_INF
@@ -113,66 +140,32 @@ class HypergraphMT:
         train_info = []
         final_it, final_convergence = None, None
 
-        for r in range(self.n_realizations):
-            # Initialize psiOmega and psiBarOmega.
-            self._initialize_psiOmega()
-
-            # Initialize the membership matrix u and the affinity matrix w.
-            # For the first iteration, we initialize u around the solution of the Hypergraph Spectral Clustering.
-            # For the next ones, we initialize the parameters either randomly or
-            # around the input values chosen with "initialize_u0".
-            # In the end, we choose the realization with the best likelihood.
-            if r == 0:
-                self._initialize_u_w(
-                    hyperEdges=self.hyperEdges, baseline_HySC=self.baseline_r0
-                )
-            else:
-                self._initialize_u_w(hyperEdges=self.hyperEdges, baseline_HySC=False)
-
-            # First update of the matrices u, psiOmega and psiBarOmega.
-            self._initial_update_u_psi(r=r)
-            # Initialize the rho matrix that represents the variational distribution used in the EM routine.
-            self._update_rho()
-
-            if self.verbose:
-                _log(f"Updating realization {r} ...")
-            # Initial value for the log-likelihood.
-            loglik = -DEFAULT_INF
-            # Convergence local variables.
-            n_tolerance_reached = (
-                0  # number of consecutive times the tolerance is reached
-            )
-            converged = False  # flag for reached convergence
-            it = 0  # iteration
-
-            # EM routine.
-            while not converged and it < self.max_iter:
-                time_start = time.time()
-                # Train.
-                self._update_em()
-
-                # Check for convergence.
-                loglik, n_tolerance_reached, converged = self._check_for_convergence(
-                    it, loglik, n_tolerance_reached, converged
+        if self.n_jobs == 1:
+            results = []
+            for r in range(self.n_realizations):
+                results.append(self._fit_realization(r))
+                # Update seed.
+                self._set_seed(self.seed + self.prng.randint(1, 1e6))
+        else:
+            seeds = [self.seed]
+            for r in range(1, self.n_realizations):
+                seeds.append(seeds[-1] + self.prng.randint(1, 1e6))
+            with Pool(
+                processes=cpu_count() if self.n_jobs is None else self.n_jobs
+            ) as pool:
+                results = pool.map(
+                    _fit_realization, [(self, r, seed) for r, seed in enumerate(seeds)]
                 )
-                # Store training information.
-                runtime = time.time() - time_start
-                if not it % self.check_convergence_every:
-                    train_info.append((r, self.seed, it, loglik, runtime, converged))
-                it += 1
-
-            if self.verbose:
-                _log(f"N_real={r} -- num it={it} -- Loglikelihood:{loglik}")
+            self._set_seed(seeds[-1])
 
+        for loglik, it, converged, info, u, w in results:
+            train_info.extend(info)
             # Save parameters for the realization with the highest log-likelihood.
             if self.maxL < loglik:
-                self._update_optimal_parameters()
+                self.u_f, self.w_f = u, w
                 self.maxL = loglik
                 final_it = it
                 final_convergence = converged
-
-            # Update seed.
-            self._set_seed(self.seed + self.prng.randint(1, 1e6))
         # end cycle over realizations
 
         # Update DataFrame with training information.
@@ -196,6 +189,75 @@ class HypergraphMT:
 
         return self.u_f, self.w_f, self.maxL
 
+    def _fit_realization(
+        self, r: int
+    ) -> Tuple[float, int, bool, List[tuple], np.array, np.array]:
+        """Run the EM routine for the realization r.
+
+        Returns
+        -------
+        loglik: final log-likelihood value.
+        it: number of iterations.
+        converged: flag for reached convergence.
+        train_info: training information of the realization.
+        u: membership matrix.
+        w: affinity matrix.
+        """
+        train_info = []
+
+        # Initialize psiOmega and psiBarOmega.
+        self._initialize_psiOmega()
+
+        # Initialize the membership matrix u and the affinity matrix w.
+        # For the first iteration, we initialize u around the solution of the Hypergraph Spectral Clustering.
+        # For the next ones, we initialize the parameters either randomly or
+        # around the input values chosen with "initialize_u0".
+        # In the end, we choose the realization with the best likelihood.
+        if r == 0:
+            self._initialize_u_w(
+                hyperEdges=self.hyperEdges, baseline_HySC=self.baseline_r0
+            )
+        else:
+            self._initialize_u_w(hyperEdges=self.hyperEdges, baseline_HySC=False)
+
+        # First update of the matrices u, psiOmega and psiBarOmega.
+        if self.u_update == "gauss-seidel":
+            self._initial_update_u_psi(r=r)
+        else:
+            self._initial_update_u_psi_vectorized()
+        # Initialize the rho matrix that represents the variational distribution used in the EM routine.
+        self._update_rho()
+
+        if self.verbose:
+            _log(f"Updating realization {r} ...")
+        # Initial value for the log-likelihood.
+        loglik = -DEFAULT_INF
+        # Convergence local variables.
+        n_tolerance_reached = 0  # number of consecutive times the tolerance is reached
+        converged = False  # flag for reached convergence
+        it = 0  # iteration
+
+        # EM routine.
+        while not converged and it < self.max_iter:
+            time_start = time.time()
+            # Train.
+            self._update_em()
+
+            # Check for convergence.
+            loglik, n_tolerance_reached, converged = self._check_for_convergence(
+                it, loglik, n_tolerance_reached, converged
+            )
+            # Store training information.
+            runtime = time.time() - time_start
+            if not it % self.check_convergence_every:
+                train_info.append((r, self.seed, it, loglik, runtime, converged))
+            it += 1
+
+        if self.verbose:
+            _log(f"N_real={r} -- num it={it} -- Loglikelihood:{loglik}")
+
+        return loglik, it, converged, train_info, np.copy(self.u), np.copy(self.w)
+
     def _check_fit_params(
         self,
         hypergraph: Hypergraph,
@@ -602,7 +664,10 @@ class HypergraphMT:
             self._update_w()
             self._update_rho()
         if not self.fix_communities:
-            self._update_u()
+            if self.u_update == "gauss-seidel":
+                self._update_u()
+            else:
+                self._update_u_vectorized()
             self._update_rho()
 
     def _update_w(self) -> None:
@@ -655,12 +720,110 @@ class HypergraphMT:
                     high_values_indices = (
                         self.u[i] > self.max_value_par
                     )  # values are too high
-                    self.u[i][high_values_indices] = 1e2  # and set to 100.
+                    self.u[i][
+                        high_values_indices
+                    ] = self.max_value_par  # and set to max_value_par.
 
                     self._update_psiOmega(i=i, ks=ks)
             self.u_old[i] = np.copy(self.u[i])
             # dist_u = np.amax(abs(self.u - self.u_old))
 
+    def _initial_update_u_psi_vectorized(self) -> None:
+        """Vectorized version of _initial_update_u_psi.
+        The matrix psiOmega is computed from scratch from the initial u.
+        """
+        u = np.zeros((self.N, self.K))
+        u[self.non_isolates] = self.u0_current_real_t0[self.non_isolates]
+        row_sums = u.sum(axis=1)
+        u[row_sums > 0] /= row_sums[row_sums > 0, np.newaxis]
+        u[u < self.min_value_par] = 0.0
+
+        self.u = u
+        self.u_old = np.copy(u)
+        self.psiOmega = elementary_symmetric_polynomials(u, self.D)[1:]
+
+    def _update_u_vectorized(self) -> None:
+        """Update membership matrix u, updating groups of nodes at once.
+        With u_update="jacobi" all the nodes are updated simultaneously, with
+        u_update="block" the nodes are split in random blocks, updated one after the
+        other. The update of every node is the same as in _update_u, the difference
+        being that the nodes in the same group do not see each other's new values.
+        """
+        # The numerators only depend on rho, which is fixed during the update of u.
+        numerators = self.incidence @ self.rho
+
+        if self.u_update == "jacobi":
+            blocks = [np.arange(self.N)]
+        else:
+            perm = self.prng.permutation(self.N)
+            blocks = np.array_split(perm, min(self.n_blocks, self.N))
+
+        # Elementary symmetric polynomials, with the constant term. Recomputed from
+        # scratch at every sweep not to accumulate rounding errors.
+        psi = elementary_symmetric_polynomials(self.u, self.D)
+        for b, nodes in enumerate(blocks):
+            u_old = self.u[nodes]
+            u_new = self._update_u_nodes(nodes, numerators[nodes], psi[1:])
+            self.u[nodes] = u_new
+            if b < len(blocks) - 1:
+                # Replace the factors (1 + u_i t) of the block in the polynomials.
+                psi = _poly_multiply(
+                    _poly_divide(psi, elementary_symmetric_polynomials(u_old, self.D)),
+                    elementary_symmetric_polynomials(u_new, self.D),
+                )
+
+        self.psiOmega = elementary_symmetric_polynomials(self.u, self.D)[1:]
+        self.u_old = np.copy(self.u)
+
+    def _update_u_nodes(
+        self, nodes: np.array, numerators: np.array, psiOmega: np.array
+    ) -> np.array:
+        """New values of u for a group of nodes, computed from the same psiOmega.
+
+        Parameters
+        ----------
+        nodes: indices of the nodes.
+        numerators: array of shape (len(nodes), K), the numerators of the updates.
+        psiOmega: array of shape (D, K), the matrix psiOmega of the current u.
+
+        Returns
+        -------
+        The array of shape (len(nodes), K) with the updated memberships.
+        """
+        u = self.u[nodes]
+        # Only the communities with non-negligible membership are updated.
+        ks = u > self.min_value_par
+
+        # Denominators, sum over d of w[d] * psiBarOmega[d], with psiBarOmega computed
+        # for all the nodes at once with the same recursion of _update_psiBarOmega.
+        # Nodes for which psiBarOmega has significantly negative entries are skipped,
+        # as in _update_u.
+        den = np.full(u.shape, float(self.gammaU))
+        failed = np.zeros(len(nodes), dtype=bool)
+        psiBar = psiOmega[0] - u
+        for d in range(self.D - 1):
+            failed |= np.any(ks & (psiBar < -1e-3), axis=1)
+            den += self.w[d] * np.maximum(psiBar, 0.0)
+            psiBar = psiOmega[d + 1] - u * psiBar
+
+        num = np.where(ks, numerators, 0.0)
+        if self.normalizeU:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                num[num / den < self.min_value_par] = 0.0
+            lambdas = _lagrange_multipliers(num, den)
+            den = den + lambdas[:, np.newaxis]
+
+        updated = ~failed & ks.any(axis=1)
+        update = ks & updated[:, np.newaxis] & (den > 0)
+        u_new = np.copy(u)
+        u_new[update] = num[update] / den[update]
+        # Values too low are set to 0, values too high to max_value_par.
+        rows = u_new[updated]
+        rows[rows < self.min_value_par] = 0.0
+        rows[rows > self.max_value_par] = self.max_value_par
+        u_new[updated] = rows
+        return u_new
+
     @staticmethod
     def enforce_constraint_u(num: np.array, den: float) -> float:
         """Return the lagrangian multiplier to enforce the constraint on the matrix u.
@@ -747,11 +910,6 @@ class HypergraphMT:
         else:
             return loglik
 
-    def _update_optimal_parameters(self) -> None:
-        """Update values of the parameters after convergence."""
-        self.u_f = np.copy(self.u)
-        self.w_f = np.copy(self.w)
-
     def _output_results(self, it_of_convergence: Optional[int]) -> None:
         """Save the results in a .npz file.
 
@@ -773,6 +931,112 @@ class HypergraphMT:
         _log('To load: theta=np.load(filename), then e.g. theta["u"]')
 
 
+def _fit_realization(args) -> tuple:
+    """Run a single realization of HypergraphMT.fit in a worker process."""
+    model, r, seed = args
+    model._set_seed(seed)
+    return model._fit_realization(r)
+
+
+def elementary_symmetric_polynomials(u: np.array, D: int) -> np.array:
+    """Elementary symmetric polynomials of the columns of u, up to degree D.
+    Row d of the output contains, for every column k, the sum over all the subsets of
+    d rows of the product of their entries. Row 0 is constant and equal to 1.
+    They are the coefficients of prod_i (1 + u_ik t), which is computed by multiplying
+    pairs of polynomials, truncated to degree D, in a binary tree. For non-negative u,
+    all the summed terms are non-negative, hence no cancellation occurs.
+
+    Parameters
+    ----------
+    u: array of shape (N, K).
+    D: maximum degree.
+
+    Returns
+    -------
+    Array of shape (D+1, K).
+    """
+    N, K = u.shape
+    polys = np.zeros((max(N, 1), 2, K))
+    polys[:, 0] = 1.0
+    polys[:N, 1] = u
+    while len(polys) > 1:
+        if len(polys) % 2:
+            unit = np.zeros((1,) + polys.shape[1:])
+            unit[0, 0] = 1.0
+            polys = np.concatenate([polys, unit])
+        polys = _poly_multiply(polys[0::2], polys[1::2], D)
+
+    res = np.zeros((D + 1, K))
+    degree = min(polys.shape[1], D + 1)
+    res[:degree] = polys[0, :degree]
+    return res
+
+
+def _poly_multiply(p: np.array, q: np.array, D: Optional[int] = None) -> np.array:
+    """Product of polynomials, truncated to degree D.
+    The coefficients are along axis -2, the polynomials are batched along the other
+    axes. If D is None, the degree of p is kept.
+    """
+    Lp, Lq = p.shape[-2], q.shape[-2]
+    L = Lp if D is None else min(Lp + Lq - 1, D + 1)
+    shape = np.broadcast_shapes(p.shape[:-2], q.shape[:-2]) + (L, p.shape[-1])
+    res = np.zeros(shape)
+    for a in range(min(Lp, L)):
+        n = min(Lq, L - a)
+        res[..., a : a + n, :] += p[..., a : a + 1, :] * q[..., :n, :]
+    return res
+
+
+def _poly_divide(p: np.array, q: np.array) -> np.array:
+    """Quotient of the power series p / q, truncated to the degree of p.
+    The series q needs to have constant term equal to 1.
+    """
+    res = np.zeros_like(p)
+    for d in range(p.shape[-2]):
+        res[..., d, :] = p[..., d, :]
+        for j in range(1, min(d, q.shape[-2] - 1) + 1):
+            res[..., d, :] -= q[..., j, :] * res[..., d - j, :]
+    return res
+
+
+def _lagrange_multipliers(
+    num: np.array, den: np.array, max_iter: int = 100, tol: float = 1e-12
+) -> np.array:
+    """Vectorized version of enforce_constraint_u.
+    For every row i, find the lambda_i such that sum_k num_ik / (lambda_i + den_ik) = 1
+    and lambda_i + den_ik > 0 for the k with num_ik > 0. The function is convex and
+    decreasing in lambda_i, the root is found with a safeguarded Newton method.
+    Rows with all zero numerators get lambda_i = 0.
+    """
+    active = num > 0
+    rows = active.any(axis=1)
+    num, den, active = num[rows], den[rows], active[rows]
+
+    # Bracket of the root: the pole at -min(den), and a point where the function is
+    # non-positive.
+    min_den = np.where(active, den, np.inf).min(axis=1)
+    low = -min_den
+    high = num.sum(axis=1) - min_den
+    lam = high.copy()
+    for _ in range(max_iter):
+        shifted = np.where(active, lam[:, np.newaxis] + den, 1.0)
+        f = np.where(active, num / shifted, 0.0).sum(axis=1) - 1
+        df = -np.where(active, num / shifted**2, 0.0).sum(axis=1)
+        low = np.where(f > 0, lam, low)
+        high = np.where(f <= 0, lam, high)
+        newton = lam - f / df
+        inside = (newton > low) & (newton < high)
+        new_lam = np.where(inside, newton, 0.5 * (low + high))
+        converged = np.abs(new_lam - lam) <= tol * np.maximum(1.0, np.abs(lam))
+        lam = new_lam
+        if converged.all():
+            break
+
+    res = np.zeros(len(rows))
+    res[rows] = lam
+    return res
+
+
 def u0_w0_from_nparray(input_array: np.array) -> np.array:
     """Import an array."""
     return input_array
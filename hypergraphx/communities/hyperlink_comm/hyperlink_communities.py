@@ -1,16 +1,151 @@
+import heapq
 import logging
-import networkx as nx
+import os
+
 import numpy as np
 import scipy.spatial.distance as ssd
+from scipy import sparse
 from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.sparse.csgraph import minimum_spanning_tree
 
 from hypergraphx import Hypergraph
-from hypergraphx.measures.edge_similarity import jaccard_distance as jaccard
-from hypergraphx.readwrite.io_pickle import load_pickle, save_pickle
+from hypergraphx.linalg.linalg import binary_incidence_matrix
+
+METHODS = ("average", "sparse-average", "single")
+
+
+def hyperlink_distances(H: Hypergraph) -> sparse.csr_array:
+    """
+    Computes the Jaccard distances between the overlapping hyperedges
+
+    Only the pairs of hyperedges sharing at least one node are computed, from the
+    overlaps B^T B of the binary incidence matrix B. All the other pairs have distance 1.
+
+    Parameters
+    ----------
+    H : Hypergraph
+        The hypergraph of interest
+
+    Returns
+    -------
+    sparse.csr_array
+        Upper triangular E x E matrix, with the Jaccard distance of every pair of
+        overlapping hyperedges, indexed as in H.get_edges()
+    """
+    incidence = binary_incidence_matrix(H).astype(np.int64)
+    sizes = np.asarray(incidence.sum(axis=0)).ravel()
+    overlaps = sparse.triu(incidence.T @ incidence, k=1, format="coo")
+    rows, cols, common = overlaps.row, overlaps.col, overlaps.data
+    distances = 1 - common / (sizes[rows] + sizes[cols] - common)
+    return sparse.csr_array((distances, (rows, cols)), shape=(len(sizes), len(sizes)))
+
+
+def _load_distances(path):
+    file_name = "{}.hlcd.npz".format(path)
+    if not os.path.exists(file_name):
+        return None
+    return sparse.csr_array(sparse.load_npz(file_name))
+
+
+def _dense_average_linkage(distances):
+    X = np.ones(distances.shape)
+    coo = distances.tocoo()
+    X[coo.row, coo.col] = coo.data
+    X[coo.col, coo.row] = coo.data
+    np.fill_diagonal(X, 0.0)
+    return linkage(ssd.squareform(X), method="average")
+
+
+def _linkage_row(a, b, dist, size):
+    return [min(a, b), max(a, b), dist, size]
+
+
+def _merge_remaining(Z, roots, sizes, next_id):
+    # Clusters without overlapping hyperedges are merged at the maximum distance 1.
+    roots = sorted(roots)
+    current = roots[0]
+    for other in roots[1:]:
+        sizes[next_id] = sizes[current] + sizes[other]
+        Z.append(_linkage_row(current, other, 1.0, sizes[next_id]))
+        current = next_id
+        next_id += 1
+    return np.array(Z, dtype=float).reshape(-1, 4)
+
+
+def _single_linkage(distances):
+    """Single linkage from the minimum spanning tree of the sparse distance graph."""
+    n = distances.shape[0]
+    mst = minimum_spanning_tree(distances).tocoo()
+    order = np.argsort(mst.data, kind="stable")
+
+    parent = np.arange(2 * n - 1)
+    sizes = {i: 1 for i in range(n)}
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    Z = []
+    next_id = n
+    for k in order:
+        a, b = find(mst.row[k]), find(mst.col[k])
+        parent[a] = parent[b] = next_id
+        sizes[next_id] = sizes.pop(a) + sizes.pop(b)
+        Z.append(_linkage_row(a, b, mst.data[k], sizes[next_id]))
+        next_id += 1
+    return _merge_remaining(Z, list(sizes), sizes, next_id)
+
+
+def _sparse_average_linkage(distances):
+    """
+    Average linkage on the sparse distance graph.
+
+    Since the pairs of hyperedges that do not overlap have distance 1, the average
+    distance of two clusters A and B is 1 + S(A, B) / (|A| |B|), where S(A, B) is the
+    sum of d - 1 over the overlapping pairs between them. Only the pairs of clusters
+    with S != 0 are stored, and the closest pair is merged from a heap.
+    The result is the same as the dense average linkage, up to the order of ties.
+    """
+    n = distances.shape[0]
+    coo = distances.tocoo()
+    sizes = {i: 1 for i in range(n)}
+    neighbors = {i: {} for i in range(n)}
+    heap = []
+    for a, b, d in zip(coo.row.tolist(), coo.col.tolist(), coo.data.tolist()):
+        neighbors[a][b] = neighbors[b][a] = d - 1
+        heap.append((d, a, b))
+    heapq.heapify(heap)
+
+    Z = []
+    next_id = n
+    while heap:
+        dist, a, b = heapq.heappop(heap)
+        if a not in sizes or b not in sizes:
+            continue
+        c = next_id
+        next_id += 1
+        sizes[c] = sizes.pop(a) + sizes.pop(b)
+        Z.append(_linkage_row(a, b, dist, sizes[c]))
+
+        merged = neighbors.pop(a)
+        for k, s in neighbors.pop(b).items():
+            merged[k] = merged.get(k, 0.0) + s
+        merged.pop(a, None)
+        merged.pop(b, None)
+        neighbors[c] = merged
+        for k, s in merged.items():
+            neighbor = neighbors[k]
+            neighbor.pop(a, None)
+            neighbor.pop(b, None)
+            neighbor[c] = s
+            heapq.heappush(heap, (1 + s / (sizes[c] * sizes[k]), k, c))
+    return _merge_remaining(Z, list(sizes), sizes, next_id)
 
 
 def hyperlink_communities(
-    H: Hypergraph, load_distances=None, save_distances=None
+    H: Hypergraph, load_distances=None, save_distances=None, method: str = "average"
 ) -> np.ndarray:
     """
     Computes the dendrogram of the given hypergraph
@@ -22,7 +157,13 @@ def hyperlink_communities(
     load_distances : str
         The path to load the distances from
     save_distances : str
-        The path to save the distances to
+        The path to save the distances to. The distances of the overlapping
+        hyperedges are saved in sparse format, in the file save_distances.hlcd.npz
+    method : str
+        The linkage method. "average" runs the average linkage on the dense matrix of
+        distances, "sparse-average" computes the same dendrogram storing only the
+        distances of the overlapping hyperedges, "single" runs the single linkage on
+        the minimum spanning tree of the sparse distances.
 
     Returns
     -------
@@ -30,63 +171,33 @@ def hyperlink_communities(
         The dendrogram of the given hypergraph
 
     """
+    if method not in METHODS:
+        raise ValueError(
+            "Invalid method {}. Choose among {}.".format(method, ", ".join(METHODS))
+        )
     logger = logging.getLogger(__name__)
     logger.info("Hypergraph info - nodes: %s edges: %s", H.num_nodes(), H.num_edges())
     lcc = H.largest_component()
     H = H.subhypergraph(lcc)
-    h = H.get_edges()
     logger.info(
         "Subhypergraph info - nodes: %s edges: %s", H.num_nodes(), H.num_edges()
     )
 
-    adj = {}
-    edge_to_id = {}
-
-    cont = 0
-    for e in h:
-        e = tuple(sorted(e))
-        edge_to_id[e] = cont
-        for n in e:
-            if n not in adj:
-                adj[n] = []
-            adj[n].append(e)
-        cont += 1
-
     logger.info("Computing distances")
-
-    G = nx.Graph()
-    G.add_nodes_from([i for i in range(len(h))])
-
-    try:
-        X = load_pickle("{}.hlcd".format(load_distances))
-    except FileNotFoundError:
-        vis = {}
-        c = 0
-        for n in adj:
-            logger.info("Done %s of %s", c, len(adj))
-            for i in range(len(adj[n]) - 1):
-                for j in range(i + 1, len(adj[n])):
-                    k = tuple(sorted((edge_to_id[adj[n][i]], edge_to_id[adj[n][j]])))
-                    e_i = set(adj[n][i])
-                    e_j = set(adj[n][j])
-                    if k not in vis:
-                        w = jaccard(e_i, e_j)
-                        if w > 0:
-                            G.add_edge(
-                                edge_to_id[adj[n][i]], edge_to_id[adj[n][j]], weight=w
-                            )
-                        vis[k] = True
-            c += 1
-
-        X = nx.to_numpy_array(G, weight="weight", nonedge=1.0)
-        save_pickle(X, "{}.hlcd".format(save_distances))
-
+    distances = None
+    if load_distances is not None:
+        distances = _load_distances(load_distances)
+    if distances is None:
+        distances = hyperlink_distances(H)
+        if save_distances is not None:
+            sparse.save_npz("{}.hlcd.npz".format(save_distances), distances)
     logger.info("dist computed")
 
-    np.fill_diagonal(X, 0.0)
-    dist_matrix = ssd.squareform(X)
-    dendrogram = linkage(dist_matrix, method="average")
-    return dendrogram
+    if method == "average":
+        return _dense_average_linkage(distances)
+    if method == "single":
+        return _single_linkage(distances)
+    return _sparse_average_linkage(distances)
 
 
 def _cut_dendrogram(dendrogram, cut_height):
@@ -566,6 +566,39 @@ class BaseHypergraph(SerializationMixin):
             for edge in self._edge_list
         }
 
+    def incidence_arrays(self, node_order=None):
+        """Return the incidences of the nodes as aligned flat lists, for bulk
+        computations.
+
+        Every incidence of a node in a hyperedge gives one entry, node by node, for
+        every adjacency (e.g. as source and as target in directed hypergraphs).
+
+        Parameters
+        ----------
+        node_order : list, optional
+            Order of the nodes. Defaults to get_nodes().
+
+        Returns
+        -------
+        tuple
+            (positions, orders, weights): for every incidence, the position of the
+            node in node_order and the order and weight of the hyperedge.
+        """
+        if node_order is None:
+            node_order = self.get_nodes()
+        edge_orders = {
+            edge_id: self._edge_order(edge_key)
+            for edge_id, edge_key in self._reverse_edge_list.items()
+        }
+        positions, orders, weights = [], [], []
+        for adj in self._adjacency_maps().values():
+            for position, node in enumerate(node_order):
+                edge_ids = adj.get(node, ())
+                positions.extend([position] * len(edge_ids))
+                orders.extend(map(edge_orders.__getitem__, edge_ids))
+                weights.extend(map(self._weights.__getitem__, edge_ids))
+        return positions, orders, weights
+
     # Incidence helpers
     def _add_incidence(self, node, edge_id, edge_key):
         for adj in self._adjacency_maps().values():
@@ -666,6 +699,32 @@ class BaseHypergraph(SerializationMixin):
             del self._edge_metadata[edge_id]
         del self._edge_list[edge_key]
 
+    def _remove_edge_keys(self, edge_keys):
+        """Remove several edges, rebuilding each touched incidence list once."""
+        edge_keys = list(edge_keys)
+        seen = set()
+        for edge_key in edge_keys:
+            if edge_key not in self._edge_list or edge_key in seen:
+                raise MissingEdgeError(f"Edge {edge_key} not in hypergraph.")
+            seen.add(edge_key)
+        removed_ids = set()
+        touched = set()
+        for edge_key in edge_keys:
+            edge_id = self._edge_list.pop(edge_key)
+            removed_ids.add(edge_id)
+            touched.update(self._edge_nodes(edge_key))
+            del self._reverse_edge_list[edge_id]
+            self._weights.pop(edge_id, None)
+            self._edge_metadata.pop(edge_id, None)
+        for adj in self._adjacency_maps().values():
+            for node in touched:
+                if node in adj:
+                    adj[node] = [e for e in adj[node] if e not in removed_ids]
+        if self._incidences_metadata:
+            for key in list(self._incidences_metadata):
+                if key[0] in seen:
+                    del self._incidences_metadata[key]
+
     def _edge_exists(self, edge_key):
         return edge_key in self._edge_list
 
@@ -223,8 +223,7 @@ class Hypergraph(BaseHypergraph):
         ------
         KeyError
         """
-        for edge in edge_list:
-            self.remove_edge(edge)
+        self._remove_edge_keys(self._normalize_edge(edge) for edge in edge_list)
 
     def set_edge_list(self, edge_list):
         self._guard_unsafe_setter("Hypergraph.set_edge_list")
@@ -14,6 +14,24 @@ def simplicial_contagion(*args, **kwargs):
     return _impl(*args, **kwargs)
 
 
+def simplicial_contagion_batch(*args, **kwargs):
+    from hypergraphx.dynamics.contagion import simplicial_contagion_batch as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def higher_order_contagion(*args, **kwargs):
+    from hypergraphx.dynamics.epidemics import higher_order_contagion as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def contagion_sweep(*args, **kwargs):
+    from hypergraphx.dynamics.epidemics import contagion_sweep as _impl
+
+    return _impl(*args, **kwargs)
+
+
 def transition_matrix(*args, **kwargs):
     from hypergraphx.dynamics.randwalk import transition_matrix as _impl
 
@@ -26,6 +44,24 @@ def random_walk(*args, **kwargs):
     return _impl(*args, **kwargs)
 
 
+def random_walks(*args, **kwargs):
+    from hypergraphx.dynamics.randwalk import random_walks as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def hitting_times(*args, **kwargs):
+    from hypergraphx.dynamics.randwalk import hitting_times as _impl
+
+    return _impl(*args, **kwargs)
+
+
+def cover_times(*args, **kwargs):
+    from hypergraphx.dynamics.randwalk import cover_times as _impl
+
+    return _impl(*args, **kwargs)
+
+
 def RW_stationary_state(*args, **kwargs):
     from hypergraphx.dynamics.randwalk import RW_stationary_state as _impl
 
@@ -50,10 +86,25 @@ def higher_order_MSF(*args, **kwargs):
     return _impl(*args, **kwargs)
 
 
+def __getattr__(name: str):
+    if name == "TransitionOperator":
+        from hypergraphx.dynamics.randwalk import TransitionOperator as _cls
+
+        return _cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "simplicial_contagion",
+    "simplicial_contagion_batch",
+    "higher_order_contagion",
+    "contagion_sweep",
     "transition_matrix",
+    "TransitionOperator",
     "random_walk",
+    "random_walks",
+    "hitting_times",
+    "cover_times",
     "RW_stationary_state",
     "random_walk_density",
     "MSF",
@@ -1,4 +1,180 @@
 import numpy as np
+from scipy import sparse
+
+
+def _contagion_structure(hypergraph):
+    """
+    Precompute the arrays driving the simplicial contagion.
+
+    Returns the node list, the binary pairwise adjacency (CSR, one entry per
+    distinct neighbour, as ``get_neighbors(node, order=1)``) and, for each
+    corner of the 2-simplices, the ``(N, M)`` CSR matrix sending triangle
+    ``m`` to that corner together with the ``(M, 2)`` array of the two other
+    corners.
+    """
+    nodes = hypergraph.get_nodes()
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+
+    pairs = np.array(
+        [[index[u], index[v]] for u, v in hypergraph.get_edges(size=2)],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    rows = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    cols = np.concatenate([pairs[:, 1], pairs[:, 0]])
+    adjacency = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+    adjacency.sum_duplicates()
+    adjacency.data[:] = 1.0
+
+    triangles = np.array(
+        [[index[u] for u in edge] for edge in hypergraph.get_edges(size=3)],
+        dtype=np.int64,
+    ).reshape(-1, 3)
+    m = len(triangles)
+    corners = []
+    for c in range(3):
+        others = triangles[:, [j for j in range(3) if j != c]]
+        to_corner = sparse.csr_matrix(
+            (np.ones(m), (triangles[:, c], np.arange(m))), shape=(n, m)
+        )
+        corners.append((to_corner, others))
+    return nodes, adjacency, corners
+
+
+def _as_rates(value, n_realizations, name):
+    rates = np.broadcast_to(np.asarray(value, dtype=float), (n_realizations,))
+    if np.any((rates < 0) | (rates > 1)):
+        raise ValueError(f"{name} must be between 0 and 1.")
+    return rates[:, None]
+
+
+def _run_simplicial_contagion(adjacency, corners, state, T, beta, beta_D, mu, rng):
+    """Run the batched process from the boolean ``(R, N)`` state; return counts."""
+    R = state.shape[0]
+    counts = np.zeros((R, T))
+    counts[:, 0] = state.sum(axis=1)
+
+    for t in range(1, T):
+        if not state.any():
+            break
+        infected = state.astype(float)
+        # Number of infected pairwise neighbours and of fully infected
+        # 2-simplices seen by every node, for every realization at once.
+        k_pair = (adjacency @ infected.T).T
+        k_simplex = np.zeros_like(infected)
+        for to_corner, others in corners:
+            both = state[:, others[:, 0]] & state[:, others[:, 1]]
+            k_simplex += (to_corner @ both.T.astype(float)).T
+        p_infect = 1 - (1 - beta) ** k_pair * (1 - beta_D) ** k_simplex
+        draws = rng.random(state.shape)
+        state = np.where(state, draws >= mu, draws < p_infect)
+        counts[:, t] = state.sum(axis=1)
+    return counts
+
+
+def simplicial_contagion_batch(
+    hypergraph,
+    I_0,
+    T,
+    beta,
+    beta_D,
+    mu,
+    n_realizations=1,
+    *,
+    seed=None,
+    rng=None,
+):
+    """
+    Simulates several realizations of the simplicial contagion at once.
+
+    The dynamics are those of :func:`simplicial_contagion`: at each step a
+    susceptible node is infected by each infected neighbour with probability
+    beta and by each 2-simplex whose other two nodes are infected with
+    probability beta_D, while an infected node recovers with probability mu.
+    The states of all realizations are kept in an (R x N) boolean matrix and
+    updated with one vectorized Bernoulli draw per step, using pairwise and
+    triangle index arrays built once from the hypergraph.
+
+    Parameters
+    ----------
+    hypergraph : hypergraphx.Hypergraph
+        The hypergraph on which the contagion process is run.
+
+    I_0 : dictionary or array-like
+        The initial condition. Either a dictionary mapping nodes to 1
+        (infected) or 0, shared by all realizations, or an array of shape
+        (N,) or (R, N) with columns ordered as ``hypergraph.get_nodes()``.
+
+    T : int
+        The number of time steps.
+
+    beta : float or array-like
+        The infection rate, either shared or one value per realization.
+
+    beta_D : float or array-like
+        The three-body infection rate, either shared or one value per
+        realization.
+
+    mu : float or array-like
+        The recovery rate, either shared or one value per realization.
+
+    n_realizations : int, optional
+        The number of realizations R. Default is 1.
+
+    seed : int, optional (keyword-only)
+        Seed for reproducibility. Ignored if `rng` is provided.
+    rng : numpy.random.Generator, optional (keyword-only)
+        Random number generator to use.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (R, T) with the fraction of infected nodes at each time
+        step of each realization.
+
+    Examples
+    --------
+    Sweep beta_D on a grid, ten realizations per value:
+
+    >>> import numpy as np
+    >>> from hypergraphx import Hypergraph
+    >>> from hypergraphx.dynamics.contagion import simplicial_contagion_batch
+    >>> H = Hypergraph(edge_list=[(0, 1), (1, 2), (0, 1, 2)], weighted=False)
+    >>> beta_D = np.repeat([0.0, 0.5, 1.0], 10)
+    >>> rho = simplicial_contagion_batch(
+    ...     H, {0: 1, 1: 0, 2: 0}, T=5, beta=0.1, beta_D=beta_D, mu=0.1,
+    ...     n_realizations=len(beta_D), seed=0,
+    ... )
+    >>> rho.shape
+    (30, 5)
+    """
+    if rng is not None and seed is not None:
+        raise ValueError("Provide only one of seed= or rng=.")
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    if n_realizations < 1:
+        raise ValueError("n_realizations must be a positive integer.")
+
+    nodes, adjacency, corners = _contagion_structure(hypergraph)
+    N = len(nodes)
+    if isinstance(I_0, dict):
+        state = np.array([I_0[node] for node in nodes], dtype=bool)
+    else:
+        state = np.asarray(I_0).astype(bool)
+    if state.shape[-1] != N or state.ndim > 2:
+        raise ValueError("I_0 must have one entry per node.")
+    state = np.array(np.broadcast_to(state, (n_realizations, N)))
+
+    counts = _run_simplicial_contagion(
+        adjacency,
+        corners,
+        state,
+        T,
+        _as_rates(beta, n_realizations, "beta"),
+        _as_rates(beta_D, n_realizations, "beta_D"),
+        _as_rates(mu, n_realizations, "mu"),
+        rng,
+    )
+    return counts / N
 
 
 def simplicial_contagion(hypergraph, I_0, T, beta, beta_D, mu, *, seed=None, rng=None):
@@ -38,56 +214,25 @@ def simplicial_contagion(hypergraph, I_0, T, beta, beta_D, mu, *, seed=None, rng
     -------
     numpy.ndarray
         The fraction of infected nodes at each time step.
+
+    See Also
+    --------
+    simplicial_contagion_batch : Many realizations (or parameter values) at once.
     """
     if rng is not None and seed is not None:
         raise ValueError("Provide only one of seed= or rng=.")
     rng = rng if rng is not None else np.random.default_rng(seed)
 
-    numberInf = np.linspace(0, 0, T)
-    Infected = sum(I_0.values())
-    numberInf[0] = Infected
-    N = len(I_0)
-    nodes = hypergraph.get_nodes()
-    mapping = hypergraph.get_mapping()
-    I_old = I_0.copy()
-    t = 1
-
-    while Infected > 0 and t < T:
-        # I_new = np.copy(I_old)
-        I_new = I_old.copy()
-
-        # We run over the nodes
-        for node in nodes:
-            # if the node is susceptible, we run the infection process
-            if I_old[node] == 0:
-                # we first run the two-body infections
-                neighbors = hypergraph.get_neighbors(node, order=1)
-                for neigh in neighbors:
-                    if I_old[neigh] == 1 and rng.random() < beta:
-                        I_new[node] = 1
-                        break  # if the susceptile node gets infected, we stop iterating over its neighbors
-                if I_new[node] == 1:
-                    continue  # if the susceptile node is already infected, we don't run the three-body processes
-                # we run the three-body infections
-                triplets = hypergraph.get_incident_edges(node, order=2)
-                for triplet in triplets:
-                    neighbors = list(triplet)
-                    neighbors.remove(node)
-                    neigh1, neigh2 = tuple(neighbors)
-                    if (
-                        I_old[neigh1] == 1
-                        and I_old[neigh2] == 1
-                        and rng.random() < beta_D
-                    ):
-                        I_new[node] = 1
-                        break  # if the susceptile node gets infected, we stop iterating over the triplets
-            # if the node is infected, we run the recovery process
-            elif rng.random() < mu:
-                I_new[node] = 0
-
-        I_old = I_new.copy()
-        Infected = sum(I_new.values())
-        numberInf[t] = Infected
-        t = t + 1
-
-    return numberInf / N
+    nodes, adjacency, corners = _contagion_structure(hypergraph)
+    state = np.array([[I_0[node] for node in nodes]], dtype=bool)
+    counts = _run_simplicial_contagion(
+        adjacency,
+        corners,
+        state,
+        T,
+        _as_rates(beta, 1, "beta"),
+        _as_rates(beta_D, 1, "beta_D"),
+        _as_rates(mu, 1, "mu"),
+        rng,
+    )
+    return counts[0] / len(I_0)
@@ -0,0 +1,548 @@
+import math
+from multiprocessing import Pool, cpu_count
+
+import numpy as np
+from scipy import sparse
+
+from hypergraphx.core.temporal import TemporalHypergraph
+
+_SUSCEPTIBLE, _INFECTED, _RECOVERED = 0, 1, 2
+
+
+def _threshold_kernel(threshold):
+    def kernel(i, s):
+        needed = np.maximum(1, np.ceil(threshold * (s - 1)))
+        return (i >= needed).astype(float)
+
+    return kernel
+
+
+def _resolve_kernel(kernel, threshold, nu):
+    if callable(kernel):
+        return kernel
+    if kernel == "linear":
+        return lambda i, s: i.astype(float)
+    if kernel == "threshold":
+        if not (0 <= threshold <= 1):
+            raise ValueError("threshold must be between 0 and 1.")
+        return _threshold_kernel(threshold)
+    if kernel == "power":
+        return lambda i, s: i.astype(float) ** nu
+    raise ValueError(
+        "kernel must be 'linear', 'threshold', 'power' or a callable f(i, s)."
+    )
+
+
+class _Structure:
+    """
+    Array form of a (possibly temporal) hypergraph for the contagion engine.
+
+    Hyperedges are stored once, as CSR member lists, together with their
+    sizes and the node-to-hyperedge incidence. For temporal hypergraphs the
+    event times of each hyperedge are kept sorted in ``event_times`` /
+    ``event_edges``.
+    """
+
+    def __init__(self, hypergraph):
+        self.temporal = isinstance(hypergraph, TemporalHypergraph)
+        self.nodes = hypergraph.get_nodes()
+        index = {node: i for i, node in enumerate(self.nodes)}
+
+        edge_index = {}
+        times, occurrences = [], []
+        for edge in hypergraph.get_edges():
+            if self.temporal:
+                time, edge = edge
+                times.append(time)
+            key = tuple(index[node] for node in edge)
+            occurrences.append(edge_index.setdefault(key, len(edge_index)))
+        members = list(edge_index)
+
+        self.sizes = np.fromiter(map(len, members), dtype=np.int64, count=len(members))
+        self.edge_ptr = np.concatenate([[0], np.cumsum(self.sizes)])
+        self.edge_nodes = np.fromiter(
+            (node for edge in members for node in edge),
+            dtype=np.int64,
+            count=int(self.edge_ptr[-1]),
+        )
+        n, m = len(self.nodes), len(members)
+        edge_of = np.repeat(np.arange(m), self.sizes)
+        self.incidence = sparse.csr_matrix(
+            (np.ones(len(edge_of)), (self.edge_nodes, edge_of)), shape=(n, m)
+        )
+        self.node_edges = [[] for _ in range(n)]
+        for e, node in zip(edge_of.tolist(), self.edge_nodes.tolist()):
+            self.node_edges[node].append(e)
+
+        if self.temporal:
+            order = np.argsort(times, kind="stable")
+            self.event_times = np.asarray(times, dtype=float)[order]
+            self.event_edges = np.asarray(occurrences, dtype=np.int64)[order]
+            self.start = float(self.event_times[0]) if len(order) else 0.0
+        else:
+            self.start = 0.0
+
+    def initial_state(self, I_0):
+        state = np.zeros(len(self.nodes), dtype=np.int8)
+        for i, node in enumerate(self.nodes):
+            if I_0.get(node, 0):
+                state[i] = _INFECTED
+        return state
+
+    def lookup_tables(self, infection_rate, kernel, discrete):
+        """
+        Tabulate the kernel as an ``(s_max + 1, s_max + 1)`` array indexed by
+        ``[size, infected members]``.
+
+        In discrete mode the entries are the log-probabilities of *not*
+        being infected through a hyperedge, ``f(i, s) log(1 - lambda_s)``;
+        otherwise they are the per-susceptible rates ``lambda_s f(i, s)``.
+        """
+        s_max = int(self.sizes.max()) if len(self.sizes) else 1
+        table = np.zeros((s_max + 1, s_max + 1))
+        for s in range(2, s_max + 1):
+            if isinstance(infection_rate, dict):
+                rate = float(infection_rate.get(s, 0.0))
+            else:
+                rate = float(infection_rate)
+            if rate < 0 or (discrete and rate > 1):
+                raise ValueError(
+                    "infection_rate must be a probability in discrete mode "
+                    "and non-negative in gillespie mode."
+                )
+            i = np.arange(s)
+            f = np.asarray(kernel(i, np.full(s, s)), dtype=float)
+            if np.any(f < 0):
+                raise ValueError("The infection kernel must be non-negative.")
+            f[0] = 0.0
+            if discrete:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    table[s, :s] = np.where(f > 0, f * np.log1p(-rate), 0.0)
+            else:
+                table[s, :s] = rate * f
+        return table
+
+
+def _discrete_run(structure, state, T, table, recovery_rate, sir, dt, rng):
+    n = len(state)
+    incidence = structure.incidence
+    incidence_t = incidence.T.tocsr()
+    sizes = structure.sizes
+    active = np.ones(len(sizes))
+    times = structure.start + dt * np.arange(T)
+    infected = np.zeros(T)
+    recovered = np.zeros(T)
+    infected[0] = np.count_nonzero(state == _INFECTED)
+    recovered[0] = np.count_nonzero(state == _RECOVERED)
+
+    for t in range(1, T):
+        if infected[t - 1] == 0:
+            recovered[t:] = recovered[t - 1]
+            break
+        if structure.temporal:
+            lo, hi = np.searchsorted(
+                structure.event_times, [times[t - 1], times[t - 1] + dt]
+            )
+            active = np.zeros(len(sizes))
+            active[structure.event_edges[lo:hi]] = 1.0
+        is_infected = state == _INFECTED
+        infected_members = (incidence_t @ is_infected.astype(float)).astype(np.int64)
+        # Masking instead of multiplying by active avoids 0 * -inf when the rate is 1
+        log_escape = incidence @ np.where(
+            active > 0, table[sizes, infected_members], 0.0
+        )
+        draws = rng.random(n)
+        new_state = state.copy()
+        new_state[(state == _SUSCEPTIBLE) & (draws < -np.expm1(log_escape))] = _INFECTED
+        new_state[is_infected & (draws < recovery_rate)] = (
+            _RECOVERED if sir else _SUSCEPTIBLE
+        )
+        state = new_state
+        infected[t] = np.count_nonzero(state == _INFECTED)
+        recovered[t] = np.count_nonzero(state == _RECOVERED)
+    return times, infected, recovered
+
+
+class _RateTree:
+    """Binary sum tree over hyperedge rates: O(log M) update and sampling."""
+
+    def __init__(self, m):
+        size = 1
+        while size < max(m, 1):
+            size *= 2
+        self._size = size
+        self._tree = [0.0] * (2 * size)
+
+    def total(self):
+        return self._tree[1]
+
+    def update(self, i, value):
+        tree = self._tree
+        i += self._size
+        tree[i] = value
+        i //= 2
+        while i:
+            tree[i] = tree[2 * i] + tree[2 * i + 1]
+            i //= 2
+
+    def sample(self, u):
+        tree = self._tree
+        i = 1
+        while i < self._size:
+            left = tree[2 * i]
+            if u < left or tree[2 * i + 1] == 0.0:
+                i = 2 * i
+            else:
+                u -= left
+                i = 2 * i + 1
+        return i - self._size
+
+
+def _gillespie_run(structure, state, T, table, recovery_rate, sir, duration, rng):
+    state = state.tolist()
+    sizes = structure.sizes.tolist()
+    ptr = structure.edge_ptr.tolist()
+    edge_nodes = structure.edge_nodes.tolist()
+    node_edges = structure.node_edges
+    rates = table.tolist()
+    m = len(sizes)
+
+    infected_members = [0] * m
+    susceptible_members = [0] * m
+    for e in range(m):
+        for node in edge_nodes[ptr[e] : ptr[e + 1]]:
+            if state[node] == _INFECTED:
+                infected_members[e] += 1
+            elif state[node] == _SUSCEPTIBLE:
+                susceptible_members[e] += 1
+
+    # Temporal hyperedges are switched on at each event time and off
+    # ``duration`` later; overlapping activations are counted.
+    if structure.temporal:
+        on_times = structure.event_times
+        switches = np.concatenate([on_times, on_times + duration])
+        deltas = np.concatenate(
+            [np.ones(len(on_times), dtype=np.int64), -np.ones(len(on_times), np.int64)]
+        )
+        edges = np.concatenate([structure.event_edges, structure.event_edges])
+        order = np.lexsort((deltas, switches))
+        switches = list(zip(switches[order], edges[order], deltas[order]))
+        active = [0] * m
+    else:
+        switches = []
+        active = [1] * m
+
+    tree = _RateTree(m)
+
+    def refresh(e):
+        rate = 0.0
+        if active[e] > 0:
+            rate = susceptible_members[e] * rates[sizes[e]][infected_members[e]]
+        tree.update(e, rate)
+
+    for e in range(m):
+        refresh(e)
+
+    infected_nodes = [i for i, x in enumerate(state) if x == _INFECTED]
+    position = {node: k for k, node in enumerate(infected_nodes)}
+    n_recovered = sum(1 for x in state if x == _RECOVERED)
+
+    t = structure.start
+    end = structure.start + T
+    times, infected, recovered = [t], [len(infected_nodes)], [n_recovered]
+    k = 0
+    while infected_nodes:
+        infection_total = tree.total()
+        recovery_total = recovery_rate * len(infected_nodes)
+        total = infection_total + recovery_total
+        t_next = t + rng.exponential(1.0 / total) if total > 0 else math.inf
+        if k < len(switches) and switches[k][0] <= t_next:
+            t = float(switches[k][0])
+            if t >= end:
+                break
+            _, e, delta = switches[k]
+            active[e] += int(delta)
+            refresh(int(e))
+            k += 1
+            continue
+        if t_next >= end:
+            break
+        t = t_next
+
+        if rng.random() * total < recovery_total:
+            node = infected_nodes[rng.integers(len(infected_nodes))]
+            last = infected_nodes.pop()
+            if last != node:
+                infected_nodes[position[node]] = last
+                position[last] = position[node]
+            del position[node]
+            state[node] = _RECOVERED if sir else _SUSCEPTIBLE
+            n_recovered += sir
+            for e in node_edges[node]:
+                infected_members[e] -= 1
+                susceptible_members[e] += not sir
+                refresh(e)
+        else:
+            e = tree.sample(rng.random() * infection_total)
+            candidates = [
+                node
+                for node in edge_nodes[ptr[e] : ptr[e + 1]]
+                if state[node] == _SUSCEPTIBLE
+            ]
+            node = candidates[rng.integers(len(candidates))]
+            state[node] = _INFECTED
+            position[node] = len(infected_nodes)
+            infected_nodes.append(node)
+            for f in node_edges[node]:
+                infected_members[f] += 1
+                susceptible_members[f] -= 1
+                refresh(f)
+
+        times.append(t)
+        infected.append(len(infected_nodes))
+        recovered.append(n_recovered)
+
+    times.append(end)
+    infected.append(len(infected_nodes))
+    recovered.append(n_recovered)
+    return np.asarray(times), np.asarray(infected, float), np.asarray(recovered, float)
+
+
+def _simulate(
+    structure,
+    I_0,
+    T,
+    infection_rate,
+    recovery_rate,
+    model,
+    kernel,
+    threshold,
+    nu,
+    mode,
+    dt,
+    rng,
+):
+    if model not in ("SIS", "SIR"):
+        raise ValueError("model must be either 'SIS' or 'SIR'.")
+    if mode not in ("discrete", "gillespie"):
+        raise ValueError("mode must be either 'discrete' or 'gillespie'.")
+    if recovery_rate < 0 or (mode == "discrete" and recovery_rate > 1):
+        raise ValueError(
+            "recovery_rate must be a probability in discrete mode "
+            "and non-negative in gillespie mode."
+        )
+    if dt <= 0:
+        raise ValueError("dt must be positive.")
+
+    kernel = _resolve_kernel(kernel, threshold, nu)
+    discrete = mode == "discrete"
+    table = structure.lookup_tables(infection_rate, kernel, discrete)
+    state = structure.initial_state(I_0)
+    run = _discrete_run if discrete else _gillespie_run
+    times, infected, recovered = run(
+        structure, state, T, table, recovery_rate, model == "SIR", dt, rng
+    )
+    n = len(structure.nodes)
+    return times, infected / n, recovered / n
+
+
+def higher_order_contagion(
+    hypergraph,
+    I_0,
+    T,
+    infection_rate,
+    recovery_rate,
+    *,
+    model="SIS",
+    kernel="linear",
+    threshold=0.5,
+    nu=2.0,
+    mode="discrete",
+    dt=1.0,
+    seed=None,
+    rng=None,
+):
+    """
+    Simulates an SIS or SIR process driven by hyperedges of any size.
+
+    A susceptible node in a hyperedge of size s with i infected members is
+    infected through it at rate ``infection_rate[s] * f(i, s)``, where f is
+    the infection kernel; infected nodes recover at rate ``recovery_rate``.
+
+    With ``mode="discrete"`` all nodes are updated synchronously at each of
+    the T steps: a susceptible node escapes a hyperedge with probability
+    ``(1 - infection_rate[s]) ** f(i, s)`` and an infected node recovers with
+    probability ``recovery_rate``. With ``mode="gillespie"`` the process is
+    simulated exactly in continuous time up to time T, sampling infection
+    events from a sum tree of hyperedge rates that is updated incrementally
+    after each event.
+
+    For a ``TemporalHypergraph`` a hyperedge is switched on at each of its
+    event times, for a window of length ``dt``, and the clock starts at the
+    first event time.
+
+    Parameters
+    ----------
+    hypergraph : Hypergraph or TemporalHypergraph
+        The hypergraph on which the process is run.
+    I_0 : dict
+        The initial condition: nodes mapped to 1 are infected, all others
+        susceptible.
+    T : int or float
+        The number of time steps (discrete mode) or the final time
+        (gillespie mode).
+    infection_rate : float or dict
+        The infection rate, shared by all sizes or given per hyperedge size
+        (missing sizes do not transmit). A probability in discrete mode.
+    recovery_rate : float
+        The recovery rate. A probability in discrete mode.
+    model : {"SIS", "SIR"}, optional (keyword-only)
+        Whether recovered nodes become susceptible again or are removed.
+    kernel : {"linear", "threshold", "power"} or callable, optional (keyword-only)
+        The infection kernel f(i, s): i itself, 1 when at least a fraction
+        ``threshold`` of the other s - 1 members is infected, ``i ** nu``,
+        or a callable evaluated on integer arrays i and s.
+    threshold : float, optional (keyword-only)
+        Fraction of infected members used by the threshold kernel.
+    nu : float, optional (keyword-only)
+        Exponent used by the power kernel.
+    mode : {"discrete", "gillespie"}, optional (keyword-only)
+        The simulation scheme.
+    dt : float, optional (keyword-only)
+        Length of a discrete step and of the activation window of temporal
+        hyperedge events.
+    seed : int, optional (keyword-only)
+        Seed for reproducibility. Ignored if `rng` is provided.
+    rng : numpy.random.Generator, optional (keyword-only)
+        Random number generator to use.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The times and the fractions of infected and recovered nodes at those
+        times. In gillespie mode the times are those of the events, closed by
+        a final entry at the end of the simulation.
+
+    Examples
+    --------
+    >>> from hypergraphx import Hypergraph
+    >>> from hypergraphx.dynamics.epidemics import higher_order_contagion
+    >>> H = Hypergraph(edge_list=[(0, 1), (1, 2, 3)], weighted=False)
+    >>> t, I, R = higher_order_contagion(
+    ...     H, {0: 1}, T=5, infection_rate=0.5, recovery_rate=0.1, seed=0
+    ... )
+    >>> len(t) == len(I) == 5
+    True
+    """
+    if rng is not None and seed is not None:
+        raise ValueError("Provide only one of seed= or rng=.")
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    return _simulate(
+        _Structure(hypergraph),
+        I_0,
+        T,
+        infection_rate,
+        recovery_rate,
+        model,
+        kernel,
+        threshold,
+        nu,
+        mode,
+        dt,
+        rng,
+    )
+
+
+_worker_structure = None
+
+
+def _init_worker(structure):
+    global _worker_structure
+    _worker_structure = structure
+
+
+def _sweep_task(args):
+    params, seed_seq = args
+    return _simulate(_worker_structure, rng=np.random.default_rng(seed_seq), **params)
+
+
+def contagion_sweep(
+    hypergraph,
+    I_0,
+    T,
+    param_grid,
+    n_realizations=1,
+    n_jobs: int | None = None,
+    *,
+    seed=None,
+    **kwargs,
+):
+    """
+    Runs :func:`higher_order_contagion` over a grid of parameters in parallel.
+
+    The hypergraph is converted to arrays once and shared with the worker
+    processes; every (parameter set, realization) pair gets an independent
+    random stream spawned from ``seed``.
+
+    Parameters
+    ----------
+    hypergraph : Hypergraph or TemporalHypergraph
+        The hypergraph on which the process is run.
+    I_0 : dict
+        The initial condition shared by all runs.
+    T : int or float
+        The number of time steps or the final time.
+    param_grid : list of dict
+        Keyword arguments of :func:`higher_order_contagion` for each point
+        of the sweep, e.g. ``{"infection_rate": 0.1, "recovery_rate": 0.2}``.
+    n_realizations : int, optional
+        Number of independent runs per parameter set. Default is 1.
+    n_jobs : int, optional
+        Number of worker processes. Defaults to ``cpu_count()``; 1 runs the
+        sweep in the current process.
+    seed : int, optional (keyword-only)
+        Seed for reproducibility.
+    **kwargs
+        Keyword arguments shared by all runs (e.g. ``model`` or ``mode``).
+        A callable ``kernel`` must be picklable when ``n_jobs != 1``.
+
+    Returns
+    -------
+    list of list of tuple
+        For each parameter set, the ``(times, infected, recovered)`` output
+        of each realization.
+    """
+    defaults = {
+        "model": "SIS",
+        "kernel": "linear",
+        "threshold": 0.5,
+        "nu": 2.0,
+        "mode": "discrete",
+        "dt": 1.0,
+    }
+    tasks = []
+    for point in param_grid:
+        params = {**defaults, **kwargs, **point, "I_0": I_0, "T": T}
+        tasks.append(params)
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks) * n_realizations)
+    jobs = [
+        (params, seeds[k * n_realizations + r])
+        for k, params in enumerate(tasks)
+        for r in range(n_realizations)
+    ]
+
+    structure = _Structure(hypergraph)
+    if n_jobs == 1:
+        _init_worker(structure)
+        results = list(map(_sweep_task, jobs))
+    else:
+        with Pool(
+            processes=cpu_count() if n_jobs is None else n_jobs,
+            initializer=_init_worker,
+            initargs=(structure,),
+        ) as p:
+            results = p.map(_sweep_task, jobs)
+    return [
+        results[k * n_realizations : (k + 1) * n_realizations]
+        for k in range(len(tasks))
+    ]
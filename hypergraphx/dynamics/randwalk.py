@@ -1,16 +1,254 @@
+from collections import Counter
+
 import numpy as np
 from scipy import sparse
+from scipy.sparse import linalg as splinalg
 
 from hypergraphx import Hypergraph
 
 
-def transition_matrix(HG: Hypergraph) -> sparse.spmatrix:
-    """Compute the transition matrix of the random walk on the hypergraph.
+class TransitionOperator:
+    """Transition operator of a random walk on a hypergraph.
+
+    The operator is built once from the binary incidence matrix B and kept in
+    factored form, P = D^-1 (B G Gamma^T - S), where G holds per-hyperedge
+    factors, Gamma the vertex weights inside each hyperedge, S the removed
+    self-loops and D the normalisation. It can be applied to vectors without
+    forming the N x N matrix, materialised on demand, and sampled from in two
+    stages (node -> hyperedge -> node). Every walk function in this module
+    accepts a ``TransitionOperator`` in place of the hypergraph.
 
     Parameters
     ----------
     HG : Hypergraph
         The hypergraph on which the random walk is defined.
+    kernel : str, optional
+        The walk kernel:
+
+        - ``"carletti"`` (default): a hyperedge of size s contributes s - 1
+          to every pair of its nodes, without self-loops [1];
+        - ``"uniform"``: pick an incident hyperedge, then one of its nodes,
+          uniformly;
+        - ``"edge_dependent"``: pick an incident hyperedge, then a node with
+          probability proportional to its vertex weight in that hyperedge [2].
+    weighted : bool, optional (keyword-only)
+        If True, hyperedges are chosen proportionally to their weights.
+    vertex_weights : str or sparse matrix, optional (keyword-only)
+        For the ``"edge_dependent"`` kernel: either the incidence-metadata
+        field holding the weight of each node in each hyperedge (missing
+        entries count as 1), or an (N x E) matrix aligned with
+        ``HG.binary_incidence_matrix()``.
+    laziness : float, optional (keyword-only)
+        Probability of staying put at each step.
+    teleport : float, optional (keyword-only)
+        Probability of jumping to a uniformly random node at each step.
+
+    References
+    ----------
+    [1] Timoteo Carletti, Federico Battiston, Giulia Cencetti, and Duccio Fanelli, Random walks on hypergraphs, Phys. Rev. E 96, 012308 (2017)
+    [2] Uthsav Chitra and Benjamin Raphael, Random walks on hypergraphs with edge-dependent vertex weights, ICML (2019)
+    """
+
+    KERNELS = ("carletti", "uniform", "edge_dependent")
+
+    def __init__(
+        self,
+        HG: Hypergraph,
+        kernel: str = "carletti",
+        *,
+        weighted: bool = False,
+        vertex_weights="weight",
+        laziness: float = 0.0,
+        teleport: float = 0.0,
+    ):
+        if kernel not in self.KERNELS:
+            raise ValueError(f"kernel must be one of {', '.join(self.KERNELS)}.")
+        if not (0 <= laziness < 1):
+            raise ValueError("laziness must be in [0, 1).")
+        if not (0 <= teleport <= 1):
+            raise ValueError("teleport must be between 0 and 1.")
+        if not HG.is_connected():
+            raise ValueError("The hypergraph is not connected")
+
+        B, self.mapping = HG.binary_incidence_matrix(return_mapping=True)
+        edges = HG.get_edges()
+        if len(edges) == 0:
+            raise ValueError("Cannot compute a random walk on an empty hypergraph.")
+        B = sparse.csr_matrix(B, dtype=float)
+        sizes = np.asarray([len(e) for e in edges], dtype=float)
+        w = np.ones(len(edges))
+        if weighted:
+            w = np.asarray([HG.get_weight(e) for e in edges], dtype=float)
+
+        self.kernel = kernel
+        self.laziness = float(laziness)
+        self.teleport = float(teleport)
+        self.exclude_self = kernel == "carletti"
+        if kernel == "carletti":
+            gamma = B
+            self.factor = w * (sizes - 1)
+            self.self_loops = B @ self.factor
+            first_stage = self.factor * (sizes - 1)
+        elif kernel == "uniform":
+            gamma = B
+            self.factor = w / sizes
+            self.self_loops = np.zeros(B.shape[0])
+            first_stage = w
+        else:
+            gamma = self._vertex_weight_matrix(
+                HG, B, edges, self.mapping, vertex_weights
+            )
+            delta = np.asarray(gamma.sum(axis=0)).ravel()
+            if np.any(delta <= 0):
+                raise ValueError("Every hyperedge needs a positive vertex weight.")
+            self.factor = w / delta
+            self.self_loops = np.zeros(B.shape[0])
+            first_stage = w
+
+        self.degree = B @ first_stage
+        if np.any(self.degree == 0):
+            # This can happen with isolated nodes (or empty edges), which contradicts connectivity anyway.
+            raise ValueError(
+                "Random-walk transition undefined: a node has no outgoing probability mass."
+            )
+        self.B = B
+        self.gamma = sparse.csr_matrix(gamma)
+        self._first_stage = B @ sparse.diags(first_stage, format="csr")
+        self._sparse = None
+        self._sampler = None
+
+    @staticmethod
+    def _vertex_weight_matrix(HG, B, edges, mapping, vertex_weights):
+        if isinstance(vertex_weights, str):
+            node_to_idx = {node: idx for idx, node in mapping.items()}
+            rows, cols, vals = [], [], []
+            incidences = HG.get_all_incidences_metadata()
+            for j, edge in enumerate(edges):
+                for node in edge:
+                    meta = incidences.get((edge, node), {})
+                    rows.append(node_to_idx[node])
+                    cols.append(j)
+                    vals.append(float(meta.get(vertex_weights, 1.0)))
+            gamma = sparse.csr_matrix((vals, (rows, cols)), shape=B.shape)
+        else:
+            gamma = sparse.csr_matrix(vertex_weights, dtype=float)
+            if gamma.shape != B.shape:
+                raise ValueError(
+                    "vertex_weights must have the shape of the incidence matrix."
+                )
+        if gamma.nnz and gamma.data.min() < 0:
+            raise ValueError("vertex_weights must be non-negative.")
+        outside = gamma - gamma.multiply(B)
+        outside.eliminate_zeros()
+        if outside.nnz:
+            raise ValueError("vertex_weights must vanish outside the hyperedges.")
+        return gamma
+
+    @property
+    def shape(self):
+        n = self.B.shape[0]
+        return (n, n)
+
+    @property
+    def reversible(self):
+        """Whether pi is proportional to ``degree`` (detailed balance holds)."""
+        return self.kernel in ("carletti", "uniform") and self.teleport == 0
+
+    def matvec(self, y):
+        """Return P @ y for a vector or an (N, k) block of vectors."""
+        y = np.asarray(y, dtype=float)
+        column = (-1,) + (1,) * (y.ndim - 1)
+        walked = self.B @ (self.factor.reshape(column) * (self.gamma.T @ y))
+        if self.exclude_self:
+            walked = walked - self.self_loops.reshape(column) * y
+        walked = walked / self.degree.reshape(column)
+        if self.teleport:
+            walked = (1 - self.teleport) * walked + self.teleport * y.mean(axis=0)
+        if self.laziness:
+            walked = self.laziness * y + (1 - self.laziness) * walked
+        return walked
+
+    def rmatvec(self, x):
+        """Return x @ P for a row vector or a (k, N) block of row vectors."""
+        x = np.asarray(x, dtype=float)
+        scaled = x / self.degree
+        per_edge = self.B.T @ scaled.T
+        per_edge = per_edge * self.factor.reshape((-1,) + (1,) * (x.ndim - 1))
+        walked = (self.gamma @ per_edge).T
+        if self.exclude_self:
+            walked = walked - scaled * self.self_loops
+        if self.teleport:
+            mass = x.sum(axis=-1, keepdims=True) / self.shape[0]
+            walked = (1 - self.teleport) * walked + self.teleport * mass
+        if self.laziness:
+            walked = self.laziness * x + (1 - self.laziness) * walked
+        return walked
+
+    def as_linear_operator(self):
+        """Return the operator as a ``scipy.sparse.linalg.LinearOperator``."""
+        return splinalg.LinearOperator(
+            self.shape, matvec=self.matvec, rmatvec=self.rmatvec, dtype=float
+        )
+
+    def to_sparse(self) -> sparse.csr_matrix:
+        """Materialise (and cache) the transition matrix as a CSR matrix."""
+        if self.teleport:
+            raise ValueError(
+                "A teleporting walk has a dense transition matrix; use matvec or rmatvec."
+            )
+        if self._sparse is None:
+            M = (
+                self.B @ sparse.diags(self.factor, format="csr") @ self.gamma.T
+            ).tocsr()
+            if self.exclude_self:
+                M.setdiag(0)
+                M.eliminate_zeros()
+            P = (sparse.diags(1.0 / self.degree, format="csr") @ M).tocsr()
+            if self.laziness:
+                P = (
+                    self.laziness * sparse.identity(P.shape[0], format="csr")
+                    + (1 - self.laziness) * P
+                ).tocsr()
+            self._sparse = P
+        return self._sparse
+
+    def step(self, current, rng):
+        """Move every walker in ``current`` (node indices) by one step."""
+        if self._sampler is None:
+            self._sampler = (
+                _CSRSampler(self._first_stage),
+                _CSRSampler(self.gamma.T.tocsr()),
+            )
+        to_edge, to_node = self._sampler
+        edges = to_edge.step(current, rng)
+        nxt = to_node.step(edges, rng)
+        if self.exclude_self:
+            # Redraw the node inside the same hyperedge until it differs.
+            redo = np.flatnonzero(nxt == current)
+            while len(redo):
+                nxt[redo] = to_node.step(edges[redo], rng)
+                redo = redo[nxt[redo] == current[redo]]
+        if self.teleport or self.laziness:
+            u = rng.random(len(current))
+            stay = u < self.laziness
+            jump = ~stay & (u < self.laziness + (1 - self.laziness) * self.teleport)
+            nxt[jump] = rng.integers(self.shape[0], size=int(jump.sum()))
+            nxt[stay] = current[stay]
+        return nxt
+
+
+def _as_operator(HG) -> TransitionOperator:
+    return HG if isinstance(HG, TransitionOperator) else TransitionOperator(HG)
+
+
+def transition_matrix(HG: Hypergraph) -> sparse.spmatrix:
+    """Compute the transition matrix of the random walk on the hypergraph.
+
+    Parameters
+    ----------
+    HG : Hypergraph or TransitionOperator
+        The hypergraph on which the random walk is defined, or a prebuilt
+        operator (e.g. with another kernel).
 
     Returns
     -------
@@ -22,38 +260,7 @@ def transition_matrix(HG: Hypergraph) -> sparse.spmatrix:
     ----------
     [1] Timoteo Carletti, Federico Battiston, Giulia Cencetti, and Duccio Fanelli, Random walks on hypergraphs, Phys. Rev. E 96, 012308 (2017)
     """
-    if not HG.is_connected():
-        raise ValueError("The hypergraph is not connected")
-
-    # Build a sparse transition matrix using the binary incidence matrix B.
-    # For each hyperedge e of size s, contribute (s-1) to every off-diagonal pair in e.
-    # This corresponds to: M = B * diag(s_e - 1) * B^T, then zero the diagonal, then row-normalize.
-    B, idx_to_node = HG.binary_incidence_matrix(return_mapping=True)
-    _ = idx_to_node  # mapping is relevant for callers; matrix is in index space.
-
-    edges = HG.get_edges()
-    if len(edges) == 0:
-        raise ValueError("Cannot compute a random walk on an empty hypergraph.")
-
-    w = np.asarray([len(e) - 1 for e in edges], dtype=float)
-    if np.any(w < 0):
-        raise ValueError("Invalid hyperedge size encountered.")
-
-    M = B @ sparse.diags(w, offsets=0, format="csr") @ B.T
-    M = M.tocsr()
-    M.setdiag(0)
-    M.eliminate_zeros()
-
-    row_sums = np.asarray(M.sum(axis=1)).ravel()
-    if np.any(row_sums == 0):
-        # This can happen with isolated nodes (or empty edges), which contradicts connectivity anyway.
-        raise ValueError(
-            "Random-walk transition undefined: a node has no outgoing probability mass."
-        )
-
-    inv_row = sparse.diags(1.0 / row_sums, offsets=0, format="csr")
-    T = (inv_row @ M).tocsr()
-    return T
+    return _as_operator(HG).to_sparse()
 
 
 def random_walk(
@@ -68,7 +275,7 @@ def random_walk(
 
     Parameters
     ----------
-    HG : Hypergraph
+    HG : Hypergraph or TransitionOperator
         The hypergraph on which the random walk is defined.
     s : int
         The starting node of the random walk.
@@ -95,42 +302,302 @@ def _random_walk_impl(
     seed: int | None = None,
     rng: np.random.Generator | None = None,
 ) -> list:
+    walks, mapping = random_walks(
+        HG, [s], time, seed=seed, rng=rng, return_mapping=True
+    )
+    return [mapping[i] for i in walks[0].tolist()]
+
+
+class _CSRSampler:
+    """
+    Inverse-CDF sampler drawing one column per requested row of a CSR matrix.
+
+    The cumulative weights of every row are stored once in ``cdf``; each
+    step draws one uniform per row request and locates it within its row
+    by a binary search run on all requests simultaneously.
+    """
+
+    def __init__(self, P):
+        P = P.tocsr()
+        self.indptr = P.indptr.astype(np.int64)
+        self.indices = P.indices.astype(np.int64)
+        lengths = np.diff(self.indptr)
+        cdf = np.cumsum(P.data, dtype=float)
+        before = np.concatenate([[0.0], cdf])[self.indptr[:-1]]
+        cdf -= np.repeat(before, lengths)
+        # Renormalise each row so its last entry is exactly 1.
+        last = self.indptr[1:] - 1
+        nonempty = lengths > 0
+        totals = np.ones(len(lengths))
+        totals[nonempty] = cdf[last[nonempty]]
+        cdf /= np.repeat(totals, lengths)
+        cdf[last[nonempty]] = 1.0
+        self.cdf = cdf
+        self.empty = ~nonempty
+        self.n_rounds = int(np.ceil(np.log2(max(lengths.max(initial=1), 1)))) + 1
+
+    def step(self, current, rng):
+        lo = self.indptr[current]
+        hi = self.indptr[current + 1] - 1
+        u = rng.random(len(current))
+        for _ in range(self.n_rounds):
+            mid = (lo + hi) // 2
+            right = self.cdf[mid] <= u
+            lo = np.where(right, mid + 1, lo)
+            hi = np.where(right, hi, mid)
+        nxt = self.indices[np.minimum(lo, len(self.indices) - 1)]
+        return np.where(self.empty[current], current, nxt)
+
+
+def _walk_setup(HG, starts, seed, rng):
     if rng is not None and seed is not None:
         raise ValueError("Provide only one of seed= or rng=.")
     rng = rng if rng is not None else np.random.default_rng(seed)
+    op = _as_operator(HG)
+    node_to_idx = {node: idx for idx, node in op.mapping.items()}
+    try:
+        current = np.array([node_to_idx[s] for s in starts], dtype=np.int64)
+    except KeyError:
+        raise ValueError("Starting node is not in the hypergraph.") from None
+    return op, current, op.mapping, node_to_idx, rng
+
+
+def random_walks(
+    HG: Hypergraph,
+    starts,
+    time: int,
+    *,
+    seed: int | None = None,
+    rng: np.random.Generator | None = None,
+    return_mapping: bool = False,
+):
+    """Run an ensemble of independent random walks on the hypergraph.
+
+    All walkers are advanced together, one vectorized draw per step.
+
+    Parameters
+    ----------
+    HG : Hypergraph or TransitionOperator
+        The hypergraph on which the random walk is defined.
+    starts : list
+        The starting node of each of the W walkers.
+    time : int
+        The number of steps of each walk.
+    seed : int, optional (keyword-only)
+        Seed for reproducibility (does not touch global RNG state).
+    rng : numpy.random.Generator, optional (keyword-only)
+        Random number generator to use. If provided, `seed` must be None.
+    return_mapping : bool, optional (keyword-only)
+        If True, also return the dictionary mapping node indices to nodes.
+
+    Returns
+    -------
+    walks : np.ndarray
+        Array of shape (W, time + 1) with the node index of each walker at
+        each step, starting position included.
+    mapping : dict
+        The index-to-node mapping, if `return_mapping` is True.
+    """
     if time < 0:
         raise ValueError("time must be non-negative.")
+    sampler, current, mapping, _, rng = _walk_setup(HG, starts, seed, rng)
+    walks = np.empty((len(current), time + 1), dtype=np.int64)
+    walks[:, 0] = current
+    for t in range(1, time + 1):
+        current = sampler.step(current, rng)
+        walks[:, t] = current
+    if return_mapping:
+        return walks, mapping
+    return walks
+
+
+def _first_passage(sampler, current, max_time, rng, done, update=None):
+    """Step walkers until ``done(walker_ids, positions)`` holds; -1 if never."""
+    times = np.full(len(current), -1, dtype=np.int64)
+    alive = np.arange(len(current))
+    finished = done(alive, current)
+    times[finished] = 0
+    alive, current = alive[~finished], current[~finished]
+    for t in range(1, max_time + 1):
+        if len(alive) == 0:
+            break
+        current = sampler.step(current, rng)
+        if update is not None:
+            update(alive, current)
+        finished = done(alive, current)
+        times[alive[finished]] = t
+        alive, current = alive[~finished], current[~finished]
+    return times
 
-    T, mapping = HG.binary_incidence_matrix(return_mapping=True)
-    node_to_idx = {node: idx for idx, node in mapping.items()}
-    if s not in node_to_idx:
-        raise ValueError("Starting node is not in the hypergraph.")
-    start_idx = node_to_idx[s]
 
-    P = transition_matrix(HG).tocsr()
-    path_idx = [start_idx]
-    for _ in range(time):
-        cur = path_idx[-1]
-        row = P.getrow(cur)
-        if row.nnz == 0:
-            # This should not happen for connected hypergraphs, but keep a safe fallback.
-            path_idx.append(cur)
-            continue
-        next_idx = int(rng.choice(row.indices, p=row.data))
-        path_idx.append(next_idx)
+def hitting_times(
+    HG: Hypergraph,
+    starts,
+    targets,
+    max_time: int,
+    *,
+    seed: int | None = None,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Compute the first time each random walker reaches a set of target nodes.
+
+    Walkers are simulated together and dropped as soon as they hit a target,
+    without storing their paths.
+
+    Parameters
+    ----------
+    HG : Hypergraph or TransitionOperator
+        The hypergraph on which the random walk is defined.
+    starts : list
+        The starting node of each walker.
+    targets : list
+        The target nodes.
+    max_time : int
+        The maximum number of steps.
+    seed : int, optional (keyword-only)
+        Seed for reproducibility.
+    rng : numpy.random.Generator, optional (keyword-only)
+        Random number generator to use. If provided, `seed` must be None.
+
+    Returns
+    -------
+    np.ndarray
+        The hitting time of each walker, -1 if no target was reached within
+        `max_time` steps.
+    """
+    if max_time < 0:
+        raise ValueError("max_time must be non-negative.")
+    sampler, current, _, node_to_idx, rng = _walk_setup(HG, starts, seed, rng)
+    is_target = np.zeros(len(node_to_idx), dtype=bool)
+    try:
+        is_target[[node_to_idx[node] for node in targets]] = True
+    except KeyError:
+        raise ValueError("Target node is not in the hypergraph.") from None
+    return _first_passage(
+        sampler, current, max_time, rng, lambda _, pos: is_target[pos]
+    )
+
+
+def cover_times(
+    HG: Hypergraph,
+    starts,
+    max_time: int,
+    *,
+    seed: int | None = None,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Compute the time each random walker takes to visit every node.
+
+    Parameters
+    ----------
+    HG : Hypergraph or TransitionOperator
+        The hypergraph on which the random walk is defined.
+    starts : list
+        The starting node of each walker.
+    max_time : int
+        The maximum number of steps.
+    seed : int, optional (keyword-only)
+        Seed for reproducibility.
+    rng : numpy.random.Generator, optional (keyword-only)
+        Random number generator to use. If provided, `seed` must be None.
+
+    Returns
+    -------
+    np.ndarray
+        The cover time of each walker, -1 if some node was still unvisited
+        after `max_time` steps.
+    """
+    if max_time < 0:
+        raise ValueError("max_time must be non-negative.")
+    sampler, current, _, node_to_idx, rng = _walk_setup(HG, starts, seed, rng)
+    n = len(node_to_idx)
+    visited = np.zeros((len(current), n), dtype=bool)
+    visited[np.arange(len(current)), current] = True
+    unvisited = np.full(len(current), n - 1, dtype=np.int64)
+
+    def update(walkers, positions):
+        new = ~visited[walkers, positions]
+        visited[walkers[new], positions[new]] = True
+        unvisited[walkers[new]] -= 1
+
+    return _first_passage(
+        sampler,
+        current,
+        max_time,
+        rng,
+        lambda walkers, _: unvisited[walkers] == 0,
+        update,
+    )
+
+
+_STATIONARY_METHODS = ("closed_form", "solve", "gmres", "eigs", "power")
+
+# Above this size the "solve" method switches from a sparse LU factorisation
+# to GMRES: on well-mixed hypergraphs the LU fill-in grows quickly, while
+# GMRES only needs matrix-vector products.
+_DIRECT_SOLVE_MAX_NODES = 2_000
+
+
+def _stationary_system(P):
+    # pi (P - I) = 0 with pi_0 fixed to 1: drop the first equation and move
+    # the first unknown to the right-hand side (no dense normalisation row).
+    n = P.shape[0]
+    A = (P.T - sparse.identity(n, format="csr")).tocsc()
+    return A[1:, 1:], -A[1:, 0].toarray().ravel()
+
+
+def _stationary_direct(P):
+    A, b = _stationary_system(P)
+    return np.concatenate([[1.0], splinalg.spsolve(A, b)])
 
-    return [mapping[i] for i in path_idx]
+
+def _stationary_gmres(op, tol, max_iter):
+    # Same pinned system as _stationary_system, applied matrix-free.
+    n = op.shape[0]
+
+    def apply(x):
+        z = np.concatenate([[0.0], x])
+        return (op.rmatvec(z) - z)[1:]
+
+    A = splinalg.LinearOperator((n - 1, n - 1), matvec=apply, dtype=float)
+    e0 = np.zeros(n)
+    e0[0] = 1.0
+    b = -op.rmatvec(e0)[1:]
+    rest, info = splinalg.gmres(A, b, x0=np.ones(n - 1), rtol=tol, maxiter=max_iter)
+    if info != 0:
+        raise RuntimeError("GMRES did not converge to the stationary distribution.")
+    return np.concatenate([[1.0], rest])
 
 
 def RW_stationary_state(
-    HG: Hypergraph, *, tol: float = 1e-12, max_iter: int = 10000
+    HG: Hypergraph,
+    *,
+    tol: float = 1e-12,
+    max_iter: int = 10000,
+    method: str = "closed_form",
 ) -> np.ndarray:
     """Compute the stationary state of the random walk on the hypergraph.
 
     Parameters
     ----------
-    HG : Hypergraph
+    HG : Hypergraph or TransitionOperator
         The hypergraph on which the random walk is defined.
+    tol : float, optional (keyword-only)
+        Tolerance of the iterative methods.
+    max_iter : int, optional (keyword-only)
+        Maximum number of iterations of the iterative methods.
+    method : str, optional (keyword-only)
+        How to compute the stationary state:
+
+        - ``"closed_form"`` (default): for reversible walks, the stationary
+          state is proportional to the projected weighted degree
+          sum_{e : i in e} (|e| - 1)^2 (``TransitionOperator.degree`` for
+          other reversible kernels). Other walks fall back to ``"solve"``;
+        - ``"solve"``: sparse direct solve of pi (P - I) = 0 with sum(pi) = 1,
+          switching to GMRES for very large hypergraphs;
+        - ``"gmres"``: the same linear system solved with GMRES;
+        - ``"eigs"``: leading eigenvector of P^T via ARPACK;
+        - ``"power"``: power iteration pi_{k+1} = pi_k P.
 
     Returns
     -------
@@ -141,19 +608,41 @@ def RW_stationary_state(
         raise ValueError("tol must be positive.")
     if max_iter <= 0:
         raise ValueError("max_iter must be positive.")
-
-    P = transition_matrix(HG).tocsr()
-    n = P.shape[0]
-    pi = np.full(n, 1.0 / n, dtype=float)
-
-    # Power iteration on row-stochastic P: pi_{k+1} = pi_k P.
-    for _ in range(max_iter):
-        pi_next = pi @ P
-        # L1 distance is natural for distributions.
-        if np.linalg.norm(pi_next - pi, ord=1) < tol:
+    if method not in _STATIONARY_METHODS:
+        raise ValueError(f"method must be one of {', '.join(_STATIONARY_METHODS)}.")
+
+    op = _as_operator(HG)
+    n = op.shape[0]
+    if method == "closed_form" and not op.reversible:
+        # No closed form without detailed balance: solve the linear system instead.
+        method = "solve"
+    if method == "closed_form":
+        pi = op.degree
+    elif method == "gmres" or (
+        method == "solve" and (n > _DIRECT_SOLVE_MAX_NODES or op.teleport)
+    ):
+        pi = _stationary_gmres(op, tol, max_iter)
+    elif method == "solve":
+        pi = _stationary_direct(op.to_sparse())
+    elif method == "eigs" and n > 2:
+        PT = splinalg.LinearOperator(op.shape, matvec=op.rmatvec, dtype=float)
+        _, vecs = splinalg.eigs(
+            PT, k=1, which="LR", tol=tol, maxiter=max_iter, v0=np.ones(n)
+        )
+        pi = np.abs(np.real(vecs[:, 0]))
+    elif method == "eigs":
+        vals, vecs = np.linalg.eig(op.rmatvec(np.eye(n)).T)
+        pi = np.abs(np.real(vecs[:, np.argmax(np.real(vals))]))
+    else:
+        pi = np.full(n, 1.0 / n, dtype=float)
+        # Power iteration on row-stochastic P: pi_{k+1} = pi_k P.
+        for _ in range(max_iter):
+            pi_next = op.rmatvec(pi)
+            # L1 distance is natural for distributions.
+            if np.linalg.norm(pi_next - pi, ord=1) < tol:
+                pi = pi_next
+                break
             pi = pi_next
-            break
-        pi = pi_next
 
     total = pi.sum()
     if total == 0 or not np.isfinite(total):
@@ -162,30 +651,78 @@ def RW_stationary_state(
     return np.asarray(pi).ravel()
 
 
-def random_walk_density(HG: Hypergraph, s: np.ndarray, time: int) -> list:
+def _in_checkpoint_order(steps, checkpoints):
+    """Yield the densities of ``steps`` (in time order) in the order of
+    ``checkpoints``, keeping only those that are still to be yielded."""
+    remaining = Counter(checkpoints)
+    pending = {}
+    position = 0
+    for t, density in steps:
+        pending[t] = density
+        while position < len(checkpoints) and checkpoints[position] in pending:
+            t = checkpoints[position]
+            position += 1
+            yield pending[t]
+            remaining[t] -= 1
+            if remaining[t] == 0:
+                del pending[t]
+
+
+def _density_steps(op, density, time, checkpoints):
+    wanted = None if checkpoints is None else set(checkpoints)
+    last = time if wanted is None else max(wanted, default=-1)
+    for t in range(last + 1):
+        if t > 0:
+            density = op.rmatvec(density)
+        if wanted is None or t in wanted:
+            yield t, np.asarray(density)
+
+
+def random_walk_density(
+    HG: Hypergraph,
+    s: np.ndarray,
+    time: int,
+    *,
+    checkpoints=None,
+    stream: bool = False,
+):
     """Compute the random walk on the hypergraph with starting density vector.
 
     Parameters
     ----------
-    HG : Hypergraph
+    HG : Hypergraph or TransitionOperator
         The hypergraph on which the random walk is defined.
     s : np.ndarray
-        The starting density vector of the random walk.
+        The starting density vector of the random walk, or a (k, N) array of
+        k starting densities evolved together.
+    time : int
+        The number of steps.
+    checkpoints : list of int, optional (keyword-only)
+        If given, only the densities at these times are kept, in the given
+        order, also when streaming.
+    stream : bool, optional (keyword-only)
+        If True, return a generator yielding the densities one step (or one
+        checkpoint) at a time instead of a list.
 
     Returns
     -------
     nodes : list
-        The list of density vectors over time.
+        The list of density vectors over time (or at the checkpoints). For
+        a batch of starting densities each element is a (k, N) array.
     """
-    if not np.isclose(np.sum(s), 1):
+    starting_density = np.asarray(s, dtype=float)
+    if not np.allclose(np.sum(starting_density, axis=-1), 1):
         raise ValueError("The vector is not a probability density")
     if time < 0:
         raise ValueError("time must be non-negative.")
-
-    P = transition_matrix(HG).tocsr()
-    starting_density = np.asarray(s, dtype=float)
-    density_list = [starting_density]
-    for _ in range(time):
-        starting_density = starting_density @ P
-        density_list.append(np.asarray(starting_density).ravel())
-    return density_list
+    if checkpoints is not None:
+        checkpoints = [int(t) for t in checkpoints]
+        if any(t < 0 or t > time for t in checkpoints):
+            raise ValueError("checkpoints must be between 0 and time.")
+
+    steps = _density_steps(_as_operator(HG), starting_density, time, checkpoints)
+    if checkpoints is None:
+        densities = (density for _, density in steps)
+    else:
+        densities = _in_checkpoint_order(steps, checkpoints)
+    return densities if stream else list(densities)
@@ -1,15 +1,19 @@
 import logging
+from multiprocessing import Pool, cpu_count
+
 import numpy as np
-from scipy.integrate import solve_ivp
 from scipy.linalg import eigh
+from scipy.sparse.linalg import eigsh
 
 from hypergraphx.dynamics.utils import (
+    AllToAllCoupling,
+    integrate_final_state,
     is_all_to_all,
     is_natural_coupling,
     sprott_algorithm,
-    sprott_algorithm_multi,
+    sprott_algorithm_batched,
 )
-from hypergraphx.linalg.linalg import compute_multiorder_laplacian
+from hypergraphx.linalg.linalg import multiorder_laplacian_operator
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,46 @@ def _log(*args, **kwargs):
     logger.info(message)
 
 
+def _sprott_chunk(args):
+    alphas, C, F, JF, JH, Y0, params, integration_time, batched, verbose = args
+    if batched:
+        return sprott_algorithm_batched(
+            alphas, C, F, JF, JH, Y0, params, integration_time, verbose
+        )
+    values = np.zeros(len(alphas))
+    for i, alpha in enumerate(alphas):
+        if verbose:
+            _log("alpha = " + str(alpha))
+        # Every alpha starts from the same perturbation (sprott_algorithm
+        # overwrites the perturbation part of Y0 in place).
+        values[i] = sprott_algorithm(
+            alpha, C, F, JF, JH, np.array(Y0), params, integration_time, None, verbose
+        )
+    return values
+
+
+def _msf_sweep(
+    interval, C, F, JF, JH, Y0, params, integration_time, verbose, n_jobs, batched
+):
+    """Evaluate the MSF over ``interval``, serially or split across a process pool."""
+    alphas = np.asarray(interval, dtype=float)
+    if n_jobs == 1:
+        return _sprott_chunk(
+            (alphas, C, F, JF, JH, Y0, params, integration_time, batched, verbose)
+        )
+    processes = cpu_count() if n_jobs is None else n_jobs
+    chunks = [c for c in np.array_split(alphas, processes) if len(c)]
+    with Pool(processes=processes) as p:
+        values = p.map(
+            _sprott_chunk,
+            [
+                (c, C, F, JF, JH, Y0, params, integration_time, batched, False)
+                for c in chunks
+            ],
+        )
+    return np.concatenate(values) if values else np.zeros(0)
+
+
 def MSF(
     F,
     JF,
@@ -33,6 +77,8 @@ def MSF(
     *,
     seed: int | None = None,
     rng: np.random.Generator | None = None,
+    n_jobs: int | None = 1,
+    batched: bool = False,
 ):
     """
     Evaluates the Master Stability Function
@@ -52,8 +98,14 @@ def MSF(
     X0: initial condition of the isolated system.
         It is a list-like object containg the initial conditions.
     integration_time: time over which the system is integrated.
-    integration_step: step of the integrating function.
+    integration_step: kept for backwards compatibility.
+        Only final states are computed, so it no longer has any effect.
     C: number of cycles of the Sprott's algorithm.
+    n_jobs: number of worker processes over which the values of alpha are split.
+        Defaults to 1 (serial); None uses `cpu_count()`. F, JF and the coupling
+        Jacobians must be picklable (e.g. module-level functions) when n_jobs != 1.
+    batched: if True, integrate all the values of alpha handled by a process in a single
+        vectorized variational system instead of one integration per value.
 
     Returns
     -------
@@ -66,15 +118,7 @@ def MSF(
     # Here we make sure to be on the system attractor
     if verbose:
         _log("Getting to the attractor...")
-    sol = solve_ivp(
-        fun=F,
-        t_span=[0.0, integration_time],
-        t_eval=np.arange(0.0, integration_time, integration_step),
-        y0=X0,
-        args=params,
-        method="LSODA",
-    )
-    X0 = sol.y[:, -1]
+    X0 = integrate_final_state(F, X0, integration_time, params)
 
     # Integrating the dynamics of the perturbation using Sprott's algorithm
     dim = len(X0)
@@ -84,24 +128,19 @@ def MSF(
 
     if verbose:
         _log("Evaluating the Master Stability Function...")
-    MSF = np.zeros(shape=len(interval))
-    for i, alpha in enumerate(interval):
-        if verbose:
-            _log("alpha = " + str(alpha))
-        MSF[i] = sprott_algorithm(
-            alpha,
-            C,
-            F,
-            JF,
-            JH,
-            Y0,
-            params,
-            integration_time / C,
-            integration_step,
-            verbose,
-        )
-
-    return MSF
+    return _msf_sweep(
+        interval,
+        C,
+        F,
+        JF,
+        JH,
+        Y0,
+        params,
+        integration_time / C,
+        verbose,
+        n_jobs,
+        batched,
+    )
 
 
 def MSF_multi_coupling(
@@ -120,6 +159,8 @@ def MSF_multi_coupling(
     *,
     seed: int | None = None,
     rng: np.random.Generator | None = None,
+    n_jobs: int | None = 1,
+    batched: bool = False,
 ):
     """
     Evaluates the Master Stability Function for the higher-order all-to-all network
@@ -142,8 +183,14 @@ def MSF_multi_coupling(
     X0: initial condition of the isolated system.
         It is a list-like object containg the initial conditions.
     integration_time: time over which the system is integrated.
-    integration_step: step of the integrating function.
+    integration_step: kept for backwards compatibility.
+        Only final states are computed, so it no longer has any effect.
     C: number of cycles of the Sprott's algorithm.
+    n_jobs: number of worker processes over which the values of alpha are split.
+        Defaults to 1 (serial); None uses `cpu_count()`. F, JF and the coupling
+        Jacobians must be picklable (e.g. module-level functions) when n_jobs != 1.
+    batched: if True, integrate all the values of alpha handled by a process in a single
+        vectorized variational system instead of one integration per value.
 
     Returns
     -------
@@ -156,15 +203,7 @@ def MSF_multi_coupling(
     # Here we make sure to be on the system attractor
     if verbose:
         _log("Getting to the attractor...")
-    sol = solve_ivp(
-        fun=F,
-        t_span=[0.0, integration_time],
-        t_eval=np.arange(0.0, integration_time, integration_step),
-        y0=X0,
-        args=params,
-        method="LSODA",
-    )
-    X0 = sol.y[:, -1]
+    X0 = integrate_final_state(F, X0, integration_time, params)
 
     # Integrating the dynamics of the perturbation using Sprott's algorithm
     dim = len(X0)
@@ -174,27 +213,21 @@ def MSF_multi_coupling(
 
     if verbose:
         _log("Evaluating the Master Stability Function...")
-    MSF = np.zeros(shape=len(interval))
-    for i, alpha in enumerate(interval):
-        if verbose:
-            _log("alpha = " + str(alpha))
-        MSF[i] = sprott_algorithm_multi(
-            alpha,
-            C,
-            F,
-            JF,
-            sigmas,
-            N,
-            JHs,
-            Y0,
-            params,
-            True,
-            integration_time / C,
-            integration_step,
-            verbose,
-        )
-
-    return MSF
+    # The all-to-all system is the single-coupling one with an effective
+    # coupling Jacobian, so it shares the sweep (and the batched integrator).
+    return _msf_sweep(
+        interval,
+        C,
+        F,
+        JF,
+        AllToAllCoupling(sigmas, N, JHs),
+        Y0,
+        params,
+        integration_time / C,
+        verbose,
+        n_jobs,
+        batched,
+    )
 
 
 def higher_order_MSF(
@@ -215,6 +248,9 @@ def higher_order_MSF(
     *,
     seed: int | None = None,
     rng: np.random.Generator | None = None,
+    n_jobs: int | None = 1,
+    batched: bool = False,
+    n_eigenvalues: int | None = None,
 ):
     N = hypergraph.num_nodes()
     if rng is not None and seed is not None:
@@ -224,10 +260,25 @@ def higher_order_MSF(
     # If the coupling is natural, we evaluate a single-parameter MSF for this scenario
     natural_coupling = is_natural_coupling(JHs, dim, verbose, rng=rng)
     if natural_coupling and diffusive_like:
-        multiorder_laplacian = compute_multiorder_laplacian(
+        multiorder_laplacian = multiorder_laplacian_operator(
             hypergraph, sigmas, order_weighted=True, degree_weighted=False
         )
-        spectrum = eigh(multiorder_laplacian.toarray(), eigvals_only=True)
+        if n_eigenvalues is None:
+            spectrum = eigh(
+                multiorder_laplacian.tosparse().toarray(), eigvals_only=True
+            )
+        else:
+            # Only the extremes of the spectrum, from both ends, without building the
+            # Laplacian
+            spectrum = np.sort(
+                eigsh(
+                    multiorder_laplacian,
+                    k=n_eigenvalues,
+                    which="BE",
+                    v0=rng.random(multiorder_laplacian.shape[0]),
+                    return_eigenvectors=False,
+                )
+            )
 
         if verbose:
             _log("Starting the evaluation of the Master Stability Function...")
@@ -243,6 +294,8 @@ def higher_order_MSF(
             C,
             verbose,
             rng=rng,
+            n_jobs=n_jobs,
+            batched=batched,
         )
 
         if verbose:
@@ -261,6 +314,8 @@ def higher_order_MSF(
             C,
             verbose,
             rng=rng,
+            n_jobs=n_jobs,
+            batched=batched,
         )
 
         return master_stability_function, hon_master_stability_function, spectrum
@@ -283,6 +338,8 @@ def higher_order_MSF(
             C,
             verbose,
             rng=rng,
+            n_jobs=n_jobs,
+            batched=batched,
         )
 
         hon_master_stability_function = MSF_multi_coupling(
@@ -299,6 +356,8 @@ def higher_order_MSF(
             C,
             verbose,
             rng=rng,
+            n_jobs=n_jobs,
+            batched=batched,
         )
 
         return master_stability_function, hon_master_stability_function, [sigmas[0] * N]
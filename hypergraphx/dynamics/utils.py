@@ -26,31 +26,57 @@ def lin_system(t, X, F, JF, JH, alpha, *params):
     return np.concatenate((new_X_s, new_Eta))
 
 
-def lin_system_a2a(t, X, F, JF, sigmas, N, JHs, alpha, *params):
-    dim = len(X) // 2
-    X_s = X[:dim]
-    Eta = X[dim:]
+def lin_system_batched(t, Y, F, JF, JH, alphas, *params):
+    """Variational system for many alphas: one trajectory, one Eta column per alpha."""
+    alphas = np.asarray(alphas)
+    dim = len(Y) // (len(alphas) + 1)
+    X_s = Y[:dim]
+    Etas = Y[dim:].reshape(dim, len(alphas))
 
     JF_X_s = JF(X_s, *params)
+    JH_X_s = JH(X_s)
 
-    if not type(sigmas) == np.ndarray:
-        sigmas = np.array(sigmas)
-    rescaled_sigmas = sigmas / sigmas[0]
-    all2all_weights = [
-        factorial(N - 2) / factorial(N - 2 - d) for d in range(len(sigmas))
-    ]
-    weighted_JH_X_s = [
-        sigma * w * JH(X_s)
-        for sigma, w, JH in zip(rescaled_sigmas, all2all_weights, JHs)
-    ]
-    JH_X_s = sum(weighted_JH_X_s)
+    new_X_s = F(0, X_s, *params)
+    new_Etas = JF_X_s.dot(Etas) - JH_X_s.dot(Etas) * alphas
 
-    J_alpha = JF_X_s - alpha * JH_X_s
+    return np.concatenate((new_X_s, new_Etas.ravel()))
 
-    new_X_s = F(0, X_s, *params)
-    new_Eta = J_alpha.dot(Eta)
 
-    return np.concatenate((new_X_s, new_Eta))
+class AllToAllCoupling:
+    """
+    Effective coupling Jacobian of the higher-order all-to-all network.
+
+    Combines the Jacobians JHs of the coupling functions of each order,
+    weighted by the rescaled coupling strengths sigma_{d+1} / sigma_1 and by the
+    number (N - 2)! / (N - 2 - d)! of hyperedges of order d + 1 that a node
+    shares with each other node.
+    Being a module-level class, it can be sent to worker processes.
+    """
+
+    def __init__(self, sigmas, N, JHs):
+        sigmas = np.asarray(sigmas, dtype=float)
+        rescaled_sigmas = sigmas / sigmas[0]
+        all2all_weights = [
+            factorial(N - 2) / factorial(N - 2 - d) for d in range(len(sigmas))
+        ]
+        self.factors = [s * w for s, w in zip(rescaled_sigmas, all2all_weights)]
+        self.JHs = JHs
+
+    def __call__(self, X):
+        return sum(f * JH(X) for f, JH in zip(self.factors, self.JHs))
+
+
+def integrate_final_state(fun, y0, integration_time, args=()):
+    """Integrate with LSODA over [0, integration_time] keeping only the final state."""
+    sol = solve_ivp(
+        fun=fun,
+        t_span=[0.0, integration_time],
+        t_eval=[integration_time],
+        y0=y0,
+        args=args,
+        method="LSODA",
+    )
+    return sol.y[:, -1]
 
 
 def sprott_algorithm(
@@ -83,7 +109,8 @@ def sprott_algorithm(
     params: parameters of function f.
         It is a tuple of parameters used by the function F.
     integration_time: time over which the system is integrated in each cycle.
-    integration_step: step of the integrating function.
+    integration_step: kept for backwards compatibility.
+        Only the final state of each cycle is computed, so it no longer has any effect.
 
     Returns
     -------
@@ -104,16 +131,9 @@ def sprott_algorithm(
     for iter in range(C):
         if verbose:
             _log("Integrating over cycle " + str(iter + 1) + " of " + str(C))
-        sol = solve_ivp(
-            fun=lin_system,
-            t_span=[0.0, integration_time],
-            t_eval=np.arange(0.0, integration_time, integration_step),
-            y0=Y0,
-            args=(F, JF, JH, alpha, *params),
-            method="LSODA",
-        )
-
-        EtaT = sol.y[dim:, -1]
+        EtaT = integrate_final_state(
+            lin_system, Y0, integration_time, (F, JF, JH, alpha, *params)
+        )[dim:]
         EtaT_norm = np.linalg.norm(EtaT)
 
         lyap[iter] = np.log(EtaT_norm / Eta0_norm) / integration_time
@@ -143,6 +163,8 @@ def sprott_algorithm_multi(
     """
     Evaluates the Master Stability Function as the maximum Lyapunov exponent using the Sprott's algorithm [1]
 
+    This is sprott_algorithm with the all-to-all effective coupling ``AllToAllCoupling``.
+
     Parameters
     ----------
     alpha: value for which the MSF is computed.
@@ -151,14 +173,18 @@ def sprott_algorithm_multi(
         It is a callable as requested by scipy.solve_ivp
     JF: Jacobian matrix of the function f.
         It is a callable that returns the value of the Jacobian at a given point.
+    sigmas: coupling strengths of each order.
+    N: number of nodes of the all-to-all hypergraph.
     JHs: Jacobian matrices of the coupling functions.
         It is a list of callables that return the value of the Jacobians at a given point.
     Y0: initial condition of the isolated system, and initial perturbation.
         It is a list-like object.
     params: parameters of function f.
         It is a tuple of parameters used by the function F.
+    all2all: only all-to-all couplings are supported.
     integration_time: time over which the system is integrated in each cycle.
-    integration_step: step of the integrating function.
+    integration_step: kept for backwards compatibility.
+        Only the final state of each cycle is computed, so it no longer has any effect.
 
     Returns
     -------
@@ -169,36 +195,89 @@ def sprott_algorithm_multi(
     ---------
     [1] J.C. Sprott, Chaos and Time-Series Analysis, Oxford University Press vol.69, pp.116-117 (2003).
     """
+    if not all2all:
+        raise ValueError("Only all-to-all higher-order couplings are supported.")
+    return sprott_algorithm(
+        alpha,
+        C,
+        F,
+        JF,
+        AllToAllCoupling(sigmas, N, JHs),
+        Y0,
+        params,
+        integration_time,
+        integration_step,
+        verbose,
+    )
+
+
+def sprott_algorithm_batched(
+    alphas,
+    C,
+    F,
+    JF,
+    JH,
+    Y0,
+    params,
+    integration_time=400.0,
+    verbose=True,
+):
+    """
+    Evaluates the Master Stability Function at many values of alpha at once with the Sprott's algorithm [1]
+
+    The isolated system is integrated once, together with one perturbation
+    per alpha, in a single vectorized variational system (``lin_system_batched``).
+    Every alpha starts from the same initial perturbation.
+
+    Parameters
+    ----------
+    alphas: values for which the MSF is computed.
+        It is a list-like object.
+    C: number of cycles of the algorithm.
+    F: function determining the dynamics of the isolated system.
+        It is a callable as requested by scipy.solve_ivp
+    JF: Jacobian matrix of the function f.
+        It is a callable that returns the value of the Jacobian at a given point.
+    JH: Jacobian matrix of the coupling function.
+        It is a callable that returns the value of the Jacobian at a given point.
+    Y0: initial condition of the isolated system, and initial perturbation.
+        It is a list-like object.
+    params: parameters of function f.
+        It is a tuple of parameters used by the function F.
+    integration_time: time over which the system is integrated in each cycle.
+
+    Returns
+    -------
+    MSF: MSF evaluated at each alpha.
+
+    References
+    ---------
+    [1] J.C. Sprott, Chaos and Time-Series Analysis, Oxford University Press vol.69, pp.116-117 (2003).
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    Y0 = np.asarray(Y0, dtype=float)
     dim = len(Y0) // 2
-    Eta0 = Y0[dim:]
-    Eta0_norm = np.linalg.norm(Eta0)
+    X0 = Y0[:dim]
+    Eta0_norm = np.linalg.norm(Y0[dim:])
+    Etas = np.tile(Y0[dim:, None], (1, len(alphas)))
 
-    lyap = np.zeros((C,))
+    lyap = np.zeros((C, len(alphas)))
     for iter in range(C):
         if verbose:
             _log("Integrating over cycle " + str(iter + 1) + " of " + str(C))
+        EtasT = integrate_final_state(
+            lin_system_batched,
+            np.concatenate((X0, Etas.ravel())),
+            integration_time,
+            (F, JF, JH, alphas, *params),
+        )[dim:].reshape(dim, len(alphas))
+        EtasT_norm = np.linalg.norm(EtasT, axis=0)
 
-        if all2all:
-            sol = solve_ivp(
-                fun=lin_system_a2a,
-                t_span=[0.0, integration_time],
-                t_eval=np.arange(0.0, integration_time, integration_step),
-                y0=Y0,
-                args=(F, JF, sigmas, N, JHs, alpha, *params),
-                method="LSODA",
-            )
-
-        EtaT = sol.y[dim:, -1]
-        EtaT_norm = np.linalg.norm(EtaT)
-
-        lyap[iter] = np.log(EtaT_norm / Eta0_norm) / integration_time
-
-        Eta0 = EtaT * Eta0_norm / EtaT_norm
-        Eta0_norm = np.linalg.norm(Eta0)
+        lyap[iter] = np.log(EtasT_norm / Eta0_norm) / integration_time
 
-        Y0[dim:] = Eta0
+        Etas = EtasT * Eta0_norm / EtasT_norm
 
-    return np.mean(lyap)
+    return lyap.mean(axis=0)
 
 
 def is_natural_coupling(JHs, dim, verbose=True, *, seed: int | None = None, rng=None):
@@ -1,13 +1,15 @@
-from collections import Counter, defaultdict
+from collections import defaultdict
 import logging
-from functools import reduce
-from itertools import combinations
+from math import comb
 from multiprocessing import Pool, cpu_count
 
 import numpy as np
 import pandas as pd
 import scipy.stats as st
-from scipy.special import binom
+from scipy import sparse
+from scipy.special import binom, gammaln
+
+from hypergraphx.utils.edges import edge_combinations, pack_edges
 
 
 def _approximated_pvalue(t):
@@ -37,37 +39,157 @@ def _approximated_pvalue(t):
         return p
 
 
-def _get_bipartite_representation(hypergraph):
-    def _as_int_multiplicity(w):
-        if w is None:
-            return 1
-        if isinstance(w, bool):
-            return int(w)
-        if isinstance(w, (int, np.integer)):
-            if w < 0:
-                raise ValueError("Edge weights must be non-negative.")
-            return int(w)
-        if isinstance(w, (float, np.floating)):
-            if w < 0:
-                raise ValueError("Edge weights must be non-negative.")
-            if float(w).is_integer():
-                return int(w)
-        raise ValueError(
-            "Statistical filters require integer edge weights (multiplicity). "
-            "If your hypergraph is weighted with real-valued weights, provide an unweighted hypergraph "
-            "or integer-valued multiplicities."
+def _approximated_pvalues(n12, n, ns):
+    """
+    Vectorized _approximated_pvalue.
+
+    Parameters
+    ----------
+
+    n12 :   np.ndarray
+            Co-occurrences of the tested groups
+    n   :   int
+            Number of observations
+    ns  :   np.ndarray
+            Degrees of the nodes, one row per group and one column per node
+
+    Returns
+    -------
+    p-values:   np.ndarray
+                approximated p-values associated to the groups
+    """
+    return st.binom.sf(n12 - 1, p=np.prod(ns / n, axis=1), n=n)
+
+
+def _cooccurrence_pmf(n, ns, log_factorials):
+    """
+    Distribution of the size of the intersection of random subsets of sizes ns of n
+    observations, computed by chaining hypergeometric distributions.
+    """
+
+    def log_binom(a, b):
+        valid = (b >= 0) & (b <= a)
+        a, b = np.where(valid, a, 0), np.where(valid, b, 0)
+        out = log_factorials[a] - log_factorials[b] - log_factorials[a - b]
+        return np.where(valid, out, -np.inf)
+
+    ns = np.sort(ns)
+    pmf = np.zeros(ns[0] + 1)
+    pmf[-1] = 1.0
+    k = np.arange(ns[0] + 1)
+    for n_i in ns[1:]:
+        # Probability that a random subset of size n_i shares k' of k observations.
+        log_pmf = (
+            log_binom(k[:, None], k[None, :])
+            + log_binom(n - k[:, None], n_i - k[None, :])
+            - log_binom(np.array(n), np.array(n_i))
         )
+        pmf = pmf @ np.exp(log_pmf)
+    return pmf
+
+
+def _exact_pvalues(n12, n, ns):
+    """
+    Exact p-values of the co-occurrences, see _approximated_pvalues.
+    For pairs of nodes this is the hypergeometric test.
+    """
+    if ns.shape[1] == 2:
+        return st.hypergeom.sf(n12 - 1, n, ns[:, 0], ns[:, 1])
+    log_factorials = gammaln(np.arange(n + 1) + 1)
+    pvalues = np.empty(len(n12))
+    cache = {}
+    for t, (x, row) in enumerate(zip(n12, ns)):
+        key = tuple(np.sort(row))
+        if key not in cache:
+            pmf = _cooccurrence_pmf(n, row, log_factorials)
+            cache[key] = np.cumsum(pmf[::-1])[::-1]
+        sf = cache[key]
+        pvalues[t] = sf[x] if x < len(sf) else 0.0
+    return np.minimum(pvalues, 1.0)
+
+
+def _pvalues(args):
+    n12, n, ns, exact = args
+    if exact:
+        return _exact_pvalues(n12, n, ns)
+    return _approximated_pvalues(n12, n, ns)
+
+
+def _get_pool(mp, n_jobs):
+    if not mp:
+        return None
+    return Pool(processes=cpu_count() if n_jobs is None else n_jobs)
+
+
+def _map_chunks(func, tasks, pool=None):
+    """Apply func to the tasks, on the pool of processes if given."""
+    if pool is None:
+        return list(map(func, tasks))
+    return pool.map(func, tasks)
+
+
+def _pvalue_tasks(n12, n, ns, exact, chunk_size):
+    return [
+        (n12[start : start + chunk_size], n, ns[start : start + chunk_size], exact)
+        for start in range(0, len(n12), chunk_size)
+    ]
+
+
+def _validated(pvalues, n_possible, alpha):
+    """FDR validation of the p-values, with n_possible tests."""
+    bonf = alpha / n_possible
+    ps = np.sort(pvalues)
+    k = np.arange(1, len(ps) + 1) * bonf
+    try:
+        fdr = k[ps < k][-1]
+    except IndexError:
+        fdr = 0
+    return pvalues < fdr
+
+
+def _as_int_multiplicity(w):
+    if w is None:
+        return 1
+    if isinstance(w, bool):
+        return int(w)
+    if isinstance(w, (int, np.integer)):
+        if w < 0:
+            raise ValueError("Edge weights must be non-negative.")
+        return int(w)
+    if isinstance(w, (float, np.floating)):
+        if w < 0:
+            raise ValueError("Edge weights must be non-negative.")
+        if float(w).is_integer():
+            return int(w)
+    raise ValueError(
+        "Statistical filters require integer edge weights (multiplicity). "
+        "If your hypergraph is weighted with real-valued weights, provide an unweighted hypergraph "
+        "or integer-valued multiplicities."
+    )
+
 
-    edge_index = 0
-    bipartite_list = []
+def _get_edge_multiplicities(hypergraph):
+    """
+    Distinct hyperedges, as sorted tuples, with their integer multiplicities.
+    Hyperedges with multiplicity zero are not observed and are dropped.
+    """
+    multiplicities = defaultdict(int)
     for edge in hypergraph.get_edges():
         w = hypergraph.get_weight(edge) if hypergraph.is_weighted() else 1
-        for _ in range(_as_int_multiplicity(w)):
-            for node in edge:
-                bipartite_list.append((node, edge_index))
-            edge_index += 1
-    bipartite_df = pd.DataFrame(bipartite_list, columns=["a", "b"])
-    return bipartite_df
+        m = _as_int_multiplicity(w)
+        if m > 0:
+            multiplicities[tuple(sorted(edge))] += m
+    return multiplicities
+
+
+def _encode_edges(edges):
+    """Integer-encode hyperedges of the same size into an array with one row each."""
+    labels = {}
+    nodes = np.array(
+        [[labels.setdefault(node, len(labels)) for node in edge] for edge in edges],
+        dtype=np.int64,
+    ).reshape(len(edges), -1)
+    return nodes, len(labels)
 
 
 def get_svh(
@@ -77,6 +199,8 @@ def get_svh(
     mp: bool = False,
     n_jobs: int | None = None,
     max_tests_per_order: int | None = None,
+    exact: bool = False,
+    chunk_size: int = 100000,
 ):
     """
     Extract the Statistically Validated Hypergraph.
@@ -98,6 +222,12 @@ def get_svh(
         Number of worker processes to use when `mp=True`. Defaults to `cpu_count()`.
     max_tests_per_order: int, optional
         Guardrail: maximum number of hypothesis tests per order. If exceeded, raises a ValueError.
+    exact:      bool (default: False)
+        If True, compute exact p-values from hypergeometric distributions instead of
+        their binomial approximation.
+    chunk_size: int (default: 100000)
+        Number of hypothesis tests computed together, in every task of the pool of
+        processes when `mp=True`.
 
     Returns
     -------------
@@ -108,81 +238,128 @@ def get_svh(
         'fdr' is a bool that is True if the hyperlink belongs to the SVH, False otherwise
     """
 
-    df = _get_bipartite_representation(hypergraph)
-
-    deg_set_b = df.groupby("b")["a"].count().reset_index()
-
-    orders = deg_set_b.a.unique()
-    orders = orders[(orders >= 2) & (orders <= max_order)]
-    pvalues = {}
-
-    for order in np.sort(orders):
-        sub_deg = deg_set_b.query("a==@order").b.tolist()
-        N = len(sub_deg)
-        sub_edges = df.query("b in @sub_deg")
-        tuples = (
-            sub_edges.groupby("b")["a"]
-            .apply(lambda x: tuple(sorted(x)))
-            .unique()
-            .tolist()
-        )
-        tuples_order = list(filter(lambda x: len(x) == order, tuples))
-        neigh_set_a_sub = dict(
-            sub_edges.groupby("a")["b"].apply(list).reset_index().values
-        )
-
-        tuples_params = [
-            (
-                len(
-                    reduce(
-                        lambda x, y: set(x).intersection(y),
-                        [neigh_set_a_sub[node] for node in edge],
-                    )
-                ),
-                N,
-            )
-            + tuple([len(neigh_set_a_sub[node]) for node in edge])
-            for edge in tuples_order
-        ]
-        if max_tests_per_order is not None and len(tuples_params) > max_tests_per_order:
+    multiplicities = _get_edge_multiplicities(hypergraph)
+    edges_by_order = defaultdict(list)
+    for edge in multiplicities:
+        if 2 <= len(edge) <= max_order:
+            edges_by_order[len(edge)].append(edge)
+
+    tasks = []
+    tuples = {}
+    n_nodes = {}
+    for order in sorted(edges_by_order):
+        tuples_order = edges_by_order[order]
+        if max_tests_per_order is not None and len(tuples_order) > max_tests_per_order:
             raise ValueError(
-                f"Too many hypothesis tests (order={order}): {len(tuples_params)} > {max_tests_per_order}. "
+                f"Too many hypothesis tests (order={order}): {len(tuples_order)} > {max_tests_per_order}. "
                 "Reduce max_order, pre-filter your hypergraph, or increase max_tests_per_order."
             )
-
-        if mp:
-            p = Pool(processes=cpu_count() if n_jobs is None else n_jobs)
-            pvalues[order] = dict(
-                zip(tuples_order, p.map(_approximated_pvalue, tuples_params))
-            )
-            p.close()
-        else:
-            pvalues[order] = dict(
-                zip(tuples_order, map(_approximated_pvalue, tuples_params))
-            )
+        nodes, n_nodes[order] = _encode_edges(tuples_order)
+        m = np.array([multiplicities[edge] for edge in tuples_order], dtype=np.int64)
+
+        # Observations of this order, with multiplicity, and degrees of the nodes.
+        N = int(m.sum())
+        deg = np.bincount(nodes.ravel(), weights=np.repeat(m, order)).astype(np.int64)
+        # The hyperedges of this order containing all the nodes of a hyperedge are its
+        # copies, so the co-occurrence of the nodes is the multiplicity.
+        tasks.extend(_pvalue_tasks(m, N, deg[nodes], exact, chunk_size))
+        tuples[order] = tuples_order
+
+    pool = _get_pool(mp, n_jobs)
+    try:
+        results = iter(_map_chunks(_pvalues, tasks, pool))
+    finally:
+        if pool is not None:
+            pool.close()
 
     svh = {}
-    links = 0
-    links_order = {}
-    for order in sorted(pvalues):
-        n_a = len(set(np.concatenate(list(pvalues[order].keys()))))
-        n_possible = binom(n_a, order)
-        bonf = alpha / n_possible
-
-        temp_df = pd.DataFrame(pvalues[order].items())
-        temp_df.columns = ["edge", "pvalue"]
-        ps = np.sort(temp_df.pvalue)
-        k = np.arange(1, len(ps) + 1) * bonf
-        try:
-            fdr = k[ps < k][-1]
-        except:
-            fdr = 0
-        temp_df["fdr"] = temp_df["pvalue"] < fdr
+    for order in sorted(tuples):
+        n_tasks = -(-len(tuples[order]) // chunk_size)
+        pvalues = np.concatenate([next(results) for _ in range(n_tasks)])
+        temp_df = pd.DataFrame({"edge": tuples[order], "pvalue": pvalues})
+        temp_df["fdr"] = _validated(pvalues, binom(n_nodes[order], order), alpha)
         svh[order] = temp_df
 
     return svh
 
 
+def _reduce_candidates(keys, rows, counts, first):
+    """Merge the candidates with the same key, summing their counts."""
+    keys, index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    min_first = np.full(len(keys), np.iinfo(np.int64).max)
+    np.minimum.at(min_first, inverse, first)
+    return keys, rows[index], np.bincount(inverse, weights=counts), min_first
+
+
+def _subsets_of_cores(rows, cores, n_nodes):
+    """
+    Mask of the rows whose nodes are all contained in one of the cores.
+    cores is a sparse node-core incidence matrix, the product with the incidence of the
+    rows counts the shared nodes.
+    """
+    if cores is None or len(rows) == 0:
+        return np.zeros(len(rows), dtype=bool)
+    order = rows.shape[1]
+    incidence = sparse.csr_array(
+        (np.ones(rows.size), rows.ravel(), np.arange(0, rows.size + 1, order)),
+        shape=(len(rows), n_nodes),
+    )
+    shared = (incidence @ cores).tocoo()
+    mask = np.zeros(len(rows), dtype=bool)
+    mask[shared.row[shared.data == order]] = True
+    return mask
+
+
+def _core_incidence(cores, n_nodes):
+    if not cores:
+        return None
+    sizes = [len(core) for core in cores]
+    return sparse.csr_array(
+        (
+            np.ones(sum(sizes)),
+            (np.concatenate(cores), np.repeat(np.arange(len(cores)), sizes)),
+        ),
+        shape=(n_nodes, len(cores)),
+    )
+
+
+def _count_groups(edges_by_size, order, n_nodes, cores, chunk_size):
+    """
+    Count the hyperedges, with multiplicity, containing every group of order nodes
+    that is a subset of an observed hyperedge and not of a validated core.
+
+    Returns
+    -------
+    The groups as rows of sorted node indices, their counts, and the order in which
+    they first appear in the hyperedges.
+    """
+    max_combos = max(
+        (comb(size, order) for size in edges_by_size if size >= order), default=0
+    )
+    parts = []
+    for size, (edges, m, position) in edges_by_size.items():
+        if size < order:
+            continue
+        n_combos = comb(size, order)
+        for chunk, rows in edge_combinations(edges, order, chunk_size):
+            counts = np.repeat(m[chunk], n_combos)
+            first = (position[chunk, None] * max_combos + np.arange(n_combos)).ravel()
+            keep = ~_subsets_of_cores(rows, cores, n_nodes)
+            rows, counts, first = rows[keep], counts[keep], first[keep]
+            parts.append(
+                _reduce_candidates(pack_edges(rows, n_nodes), rows, counts, first)
+            )
+
+    if not parts:
+        return np.zeros((0, order), dtype=np.int64), np.zeros(0), np.zeros(0)
+    _, rows, counts, first = _reduce_candidates(
+        *(np.concatenate(arrays) for arrays in zip(*parts))
+    )
+    sort = np.argsort(first, kind="stable")
+    return rows[sort], counts[sort].astype(np.int64), first[sort]
+
+
 def get_svc(
     hypergraph,
     min_order=2,
@@ -191,6 +368,8 @@ def get_svc(
     mp: bool = False,
     n_jobs: int | None = None,
     max_groups: int | None = None,
+    exact: bool = False,
+    chunk_size: int = 100000,
 ):
     """
     Extract the Statistically Validated Cores.
@@ -214,6 +393,12 @@ def get_svc(
         Number of worker processes to use when `mp=True`. Defaults to `cpu_count()`.
     max_groups: int, optional
         Guardrail: maximum number of groups tested per order. If exceeded, raises a ValueError.
+    exact:      bool (default: False)
+        If True, compute exact p-values from hypergeometric distributions instead of
+        their binomial approximation.
+    chunk_size: int (default: 100000)
+        Number of candidate groups generated, and of hypothesis tests computed,
+        together. The same pool of processes is used for all the orders.
 
     Returns
     -------------
@@ -223,74 +408,67 @@ def get_svc(
         'pvalue' reports the pvalue
         'fdr' is a bool that is True if the core has been validated, False otherwise
     """
-    df = _get_bipartite_representation(hypergraph)
-
-    observables = df.groupby("b")["a"].apply(lambda x: tuple(sorted(x))).tolist()
-
-    if max_order:
-        max_order = min(max_order, max(map(len, observables)))
-    else:
-        max_order = max(map(len, observables))
-
-    s_groups = []
-    neigh_set_a_sub = dict(df.groupby("a")["b"].apply(list).reset_index().values)
-    N = df.b.nunique()
-    na = df.a.nunique()
-
+    multiplicities = _get_edge_multiplicities(hypergraph)
+
+    # Integer-encode the nodes, preserving their order, and group the hyperedges by size.
+    labels = sorted({node for edge in multiplicities for node in edge})
+    node_index = {node: i for i, node in enumerate(labels)}
+    n_nodes = len(labels)
+    by_size = defaultdict(list)
+    for position, (edge, m) in enumerate(multiplicities.items()):
+        by_size[len(edge)].append(([node_index[node] for node in edge], m, position))
+    edges_by_size = {
+        size: tuple(np.array(column, dtype=np.int64) for column in zip(*by_size[size]))
+        for size in sorted(by_size)
+    }
+
+    largest = max(edges_by_size, default=0)
+    max_order = min(max_order, largest) if max_order else largest
+
+    N = sum(multiplicities.values())
+    deg = np.zeros(n_nodes, dtype=np.int64)
+    for edges, m, _ in edges_by_size.values():
+        deg += np.bincount(
+            edges.ravel(), weights=np.repeat(m, edges.shape[1]), minlength=n_nodes
+        ).astype(np.int64)
+
+    cores = []
     svh_dfs = []
 
-    for order in list(range(min_order, max_order + 1))[::-1]:
-        drop = []
-        for l in list(map(lambda x: tuple(combinations(x, order)), s_groups)):
-            drop.extend(l)
-
-        deg_a = Counter(df.a)
-        groups = defaultdict(int)
-        for l in map(
-            lambda x: tuple(combinations(x, order)),
-            filter(lambda x: len(x) >= order, observables),
-        ):
-            for g in l:
-                if g not in drop:
-                    groups[g] += 1
-
-        tuples_params = [
-            tuple([groups[i], N]) + tuple([deg_a[ii] for ii in i]) for i in groups
-        ]
-        if max_groups is not None and len(tuples_params) > max_groups:
-            raise ValueError(
-                f"Too many groups to test (order={order}): {len(tuples_params)} > {max_groups}. "
-                "Increase max_groups, reduce max_order, or pre-filter your hypergraph."
+    pool = _get_pool(mp, n_jobs)
+    try:
+        for order in list(range(min_order, max_order + 1))[::-1]:
+            rows, counts, _ = _count_groups(
+                edges_by_size,
+                order,
+                n_nodes,
+                _core_incidence(cores, n_nodes),
+                chunk_size,
             )
-        if mp:
-            p = Pool(processes=cpu_count() if n_jobs is None else n_jobs)
-            pvalues = dict(zip(groups, p.map(_approximated_pvalue, tuples_params)))
-            p.close()
-        else:
-            pvalues = dict(zip(groups, map(_approximated_pvalue, tuples_params)))
-
-        n_possible = binom(na, order)
-        bonf = alpha / n_possible
-
-        temp_df = pd.DataFrame(pvalues.items())
-        try:
-            temp_df.columns = ["group", "pvalue"]
-        except ValueError:
-            temp_df = pd.DataFrame(columns=["group", "pvalue"])
-        ps = np.sort(temp_df.pvalue)
-        k = np.arange(1, len(ps) + 1) * bonf
-        try:
-            fdr = k[ps < k][-1]
-        except IndexError:
-            fdr = 0
-
-        temp_df["w"] = temp_df.group.apply(lambda x: groups[x])
-        temp_df["fdr"] = temp_df["pvalue"] < fdr
-
-        svh_dfs.append(temp_df)  # .query('fdr'))
-
-        s_groups_order = temp_df.query("fdr").group.tolist()
-
-        s_groups.extend(s_groups_order)
+            if max_groups is not None and len(rows) > max_groups:
+                raise ValueError(
+                    f"Too many groups to test (order={order}): {len(rows)} > {max_groups}. "
+                    "Increase max_groups, reduce max_order, or pre-filter your hypergraph."
+                )
+            tasks = _pvalue_tasks(counts, N, deg[rows], exact, chunk_size)
+            results = _map_chunks(_pvalues, tasks, pool)
+            pvalues = np.concatenate(results) if results else np.zeros(0)
+
+            temp_df = pd.DataFrame(
+                {
+                    "group": [tuple(labels[i] for i in row) for row in rows.tolist()],
+                    "pvalue": pvalues,
+                    "w": counts,
+                }
+            )
+            validated = _validated(pvalues, binom(n_nodes, order), alpha)
+            temp_df["fdr"] = validated
+
+            svh_dfs.append(temp_df)
+
+            cores.extend(rows[validated])
+    finally:
+        if pool is not None:
+            pool.close()
 
     return pd.concat(svh_dfs)
@@ -204,6 +204,225 @@ def _cm_MCMC(
         logging.getLogger(__name__).warning("Not implemented")
 
 
+def _encode_edges(hypergraph):
+    """Encode the hyperedges as a padded integer array grouped by size."""
+    nodes = list(hypergraph.get_nodes())
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = sorted(hypergraph.get_edges(), key=len)
+    sizes = np.fromiter(map(len, edges), dtype=np.int64, count=len(edges))
+    width = int(sizes.max()) if len(sizes) else 0
+    # Padding uses the value n, which never collides with a node index.
+    rows = np.full((len(edges), width), n, dtype=np.int64)
+    mask = np.arange(width)[None, :] < sizes[:, None]
+    rows[mask] = np.fromiter(
+        (index[node] for edge in edges for node in edge),
+        dtype=np.int64,
+        count=int(sizes.sum()),
+    )
+    return rows, sizes, nodes
+
+
+def _hash_rows(rows, node_keys):
+    """Hash padded rows into uint64 keys, independently of the order of the nodes."""
+    return node_keys[rows].sum(axis=1, dtype=np.uint64)
+
+
+def _batched_reshuffle(f1, f2, n, rng):
+    """
+    Vectorized pairwise reshuffle of many edge pairs at once.
+
+    Nodes shared by both edges stay in both; the remaining nodes are split
+    uniformly at random, preserving the size of each edge.
+    """
+    k, width = f1.shape
+    shared1 = np.zeros(f1.shape, dtype=bool)
+    shared2 = np.zeros(f2.shape, dtype=bool)
+    for c in range(width):
+        shared1 |= f1 == f2[:, c : c + 1]
+        shared2 |= f2 == f1[:, c : c + 1]
+    shared1 &= f1 < n
+    shared2 &= f2 < n
+    free = np.concatenate([(f1 < n) & ~shared1, (f2 < n) & ~shared2], axis=1)
+
+    # Shuffle the free nodes of each pair: the first ones fill the free slots of
+    # the first edge, the others those of the second edge.
+    keys = rng.random(free.shape)
+    keys[~free] = 2.0
+    order = np.argsort(keys, axis=1)
+    to_first = np.empty(free.shape, dtype=bool)
+    to_first[np.arange(k)[:, None], order] = (
+        np.arange(2 * width)[None, :] < free[:, :width].sum(axis=1)[:, None]
+    )
+
+    leaving = free[:, :width] & ~to_first[:, :width]
+    joining = to_first[:, width:]
+    # Each row has as many nodes leaving the first edge as nodes joining it, so
+    # the flattened boolean selections line up row by row.
+    g1 = f1.copy()
+    g2 = f2.copy()
+    g1[leaving] = f2[joining]
+    g2[joining] = f1[leaving]
+    return g1, g2, shared1.sum(axis=1)
+
+
+def _count_sorted(sorted_keys, keys):
+    """Count the occurrences of each of `keys` in the sorted array `sorted_keys`."""
+    # Searching sorted needles is much more cache friendly.
+    order = np.argsort(keys)
+    needles = keys[order]
+    counts = np.empty(len(keys), dtype=np.int64)
+    counts[order] = np.searchsorted(sorted_keys, needles, side="right")
+    counts[order] -= np.searchsorted(sorted_keys, needles, side="left")
+    return counts
+
+
+def _first_claim(keys, owner):
+    """Return True where `owner` is the first proposal that touches `keys`."""
+    _, first, inv = np.unique(keys, return_index=True, return_inverse=True)
+    return owner[first][inv] == owner
+
+
+def _cm_MCMC_array(
+    hypergraph,
+    n_steps=1000,
+    label="edge",
+    detailed=True,
+    batch_size=None,
+    *,
+    seed: int | None = None,
+):
+    """
+    Array-based counterpart of `_cm_MCMC`.
+
+    Hyperedges are kept in a fixed-width padded integer array sorted by size, and
+    swaps are performed in vectorized batches: each round draws a random matching
+    of the edges (within each size class if `detailed`) and reshuffles all the
+    matched pairs at once. Pairs of a matching never share an edge, so every
+    reshuffle is applied to the current state of its edges and the stationary
+    distribution is the one of the sequential chain.
+
+    In the vertex-labeled chain the Metropolis-Hastings acceptance depends on the
+    multiplicities of the node tuples, which are tracked through a sorted array of
+    order-independent hashes of the tuples. A batch is only applied up to the first
+    pair whose tuples were removed or created by an earlier pair of the batch; the
+    other pairs are carried over, so that acceptances are always computed on
+    up-to-date multiplicities and `n_clash` of the legacy sampler is not needed.
+    Unlike the legacy sampler, rejected proposals count as steps.
+
+    n_steps: number of steps to perform
+    label: the label space to use. Can take values in ['vertex' , 'stub', 'edge'].
+    detailed: if True, preserve the number of edges of given dimension incident to each node
+    batch_size: maximum number of pairs reshuffled at once. Defaults to half the
+        number of edges.
+    """
+    if label not in ("edge", "stub", "vertex"):
+        raise InvalidParameterError("label must be one of: 'edge', 'stub', 'vertex'.")
+    rng = np_rng(seed)
+    rows, sizes, nodes = _encode_edges(hypergraph)
+    n, m = len(nodes), len(sizes)
+    vertex = label == "vertex"
+    if batch_size is None:
+        batch_size = max(1, m // 2)
+
+    # Size classes occupy contiguous blocks of `rows`.
+    _, class_start, class_count = np.unique(
+        sizes, return_index=True, return_counts=True
+    )
+
+    def random_matching():
+        if not detailed:
+            perm = rng.permutation(m)
+            return perm[: 2 * (m // 2)].reshape(-1, 2)
+        pairs = [
+            (start + rng.permutation(count))[: 2 * (count // 2)].reshape(-1, 2)
+            for start, count in zip(class_start, class_count)
+        ]
+        pairs = np.concatenate(pairs) if pairs else np.empty((0, 2), np.int64)
+        return pairs[rng.permutation(len(pairs))]
+
+    if vertex:
+        node_keys = rng.integers(0, 2**64 - 1, size=n + 1, dtype=np.uint64)
+        node_keys[n] = 0
+        hashes = _hash_rows(rows, node_keys)
+        sorted_hashes = np.sort(hashes)
+
+    done = 0
+    n_rejected = 0
+    n_batches = 0
+    window_size = batch_size
+    pairs = np.empty((0, 2), dtype=np.int64)
+    while done < n_steps:
+        if len(pairs) == 0:
+            pairs = random_matching()
+            if len(pairs) == 0:
+                break
+        window = pairs[: min(window_size, n_steps - done)]
+        i, j = window.T
+        n_batches += 1
+        g1, g2, n_shared = _batched_reshuffle(rows[i], rows[j], n, rng)
+
+        if not vertex:
+            pairs = pairs[len(window) :]
+            rows[i], rows[j] = g1, g2
+            done += len(window)
+            continue
+
+        h1, h2 = hashes[i], hashes[j]
+        k1, k2 = _hash_rows(g1, node_keys), _hash_rows(g2, node_keys)
+        # Stop at the first pair whose tuples were removed or created by an
+        # earlier pair of the batch, as its acceptance would be stale.
+        touched = np.stack([h1, h2, k1, k2], axis=1).ravel()
+        owner = np.repeat(np.arange(len(window)), 4)
+        ok = _first_claim(touched, owner).reshape(-1, 4)[:, :2].all(axis=1)
+        cut = len(window) if ok.all() else int(np.argmin(ok))
+        pairs = pairs[cut:]
+        # Size the next window on the observed distance between collisions.
+        window_size = int(min(batch_size, max(256, 2 * cut)))
+
+        # Pairs of copies of the same tuple are left unchanged. Rejected and
+        # unchanged pairs still count as steps: counting accepted moves only would
+        # sample the jump chain, which is biased against states with many
+        # multi-edges.
+        done += cut
+        sel = np.flatnonzero(h1[:cut] != h2[:cut])
+        c1 = _count_sorted(sorted_hashes, h1[sel])
+        c2 = _count_sorted(sorted_hashes, h2[sel])
+        accept = rng.random(len(sel)) <= 2.0 ** (-n_shared[sel]) / (c1 * c2)
+        n_rejected += len(sel) - int(accept.sum())
+        sel = sel[accept]
+
+        removed = np.concatenate([h1[sel], h2[sel]])
+        created = np.sort(np.concatenate([k1[sel], k2[sel]]))
+        sorted_hashes = np.delete(
+            sorted_hashes, np.searchsorted(sorted_hashes, np.sort(removed))
+        )
+        sorted_hashes = np.insert(
+            sorted_hashes, np.searchsorted(sorted_hashes, created), created
+        )
+        hashes[i[sel]], hashes[j[sel]] = k1[sel], k2[sel]
+        rows[i[sel]], rows[j[sel]] = g1[sel], g2[sel]
+
+    logger = logging.getLogger(__name__)
+    if vertex:
+        logger.info(
+            "%s batches completed, %s steps taken, %s steps rejected.",
+            n_batches,
+            done,
+            n_rejected,
+        )
+    else:
+        logger.info("%s steps completed.", done)
+
+    edges = [tuple(nodes[v] for v in row if v < n) for row in rows.tolist()]
+    new_h = Hypergraph()
+    if vertex:
+        new_h.add_edges([tuple(sorted(f)) for f in edges])
+    else:
+        new_h.add_edges(list(set(tuple(sorted(f)) for f in edges)))
+    return new_h
+
+
 def configuration_model(
     hypergraph,
     n_steps=1000,
@@ -213,6 +432,7 @@ def configuration_model(
     n_clash=1,
     detailed=True,
     seed: int | None = None,
+    method: str = "python",
 ):
     """
     Sample a randomized hypergraph using a configuration-model-style MCMC.
@@ -220,6 +440,9 @@ def configuration_model(
     Parameters are largely legacy; the key UX improvements are:
     - `seed=` controls the RNG (reproducible, does not rely on global `np.random.seed`)
     - when `order`/`size` is provided, only that size class is rewired
+    - `method="array"` runs the vectorized MCMC engine (`_cm_MCMC_array`), which is
+      orders of magnitude faster for large `n_steps`; `n_clash` is ignored there
+      since the vertex-labeled chain is exact
 
     Examples
     --------
@@ -229,19 +452,36 @@ def configuration_model(
     >>> H2 = configuration_model(H, n_steps=10, label="edge", seed=0)
     >>> H.num_edges() == H2.num_edges()
     True
+    >>> H3 = configuration_model(H, n_steps=10, label="stub", seed=0, method="array")
+    >>> H.num_edges() == H3.num_edges()
+    True
     """
     if order is not None and size is not None:
         raise InvalidParameterError("Only one of order and size can be specified.")
-    if order is None and size is None:
+    if method not in ("python", "array"):
+        raise InvalidParameterError("method must be either 'python' or 'array'.")
+
+    def _sample(h, sample_seed):
+        if method == "array":
+            return _cm_MCMC_array(
+                h,
+                n_steps=n_steps,
+                label=label,
+                detailed=detailed,
+                seed=sample_seed,
+            )
         return _cm_MCMC(
-            hypergraph,
+            h,
             n_steps=n_steps,
             label=label,
             n_clash=n_clash,
             detailed=detailed,
-            seed=seed,
+            seed=sample_seed,
         )
 
+    if order is None and size is None:
+        return _sample(hypergraph, seed)
+
     if size is None:
         size = order + 1
 
@@ -251,14 +491,7 @@ def configuration_model(
     # Derive a distinct seed for the size-restricted shuffle to keep deterministic behavior.
     seed_rng = np_rng(seed) if seed is not None else None
     sub_seed = split_seed(seed_rng) if seed_rng is not None else None
-    shuffled = _cm_MCMC(
-        tmp_h,
-        n_steps=n_steps,
-        label=label,
-        n_clash=n_clash,
-        detailed=detailed,
-        seed=sub_seed,
-    )
+    shuffled = _sample(tmp_h, sub_seed)
     for e in hypergraph.get_edges():
         if len(e) != size:
             shuffled.add_edge(e)
@@ -133,50 +133,13 @@ def random_shuffle(
         raise ValueError("p must be between 0 and 1.")
 
     npgen = np_rng(seed)
-    pyrand = py_rng(seed)
-
-    # Retrieve current hyperedges of the specified size.
+    target_hg = hg if inplace else hg.copy()
     current_edges = list(hg.get_edges(size=size))
-    num_edges = len(current_edges)
-    num_to_randomize = int(p * num_edges)
-
-    # Randomly choose indices of hyperedges to replace.
-    indices_to_replace = set(pyrand.sample(range(num_edges), num_to_randomize))
-
-    # Build a pool of nodes only from the hyperedges being randomized.
-    pool_nodes = {}
-    for i in indices_to_replace:
-        for node in current_edges[i]:
-            if node not in pool_nodes:
-                pool_nodes[node] = 1
-            elif preserve_degree:
-                pool_nodes[node] += 1
-
-    weights = np.array(list(pool_nodes.values()))
-    weights = weights / np.sum(weights)
-    pool_nodes = np.array(list(pool_nodes.keys()))
-
-    new_edges = []
-    for i, edge in enumerate(current_edges):
-        if i in indices_to_replace:
-            # Build a new hyperedge using nodes only from the pool.
-            new_edge = tuple(
-                sorted(npgen.choice(pool_nodes, size, replace=False, p=weights))
-            )
-
-            new_edges.append(new_edge)
-        else:
-            new_edges.append(edge)
-
-    if inplace:
-        hg.remove_edges(current_edges)
-        hg.add_edges(new_edges)
-        return hg
-    else:
-        h = hg.copy()
-        h.remove_edges(current_edges)
-        h.add_edges(new_edges)
-        return h
+    _apply_replacements(
+        target_hg,
+        [_shuffled_edges(current_edges, size, p, preserve_degree, npgen)],
+    )
+    return target_hg
 
 
 def random_shuffle_all_orders(
@@ -231,30 +194,96 @@ def random_shuffle_all_orders(
     # a distinct stream of randomness.
     seed_rng = np_rng(seed) if seed is not None else None
 
-    for size in set(hg.get_sizes()):
+    replacements = []
+    for size in sorted(set(hg.get_sizes())):
         per_size_seed = split_seed(seed_rng) if seed_rng is not None else None
-        if inplace:
-            random_shuffle(
-                target_hg,
-                size=size,
-                p=p,
-                inplace=True,
-                preserve_degree=preserve_degree,
-                seed=per_size_seed,
+        current_edges = list(hg.get_edges(size=size))
+        replacements.append(
+            _shuffled_edges(
+                current_edges, size, p, preserve_degree, np_rng(per_size_seed)
             )
-        else:
-            target_hg = random_shuffle(
-                target_hg,
-                size=size,
-                p=p,
-                inplace=False,
-                preserve_degree=preserve_degree,
-                seed=per_size_seed,
-            )
-
+        )
+    _apply_replacements(target_hg, replacements)
     return target_hg
 
 
+def _sample_without_replacement(npgen, weights, size, num, max_rounds=32):
+    """
+    Draw ``num`` independent samples of ``size`` distinct pool indices.
+
+    Positions are filled one at a time for all samples together: each draw comes
+    from ``weights`` and is redrawn if it repeats an index already in its sample,
+    which is exactly successive sampling (the scheme behind
+    ``np.random.choice(..., replace=False, p=weights)``).
+    """
+    n_pool = len(weights)
+    if size > n_pool:
+        raise ValueError(
+            f"Cannot draw hyperedges of size {size} from a pool of {n_pool} nodes."
+        )
+    uniform = bool(np.all(weights == weights[0]))
+    cdf = np.cumsum(weights, dtype=float)
+    cdf /= cdf[-1]
+
+    out = np.empty((num, size), dtype=np.int64)
+    for pos in range(size):
+        todo = np.arange(num)
+        for _ in range(max_rounds):
+            if uniform:
+                cand = npgen.integers(0, n_pool, size=len(todo))
+            else:
+                cand = np.searchsorted(cdf, npgen.random(len(todo)), side="right")
+                np.minimum(cand, n_pool - 1, out=cand)
+            clash = (out[todo, :pos] == cand[:, None]).any(axis=1)
+            out[todo[~clash], pos] = cand[~clash]
+            todo = todo[clash]
+            if len(todo) == 0:
+                break
+        # Samples that kept hitting taken nodes draw from the renormalized rest.
+        for row in todo:
+            w = np.asarray(weights, dtype=float).copy()
+            w[out[row, :pos]] = 0
+            out[row, pos] = npgen.choice(n_pool, p=w / w.sum())
+    return out
+
+
+def _shuffled_edges(current_edges, size, p, preserve_degree, npgen):
+    """Pick a fraction ``p`` of ``current_edges`` and draw their replacements."""
+    num_edges = len(current_edges)
+    num_to_randomize = int(p * num_edges)
+    if num_to_randomize == 0:
+        return [], []
+
+    # Randomly choose indices of hyperedges to replace.
+    indices = npgen.choice(num_edges, num_to_randomize, replace=False)
+    removed = [current_edges[i] for i in indices]
+
+    # Build a pool of nodes only from the hyperedges being randomized.
+    pool_nodes = {}
+    for edge in removed:
+        for node in edge:
+            if node not in pool_nodes:
+                pool_nodes[node] = 1
+            elif preserve_degree:
+                pool_nodes[node] += 1
+    weights = np.fromiter(pool_nodes.values(), dtype=float, count=len(pool_nodes))
+    pool_nodes = list(pool_nodes)
+
+    samples = _sample_without_replacement(npgen, weights, size, num_to_randomize)
+    added = [tuple(sorted(pool_nodes[j] for j in row)) for row in samples.tolist()]
+    return removed, added
+
+
+def _apply_replacements(hg, replacements):
+    """Remove and add the replaced hyperedges of every size in one bulk update."""
+    removed = [edge for batch, _ in replacements for edge in batch]
+    added = [edge for _, batch in replacements for edge in batch]
+    if removed:
+        hg.remove_edges(removed)
+    if added:
+        hg.add_edges(added)
+
+
 def add_random_edge(
     hg: Hypergraph,
     order=None,
@@ -1,4 +1,6 @@
 from hypergraphx.linalg.linalg import (
+    LaplacianOperator,
+    SymmetricAdjacencyTensor,
     adjacency_factor,
     adjacency_matrix,
     adjacency_matrix_by_order,
@@ -13,9 +15,13 @@ from hypergraphx.linalg.linalg import (
     hye_list_to_binary_incidence,
     incidence_matrices_all_orders,
     incidence_matrix,
+    incidence_matrix_blocks,
     incidence_matrix_by_order,
     laplacian_matrices_all_orders,
     laplacian_matrix_by_order,
+    laplacian_operator_by_order,
+    multiorder_laplacian_operator,
+    sparse_adjacency_tensor,
     temporal_adjacency_matrix,
     temporal_adjacency_matrix_by_order,
     temporal_adjacency_matrices_all_orders,
@@ -27,6 +33,7 @@ __all__ = [
     "incidence_matrix",
     "incidence_matrix_by_order",
     "incidence_matrices_all_orders",
+    "incidence_matrix_blocks",
     "adjacency_matrix",
     "adjacency_matrix_by_order",
     "dual_random_walk_adjacency",
@@ -34,8 +41,13 @@ __all__ = [
     "laplacian_matrix_by_order",
     "laplacian_matrices_all_orders",
     "compute_multiorder_laplacian",
+    "LaplacianOperator",
+    "laplacian_operator_by_order",
+    "multiorder_laplacian_operator",
     "are_commuting",
     "adjacency_tensor",
+    "SymmetricAdjacencyTensor",
+    "sparse_adjacency_tensor",
     "adjacency_factor",
     "temporal_adjacency_matrix",
     "temporal_adjacency_matrix_by_order",
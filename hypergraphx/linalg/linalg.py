@@ -1,14 +1,15 @@
 from __future__ import annotations
 from typing import Any, Dict, List, Literal, Optional, Tuple
 import logging
+from itertools import permutations
 import numpy as np
 from scipy import sparse
 from scipy.sparse import csc_array
+from scipy.sparse.linalg import LinearOperator, aslinearoperator
 from scipy.special import factorial
 from hypergraphx import Hypergraph, TemporalHypergraph
 from hypergraphx.utils.labeling import get_inverse_mapping
 
-
 SparseFormat = Literal["csr", "csc"]
 
 
@@ -71,6 +72,140 @@ def hye_list_to_binary_incidence(
     return sparse.coo_array((data, (rows, columns)), shape=shape, dtype=np.uint8)
 
 
+def _incidence_arrays(
+    hypergraph: Hypergraph, return_counts: bool = False
+) -> (
+    Tuple[np.ndarray, np.ndarray, np.ndarray, List[Any]]
+    | Tuple[np.ndarray, np.ndarray, np.ndarray, List[Any], np.ndarray]
+):
+    """Build the compressed columns of the binary incidence matrix with a single pass
+    over the hyperedges.
+    Columns follow the order of hypergraph.get_edges(), rows the order of
+    hypergraph.get_nodes(). Within a column, the nodes are in the order of the
+    hyperedge, and repeated nodes are counted once.
+
+    Returns
+    -------
+    The indptr and indices arrays of the compressed columns, the hyperedge sizes and
+    the list of nodes.
+    If return_counts is True, also return the number of times every entry appears in
+    its hyperedge.
+    """
+    nodes = list(hypergraph.get_nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = hypergraph.get_edges()
+    sizes = np.fromiter(map(len, edges), dtype=np.int64, count=len(edges))
+    indptr = np.zeros(len(edges) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=indptr[1:])
+    indices = np.fromiter(
+        (index[node] for edge in edges for node in edge),
+        dtype=np.int64,
+        count=indptr[-1],
+    )
+
+    # Hyperedges are stored sorted, so that repeated nodes are consecutive
+    repeated = indices[1:] == indices[:-1]
+    repeated[indptr[1:-1] - 1] = False
+    counts = np.ones(len(indices), dtype=np.int64)
+    if repeated.any():
+        keep = np.concatenate(([True], ~repeated))
+        counts = np.bincount(np.cumsum(keep) - 1)
+        indices = indices[keep]
+        columns = np.repeat(np.arange(len(edges)), sizes)[keep]
+        indptr[1:] = np.cumsum(np.bincount(columns, minlength=len(edges)))
+    if return_counts:
+        return indptr, indices, sizes, nodes, counts
+    return indptr, indices, sizes, nodes
+
+
+def _weighted_data(
+    hypergraph: Hypergraph, indptr: np.ndarray, weights: Optional[List[Any]] = None
+) -> np.ndarray:
+    """Hyperedge weights repeated over the entries of the compressed columns."""
+    weights = np.asarray(hypergraph.get_weights() if weights is None else weights)
+    dtype = np.result_type(np.uint8, weights.dtype)
+    return np.repeat(weights, np.diff(indptr)).astype(dtype, copy=False)
+
+
+def incidence_matrix_blocks(
+    hypergraph: Hypergraph,
+    binary: bool = False,
+    return_mapping: bool = False,
+) -> (
+    Tuple[sparse.csc_array, Dict[int, slice]]
+    | Tuple[sparse.csc_array, Dict[int, slice], Dict[int, Any]]
+):
+    """Produce the incidence matrix of all the hyperedges of a hypergraph with a single
+    pass, with the columns grouped by order.
+    The hyperedges are sorted by order, and hyperedges of the same order are in the
+    order of hypergraph.get_edges(). The incidence matrix of order d is the column
+    slice matrix[:, slices[d]] of the shared matrix.
+
+    Parameters
+    ----------
+    hypergraph: the hypergraph.
+    binary: if True, the entries are 1, otherwise the weights of the hyperedges.
+    return_mapping: return the dictionary mapping the node indices to the hypergraph
+        nodes.
+
+    Returns
+    -------
+    The incidence matrix of shape (N, E), in CSC format, and the dictionary
+    {order: slice} of the columns of every order from 1 to the maximum order.
+    If return_mapping is True, return the dictionary of node mappings.
+    """
+    indptr, indices, sizes, nodes = _incidence_arrays(hypergraph)
+    if binary:
+        data = np.ones(len(indices), dtype=np.uint8)
+    else:
+        data = _weighted_data(hypergraph, indptr)
+
+    # Permute the compressed columns, so that they are sorted by order
+    perm = np.argsort(sizes, kind="stable")
+    counts = np.diff(indptr)[perm]
+    sorted_indptr = np.zeros_like(indptr)
+    np.cumsum(counts, out=sorted_indptr[1:])
+    entries = np.repeat(indptr[:-1][perm] - sorted_indptr[:-1], counts) + np.arange(
+        sorted_indptr[-1]
+    )
+    matrix = sparse.csc_array(
+        (data[entries], indices[entries], sorted_indptr),
+        shape=(len(nodes), len(sizes)),
+    )
+
+    orders = sizes[perm] - 1
+    max_order = int(orders[-1]) if len(orders) else 0
+    bounds = np.searchsorted(orders, np.arange(1, max_order + 2))
+    slices = {
+        order: slice(int(bounds[order - 1]), int(bounds[order]))
+        for order in range(1, max_order + 1)
+    }
+    if return_mapping:
+        return matrix, slices, dict(enumerate(nodes))
+    return matrix, slices
+
+
+def _incidence_block(
+    matrix: sparse.csc_array,
+    columns: slice,
+    nodes: Dict[int, Any],
+    keep_isolated_nodes: bool,
+    format: SparseFormat,
+) -> Tuple[sparse.sparray, Dict[int, Any]]:
+    """Incidence matrix of a block of columns of the shared incidence matrix.
+    If keep_isolated_nodes is False, only keep the rows of the nodes in the block, in
+    order of first appearance.
+    """
+    block = matrix[:, columns]
+    if not keep_isolated_nodes:
+        rows, first = np.unique(block.indices, return_index=True)
+        rows = rows[np.argsort(first)]
+        block = block[rows]
+        nodes = {i: nodes[row] for i, row in enumerate(rows.tolist())}
+    block.sort_indices()
+    return _as_sparse_format(block, format), nodes
+
+
 def binary_incidence_matrix(
     hypergraph: Hypergraph,
     return_mapping: bool = False,
@@ -94,14 +229,15 @@ def binary_incidence_matrix(
     The binary adjacency matrix representing the hyperedges.
     If return_mapping is True, return the dictionary of node mappings.
     """
-    encoder = hypergraph.get_mapping()
-    hye_list = [tuple(encoder.transform(hye)) for hye in hypergraph.get_edges()]
-
-    shape = (hypergraph.num_nodes(), hypergraph.num_edges())
-    incidence = _as_sparse_format(hye_list_to_binary_incidence(hye_list, shape), format)
+    indptr, indices, sizes, nodes = _incidence_arrays(hypergraph)
+    incidence = sparse.csc_array(
+        (np.ones(len(indices), dtype=np.uint8), indices, indptr),
+        shape=(len(nodes), len(sizes)),
+    )
+    incidence.sort_indices()
+    incidence = _as_sparse_format(incidence, format)
     if return_mapping:
-        mapping = get_inverse_mapping(encoder)
-        return incidence, mapping
+        return incidence, dict(enumerate(nodes))
     return incidence
 
 
@@ -128,14 +264,15 @@ def incidence_matrix(
     The binary adjacency matrix representing the hyperedges.
     If return_mapping is True, return the dictionary of node mappings.
     """
-    binary_incidence, mapping = binary_incidence_matrix(
-        hypergraph, return_mapping=True, format=format
-    )
-    incidence = _as_sparse_format(
-        binary_incidence.multiply(hypergraph.get_weights()), format
+    indptr, indices, sizes, nodes = _incidence_arrays(hypergraph)
+    incidence = sparse.csc_array(
+        (_weighted_data(hypergraph, indptr), indices, indptr),
+        shape=(len(nodes), len(sizes)),
     )
+    incidence.sort_indices()
+    incidence = _as_sparse_format(incidence, format)
     if return_mapping:
-        return incidence, mapping
+        return incidence, dict(enumerate(nodes))
     return incidence
 
 
@@ -169,16 +306,9 @@ def incidence_matrix_by_order(
     The incidence matrix.
     If return_mapping is True, return the dictionary of node mappings.
     """
-    binary_incidence, mapping = binary_incidence_matrix(
-        hypergraph.get_edges(
-            order=order, subhypergraph=True, keep_isolated_nodes=keep_isolated_nodes
-        ),
-        return_mapping=True,
-        format=format,
-    )
-
-    incidence = _as_sparse_format(
-        binary_incidence.multiply(hypergraph.get_weights(order=order)), format
+    matrix, slices, nodes = incidence_matrix_blocks(hypergraph, return_mapping=True)
+    incidence, mapping = _incidence_block(
+        matrix, slices.get(order, slice(0, 0)), nodes, keep_isolated_nodes, format
     )
     if return_mapping:
         return incidence, mapping
@@ -198,6 +328,7 @@ def incidence_matrices_all_orders(
     """Produce the incidence matrices of a hypergraph at all orders.
     For any node i and hyperedge e, the entry (i, e) of the incidence matrix is the
     weight of the hyperedge if the node belongs to it, 0 otherwise.
+    All the matrices are column slices of the same incidence matrix, built once.
 
     Parameters
     ----------
@@ -214,27 +345,13 @@ def incidence_matrices_all_orders(
     -------
     Dictionary mapping each order to its incidence matrix.
     """
+    matrix, slices, nodes = incidence_matrix_blocks(hypergraph, return_mapping=True)
     incidence_matrices = {}
     mappings: Dict[int, Dict[int, Any]] = {}
     for order in range(1, hypergraph.max_order() + 1):
-        if return_mapping:
-            incidence_matrices[order], mappings[order] = incidence_matrix_by_order(
-                hypergraph,
-                order,
-                shape,
-                keep_isolated_nodes,
-                return_mapping,
-                format=format,
-            )
-        else:
-            incidence_matrices[order] = incidence_matrix_by_order(
-                hypergraph,
-                order,
-                shape,
-                keep_isolated_nodes,
-                return_mapping,
-                format=format,
-            )
+        incidence_matrices[order], mappings[order] = _incidence_block(
+            matrix, slices[order], nodes, keep_isolated_nodes, format
+        )
     if return_mapping:
         return incidence_matrices, mappings
     return incidence_matrices
@@ -366,6 +483,189 @@ def degree_matrix(
     return deg
 
 
+class LaplacianOperator(LinearOperator):
+    """Hypergraph Laplacian L = D - B W B^T, applied in factored form.
+    B is the binary incidence matrix, W the diagonal matrix of the hyperedge
+    coefficients and D the diagonal matrix of the node coefficients. A product with L
+    costs two sparse products with B, so that the Laplacian is never materialized.
+
+    Parameters
+    ----------
+    incidence: the binary incidence matrix B, of shape (N, E).
+    edge_weights: the diagonal of W, of length E.
+    degrees: the diagonal of D, of length N.
+    """
+
+    def __init__(
+        self,
+        incidence: sparse.sparray,
+        edge_weights: np.ndarray,
+        degrees: np.ndarray,
+    ):
+        self.incidence = sparse.csr_array(incidence, dtype=np.float64)
+        self.incidence_t = sparse.csr_array(self.incidence.T)
+        self.edge_weights = np.asarray(edge_weights, dtype=np.float64)
+        self.degrees = np.asarray(degrees, dtype=np.float64)
+        num_nodes = self.incidence.shape[0]
+        super().__init__(dtype=np.dtype(np.float64), shape=(num_nodes, num_nodes))
+
+    def _matvec(self, x: np.ndarray) -> np.ndarray:
+        x = np.ravel(x)
+        return self.degrees * x - self.incidence @ (
+            self.edge_weights * (self.incidence_t @ x)
+        )
+
+    def _matmat(self, X: np.ndarray) -> np.ndarray:
+        return self.degrees[:, None] * X - self.incidence @ (
+            self.edge_weights[:, None] * (self.incidence_t @ X)
+        )
+
+    def _adjoint(self) -> "LaplacianOperator":
+        return self
+
+    def diagonal(self) -> np.ndarray:
+        """Diagonal of the Laplacian."""
+        return self.degrees - self.incidence @ self.edge_weights
+
+    def tosparse(self, format: SparseFormat = "csr") -> sparse.sparray:
+        """Materialize the Laplacian as a sparse matrix."""
+        laplacian = sparse.diags_array(self.degrees, format="csr") - (
+            (self.incidence * self.edge_weights) @ self.incidence_t
+        )
+        return _as_sparse_format(sparse.csr_array(laplacian), format)
+
+
+def _laplacian_terms(
+    hypergraph: Hypergraph,
+) -> Tuple[sparse.csc_array, sparse.csc_array, np.ndarray, np.ndarray, Dict[int, Any]]:
+    """Binary incidence matrix, multiplicities of the nodes in the hyperedges, and
+    order and squared weight of every hyperedge.
+    """
+    indptr, indices, sizes, nodes, counts = _incidence_arrays(
+        hypergraph, return_counts=True
+    )
+    shape = (len(nodes), len(sizes))
+    binary = sparse.csc_array((np.ones(len(indices)), indices, indptr), shape=shape)
+    multiplicity = sparse.csc_array(
+        (counts.astype(np.float64), indices, indptr), shape=shape
+    )
+    weights = np.asarray(hypergraph.get_weights(), dtype=np.float64)
+    return binary, multiplicity, sizes - 1, weights**2, dict(enumerate(nodes))
+
+
+def _combined_laplacian(
+    binary: sparse.csc_array,
+    multiplicity: sparse.csc_array,
+    orders: np.ndarray,
+    squared_weights: np.ndarray,
+    coefficients: Dict[int, float],
+) -> LaplacianOperator:
+    """Laplacian operator of sum_d coefficients[d] * L_d, with
+    L_d = (d + 1) D_d - B_d W_d^2 B_d^T.
+    The degrees count the nodes repeated in a hyperedge as many times as they appear,
+    as in hypergraph.degree_sequence. Only the columns of the orders with a non-zero
+    coefficient are kept.
+    """
+    edge_coefficients = np.zeros(len(orders))
+    for order, coefficient in coefficients.items():
+        edge_coefficients[orders == order] = coefficient
+    columns = np.flatnonzero(edge_coefficients)
+    edge_coefficients = edge_coefficients[columns]
+    degrees = multiplicity[:, columns] @ (edge_coefficients * (orders[columns] + 1))
+    return LaplacianOperator(
+        binary[:, columns], edge_coefficients * squared_weights[columns], degrees
+    )
+
+
+def _order_scale(order: int, weighted: bool) -> float:
+    return float(factorial(order - 1)) if weighted else 1.0
+
+
+def laplacian_operator_by_order(
+    hypergraph: Hypergraph,
+    order: int,
+    weighted: bool = False,
+    return_mapping: bool = False,
+) -> LaplacianOperator | Tuple[LaplacianOperator, Dict[int, Any]]:
+    """Laplacian of the hypergraph at a given order, as a linear operator.
+    The Laplacian is L_d = (d + 1) D_d - B_d B_d^T, where D_d is the degree matrix and
+    B_d the incidence matrix of the hyperedges of order d.
+
+    Parameters
+    ----------
+    hypergraph: the hypergraph.
+    order: the order.
+    weighted: if True, scale the Laplacian by (d - 1)!.
+    return_mapping: return the dictionary mapping the node indices to the hypergraph
+        nodes.
+
+    Returns
+    -------
+    The Laplacian operator, over all the nodes of the hypergraph.
+    If return_mapping is True, return the dictionary of node mappings.
+    """
+    binary, multiplicity, orders, squared_weights, mapping = _laplacian_terms(
+        hypergraph
+    )
+    laplacian = _combined_laplacian(
+        binary,
+        multiplicity,
+        orders,
+        squared_weights,
+        {order: _order_scale(order, weighted)},
+    )
+    if return_mapping:
+        return laplacian, mapping
+    return laplacian
+
+
+def multiorder_laplacian_operator(
+    hypergraph: Hypergraph,
+    sigmas,
+    order_weighted: bool = False,
+    degree_weighted: bool = True,
+    return_mapping: bool = False,
+) -> LaplacianOperator | Tuple[LaplacianOperator, Dict[int, Any]]:
+    """Multiorder Laplacian sum_d sigma_d L_d of the hypergraph, as a linear operator.
+    All the orders share the same incidence matrix, and the coupling strengths
+    sigma_d only rescale its columns, so that the Laplacians of the single orders are
+    never built.
+
+    Parameters
+    ----------
+    hypergraph: the hypergraph.
+    sigmas: the coupling strengths of the orders 1, 2, ...
+    order_weighted: if True, scale the Laplacian of order d by (d - 1)!.
+    degree_weighted: if True, divide the Laplacian of order d by the average degree
+        of order d. Orders without hyperedges are skipped.
+    return_mapping: return the dictionary mapping the node indices to the hypergraph
+        nodes.
+
+    Returns
+    -------
+    The multiorder Laplacian operator.
+    If return_mapping is True, return the dictionary of node mappings.
+    """
+    binary, multiplicity, orders, squared_weights, mapping = _laplacian_terms(
+        hypergraph
+    )
+    coefficients = {}
+    for order, sigma in zip(range(1, hypergraph.max_order() + 1), sigmas):
+        coefficient = sigma * _order_scale(order, order_weighted)
+        if degree_weighted:
+            total_degree = multiplicity[:, orders == order].sum()
+            coefficient = (
+                coefficient * binary.shape[0] / total_degree if total_degree else 0.0
+            )
+        coefficients[order] = coefficient
+    laplacian = _combined_laplacian(
+        binary, multiplicity, orders, squared_weights, coefficients
+    )
+    if return_mapping:
+        return laplacian, mapping
+    return laplacian
+
+
 def laplacian_matrix_by_order(
     hypergraph: Hypergraph,
     order: int,
@@ -374,23 +674,10 @@ def laplacian_matrix_by_order(
     return_mapping: bool = False,
     format: SparseFormat = "csr",
 ) -> sparse.sparray | Tuple[sparse.sparray, Dict[int, Any]]:
-    incidence, mapping = incidence_matrix_by_order(
-        hypergraph,
-        order,
-        shape,
-        keep_isolated_nodes=True,
-        return_mapping=True,
-        format=format,
+    laplacian, mapping = laplacian_operator_by_order(
+        hypergraph, order, weighted, return_mapping=True
     )
-
-    degree_mtx = degree_matrix(hypergraph, order, mapping=mapping, format=format)
-    laplacian = degree_mtx.multiply(order + 1) - (incidence @ incidence.transpose())
-    laplacian = _as_sparse_format(laplacian, format)
-
-    if weighted:
-        scale_factor = factorial(order - 1)
-        laplacian = laplacian.multiply(scale_factor)
-
+    laplacian = laplacian.tosparse(format)
     if return_mapping:
         return laplacian, mapping
     return laplacian
@@ -406,27 +693,20 @@ def laplacian_matrices_all_orders(
     Dict[int, sparse.spmatrix]
     | Tuple[Dict[int, sparse.spmatrix], Dict[int, Dict[int, Any]]]
 ):
+    binary, multiplicity, orders, squared_weights, mapping = _laplacian_terms(
+        hypergraph
+    )
     laplacian_matrices = {}
     mappings: Dict[int, Dict[int, Any]] = {}
     for order in range(1, hypergraph.max_order() + 1):
-        if return_mapping:
-            laplacian_matrices[order], mappings[order] = laplacian_matrix_by_order(
-                hypergraph,
-                order,
-                weighted,
-                shape,
-                return_mapping=True,
-                format=format,
-            )
-        else:
-            laplacian_matrices[order] = laplacian_matrix_by_order(
-                hypergraph,
-                order,
-                weighted,
-                shape,
-                return_mapping=False,
-                format=format,
-            )
+        laplacian_matrices[order] = _combined_laplacian(
+            binary,
+            multiplicity,
+            orders,
+            squared_weights,
+            {order: _order_scale(order, weighted)},
+        ).tosparse(format)
+        mappings[order] = mapping
     if return_mapping:
         return laplacian_matrices, mappings
     return laplacian_matrices
@@ -435,45 +715,50 @@ def laplacian_matrices_all_orders(
 def compute_multiorder_laplacian(
     hypergraph: Hypergraph, sigmas, order_weighted=False, degree_weighted=True
 ) -> sparse.spmatrix:
-    if not type(sigmas) == np.ndarray:
-        sigmas = np.array(sigmas)
-
-    laplacians = laplacian_matrices_all_orders(hypergraph, order_weighted)
-    laplacians = [laplacians[key] for key in sorted(laplacians.keys(), reverse=False)]
-    weighted_laplacians = [
-        laplacian.multiply(sigma) for laplacian, sigma in zip(laplacians, sigmas)
-    ]
-
-    if degree_weighted:
-        average_degrees = [
-            np.average(list(hypergraph.degree_sequence(order).values()))
-            for order in range(1, hypergraph.max_order() + 1)
-        ]
-        weighted_laplacians = [
-            laplacian.multiply(1.0 / degree)
-            for laplacian, degree in zip(weighted_laplacians, average_degrees)
-        ]
-
-    multiorder_laplacian = sum(weighted_laplacians)
-
-    return multiorder_laplacian
+    return multiorder_laplacian_operator(
+        hypergraph, sigmas, order_weighted, degree_weighted
+    ).tosparse()
+
+
+def are_commuting(
+    laplacian_matrices: List[sparse.spmatrix | LinearOperator],
+    verbose=True,
+    n_probes: int = 4,
+    rtol: float = 1e-10,
+    seed: Optional[int] = None,
+) -> bool:
+    """Check if the Laplacian matrices commute pairwise.
+    The commutator L1 L2 - L2 L1 of every pair is applied to n_probes random Gaussian
+    vectors, so that the products of the matrices are never formed. A non-zero
+    commutator is detected with probability one, and the pair is considered commuting
+    if the norm of the residual is at most rtol times the norm of the products.
 
+    Parameters
+    ----------
+    laplacian_matrices: the sparse matrices, dense arrays or linear operators.
+    verbose: if True, log the result.
+    n_probes: the number of random vectors.
+    rtol: the relative tolerance on the residual.
+    seed: the seed of the random vectors.
 
-def are_commuting(laplacian_matrices: List[sparse.spmatrix], verbose=True) -> bool:
+    Returns
+    -------
+    True if all the pairs of matrices commute, False otherwise.
+    """
     logger = logging.getLogger(__name__)
-    orders = len(laplacian_matrices)
-
-    for d1 in range(orders - 1):
-        laplacian_d1 = laplacian_matrices[d1]
-        for d2 in range(d1 + 1, orders):
-            laplacian_d2 = laplacian_matrices[d2]
-
-            d1d2_product = laplacian_d1.dot(laplacian_d2)
-            d2d1_product = laplacian_d2.dot(laplacian_d1)
-
-            commutator = d1d2_product - d2d1_product
-
-            if not commutator.any():
+    operators = [aslinearoperator(laplacian) for laplacian in laplacian_matrices]
+    if operators:
+        rng = np.random.default_rng(seed)
+        probes = rng.standard_normal((operators[0].shape[1], n_probes))
+        products = [operator @ probes for operator in operators]
+
+    for d1 in range(len(operators) - 1):
+        for d2 in range(d1 + 1, len(operators)):
+            d1d2_product = operators[d1] @ products[d2]
+            d2d1_product = operators[d2] @ products[d1]
+            residual = np.linalg.norm(d1d2_product - d2d1_product)
+            scale = np.linalg.norm(d1d2_product) + np.linalg.norm(d2d1_product)
+            if residual > rtol * scale:
                 if verbose:
                     logger.info("The Laplacian matrices do not commute")
                 return False
@@ -499,6 +784,10 @@ def adjacency_tensor(hypergraph: Hypergraph) -> np.ndarray:
     -------
     T : np.ndarray
         The tensor of the hypergraph.
+
+    See Also
+    --------
+    sparse_adjacency_tensor: the sparse symmetric tensor, for larger hypergraphs.
     """
 
     if not hypergraph.is_uniform():
@@ -515,6 +804,190 @@ def adjacency_tensor(hypergraph: Hypergraph) -> np.ndarray:
     return T
 
 
+class SymmetricAdjacencyTensor:
+    """Sparse symmetric adjacency tensor of a uniform hypergraph.
+    For a hypergraph whose hyperedges have m nodes, the tensor has order m and shape
+    (N,) * m. The entry at every permutation of the node indices of a hyperedge is the
+    value of the hyperedge, and all the other entries are 0. Every hyperedge is stored
+    once, as the sorted tuple of its node indices.
+
+    Parameters
+    ----------
+    indices: array of shape (E, m) with the node indices of the hyperedges.
+    values: the values of the hyperedges. If None, all the values are 1.
+    num_nodes: the number of nodes N. If None, the maximum index plus one.
+    mapping: the dictionary mapping the node indices to the hypergraph nodes. If None,
+        the identity.
+    """
+
+    def __init__(
+        self,
+        indices: np.ndarray,
+        values: Optional[np.ndarray] = None,
+        num_nodes: Optional[int] = None,
+        mapping: Optional[Dict[int, Any]] = None,
+    ):
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.ndim != 2 or indices.shape[1] < 2:
+            raise ValueError("indices must be an array of shape (E, m), with m >= 2.")
+        self.indices = np.sort(indices, axis=1)
+        if values is None:
+            values = np.ones(len(indices))
+        self.values = np.asarray(values, dtype=np.float64)
+        if num_nodes is None:
+            num_nodes = int(self.indices.max()) + 1 if len(indices) else 0
+        self.num_nodes = num_nodes
+        self.shape = (num_nodes,) * self.indices.shape[1]
+        self.mapping = dict(enumerate(range(num_nodes))) if mapping is None else mapping
+
+        # A hyperedge with repeated nodes has prod(c!) fewer distinct permutations,
+        # where c are the multiplicities of its nodes
+        run = np.ones(len(indices))
+        permutation_counts = np.ones(len(indices))
+        for p in range(1, self.ndim):
+            run = np.where(self.indices[:, p] == self.indices[:, p - 1], run + 1, 1)
+            permutation_counts *= run
+        self._edge_scale = self.values / permutation_counts
+
+    @classmethod
+    def from_hypergraph(
+        cls, hypergraph: Hypergraph, weighted: bool = False
+    ) -> "SymmetricAdjacencyTensor":
+        """Build the adjacency tensor of a uniform hypergraph.
+        The node indices follow the order of hypergraph.get_nodes().
+
+        Parameters
+        ----------
+        hypergraph: the uniform hypergraph.
+        weighted: if True, the values are the weights of the hyperedges, otherwise 1.
+        """
+        if not hypergraph.is_uniform():
+            raise ValueError("The hypergraph is not uniform.")
+        nodes = list(hypergraph.get_nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = hypergraph.get_edges()
+        size = len(edges[0]) if edges else 2
+        indices = np.fromiter(
+            (index[node] for edge in edges for node in edge),
+            dtype=np.int64,
+            count=len(edges) * size,
+        ).reshape(len(edges), size)
+        values = hypergraph.get_weights() if weighted else None
+        return cls(indices, values, len(nodes), dict(enumerate(nodes)))
+
+    @property
+    def ndim(self) -> int:
+        return self.indices.shape[1]
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def ttv(self, x: np.ndarray) -> np.ndarray:
+        """Contraction T x^(m-1) of the tensor with the vector x along all the modes
+        but the first, i.e. the vector with entries
+        sum_{j_2, ..., j_m} T[i, j_2, ..., j_m] x[j_2] ... x[j_m].
+        """
+        x = np.asarray(x)
+        factors = x[self.indices]
+        # Product of the other nodes of the hyperedge, from prefix and suffix products
+        prefix = np.ones_like(factors)
+        suffix = np.ones_like(factors)
+        prefix[:, 1:] = np.cumprod(factors[:, :-1], axis=1)
+        suffix[:, :-1] = np.cumprod(factors[:, :0:-1], axis=1)[:, ::-1]
+        scale = self._edge_scale * float(factorial(self.ndim - 1, exact=True))
+        contributions = prefix * suffix * scale[:, None]
+        return np.bincount(
+            self.indices.ravel(),
+            weights=contributions.ravel(),
+            minlength=self.num_nodes,
+        )
+
+    def ttm(self, x: Optional[np.ndarray] = None) -> sparse.csr_array:
+        """Contraction T x^(m-2) of the tensor with the vector x along all the modes
+        but the first two, as a sparse N x N matrix. If x is None, x is the vector of
+        ones, so that the entry (i, j) counts the hyperedges containing i and j, times
+        (m-2)!.
+        """
+        m = self.ndim
+        factors = (
+            np.ones(self.indices.shape) if x is None else np.asarray(x)[self.indices]
+        )
+        scale = self._edge_scale * float(factorial(m - 2, exact=True))
+        rows, columns, data = [], [], []
+        for p, q in permutations(range(m), 2):
+            others = [r for r in range(m) if r != p and r != q]
+            rows.append(self.indices[:, p])
+            columns.append(self.indices[:, q])
+            data.append(scale * np.prod(factors[:, others], axis=1))
+        matrix = sparse.coo_array(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(columns))),
+            shape=(self.num_nodes, self.num_nodes),
+        )
+        return sparse.csr_array(matrix)
+
+    def _entries(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Coordinates of shape (nnz, m) and values of all the non-zero entries."""
+        m = self.ndim
+        orderings = np.array(list(permutations(range(m))))
+        coords = self.indices[:, orderings].reshape(-1, m)
+        values = np.repeat(self.values, len(orderings))
+        # Repeated nodes give the same entry more than once
+        _, first = np.unique(coords, axis=0, return_index=True)
+        first.sort()
+        return coords[first], values[first]
+
+    def unfold(self, mode: int = 0) -> sparse.csr_array:
+        """Mode unfolding of the tensor, as a sparse N x N^(m-1) matrix.
+        The column of the entry T[i_1, ..., i_m] is the row-major index of the
+        remaining indices. The tensor is symmetric, so that all the modes have the
+        same unfolding.
+        """
+        if not 0 <= mode < self.ndim:
+            raise ValueError(f"mode must be between 0 and {self.ndim - 1}.")
+        if self.num_nodes ** (self.ndim - 1) > np.iinfo(np.int64).max:
+            raise ValueError("The unfolding has too many columns.")
+        coords, values = self._entries()
+        rest = np.delete(coords, mode, axis=1)
+        columns = np.ravel_multi_index(rest.T, self.shape[1:])
+        matrix = sparse.coo_array(
+            (values, (coords[:, mode], columns)),
+            shape=(self.num_nodes, self.num_nodes ** (self.ndim - 1)),
+        )
+        return sparse.csr_array(matrix)
+
+    def to_coo(self) -> sparse.coo_array:
+        """The tensor as an m-dimensional sparse COO array."""
+        coords, values = self._entries()
+        return sparse.coo_array((values, tuple(coords.T)), shape=self.shape)
+
+    def todense(self) -> np.ndarray:
+        return self.to_coo().toarray()
+
+
+def sparse_adjacency_tensor(
+    hypergraph: Hypergraph, weighted: bool = False, return_mapping: bool = False
+) -> SymmetricAdjacencyTensor | Tuple[SymmetricAdjacencyTensor, Dict[int, Any]]:
+    """Compute the sparse symmetric adjacency tensor of a uniform hypergraph.
+
+    Parameters
+    ----------
+    hypergraph: the uniform hypergraph.
+    weighted: if True, the values are the weights of the hyperedges, otherwise 1.
+    return_mapping: return the dictionary mapping the node indices to the hypergraph
+        nodes.
+
+    Returns
+    -------
+    The adjacency tensor.
+    If return_mapping is True, return the dictionary of node mappings.
+    """
+    tensor = SymmetricAdjacencyTensor.from_hypergraph(hypergraph, weighted)
+    if return_mapping:
+        return tensor, tensor.mapping
+    return tensor
+
+
 def adjacency_factor(hypergraph: Hypergraph | TemporalHypergraph, t: int = 0):
     if isinstance(hypergraph, Hypergraph):
         matrix, mapping = hypergraph.adjacency_matrix(return_mapping=True)
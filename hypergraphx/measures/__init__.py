@@ -28,6 +28,18 @@ def degree_distribution(hypergraph, *, order=None, size=None):
     return _impl(hypergraph, order=order, size=size)
 
 
+def degree_sequences_all_orders(hypergraph, *, weighted=False, return_mapping=False):
+    from hypergraphx.measures.degree import degree_sequences_all_orders as _impl
+
+    return _impl(hypergraph, weighted=weighted, return_mapping=return_mapping)
+
+
+def degree_distributions_all_orders(hypergraph, *, weighted=False):
+    from hypergraphx.measures.degree import degree_distributions_all_orders as _impl
+
+    return _impl(hypergraph, weighted=weighted)
+
+
 def degree_correlation(hypergraph):
     from hypergraphx.measures.degree import degree_correlation as _impl
 
@@ -82,6 +94,8 @@ __all__ = [
     "degree",
     "degree_sequence",
     "degree_distribution",
+    "degree_sequences_all_orders",
+    "degree_distributions_all_orders",
     "degree_correlation",
     "intersection",
     "jaccard_similarity",
@@ -44,6 +44,96 @@ def degree(
         return len(hg.get_incident_edges(node, order=order))
 
 
+def degree_sequences_all_orders(
+    hg: Hypergraph | DirectedHypergraph | TemporalHypergraph,
+    weighted=False,
+    return_mapping=False,
+):
+    """
+    Computes the degrees of all the nodes at all the orders, with a single pass over
+    the incidences of the hypergraph.
+
+    Parameters
+    ----------
+    hg : Hypergraph|DirectedHypergraph|TemporalHypergraph
+        The hypergraph of interest.
+    weighted : bool, optional
+        If True, sum the weights of the incident hyperedges, i.e. compute the strengths.
+    return_mapping : bool, optional
+        If True, return the dictionary mapping the row indices to the nodes.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (N, max_order + 1), whose entry (i, d) is the number of
+        hyperedges of order d incident to the node i, or their total weight if
+        weighted is True. The rows follow the order of hg.get_nodes().
+    dict
+        Only if return_mapping is True, the dictionary {i: node}.
+    """
+    nodes = list(hg.get_nodes())
+    rows, orders, weights = hg.incidence_arrays(node_order=nodes)
+    rows = np.asarray(rows, dtype=np.int64)
+    orders = np.asarray(orders, dtype=np.int64)
+    num_orders = int(orders.max()) + 1 if len(orders) else 1
+    weights = np.asarray(weights, dtype=float) if weighted else None
+    degrees = np.bincount(
+        rows * num_orders + orders,
+        weights=weights,
+        minlength=len(nodes) * num_orders,
+    ).reshape(len(nodes), num_orders)
+    if return_mapping:
+        return degrees, dict(enumerate(nodes))
+    return degrees
+
+
+def _distribution(values: np.ndarray) -> dict:
+    """Number of times every value appears, in order of first appearance."""
+    unique, first, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.argsort(first)
+    return dict(zip(unique[order].tolist(), counts[order].tolist()))
+
+
+def degree_distributions_all_orders(
+    hg: Hypergraph | DirectedHypergraph | TemporalHypergraph, weighted=False
+):
+    """
+    Computes the degree distributions of the hypergraph at all the orders at once.
+
+    Parameters
+    ----------
+    hg : Hypergraph|DirectedHypergraph|TemporalHypergraph
+        The hypergraph of interest.
+    weighted : bool, optional
+        If True, compute the distributions of the strengths.
+
+    Returns
+    -------
+    dict
+        Dictionary {order: distribution} for the orders from 1 to the maximum order,
+        where every distribution maps the degrees to the number of nodes with that
+        degree.
+    """
+    degrees = degree_sequences_all_orders(hg, weighted=weighted)
+    return {
+        order: _distribution(degrees[:, order]) for order in range(1, degrees.shape[1])
+    }
+
+
+def _degree_values(hg, order=None, size=None):
+    """Degrees of the nodes of hg at the given order, and the node mapping."""
+    if order is not None and size is not None:
+        raise InvalidParameterError("Order and size cannot be both specified.")
+    if size is not None:
+        order = size - 1
+    degrees, mapping = degree_sequences_all_orders(hg, return_mapping=True)
+    if order is None:
+        return degrees.sum(axis=1), mapping
+    if 0 <= order < degrees.shape[1]:
+        return degrees[:, order], mapping
+    return np.zeros(len(mapping), dtype=np.int64), mapping
+
+
 def degree_sequence(
     hg: Hypergraph | DirectedHypergraph | TemporalHypergraph, order=None, size=None
 ):
@@ -64,14 +154,8 @@ def degree_sequence(
     dict
         The degree sequence of the hypergraph. The keys are the nodes and the values are the degrees.
     """
-    if order is not None and size is not None:
-        raise InvalidParameterError("Order and size cannot be both specified.")
-    if size is not None:
-        order = size - 1
-    if order is None:
-        return {node: hg.degree(node) for node in hg.get_nodes()}
-    else:
-        return {node: hg.degree(node, order=order) for node in hg.get_nodes()}
+    values, mapping = _degree_values(hg, order=order, size=size)
+    return dict(zip(mapping.values(), values.tolist()))
 
 
 def degree_correlation(hg: "Hypergraph") -> np.ndarray:
@@ -90,17 +174,8 @@ def degree_correlation(hg: "Hypergraph") -> np.ndarray:
         The (i, j) entry is the Pearson correlation coefficient between the degree sequence at size i + 2
         and the degree sequence at size j + 2.
     """
-    from scipy.stats import pearsonr
-
-    seqs = [hg.degree_sequence(size=size) for size in range(2, hg.max_size() + 1)]
-    matrix_degree_corr = np.zeros((len(seqs), len(seqs)))
-    for i in range(len(seqs)):
-        for j in range(len(seqs)):
-            matrix_degree_corr[i, j] = pearsonr(
-                list(seqs[i].values()), list(seqs[j].values())
-            )[0]
-
-    return matrix_degree_corr
+    degrees = degree_sequences_all_orders(hg)[:, 1 : hg.max_size()]
+    return np.atleast_2d(np.corrcoef(degrees, rowvar=False))
 
 
 def degree_distribution(
@@ -123,22 +198,8 @@ def degree_distribution(
     dict
         The degree distribution of the hypergraph. The keys are the degrees and the values are the number of nodes with that degree.
     """
-    if order is not None and size is not None:
-        raise InvalidParameterError("Order and size cannot be both specified.")
-    if size is not None:
-        order = size - 1
-    if order is None:
-        degree_seq = hg.degree_sequence()
-    else:
-        degree_seq = hg.degree_sequence(order=order)
-
-    degree_dist = {}
-    for node, deg in degree_seq.items():
-        if deg not in degree_dist:
-            degree_dist[deg] = 0
-        degree_dist[deg] += 1
-
-    return degree_dist
+    values, _ = _degree_values(hg, order=order, size=size)
+    return _distribution(values)
 
 
 def node_degree(hg, node, order=None, size=None):
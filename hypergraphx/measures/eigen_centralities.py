@@ -1,5 +1,8 @@
 import logging
 import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+from hypergraphx.linalg.linalg import SymmetricAdjacencyTensor
 
 
 def power_method(
@@ -16,7 +19,7 @@ def power_method(
     rng = rng if rng is not None else np.random.default_rng(seed)
     # initialize x
     if x0 is None:
-        x = rng.random(len(W))
+        x = rng.random(W.shape[0])
     else:
         x = np.asarray(x0, dtype=float)
     x = x / np.linalg.norm(x)
@@ -26,7 +29,7 @@ def power_method(
     k = 0
     while res > tol and k < max_iter:
         # compute y
-        y = np.dot(W, x)
+        y = W @ x
         # compute the norm of y
         y_norm = np.linalg.norm(y)
         # compute the residual
@@ -38,6 +41,22 @@ def power_method(
     return x
 
 
+def _adjacency_tensor(HG) -> SymmetricAdjacencyTensor:
+    """Adjacency tensor of a uniform and connected hypergraph, or the tensor itself."""
+    if isinstance(HG, SymmetricAdjacencyTensor):
+        tensor = HG
+    else:
+        # check if the hypergraph is uniform, use raise exception
+        if not HG.is_uniform():
+            raise Exception("The hypergraph is not uniform.")
+        tensor = SymmetricAdjacencyTensor.from_hypergraph(HG)
+    # check if the hypergraph is connected, use raise exception
+    n_components, _ = connected_components(tensor.ttm(), directed=False)
+    if n_components > 1:
+        raise Exception("The hypergraph is not connected.")
+    return tensor
+
+
 def CEC_centrality(HG, tol=1e-7, max_iter=1000, *, seed=None, rng=None):
     """
     Compute the CEC centrality for uniform hypergraphs.
@@ -45,8 +64,9 @@ def CEC_centrality(HG, tol=1e-7, max_iter=1000, *, seed=None, rng=None):
     Parameters
     ----------
 
-    HG : Hypergraph
-        The uniform hypergraph on which the CEC centrality is computed.
+    HG : Hypergraph or SymmetricAdjacencyTensor
+        The uniform hypergraph on which the CEC centrality is computed, or its
+        adjacency tensor.
     tol : float
         The tolerance for calculating the dominant eigenvalue by power method.
     max_iter : int
@@ -66,22 +86,12 @@ def CEC_centrality(HG, tol=1e-7, max_iter=1000, *, seed=None, rng=None):
 
     """
 
-    # check if the hypergraph is uniform, use raise exception
-    if not HG.is_uniform():
-        raise Exception("The hypergraph is not uniform.")
-    # check if HG is connected, use raise exception
-    if not HG.is_connected():
-        raise Exception("The hypergraph is not connected.")
-    # define W, matrix N x N where i,j is the number of common edges between i and j
-    W = np.zeros((HG.num_nodes(), HG.num_nodes()))
-    order = len(HG.get_edges()[0])
-    for edge in HG.get_edges():
-        for i in range(order):
-            for j in range(i + 1, order):
-                W[edge[i], edge[j]] += 1
-                W[edge[j], edge[i]] += 1
+    tensor = _adjacency_tensor(HG)
+    # W is the N x N matrix where i,j is the number of common edges between i and j,
+    # up to a constant factor
+    W = tensor.ttm()
     dominant_eig = power_method(W, tol=tol, max_iter=max_iter, seed=seed, rng=rng)
-    return {node: dominant_eig[node] for node in range(HG.num_nodes())}
+    return {tensor.mapping[i]: dominant_eig[i] for i in range(tensor.num_nodes)}
 
 
 def ZEC_centrality(HG, max_iter=1000, tol=1e-7, *, seed=None, rng=None):
@@ -91,8 +101,9 @@ def ZEC_centrality(HG, max_iter=1000, tol=1e-7, *, seed=None, rng=None):
     Parameters
     ----------
 
-    HG : Hypergraph
-        The uniform hypergraph on which the ZEC centrality is computed.
+    HG : Hypergraph or SymmetricAdjacencyTensor
+        The uniform hypergraph on which the ZEC centrality is computed, or its
+        adjacency tensor.
     max_iter : int
         The maximum number of iterations.
     tol : float
@@ -110,22 +121,16 @@ def ZEC_centrality(HG, max_iter=1000, tol=1e-7, *, seed=None, rng=None):
     https://doi.org/10.1137/18M1203031
 
     """
-    if not HG.is_uniform():
-        raise Exception("The hypergraph is not uniform.")
-
-    if not HG.is_connected():
-        raise Exception("The hypergraph is not connected.")
-
-    g = lambda v, e: np.prod(v[list(e)])
+    tensor = _adjacency_tensor(HG)
 
     if rng is not None and seed is not None:
         raise ValueError("Provide only one of seed= or rng=.")
     rng = rng if rng is not None else np.random.default_rng(seed)
-    x = rng.uniform(size=(HG.num_nodes()))
+    x = rng.uniform(size=(tensor.num_nodes))
     x = x / np.linalg.norm(x, 1)
 
     for iter in range(max_iter):
-        new_x = apply(HG, x, g)
+        new_x = tensor.ttv(x)
         # multiply by the sign to try and enforce positivity
         new_x = np.sign(new_x[0]) * new_x / np.linalg.norm(new_x, 1)
         if np.linalg.norm(x - new_x) <= tol:
@@ -133,7 +138,7 @@ def ZEC_centrality(HG, max_iter=1000, tol=1e-7, *, seed=None, rng=None):
         x = new_x.copy()
     else:
         "Iteration did not converge!"
-    return {node: x[node] for node in range(HG.num_nodes())}
+    return {tensor.mapping[i]: x[i] for i in range(tensor.num_nodes)}
 
 
 def HEC_centrality(HG, max_iter=100, tol=1e-6, *, seed=None, rng=None):
@@ -144,8 +149,9 @@ def HEC_centrality(HG, max_iter=100, tol=1e-6, *, seed=None, rng=None):
     Parameters
     ----------
 
-    HG : Hypergraph
-        The uniform hypergraph on which the HEC centrality is computed.
+    HG : Hypergraph or SymmetricAdjacencyTensor
+        The uniform hypergraph on which the HEC centrality is computed, or its
+        adjacency tensor.
     max_iter : int
         The maximum number of iterations.
     tol : float
@@ -163,26 +169,18 @@ def HEC_centrality(HG, max_iter=100, tol=1e-6, *, seed=None, rng=None):
     https://doi.org/10.1137/18M1203031
 
     """
-    # check if the hypergraph is uniform, use raise exception
-    if not HG.is_uniform():
-        raise Exception("The hypergraph is not uniform.")
-
-    if not HG.is_connected():
-        raise Exception("The hypergraph is not connected.")
-
-    order = len(HG.get_edges()[0]) - 1
+    tensor = _adjacency_tensor(HG)
+    order = tensor.ndim - 1
     f = lambda v, m: np.power(v, 1.0 / m)
-    g = lambda v, x: np.prod(v[list(x)])
 
     if rng is not None and seed is not None:
         raise ValueError("Provide only one of seed= or rng=.")
     rng = rng if rng is not None else np.random.default_rng(seed)
-    x = rng.uniform(size=(HG.num_nodes()))
+    x = rng.uniform(size=(tensor.num_nodes))
     x = x / np.linalg.norm(x, 1)
 
     for iter in range(max_iter):
-        new_x = apply(HG, x, g)
-        new_x = f(new_x, order)
+        new_x = f(tensor.ttv(x), order)
         # Multiply by the sign to try and enforce positivity.
         new_x = np.sign(new_x[0]) * new_x / np.linalg.norm(new_x, 1)
         if np.linalg.norm(x - new_x) <= tol:
@@ -190,14 +188,4 @@ def HEC_centrality(HG, max_iter=100, tol=1e-6, *, seed=None, rng=None):
         x = new_x.copy()
     else:
         logging.getLogger(__name__).warning("Iteration did not converge!")
-    return {node: x[node] for node in range(HG.num_nodes())}
-
-
-def apply(HG, x, g=lambda v, e: np.sum(v[list(e)])):
-    new_x = np.zeros(HG.num_nodes())
-    for edge in HG.get_edges():
-        edge = list(edge)
-        # Ordered permutations.
-        for shift in range(len(edge)):
-            new_x[edge[shift]] += g(x, edge[shift + 1 :] + edge[:shift])
-    return new_x
+    return {tensor.mapping[i]: x[i] for i in range(tensor.num_nodes)}
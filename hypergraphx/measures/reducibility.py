@@ -1,178 +1,19 @@
-import itertools
 import math
-from collections import Counter
 
 import numpy as np
-from scipy.special import loggamma
+from scipy import sparse
+from scipy.special import binom, loggamma
 
 from hypergraphx import Hypergraph
 from hypergraphx.exceptions import InvalidParameterError
+from hypergraphx.utils.edges import edge_combinations, pack_edges
 
-
-def reducibility(
-    hg: Hypergraph, partition=None, optimization="exact", entropy_method="count"
-):
-    """
-    Compute hypergraph reducibility and the representative set of layers.
-
-    Parameters
-    ----------
-    hg : Hypergraph
-        The hypergraph of interest.
-    partition : list or dict, optional
-        Node partition for multiscale reducibility.
-        If list, it must align with hg.get_nodes() order.
-        If dict, it must map every node to a group.
-    optimization : {"exact", "greedy"}, optional
-        Optimization method for selecting representatives.
-    entropy_method : {"count", "project"}, optional
-        Entropy computation method.
-
-    Returns
-    -------
-    tuple
-        (reducibility, representative_layers)
-
-    Notes
-    -----
-    If you use this function in published work, please cite:
-    Kirkley, Alec, Helcio Felippe, and Federico Battiston.
-    "Structural Reducibility of Hypergraphs." Physical Review Letters 135.24 (2025): 247401.
-
-    Examples
-    --------
-    >>> from hypergraphx import Hypergraph
-    >>> from hypergraphx.measures.reducibility import reducibility
-    >>> hg = Hypergraph()
-    >>> hg.add_nodes([0, 1, 2, 3])
-    >>> hg.add_edges([(0, 1), (1, 2), (2, 3), (0, 1, 2)])
-    >>> eta, reps = reducibility(hg, entropy_method="count", optimization="exact")
-    """
-    if entropy_method not in {"count", "project"}:
-        raise InvalidParameterError(
-            'entropy_method must be either "count" or "project".'
-        )
-    if optimization not in {"exact", "greedy"}:
-        raise InvalidParameterError('optimization must be either "exact" or "greedy".')
-
-    if entropy_method == "project":
-        M, Q = _get_entropies_project(hg, partition)
-    else:
-        M, Q = _get_entropies_count(hg, partition)
-
-    max_layer = max(list(Q.keys()))
-
-    if optimization == "exact":
-        DLs = {}
-        for reps in _powerset(list(Q.keys())):
-            reps = set(reps)
-            if max_layer not in reps:
-                continue
-            H = sum(Q[r] for r in reps)
-            non_reps = set(Q.keys()) - reps
-            for layer in non_reps:
-                higher = [r for r in reps if r > layer]
-                ces = [M[r][layer] for r in higher]
-                best = higher[int(np.argmin(ces))]
-                H += M[best][layer]
-            DLs[tuple(sorted(reps))] = H
-        Rstar = min(DLs, key=DLs.get)
-        Hstar = DLs[Rstar]
-    else:
-        Rs, Hs = [], []
-        reps = set([max_layer])
-        remaining = set(Q.keys()) - reps
-        Rs.append(list(reps))
-        Hs.append(Q[max_layer] + sum(M[max_layer][l] for l in remaining))
-        while len(remaining) > 0:
-            cand_layers, cand_scores = [], []
-            for candidate in remaining:
-                reps_tmp = reps.union(set([candidate]))
-                non_reps = remaining - set([candidate])
-                H_tmp = sum(Q[r] for r in reps_tmp)
-                for layer in non_reps:
-                    higher = [r for r in reps_tmp if r > layer]
-                    ces = [M[r][layer] for r in higher]
-                    best = higher[int(np.argmin(ces))]
-                    H_tmp += M[best][layer]
-                cand_layers.append(candidate)
-                cand_scores.append(H_tmp)
-            best_index = int(np.argmin(cand_scores))
-            reps.add(cand_layers[best_index])
-            remaining.remove(cand_layers[best_index])
-            Rs.append(list(reps))
-            Hs.append(cand_scores[best_index])
-        best_num_reps = int(np.argmin(Hs))
-        Rstar = tuple(sorted(Rs[best_num_reps]))
-        Hstar = Hs[best_num_reps]
-
-    H0 = sum(Q[l] for l in Q)
-    if H0 == Q[max_layer]:
-        return 1.0, Rstar
-    return (H0 - Hstar) / (H0 - Q[max_layer]), Rstar
-
-
-def layer_reducibility(hg: Hypergraph, partition=None, entropy_method="count"):
-    """
-    Compute layer-wise reducibility.
-
-    Parameters
-    ----------
-    hg : Hypergraph
-        The hypergraph of interest.
-    partition : list or dict, optional
-        Node partition for multiscale reducibility.
-    entropy_method : {"count", "project"}, optional
-        Entropy computation method.
-
-    Returns
-    -------
-    dict
-        Mapping layer size -> reducibility value.
-
-    Notes
-    -----
-    If you use this function in published work, please cite:
-    Kirkley, Alec, Helcio Felippe, and Federico Battiston.
-    "Structural Reducibility of Hypergraphs." Physical Review Letters 135.24 (2025): 247401.
-
-    Examples
-    --------
-    >>> from hypergraphx import Hypergraph
-    >>> from hypergraphx.measures.reducibility import layer_reducibility
-    >>> hg = Hypergraph()
-    >>> hg.add_nodes([0, 1, 2, 3])
-    >>> hg.add_edges([(0, 1), (1, 2), (2, 3), (0, 1, 2)])
-    >>> etas = layer_reducibility(hg, entropy_method="count")
-    """
-    if entropy_method not in {"count", "project"}:
-        raise InvalidParameterError(
-            'entropy_method must be either "count" or "project".'
-        )
-    if entropy_method == "project":
-        M, Q = _get_entropies_project(hg, partition)
-    else:
-        M, Q = _get_entropies_count(hg, partition)
-
-    lmax = max(l for l in Q)
-    etas = {}
-    for l in Q:
-        Hl = Q[l]
-        best_rep = None
-        best_ce = np.inf
-        for k in Q:
-            if k > l:
-                ce = M[k][l]
-                if ce <= best_ce:
-                    best_ce = ce
-                    best_rep = k
-        if l == lmax:
-            etas[l] = 0.0
-        elif Hl == 0:
-            etas[l] = 1.0 if best_rep != l else 0.0
-        else:
-            etas[l] = 1.0 - best_ce / Hl
-    return etas
+# Number of sub-tuples of the hyperedges processed at once.
+_CHUNK_SIZE = 2**20
+# Largest number of sub-tuples of a layer deduplicated by sort-unique.
+_ENUMERATION_LIMIT = 2**22
+# Relative tolerance below which two description lengths are tied.
+_TIE_RTOL = 1e-9
 
 
 def _logchoose(n, k):
@@ -190,17 +31,6 @@ def _logmultiset(n, k):
     return _logchoose(n + k - 1, k)
 
 
-def _powerset(iterable):
-    """Powerset of iterable, returned as a list without the empty set."""
-    items = list(iterable)
-    pset = list(
-        itertools.chain.from_iterable(
-            itertools.combinations(items, r) for r in range(len(items) + 1)
-        )
-    )
-    return pset[1:]
-
-
 def _normalize_partition(partition, hg: Hypergraph):
     if partition is None:
         return None
@@ -219,19 +49,109 @@ def _normalize_partition(partition, hg: Hypergraph):
     return {node: group for node, group in zip(nodes, partition)}
 
 
-def _projection(edges, sizes):
+def _greedy_representatives(M, Q):
     """
-    Project a collection of hyperedges onto layers with sizes in sizes.
-    Returns a dict {size: set(edges)}.
+    Greedy search of the representative layers, adding at every step the layer that
+    most reduces the description length.
+
+    Returns
+    -------
+    tuple
+        (representative_layers, description_length)
     """
-    sizes = sorted(sizes)[::-1]
-    projections = {}
-    for size in sizes:
-        projections[size] = set()
-        for edge in edges:
-            for combo in itertools.combinations(edge, size):
-                projections[size].add(combo)
-    return projections
+    max_layer = max(list(Q.keys()))
+    Rs, Hs = [], []
+    reps = set([max_layer])
+    remaining = set(Q.keys()) - reps
+    Rs.append(list(reps))
+    Hs.append(Q[max_layer] + sum(M[max_layer][l] for l in remaining))
+    while len(remaining) > 0:
+        cand_layers, cand_scores = [], []
+        for candidate in remaining:
+            reps_tmp = reps.union(set([candidate]))
+            non_reps = remaining - set([candidate])
+            H_tmp = sum(Q[r] for r in reps_tmp)
+            for layer in non_reps:
+                higher = [r for r in reps_tmp if r > layer]
+                ces = [M[r][layer] for r in higher]
+                best = higher[int(np.argmin(ces))]
+                H_tmp += M[best][layer]
+            cand_layers.append(candidate)
+            cand_scores.append(H_tmp)
+        best_index = int(np.argmin(cand_scores))
+        reps.add(cand_layers[best_index])
+        remaining.remove(cand_layers[best_index])
+        Rs.append(list(reps))
+        Hs.append(cand_scores[best_index])
+    best_num_reps = int(np.argmin(Hs))
+    Rstar = tuple(sorted(Rs[best_num_reps]))
+    Hstar = Hs[best_num_reps]
+    return Rstar, Hstar
+
+
+def _exact_representatives(M, Q):
+    """
+    Branch and bound search of the representative layers with minimum description
+    length, starting from the greedy solution.
+
+    Layers are decided from the largest one, which is always a representative. A
+    layer that is not a representative is described by the best representative above
+    it, so the cost of the decided layers is known. Every remaining layer costs at
+    least the minimum between its entropy and its conditional entropy given any layer
+    above it that is, or can still become, a representative.
+    Description lengths within a relative tolerance of _TIE_RTOL are tied, and among
+    tied sets the one with fewer layers, then the lexicographically smallest sorted
+    tuple of layers, is kept.
+    Undefined (NaN) conditional entropies are treated as infinite.
+
+    Returns
+    -------
+    tuple
+        (representative_layers, description_length)
+    """
+    sizes = sorted(Q, reverse=True)
+    m = len(sizes)
+    q = np.array([Q[size] for size in sizes])
+    # cond[t, j]: conditional entropy of layer j given layer t, for t above j.
+    cond = np.full((m, m), np.inf)
+    for t in range(m):
+        for j in range(t + 1, m):
+            cond[t, j] = M[sizes[t]][sizes[j]]
+    cond[np.isnan(cond)] = np.inf
+    # between[i, j]: minimum conditional entropy of layer j given layers i, ..., j-1.
+    between = np.full((m + 1, m), np.inf)
+    for i in range(m - 1, -1, -1):
+        between[i] = np.minimum(between[i + 1], cond[i])
+
+    reps, H = _greedy_representatives(M, Q)
+    best = [np.inf if np.isnan(H) else H, tuple(reps)]
+
+    def tied(H):
+        return np.isclose(H, best[0], rtol=_TIE_RTOL, atol=0.0) or H == best[0]
+
+    def search(i, reps, rep_cost, H):
+        if i == m:
+            reps = tuple(sorted(reps))
+            if tied(H):
+                if (len(reps), reps) < (len(best[1]), best[1]):
+                    best[:] = [H, reps]
+            elif H < best[0]:
+                best[:] = [H, reps]
+            return
+        bound = np.minimum(np.minimum(q[i:], rep_cost[i:]), between[i, i:]).sum()
+        if H + bound > best[0] and not tied(H + bound):
+            return
+        branches = [
+            (H + rep_cost[i], reps, rep_cost),
+            (H + q[i], reps + [sizes[i]], np.minimum(rep_cost, cond[i])),
+        ]
+        if branches[1][0] < branches[0][0]:
+            branches.reverse()
+        for H_next, reps_next, rep_cost_next in branches:
+            search(i + 1, reps_next, rep_cost_next, H_next)
+
+    search(1, [sizes[0]], cond[0], q[0])
+    return best[1], best[0]
 
 
 def _get_layers(hg: Hypergraph, sizes="all"):
@@ -247,54 +167,197 @@ def _get_layers(hg: Hypergraph, sizes="all"):
     return layers
 
 
-def _coarse_grain(edges, partition_map):
+def _encode_layers(hg: Hypergraph):
+    """
+    Return layers of hypergraph as a dict {size: array}, where every row of the array
+    is a hyperedge, as sorted node indices.
+    """
+    node_index = {node: i for i, node in enumerate(hg.get_nodes())}
+    layers = {}
+    for size, edges in _get_layers(hg).items():
+        rows = [[node_index[node] for node in edge] for edge in edges]
+        layers[size] = np.sort(np.array(rows, dtype=np.int64).reshape(-1, size), axis=1)
+    return layers
+
+
+def _layer_incidence(rows, num_nodes):
+    """Sparse incidence matrix of shape (len(rows), num_nodes) of a layer."""
+    size = rows.shape[1]
+    return sparse.csr_array(
+        (np.ones(rows.size), rows.ravel(), np.arange(0, rows.size + 1, size)),
+        shape=(len(rows), num_nodes),
+    )
+
+
+def _contained(lower, higher, num_nodes, chunk_size=_CHUNK_SIZE):
+    """Mask of the hyperedges in lower that are subsets of a hyperedge in higher."""
+    size = lower.shape[1]
+    higher = _layer_incidence(higher, num_nodes).T.tocsr()
+    mask = np.zeros(len(lower), dtype=bool)
+    step = max(1, chunk_size // max(1, higher.shape[1]))
+    for start in range(0, len(lower), step):
+        shared = (
+            _layer_incidence(lower[start : start + step], num_nodes) @ higher
+        ).tocoo()
+        mask[start + shared.row[shared.data == size]] = True
+    return mask
+
+
+class _SubTuples:
     """
-    Return coarse-grained hypergraph according to node partition.
-    Returns a dict {tuple: count} to represent a multiset.
+    Count the sub-tuples of size l of sets of nodes. With a node partition, they are
+    also counted by type, the multisets of groups of the hyperedges in a lower layer.
+    Counts are arrays, with the total first and then one entry per type.
     """
-    coarse = {}
-    for edge in edges:
-        mapped = [partition_map[node] for node in edge]
-        new_edge = tuple(sorted(mapped))
-        coarse[new_edge] = coarse.get(new_edge, 0) + 1
-    return coarse
 
+    def __init__(self, l, blocks=None, num_blocks=None, lower=None):
+        self.l = l
+        self.blocks = blocks
+        self.num_blocks = num_blocks
+        self.num_types = 0
+        if blocks is not None:
+            coarse = np.sort(blocks[lower], axis=1)
+            self.type_keys, index, self.type_counts = np.unique(
+                pack_edges(coarse, num_blocks), return_index=True, return_counts=True
+            )
+            self.num_types = len(self.type_keys)
+            # Groups of every type, with multiplicities: a sub-tuple of a set is of
+            # type t if it takes type_mult[t, j] nodes of the group type_groups[t, j].
+            type_rows = coarse[index]
+            self.type_groups = np.zeros(type_rows.shape, dtype=np.int64)
+            self.type_mult = np.zeros(type_rows.shape, dtype=np.int64)
+            for t, row in enumerate(type_rows):
+                groups, counts = np.unique(row, return_counts=True)
+                self.type_groups[t, : len(groups)] = groups
+                self.type_mult[t, : len(groups)] = counts
+
+    def of_rows(self, rows):
+        """Sum of the counts of the sub-tuples of every row, with repetitions."""
+        out = np.zeros(self.num_types + 1)
+        out[0] = len(rows) * math.comb(rows.shape[1], self.l)
+        if self.num_types and len(rows):
+            group_counts = np.zeros((len(rows), self.num_blocks), dtype=np.int64)
+            np.add.at(
+                group_counts,
+                (
+                    np.repeat(np.arange(len(rows)), rows.shape[1]),
+                    self.blocks[rows.ravel()],
+                ),
+                1,
+            )
+            for start in range(0, self.num_types, max(1, _CHUNK_SIZE // len(rows))):
+                stop = start + max(1, _CHUNK_SIZE // len(rows))
+                ways = binom(
+                    group_counts[:, self.type_groups[start:stop]],
+                    self.type_mult[start:stop],
+                )
+                out[1 + start : 1 + stop] = np.prod(ways, axis=2).sum(axis=0)
+        return out
+
+    def of_set(self, nodes):
+        return self.of_rows(np.array(sorted(nodes), dtype=np.int64)[None, :])
+
+    def types(self, rows):
+        """Type of every row of size l, -1 if it is not the type of a lower hyperedge."""
+        keys = pack_edges(np.sort(self.blocks[rows], axis=1), self.num_blocks)
+        index = np.searchsorted(self.type_keys, keys)
+        index[index == self.num_types] = 0
+        return np.where(self.type_keys[index] == keys, index, -1)
 
-def _all_projections(layers):
+
+def _maximal_sets(sets):
+    """The sets that are not subsets of another set."""
+    sets = sorted(set(sets), key=len, reverse=True)
+    maximal = []
+    for candidate in sets:
+        if not any(candidate <= other for other in maximal):
+            maximal.append(candidate)
+    return maximal
+
+
+def _union_count(sets, counter):
     """
-    Return dict P such that P[k][l] is projection of layer k onto tuples of size l.
+    Counts of the distinct sub-tuples of size l of a family of sets, by
+    inclusion-exclusion: the sub-tuples of a set that are in previous sets are the
+    sub-tuples of its intersections with them.
     """
-    projections = {}
-    indices = sorted(list(layers.keys()))[::-1]
-    for index, k in enumerate(indices):
-        projections[k] = {}
-        remaining = indices[index + 1 :]
-        for subindex, l in enumerate(remaining):
-            if subindex == 0:
-                projections[k][l] = _projection(layers[k], [l])[l]
-            else:
-                prev = remaining[subindex - 1]
-                projections[k][l] = _projection(projections[k][prev], [l])[l]
-    return projections
+    total = np.zeros(counter.num_types + 1)
+    for i, current in enumerate(sets):
+        total += counter.of_set(current)
+        intersections = [current & other for other in sets[:i]]
+        intersections = [c for c in intersections if len(c) >= counter.l]
+        if intersections:
+            total -= _union_count(_maximal_sets(intersections), counter)
+    return total
 
 
-def _get_entropies_project(hg: Hypergraph, partition=None):
+def _projection_counts(rows, counter, num_nodes, chunk_size=_CHUNK_SIZE):
+    """
+    Counts of the distinct sub-tuples of size l of the hyperedges of a layer.
+
+    The sub-tuples of a hyperedge repeated in previous hyperedges are those of its
+    intersections of at least l nodes with them, found from the sparse overlaps of the
+    hyperedges, and are counted by inclusion-exclusion. If such intersections are
+    frequent and there are few sub-tuples, the sub-tuples are instead streamed in
+    chunks as packed integer keys and deduplicated with sort-unique.
+    """
+    l = counter.l
+    incidence = _layer_incidence(rows, num_nodes)
+    overlaps = sparse.tril(incidence @ incidence.T, k=-1).tocsr()
+    overlaps.data[overlaps.data < l] = 0
+    overlaps.eliminate_zeros()
+
+    n_sub_tuples = len(rows) * math.comb(rows.shape[1], l)
+    if overlaps.nnz > len(rows) and n_sub_tuples <= _ENUMERATION_LIMIT:
+        keys, types = [], []
+        for _, sub_tuples in edge_combinations(rows, l, chunk_size):
+            chunk_keys, index = np.unique(
+                pack_edges(sub_tuples, num_nodes), return_index=True
+            )
+            keys.append(chunk_keys)
+            if counter.num_types:
+                types.append(counter.types(sub_tuples[index]))
+        keys, index = np.unique(np.concatenate(keys), return_index=True)
+        out = np.zeros(counter.num_types + 1)
+        out[0] = len(keys)
+        if counter.num_types:
+            types = np.concatenate(types)[index]
+            out[1:] = np.bincount(types[types >= 0], minlength=counter.num_types)
+        return out
+
+    out = counter.of_rows(rows)
+    sets = [frozenset(row) for row in rows.tolist()]
+    for e in np.flatnonzero(np.diff(overlaps.indptr)):
+        others = overlaps.indices[overlaps.indptr[e] : overlaps.indptr[e + 1]]
+        intersections = [sets[e] & sets[f] for f in others]
+        out -= _union_count(_maximal_sets(intersections), counter)
+    return out
+
+
+def _get_entropies(hg: Hypergraph, partition=None, entropy_method="count"):
     """
     Returns:
         M: dict such that M[k][l] is conditional entropy of higher layer k to lower layer l.
         Q: dict such that Q[l] is entropy of layer l.
+
+    Both methods use the number of distinct tuples of size l in the hyperedges of
+    layer k. With a node partition, the hyperedges of layer l explained by layer k
+    are counted on the multisets of groups of their nodes: the "project" method
+    compares them with the distinct projected tuples, the "count" method with all the
+    tuples of size l of every hyperedge of layer k.
     """
     if not isinstance(hg, Hypergraph):
         raise InvalidParameterError("Reducibility supports undirected Hypergraph only.")
 
     partition_map = _normalize_partition(partition, hg)
-    if partition_map is not None:
-        num_blocks = len(set(partition_map.values()))
-
     num_nodes = hg.num_nodes()
+    layers = _encode_layers(hg)
 
-    layers = _get_layers(hg)
-    projections = _all_projections(layers)
+    blocks = num_blocks = None
+    if partition_map is not None:
+        groups = {group: i for i, group in enumerate(set(partition_map.values()))}
+        num_blocks = len(groups)
+        blocks = np.array([groups[partition_map[node]] for node in hg.get_nodes()])
 
     def entropy(size):
         edge_count = len(layers[size])
@@ -304,18 +367,18 @@ def _get_entropies_project(hg: Hypergraph, partition=None):
 
     def conditional_entropy(k, l):
         edge_count = len(layers[l])
-        proj_size = len(projections[k][l])
         if partition_map is not None:
-            proj_coarse = _coarse_grain(projections[k][l], partition_map)
-            lower_coarse = _coarse_grain(layers[l], partition_map)
-            overlap = 0
-            for edge in lower_coarse:
-                if edge in proj_coarse:
-                    overlap += min(proj_coarse[edge], lower_coarse[edge])
+            counter = _SubTuples(l, blocks, num_blocks, layers[l])
+            projected = _projection_counts(layers[k], counter, num_nodes)
+            proj_size = int(projected[0])
+            if entropy_method == "count":
+                projected = counter.of_rows(layers[k])
+            overlap = int(np.minimum(np.rint(projected[1:]), counter.type_counts).sum())
             return _logchoose(proj_size, overlap) + _logmultiset(
                 math.comb(num_blocks + l - 1, l), edge_count - overlap
             )
-        overlap = len(projections[k][l].intersection(layers[l]))
+        proj_size = int(_projection_counts(layers[k], _SubTuples(l), num_nodes)[0])
+        overlap = int(_contained(layers[l], layers[k], num_nodes).sum())
         return _logchoose(proj_size, overlap) + _logchoose(
             math.comb(num_nodes, l) - proj_size, edge_count - overlap
         )
@@ -330,92 +393,22 @@ def _get_entropies_project(hg: Hypergraph, partition=None):
     return M, Q
 
 
-def _get_entropies_count(hg: Hypergraph, partition=None):
+def _get_entropies_project(hg: Hypergraph, partition=None):
     """
     Returns:
         M: dict such that M[k][l] is conditional entropy of higher layer k to lower layer l.
         Q: dict such that Q[l] is entropy of layer l.
     """
-    if not isinstance(hg, Hypergraph):
-        raise InvalidParameterError("Reducibility supports undirected Hypergraph only.")
+    return _get_entropies(hg, partition, entropy_method="project")
 
-    layers = _get_layers(hg)
-    num_nodes = hg.num_nodes()
-    partition_map = _normalize_partition(partition, hg)
-
-    if partition_map is not None:
-        num_blocks = len(set(partition_map.values()))
 
-    M, Q = {}, {}
-    indices = sorted(list(layers.keys()))[::-1]
-    for ii, k in enumerate(indices):
-        Ek = len(layers[k])
-        if partition_map is not None:
-            Q[k] = _logmultiset(math.comb(num_blocks + k - 1, k), Ek)
-        else:
-            Q[k] = _logchoose(math.comb(num_nodes, k), Ek)
-
-        lower_indices = indices[ii + 1 :]
-
-        def get_sizes_proj(layer):
-            sizes = Counter({l: 0 for l in lower_indices})
-            if len(layer) == 0:
-                return sizes
-            checked = []
-            layer = list(layer)
-            for edge in layer:
-                overlaps = set()
-                for prev in checked:
-                    inter = set(edge).intersection(set(prev))
-                    overlaps.add(tuple(sorted(list(inter))))
-                sizes_max = Counter({l: math.comb(len(edge), l) for l in lower_indices})
-                sizes += sizes_max - get_sizes_proj(overlaps)
-                checked.append(edge)
-            return sizes
-
-        Ek2ls = get_sizes_proj(layers[k])
-
-        M[k] = {}
-        for l in lower_indices:
-            El = len(layers[l])
-            Ek2l = Ek2ls[l]
-            overlap = 0
-            if partition_map is not None:
-                lower_coarse = _coarse_grain(layers[l], partition_map)
-                for lower_tup in lower_coarse:
-                    lower_counts = Counter(list(lower_tup))
-                    num_lower_in_higher = 0
-                    for higher_tup in layers[k]:
-                        higher_counts = Counter(
-                            [partition_map[node] for node in higher_tup]
-                        )
-                        hl_counts = higher_counts & lower_counts
-                        if hl_counts == lower_counts:
-                            num_lower_in_higher += np.prod(
-                                [
-                                    math.comb(higher_counts[i], lower_counts[i])
-                                    for i in lower_counts
-                                ]
-                            )
-                    overlap += min(num_lower_in_higher, lower_coarse[lower_tup])
-                M[k][l] = _logchoose(Ek2l, overlap) + _logmultiset(
-                    math.comb(num_blocks + l - 1, l), El - overlap
-                )
-            else:
-                lower_tmp = layers[l].copy()
-                for higher in layers[k]:
-                    higher_set = set(higher)
-                    overlapping = set()
-                    for lower in lower_tmp:
-                        if len(set(lower).intersection(higher_set)) == l:
-                            overlapping.add(lower)
-                    for edge in overlapping:
-                        lower_tmp.remove(edge)
-                        overlap += 1
-                M[k][l] = _logchoose(Ek2l, overlap) + _logchoose(
-                    math.comb(num_nodes, l) - Ek2l, El - overlap
-                )
-    return M, Q
+def _get_entropies_count(hg: Hypergraph, partition=None):
+    """
+    Returns:
+        M: dict such that M[k][l] is conditional entropy of higher layer k to lower layer l.
+        Q: dict such that Q[l] is entropy of layer l.
+    """
+    return _get_entropies(hg, partition, entropy_method="count")
 
 
 def reducibility(
@@ -472,48 +465,9 @@ def reducibility(
     max_layer = max(list(Q.keys()))
 
     if optimization == "exact":
-        DLs = {}
-        for reps in _powerset(list(Q.keys())):
-            reps = set(reps)
-            if max_layer not in reps:
-                continue
-            H = sum(Q[r] for r in reps)
-            non_reps = set(Q.keys()) - reps
-            for layer in non_reps:
-                higher = [r for r in reps if r > layer]
-                ces = [M[r][layer] for r in higher]
-                best = higher[int(np.argmin(ces))]
-                H += M[best][layer]
-            DLs[tuple(sorted(reps))] = H
-        Rstar = min(DLs, key=DLs.get)
-        Hstar = DLs[Rstar]
+        Rstar, Hstar = _exact_representatives(M, Q)
     else:
-        Rs, Hs = [], []
-        reps = set([max_layer])
-        remaining = set(Q.keys()) - reps
-        Rs.append(list(reps))
-        Hs.append(Q[max_layer] + sum(M[max_layer][l] for l in remaining))
-        while len(remaining) > 0:
-            cand_layers, cand_scores = [], []
-            for candidate in remaining:
-                reps_tmp = reps.union(set([candidate]))
-                non_reps = remaining - set([candidate])
-                H_tmp = sum(Q[r] for r in reps_tmp)
-                for layer in non_reps:
-                    higher = [r for r in reps_tmp if r > layer]
-                    ces = [M[r][layer] for r in higher]
-                    best = higher[int(np.argmin(ces))]
-                    H_tmp += M[best][layer]
-                cand_layers.append(candidate)
-                cand_scores.append(H_tmp)
-            best_index = int(np.argmin(cand_scores))
-            reps.add(cand_layers[best_index])
-            remaining.remove(cand_layers[best_index])
-            Rs.append(list(reps))
-            Hs.append(cand_scores[best_index])
-        best_num_reps = int(np.argmin(Hs))
-        Rstar = tuple(sorted(Rs[best_num_reps]))
-        Hstar = Hs[best_num_reps]
+        Rstar, Hstar = _greedy_representatives(M, Q)
 
     H0 = sum(Q[l] for l in Q)
     if H0 == Q[max_layer]:
@@ -1,13 +1,123 @@
-from typing import Dict
+from typing import Dict, Iterable, Optional, Tuple
 
 import logging
 import numpy as np
 from scipy import sparse
 from scipy.special import factorial
 
-from hypergraphx.linalg import (
-    annealed_adjacency_matrix,
-)
+# Number of entries of the blocks of products of adjacency matrices.
+_CHUNK_SIZE = 2**22
+
+
+def _annealed_matrix(
+    adjacency_matrices_all_orders, annealed_adjacency_matrices_all_orders, order
+):
+    """Annealed adjacency matrix of the given order, i.e. the average of its
+    adjacency matrices over time, unless precomputed.
+    """
+    if annealed_adjacency_matrices_all_orders is not None:
+        return annealed_adjacency_matrices_all_orders[order]
+    temporal_adjacency_matrix = adjacency_matrices_all_orders[order]
+    T = len(temporal_adjacency_matrix.keys())
+    return sum(temporal_adjacency_matrix[t] for t in range(T)) / T
+
+
+def _centered_matrices(
+    adjacency_matrices_all_orders, annealed_adjacency_matrices_all_orders, order
+):
+    """Adjacency matrices of the given order at every time, minus the annealed one."""
+    temporal_adjacency_matrix = adjacency_matrices_all_orders[order]
+    annealed_adjacency_mtx = _annealed_matrix(
+        adjacency_matrices_all_orders, annealed_adjacency_matrices_all_orders, order
+    )
+    T = len(temporal_adjacency_matrix.keys())
+    return [temporal_adjacency_matrix[t] - annealed_adjacency_mtx for t in range(T)]
+
+
+def _correlation_matrix(centered_d1, centered_d2, order1, order2, tau):
+    """Correlation matrix from the centered adjacency matrices of two orders."""
+    T = len(centered_d1)
+    correlation_matrix = sparse.csc_array(centered_d1[0].shape, dtype=float)
+    for t in range(T - tau):
+        correlation_matrix = correlation_matrix + centered_d1[t].dot(
+            centered_d2[t + tau].transpose()
+        )
+    return correlation_matrix / (factorial(order1) * factorial(order2)) / (T - tau)
+
+
+class _StackedAdjacency:
+    """Adjacency matrices of one order, stored as the rows of a sparse T x N^2
+    matrix, together with the flattened annealed adjacency matrix.
+
+    The trace of a product of two matrices is the sum of the elementwise product of
+    the first with the transpose of the second, so that the correlation functions
+    only need products of the stacked rows.
+    """
+
+    def __init__(self, temporal_adjacency_matrix, annealed_adjacency_mtx):
+        T = len(temporal_adjacency_matrix.keys())
+        self.T = T
+        self.matrices = sparse.vstack(
+            [
+                sparse.csr_array(temporal_adjacency_matrix[t]).reshape((1, -1))
+                for t in range(T)
+            ],
+            format="csr",
+        ).astype(float)
+        self.annealed = sparse.csr_array(
+            sparse.csr_array(annealed_adjacency_mtx).reshape((1, -1))
+        ).astype(float)
+        # Number of times at which every entry is non-zero
+        self.entry_counts = np.bincount(
+            self.matrices.indices, minlength=self.matrices.shape[1]
+        )
+
+    def _lagged_products(self, lagged, taus):
+        """Sum over t of <A_t, B_{t + tau}> for every lag in taus."""
+        T = self.T
+        # The products at all lags are the sums along the diagonals of the T x T
+        # matrix of products of the stacked rows, computed in blocks of rows.
+        # Otherwise, every lag is a single elementwise product.
+        all_lags_cost = np.dot(self.entry_counts, lagged.entry_counts)
+        by_lag_cost = len(taus) * (self.matrices.nnz + lagged.matrices.nnz)
+        if all_lags_cost > by_lag_cost:
+            return np.array(
+                [
+                    self.matrices[: T - tau].multiply(lagged.matrices[tau:]).sum()
+                    for tau in taus
+                ]
+            )
+
+        products = np.zeros(T)
+        lagged_transpose = lagged.matrices.T.tocsr()
+        block = max(1, _CHUNK_SIZE // T)
+        for start in range(0, T, block):
+            gram = (self.matrices[start : start + block] @ lagged_transpose).tocoo()
+            lags = gram.col - gram.row - start
+            keep = lags >= 0
+            products += np.bincount(lags[keep], weights=gram.data[keep], minlength=T)
+        return products[taus]
+
+    def correlation_function(self, lagged, taus):
+        """Trace of the correlation matrix with the lagged adjacency matrices, up to
+        normalization, for every lag in taus.
+        """
+        T = self.T
+        taus = np.asarray(taus, dtype=int)
+        # Sums of <A_t, annealed of the lagged order> over t < T - tau, and of
+        # <annealed, B_t> over t >= tau
+        first = (self.matrices @ lagged.annealed.T).toarray().ravel()
+        first = np.concatenate(([0.0], np.cumsum(first)))
+        second = (lagged.matrices @ self.annealed.T).toarray().ravel()
+        second = np.concatenate((np.cumsum(second[::-1])[::-1], [0.0]))
+        annealed = self.annealed.multiply(lagged.annealed).sum()
+
+        return (
+            self._lagged_products(lagged, taus)
+            - first[T - taus]
+            - second[taus]
+            + (T - taus) * annealed
+        )
 
 
 def intra_order_correlation_matrix_by_order(
@@ -29,31 +139,10 @@ def intra_order_correlation_matrix_by_order(
     -------
     The intra-order correlation matrix of order d at time lag tau, as a sparse matrix.
     """
-    temporal_adjacency_matrix = adjacency_matrices_all_orders[order]
-    T = len(temporal_adjacency_matrix.keys())
-
-    if annealed_adjacency_matrices_all_orders == None:
-        annealed_adjacency_mtx = annealed_adjacency_matrix(temporal_adjacency_matrix)
-    else:
-        annealed_adjacency_mtx = annealed_adjacency_matrices_all_orders[order]
-
-    correlation_matrix = sparse.csc_array(annealed_adjacency_mtx.shape, dtype=np.int8)
-    for t in range(T - tau):
-        adjacency_matrix_t = temporal_adjacency_matrix[t]
-        adjacency_matrix_t_lagged = temporal_adjacency_matrix[t + tau]
-
-        centered_adjacency_matrix_t = adjacency_matrix_t - annealed_adjacency_mtx
-        centered_adjacency_matrix_t_lagged = (
-            adjacency_matrix_t_lagged - annealed_adjacency_mtx
-        )
-
-        correlation_matrix = correlation_matrix + centered_adjacency_matrix_t.dot(
-            centered_adjacency_matrix_t_lagged.transpose()
-        )
-
-    correlation_matrix = correlation_matrix / (factorial(order) ** 2) / (T - tau)
-
-    return correlation_matrix
+    centered = _centered_matrices(
+        adjacency_matrices_all_orders, annealed_adjacency_matrices_all_orders, order
+    )
+    return _correlation_matrix(centered, centered, order, order, tau)
 
 
 def intra_order_correlation_function_by_order(
@@ -75,15 +164,13 @@ def intra_order_correlation_function_by_order(
     -------
     The intra-order correlation function of order d at time lag tau.
     """
-    correlation_matrix = intra_order_correlation_matrix_by_order(
+    correlation_functions = correlation_functions_all_lags(
         adjacency_matrices_all_orders,
         annealed_adjacency_matrices_all_orders,
-        order,
-        tau,
+        taus=[tau],
+        order_pairs=[(order, order)],
     )
-    correlation_function = correlation_matrix.trace()
-
-    return correlation_function
+    return correlation_functions[(order, order)][0]
 
 
 def intra_order_correlation_matrices_all_orders(
@@ -140,19 +227,15 @@ def intra_order_correlation_functions_all_orders(
     -------
     The intra-order correlation functions for all orders at time lag tau, as a dictionary {order : function}.
     """
-    correlation_functions = dict()
     if max_order == None:
         max_order = max(adjacency_matrices_all_orders.keys())
-    for order in range(1, max_order + 1):
-        correlation_function = intra_order_correlation_function_by_order(
-            adjacency_matrices_all_orders,
-            annealed_adjacency_matrices_all_orders,
-            order,
-            tau,
-        )
-        correlation_functions[order] = correlation_function
-
-    return correlation_functions
+    correlation_functions = correlation_functions_all_lags(
+        adjacency_matrices_all_orders,
+        annealed_adjacency_matrices_all_orders,
+        taus=[tau],
+        order_pairs=[(order, order) for order in range(1, max_order + 1)],
+    )
+    return {order: values[0] for (order, _), values in correlation_functions.items()}
 
 
 def cross_order_correlation_matrix_two_orders(
@@ -184,44 +267,13 @@ def cross_order_correlation_matrix_two_orders(
             tau,
         )
 
-    temporal_adjacency_matrix_d1 = adjacency_matrices_all_orders[order1]
-    temporal_adjacency_matrix_d2 = adjacency_matrices_all_orders[order2]
-    T = len(temporal_adjacency_matrix_d1.keys())
-
-    if annealed_adjacency_matrices_all_orders == None:
-        annealed_adjacency_matrix_d1 = annealed_adjacency_matrix(
-            temporal_adjacency_matrix_d1
-        )
-        annealed_adjacency_matrix_d2 = annealed_adjacency_matrix(
-            temporal_adjacency_matrix_d2
-        )
-    else:
-        annealed_adjacency_matrix_d1 = annealed_adjacency_matrices_all_orders[order1]
-        annealed_adjacency_matrix_d2 = annealed_adjacency_matrices_all_orders[order2]
-
-    correlation_matrix = sparse.csc_array(
-        annealed_adjacency_matrix_d1.shape, dtype=np.int8
+    centered_d1 = _centered_matrices(
+        adjacency_matrices_all_orders, annealed_adjacency_matrices_all_orders, order1
     )
-    for t in range(T - tau):
-        adjacency_matrix_d1_t = temporal_adjacency_matrix_d1[t]
-        adjacency_matrix_d2_t_lagged = temporal_adjacency_matrix_d2[t + tau]
-
-        centered_adjacency_matrix_d1_t = (
-            adjacency_matrix_d1_t - annealed_adjacency_matrix_d1
-        )
-        centered_adjacency_matrix_d2_t_lagged = (
-            adjacency_matrix_d2_t_lagged - annealed_adjacency_matrix_d2
-        )
-
-        correlation_matrix = correlation_matrix + centered_adjacency_matrix_d1_t.dot(
-            centered_adjacency_matrix_d2_t_lagged.transpose()
-        )
-
-    correlation_matrix = (
-        correlation_matrix / (factorial(order1) * factorial(order2)) / (T - tau)
+    centered_d2 = _centered_matrices(
+        adjacency_matrices_all_orders, annealed_adjacency_matrices_all_orders, order2
     )
-
-    return correlation_matrix
+    return _correlation_matrix(centered_d1, centered_d2, order1, order2, tau)
 
 
 def cross_order_correlation_function_two_orders(
@@ -246,32 +298,14 @@ def cross_order_correlation_function_two_orders(
     -------
     The cross-order correlation function between orders d1 and d2, at time lag tau.
     """
-    correlation_matrix = cross_order_correlation_matrix_two_orders(
+    correlation_functions = correlation_functions_all_lags(
         adjacency_matrices_all_orders,
         annealed_adjacency_matrices_all_orders,
-        order1,
-        order2,
-        tau,
+        taus=[tau],
+        order_pairs=[(order1, order2)],
+        normalized=normalized,
     )
-    correlation_function = correlation_matrix.trace()
-    if normalized:
-        sigma_d1 = intra_order_correlation_function_by_order(
-            adjacency_matrices_all_orders,
-            annealed_adjacency_matrices_all_orders,
-            order1,
-            tau=0,
-        )
-        sigma_d2 = intra_order_correlation_function_by_order(
-            adjacency_matrices_all_orders,
-            annealed_adjacency_matrices_all_orders,
-            order2,
-            tau=0,
-        )
-        normalization = 2 * np.sqrt(sigma_d1 * sigma_d2)
-
-        correlation_function = correlation_function / normalization
-
-    return correlation_function
+    return correlation_functions[(order1, order2)][0]
 
 
 def cross_order_correlation_matrices_all_orders(
@@ -342,53 +376,17 @@ def cross_order_correlation_functions_all_orders(
     The cross-order correlation functions between each couple of orders, at time lag tau,
     as a dictionary {(d1, d2 : function)}
     """
-    correlation_functions = dict()
     if max_order == None:
         max_order = max(adjacency_matrices_all_orders.keys())
-
-    if normalized:
-        sigmas = intra_order_correlation_functions_all_orders(
-            adjacency_matrices_all_orders,
-            annealed_adjacency_matrices_all_orders,
-            max_order,
-            tau=0,
-        )
-
-    for order1 in range(1, max_order + 1):
-        for order2 in range(order1, max_order + 1):
-            # order1 before order2
-            correlation_function = cross_order_correlation_function_two_orders(
-                adjacency_matrices_all_orders,
-                annealed_adjacency_matrices_all_orders,
-                order1,
-                order2,
-                tau,
-            )
-            correlation_functions[(order1, order2)] = correlation_function
-
-            # order2 before order1
-            if not order1 == order2:
-                correlation_function = cross_order_correlation_function_two_orders(
-                    adjacency_matrices_all_orders,
-                    annealed_adjacency_matrices_all_orders,
-                    order1,
-                    order2,
-                    tau,
-                )
-                correlation_functions[(order2, order1)] = correlation_function
-
-            # normalization
-            if normalized:
-                normalization = 2 * np.sqrt(sigmas[order1] * sigmas[order2])
-                correlation_functions[(order1, order2)] = (
-                    correlation_functions[(order1, order2)] / normalization
-                )
-                if not order1 == order2:
-                    correlation_functions[(order2, order1)] = (
-                        correlation_functions[(order2, order1)] / normalization
-                    )
-
-    return correlation_functions
+    orders = range(1, max_order + 1)
+    correlation_functions = correlation_functions_all_lags(
+        adjacency_matrices_all_orders,
+        annealed_adjacency_matrices_all_orders,
+        taus=[tau],
+        order_pairs=[(order1, order2) for order1 in orders for order2 in orders],
+        normalized=normalized,
+    )
+    return {pair: values[0] for pair, values in correlation_functions.items()}
 
 
 def cross_order_gap_function_two_orders(
@@ -418,41 +416,17 @@ def cross_order_gap_function_two_orders(
         )
         return 0
 
-    sigma_d1 = intra_order_correlation_function_by_order(
-        adjacency_matrices_all_orders,
-        annealed_adjacency_matrices_all_orders,
-        order1,
-        tau=0,
-    )
-    sigma_d2 = intra_order_correlation_function_by_order(
+    correlation_functions = correlation_functions_all_lags(
         adjacency_matrices_all_orders,
         annealed_adjacency_matrices_all_orders,
-        order2,
-        tau=0,
+        taus=[tau],
+        order_pairs=[(order1, order2), (order2, order1)],
+        normalized=True,
     )
-    normalization = 2 * np.sqrt(sigma_d1 * sigma_d2)
-    cross_order_correlation_function_d1_d2 = (
-        cross_order_correlation_function_two_orders(
-            adjacency_matrices_all_orders,
-            annealed_adjacency_matrices_all_orders,
-            order1,
-            order2,
-            tau,
-        )
-    )
-    cross_order_correlation_function_d2_d1 = (
-        cross_order_correlation_function_two_orders(
-            adjacency_matrices_all_orders,
-            annealed_adjacency_matrices_all_orders,
-            order2,
-            order1,
-            tau,
-        )
-    )
-
     cross_order_gap = (
-        cross_order_correlation_function_d1_d2 - cross_order_correlation_function_d2_d1
-    ) / normalization
+        correlation_functions[(order1, order2)][0]
+        - correlation_functions[(order2, order1)][0]
+    )
     return cross_order_gap
 
 
@@ -476,22 +450,106 @@ def cross_order_gap_functions_all_orders(
     The cross-order gap functions between each couple of orders, at time lag tau,
     as a dictionary {(d1, d2 : function)}
     """
-    gap_functions = dict()
     if max_order == None:
         max_order = max(adjacency_matrices_all_orders.keys())
-    for order1 in range(1, max_order + 1):
-        for order2 in range(order1, max_order + 1):
+    orders = range(1, max_order + 1)
+    correlation_functions = correlation_functions_all_lags(
+        adjacency_matrices_all_orders,
+        annealed_adjacency_matrices_all_orders,
+        taus=[tau],
+        order_pairs=[
+            (order1, order2)
+            for order1 in orders
+            for order2 in orders
+            if order1 != order2
+        ],
+        normalized=True,
+    )
+    gap_functions = dict()
+    for order1 in orders:
+        for order2 in orders:
             if order1 == order2:
                 gap_functions[(order1, order2)] = 0
             else:
-                gap_function = cross_order_gap_function_two_orders(
-                    adjacency_matrices_all_orders,
-                    annealed_adjacency_matrices_all_orders,
-                    order1,
-                    order2,
-                    tau,
+                gap_functions[(order1, order2)] = (
+                    correlation_functions[(order1, order2)][0]
+                    - correlation_functions[(order2, order1)][0]
                 )
-                gap_functions[(order1, order2)] = gap_function
-                gap_functions[(order2, order1)] = -1 * gap_function
 
     return gap_functions
+
+
+def correlation_functions_all_lags(
+    adjacency_matrices_all_orders: Dict[int, Dict[int, sparse.csc_array]],
+    annealed_adjacency_matrices_all_orders=None,
+    taus: Optional[Iterable[int]] = None,
+    order_pairs: Optional[Iterable[Tuple[int, int]]] = None,
+    normalized=False,
+) -> Dict[Tuple[int, int], np.ndarray]:
+    """Compute the correlation functions between hyperedges of orders d1 and d2, for
+    many couples of orders and time lags at once.
+    The correlation function is the trace of the correlation matrix. It is computed
+    from elementwise products of the adjacency matrices, without building the
+    correlation matrix, so that each lag costs a single pass over the non-zero entries
+    of the adjacency matrices.
+
+    Parameters
+    ----------
+    adjacency_matrices_all_orders: a dictionary {order : {time : adjacency matrix}}.
+    annealed_adjacency_matrices_all_orders: a dictionary {order : annealed adjacency matrix}.
+        If None, the average of the adjacency matrices over time.
+    taus: the temporal lags. If None, all the lags from 0 to T-1.
+    order_pairs: the couples of orders (d1, d2). If None, all the couples of orders.
+    normalized: if True, divide the correlation functions between orders d1 and d2
+        by twice the geometric mean of the intra-order correlation functions of d1 and
+        d2 at lag 0.
+
+    Returns
+    -------
+    The correlation functions as a dictionary {(d1, d2) : array}, where the array has
+    the values of the correlation function at each time lag in taus.
+    """
+    orders = sorted(adjacency_matrices_all_orders.keys())
+    if order_pairs is None:
+        order_pairs = [(order1, order2) for order1 in orders for order2 in orders]
+    order_pairs = list(order_pairs)
+
+    stacked = dict()
+
+    def _stacked(order):
+        if order not in stacked:
+            stacked[order] = _StackedAdjacency(
+                adjacency_matrices_all_orders[order],
+                _annealed_matrix(
+                    adjacency_matrices_all_orders,
+                    annealed_adjacency_matrices_all_orders,
+                    order,
+                ),
+            )
+        return stacked[order]
+
+    T = len(adjacency_matrices_all_orders[orders[0]].keys())
+    taus = np.arange(T) if taus is None else np.asarray(list(taus), dtype=int)
+    if np.any(taus < 0) or np.any(taus >= T):
+        raise ValueError("The time lags must be between 0 and T-1.")
+
+    correlation_functions = dict()
+    for order1, order2 in order_pairs:
+        values = _stacked(order1).correlation_function(_stacked(order2), taus)
+        correlation_functions[(order1, order2)] = (
+            values / (factorial(order1) * factorial(order2)) / (T - taus)
+        )
+
+    if normalized:
+        sigmas = dict()
+        for order in {order for pair in order_pairs for order in pair}:
+            sigmas[order] = _stacked(order).correlation_function(_stacked(order), [0])[
+                0
+            ] / (factorial(order) ** 2 * T)
+        for order1, order2 in order_pairs:
+            normalization = 2 * np.sqrt(sigmas[order1] * sigmas[order2])
+            correlation_functions[(order1, order2)] = (
+                correlation_functions[(order1, order2)] / normalization
+            )
+
+    return correlation_functions
@@ -0,0 +1,261 @@
+"""Temporal paths on the hyperedge event stream of a temporal hypergraph.
+
+A temporal hyperpath from a source is a sequence of hyperedge events
+(t_1, e_1), ..., (t_k, e_k) with t_1 < ... < t_k, where the source is in e_1 and
+every e_i shares a node with e_{i+1}. The information travels through the nodes of
+a hyperedge at the time of the event, and it can leave a node only with a later
+event, so that events at the same time are never chained. With a waiting-time
+constraint max_wait, every intermediate node forwards the information within
+max_wait time units, i.e. t_{i+1} - t_i <= max_wait. The source can wait
+indefinitely before the first event.
+
+The paths of all metrics are computed with a single scan of the events in time
+order. Every node keeps a queue of its arrivals inside the waiting window, ordered
+so that the best arrival is the first one:
+- earliest arrival: the arrival time at the target;
+- shortest: the number of events of the path;
+- fastest: the duration of the path, t_k - t_1.
+"""
+
+from collections import deque
+from multiprocessing import Pool, cpu_count
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from hypergraphx import TemporalHypergraph
+
+METRICS = ("earliest_arrival", "shortest", "fastest")
+
+
+class _EventStream:
+    """The hyperedge events of a temporal hypergraph, sorted by time and with the
+    nodes relabeled as integers.
+    """
+
+    def __init__(self, temporal_hypergraph: TemporalHypergraph):
+        events = sorted(temporal_hypergraph.get_edges(), key=lambda event: event[0])
+        self.nodes = list(temporal_hypergraph.get_nodes())
+        index = {node: i for i, node in enumerate(self.nodes)}
+        self.events = events
+        self.times = [time for time, _ in events]
+        self.members = [tuple(index[node] for node in edge) for _, edge in events]
+
+        # Events at the same time form a group, whose first event is group_starts[g]
+        times = np.asarray(self.times, dtype=np.int64)
+        starts = np.flatnonzero(np.diff(times, prepend=times[:1] - 1))
+        self.group_times = times[starts].tolist()
+        self.group_starts = np.append(starts, len(events)).tolist()
+        self.index = index
+
+
+def _scan(
+    stream: _EventStream,
+    source: int,
+    metric: str,
+    max_wait: Optional[int],
+    start_time: Optional[int],
+    end_time: Optional[int],
+    return_paths: bool,
+):
+    """Single scan of the events from one source.
+
+    Every arrival at a node is stored as (time, value, entry), where the value is
+    minimized by the metric: minus the arrival time for the earliest arrival (the
+    latest arrival expires last), the number of events for the shortest paths and
+    minus the start time for the fastest paths. The queue of every node keeps
+    increasing values, so that the first arrival not expired is the best one.
+    """
+    queues: Dict[int, deque] = {}
+    best: Dict[int, Tuple[int, int]] = {}
+    # Event and parent entry of every arrival, to rebuild the paths
+    entries: List[Tuple[int, int]] = []
+
+    group_times, group_starts = stream.group_times, stream.group_starts
+    first = 0 if start_time is None else np.searchsorted(group_times, start_time)
+    last = (
+        len(group_times)
+        if end_time is None
+        else np.searchsorted(group_times, end_time, side="right")
+    )
+    for g in range(first, last):
+        t = group_times[g]
+        cutoff = None if max_wait is None else t - max_wait
+        source_value = -t if metric == "fastest" else 0
+
+        # Best value reaching every node within this group of events
+        updates: Dict[int, Tuple[int, int, int]] = {}
+        for k in range(group_starts[g], group_starts[g + 1]):
+            members = stream.members[k]
+            value, parent = None, -1
+            for u in members:
+                if u == source:
+                    candidate, candidate_parent = source_value, -1
+                else:
+                    queue = queues.get(u)
+                    if not queue:
+                        continue
+                    if cutoff is not None:
+                        while queue and queue[0][0] < cutoff:
+                            queue.popleft()
+                        if not queue:
+                            continue
+                    _, candidate, candidate_parent = queue[0]
+                if value is None or candidate < value:
+                    value, parent = candidate, candidate_parent
+            if value is None:
+                continue
+
+            if metric == "earliest_arrival":
+                value = -t
+            elif metric == "shortest":
+                value += 1
+            for v in members:
+                if v != source and (v not in updates or value < updates[v][0]):
+                    updates[v] = (value, parent, k)
+
+        for v, (value, parent, k) in updates.items():
+            entry = len(entries)
+            if return_paths:
+                entries.append((k, parent))
+            queue = queues.setdefault(v, deque())
+            # Without waiting window, an arrival not better than the first is useless
+            if max_wait is not None or not queue or value < queue[0][1]:
+                while queue and queue[-1][1] >= value:
+                    queue.pop()
+                queue.append((t, value, entry))
+
+            if metric == "earliest_arrival":
+                objective = t
+            elif metric == "shortest":
+                objective = value
+            else:
+                objective = t + value
+            if v not in best or objective < best[v][0]:
+                best[v] = (objective, entry)
+
+    values = {stream.nodes[v]: objective for v, (objective, _) in best.items()}
+    if not return_paths:
+        return values, None
+    paths = {}
+    for v, (_, entry) in best.items():
+        path = []
+        while entry != -1:
+            k, entry = entries[entry]
+            path.append(stream.events[k])
+        paths[stream.nodes[v]] = path[::-1]
+    return values, paths
+
+
+def _temporal_paths_worker(args):
+    stream, sources, kwargs = args
+    return [(source, _scan(stream, source, **kwargs)) for source in sources]
+
+
+def temporal_paths(
+    temporal_hypergraph: TemporalHypergraph,
+    sources: Optional[Iterable[Hashable]] = None,
+    metric: str = "earliest_arrival",
+    max_wait: Optional[int] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    return_paths: bool = False,
+    n_jobs: int = 1,
+):
+    """Compute the optimal temporal hyperpaths from every source to all the nodes
+    reachable from it, with a single scan of the time-sorted hyperedge events.
+
+    Parameters
+    ----------
+    temporal_hypergraph: TemporalHypergraph
+        The temporal hypergraph.
+    sources: iterable, optional
+        The source nodes. If None, all the nodes.
+    metric: str
+        One of "earliest_arrival", "shortest" and "fastest". The value of a target
+        is, respectively, the earliest arrival time, the minimum number of hyperedge
+        events and the minimum duration t_k - t_1 of a temporal hyperpath from the
+        source (default: "earliest_arrival").
+    max_wait: int, optional
+        The maximum time between consecutive events of a path. If None, there is no
+        waiting-time constraint.
+    start_time: int, optional
+        Only use the events at time start_time or later.
+    end_time: int, optional
+        Only use the events at time end_time or earlier.
+    return_paths: bool
+        If True, also return an optimal path to every target, as the list of its
+        (time, hyperedge) events.
+    n_jobs: int
+        Number of processes running the sources. If None, use all the available CPUs
+        (default: 1).
+
+    Returns
+    -------
+    dict
+        Dictionary {source: {target: value}} over the reachable targets, the source
+        excluded.
+    dict
+        Only if return_paths is True, dictionary {source: {target: path}}.
+
+    Raises
+    ------
+    ValueError
+        If the metric is not valid, max_wait is negative or a source is not a node
+        of the temporal hypergraph.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}, got {metric!r}.")
+    if max_wait is not None and max_wait < 0:
+        raise ValueError("max_wait must be non-negative.")
+
+    stream = _EventStream(temporal_hypergraph)
+    if sources is None:
+        sources = stream.nodes
+    sources = list(sources)
+    for source in sources:
+        if source not in stream.index:
+            raise ValueError(f"Source {source!r} is not in the temporal hypergraph.")
+    source_ids = [stream.index[source] for source in sources]
+
+    kwargs = dict(
+        metric=metric,
+        max_wait=max_wait,
+        start_time=start_time,
+        end_time=end_time,
+        return_paths=return_paths,
+    )
+    n_jobs = cpu_count() if n_jobs is None else n_jobs
+    tasks = [
+        (stream, chunk.tolist(), kwargs)
+        for chunk in np.array_split(source_ids, max(1, min(n_jobs, len(source_ids))))
+    ]
+    if n_jobs == 1:
+        results = [_temporal_paths_worker(task) for task in tasks]
+    else:
+        with Pool(processes=n_jobs) as pool:
+            results = pool.map(_temporal_paths_worker, tasks)
+
+    values, paths = {}, {}
+    for result in results:
+        for source, (source_values, source_paths) in result:
+            values[stream.nodes[source]] = source_values
+            paths[stream.nodes[source]] = source_paths
+    if return_paths:
+        return values, paths
+    return values
+
+
+def earliest_arrival_times(temporal_hypergraph: TemporalHypergraph, **kwargs):
+    """Earliest arrival times of temporal hyperpaths, see temporal_paths."""
+    return temporal_paths(temporal_hypergraph, metric="earliest_arrival", **kwargs)
+
+
+def shortest_temporal_paths(temporal_hypergraph: TemporalHypergraph, **kwargs):
+    """Minimum number of events of temporal hyperpaths, see temporal_paths."""
+    return temporal_paths(temporal_hypergraph, metric="shortest", **kwargs)
+
+
+def fastest_temporal_paths(temporal_hypergraph: TemporalHypergraph, **kwargs):
+    """Minimum duration of temporal hyperpaths, see temporal_paths."""
+    return temporal_paths(temporal_hypergraph, metric="fastest", **kwargs)
@@ -81,38 +81,21 @@ def supra_adj(temporal_network, subtimes, unique_individuals, dataset):
         ]
         G.add_nodes_from(nodes)
 
-    # for successively each subnetwork
-    for i, t in enumerate(subtimes):
+    # for successively each subnetwork, from the last one, link every node directly
+    # to the next time it is active
+    next_active = dict()
+    for t in reversed(subtimes):
         subnet = temporal_network[t]
-        # for each node
         NODES = (
             subnet.get_nodes() if isinstance(subnet, hgx.Hypergraph) else subnet.nodes()
         )
         for n in NODES:
-            # find all next active agents and link directly
-            j = i + 1
-            found = False
-            while j < len(subtimes) and not found:
-                t_j = subtimes[j]
-                # print(i, j, n)
-                active_in = (
-                    (n in set(temporal_network[subtimes[j]].get_nodes()))
-                    if isinstance(temporal_network[subtimes[j]], hgx.Hypergraph)
-                    else (n in set(temporal_network[subtimes[j]].nodes()))
-                )
-                if active_in:
-                    found = True
-                    if "FnF" in dataset:
-                        # temp1 = datetime.strptime(t_j[:-1], "%Y-%m-%d_%H")
-                        # temp2 = datetime.strptime(t[:-1], "%Y-%m-%d_%H")
-                        # hours_passed = (temp1 - temp2).total_seconds()/3600
-                        hours_passed = t_j - t
-                    else:
-                        hours_passed = t_j - t
-
-                    assert hours_passed > 0, f"{t_j} - {t} = {t_j-t}"
-                    G.add_edge((t, n), (t_j, n), weight=hours_passed)
-                j += 1
+            if n in next_active:
+                t_j = next_active[n]
+                hours_passed = t_j - t
+                assert hours_passed > 0, f"{t_j} - {t} = {t_j-t}"
+                G.add_edge((t, n), (t_j, n), weight=hours_passed)
+            next_active[n] = t
 
     # then go back and do cross-diag coupling
     for i, t in enumerate(subtimes):
@@ -1,11 +1,12 @@
 import itertools
 import logging
 from collections import Counter
-from time import sleep
 
 import networkx as nx
 import numpy as np
 import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import shortest_path
 
 try:
     from tqdm import tqdm  # type: ignore
@@ -19,6 +20,9 @@ from hypergraphx.representations import projections
 
 logger = logging.getLogger(__name__)
 
+# Number of entries of the temporary arrays built at once.
+_CHUNK_SIZE = 2**22
+
 
 def _to_df(H):
     """
@@ -54,69 +58,145 @@ def compute_all_nodes_shortest_path(G):
         raise TypeError("G must be connected")
 
 
-def compute_all_edges_shortest_path(
-    H, graph_distance=None, verbose=False, aggregate=False
+def _node_distance_matrix(edges, graph_distance=None):
+    """
+    Compute the shortest path lengths between the nodes of a list of hyperedges.
+
+    Args:
+        edges: The hyperedges.
+        graph_distance: Precomputed node shortest path distances (optional).
+
+    Returns:
+        nodes: The list of nodes in the hyperedges.
+        distance: The N x N matrix of node shortest path distances, with N the number of nodes.
+    """
+    nodes = list(dict.fromkeys(node for edge in edges for node in edge))
+    if graph_distance is not None:
+        return nodes, np.array(
+            [[graph_distance[x][y] for y in nodes] for x in nodes], dtype=np.int64
+        )
+
+    # Adjacency matrix of the clique projection, from the binary incidence matrix
+    index = {node: i for i, node in enumerate(nodes)}
+    sizes = [len(edge) for edge in edges]
+    incidence = sparse.csr_array(
+        (
+            np.ones(sum(sizes)),
+            (
+                [index[node] for edge in edges for node in edge],
+                np.repeat(np.arange(len(edges)), sizes),
+            ),
+        ),
+        shape=(len(nodes), len(edges)),
+    )
+    distance = shortest_path(incidence @ incidence.T, directed=False, unweighted=True)
+    if np.isinf(distance).any():
+        raise TypeError("G must be connected")
+    return nodes, distance.astype(np.int64)
+
+
+def edge_distance_matrix(
+    H, graph_distance=None, verbose=False, aggregate=False, path=None
 ):
     """
-    Compute the shortest path lengths between all pairs of edges in a (temporal) HyperGraph.
+    Compute the shortest path lengths between all pairs of edges in a (temporal) HyperGraph, as a matrix.
+
+    The distance between two different hyperedges is one plus the minimum distance between their nodes in the
+    clique projection of the aggregated hypergraph. Every block of rows of the matrix is computed as a min-plus
+    product of the rows of the node distance matrix.
 
     Args:
         H: The input (temporal) HyperGraph.
         graph_distance: Precomputed node shortest path distances (optional).
         verbose: If True, print progress information.
         aggregate: If True, assume H as a time-aggregated hypergraph; otherwise, aggregate the temporal hypergraph.
+        path: If given, store the matrix in a memory-mapped .npy file at this path, to be used when the number of
+            hyperedges is large.
 
     Returns:
-        dict: A dictionary containing edge pairs as keys and their corresponding shortest path lengths as values.
+        edges: The list of the E distinct hyperedges, in the order of the rows of the matrix.
+        distance: The E x E matrix of edge shortest path lengths, of type int16 unless larger values are needed.
     """
     if aggregate:
-        H_agg = H
+        edges = list(dict.fromkeys(H.get_edges()))
     else:
-        H_agg = H.aggregate(max(H.edges) + 100)[0]
+        edges = list(dict.fromkeys(edge for _, edge in H.get_edges()))
 
-    if graph_distance is None:
-        if verbose:
-            logger.info(
-                "Computing node shortest path distance of the aggregated projected network..."
-            )
-        # Compute node shortest path distances for the aggregated projected network
-        graph_distance = compute_all_nodes_shortest_path(
-            projections.clique_projection(H_agg)
+    if verbose:
+        logger.info(
+            "Computing node shortest path distance of the aggregated projected network..."
         )
-        if verbose:
-            logger.info("Complete!")
+    nodes, node_distance = _node_distance_matrix(edges, graph_distance)
+    if verbose:
+        logger.info("Complete!")
+
+    E = len(edges)
+    max_distance = int(node_distance.max(initial=0)) + 1
+    dtype = np.int16 if max_distance <= np.iinfo(np.int16).max else np.int32
+    if path is None:
+        distance = np.zeros((E, E), dtype=dtype)
+    else:
+        distance = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(E, E))
+    if E == 0:
+        return edges, distance
 
     if verbose:
         logger.info(
             "Computing topological distance of hyperlinks path distance of the higher order aggregated network..."
         )
-
-    E = len([x for x in H_agg.get_edges()])
-    edge_dic_distance = {}
-    for edge1 in H_agg.get_edges():
-        for edge2 in H_agg.get_edges():
-            if (edge1, edge2) not in edge_dic_distance:
-                if edge1 == edge2:
-                    edge_dic_distance[(edge1, edge2)] = 0
-                else:
-                    # Compute the shortest path length between two edges based on node shortest path distances
-                    edge_dic_distance[(edge1, edge2)] = (
-                        min(
-                            [
-                                graph_distance[x][y]
-                                for x, y in itertools.product(edge1, edge2)
-                            ]
-                        )
-                        + 1
-                    )
-                    edge_dic_distance[(edge2, edge1)] = edge_dic_distance[
-                        (edge1, edge2)
-                    ]
-    assert len(edge_dic_distance) == E**2
+    index = {node: i for i, node in enumerate(nodes)}
+    offsets = np.zeros(E + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(edge) for edge in edges])
+    members = np.fromiter(
+        (index[node] for edge in edges for node in edge),
+        dtype=np.int64,
+        count=offsets[-1],
+    )
+    max_size = int(np.diff(offsets).max())
+    block = max(1, _CHUNK_SIZE // max(len(members), max_size * len(nodes)))
+    for start in range(0, E, block):
+        stop = min(start + block, E)
+        # Distance from the hyperedges in the block to every node, then to every hyperedge
+        to_nodes = np.minimum.reduceat(
+            node_distance[members[offsets[start] : offsets[stop]]],
+            offsets[start:stop] - offsets[start],
+            axis=0,
+        )
+        to_edges = np.minimum.reduceat(to_nodes[:, members], offsets[:-1], axis=1)
+        to_edges += 1
+        to_edges[np.arange(stop - start), np.arange(start, stop)] = 0
+        distance[start:stop] = to_edges
+    if path is not None:
+        distance.flush()
     if verbose:
         logger.info("Complete!")
 
-    return edge_dic_distance
+    return edges, distance
+
+
+def compute_all_edges_shortest_path(
+    H, graph_distance=None, verbose=False, aggregate=False
+):
+    """
+    Compute the shortest path lengths between all pairs of edges in a (temporal) HyperGraph.
+
+    Args:
+        H: The input (temporal) HyperGraph.
+        graph_distance: Precomputed node shortest path distances (optional).
+        verbose: If True, print progress information.
+        aggregate: If True, assume H as a time-aggregated hypergraph; otherwise, aggregate the temporal hypergraph.
+
+    Returns:
+        dict: A dictionary containing edge pairs as keys and their corresponding shortest path lengths as values.
+    """
+    edges, distance = edge_distance_matrix(
+        H, graph_distance=graph_distance, verbose=verbose, aggregate=aggregate
+    )
+    return {
+        (edge1, edge2): d
+        for edge1, row in zip(edges, distance.tolist())
+        for edge2, d in zip(edges, row)
+    }
 
 
 def get_mean_distance_events(H, order, edge_distance=None, cross_order=False):
@@ -169,6 +249,151 @@ def get_mean_distance_events(H, order, edge_distance=None, cross_order=False):
     return cnt_ev1
 
 
+def _as_distance_matrix(distance_dict):
+    """
+    Return the list of hyperedges and the matrix of their distances.
+
+    Args:
+        distance_dict: Either a dictionary with edge pairs as keys, as returned by compute_all_edges_shortest_path,
+            or the pair (edges, distance) returned by edge_distance_matrix.
+    """
+    if isinstance(distance_dict, dict):
+        edges = list(dict.fromkeys(edge for edge, _ in distance_dict))
+        distance = np.array(
+            [[distance_dict[(x, y)] for y in edges] for x in edges], dtype=np.int64
+        )
+        return edges, distance.reshape(len(edges), len(edges))
+    return distance_dict
+
+
+def _event_arrays(df, edges):
+    """
+    Return the timestamps of the events in df, sorted, and the indices of their hyperedges in edges.
+    """
+    index = {edge: e for e, edge in enumerate(edges)}
+    times = df.timestamp.to_numpy()
+    ids = np.fromiter((index[x] for x in df.nodes), dtype=np.int64, count=len(times))
+    order = np.argsort(times, kind="stable")
+    return times[order], ids[order], order
+
+
+def _to_counter(counts):
+    """Convert an array of counts by distance to a Counter."""
+    return Counter({d: int(n) for d, n in enumerate(counts) if n})
+
+
+def _pair_distance_counts(distance, left, right):
+    """
+    Count the couples of events by the topological distance of their hyperedges.
+
+    Args:
+        distance: Matrix of hyperedge distances.
+        left, right: Number of events of every hyperedge on the two sides of the couples.
+
+    Returns:
+        counts: Array with the number of couples at every distance.
+    """
+    rows, columns = np.flatnonzero(left), np.flatnonzero(right)
+    counts = np.zeros(1)
+    block = max(1, _CHUNK_SIZE // max(len(columns), 1))
+    for start in range(0, len(rows), block):
+        rows_block = rows[start : start + block]
+        d = np.asarray(distance[rows_block][:, columns]).ravel()
+        weights = np.outer(left[rows_block], right[columns]).ravel()
+        block_counts = np.bincount(d, weights=weights)
+        counts = np.pad(counts, (0, max(0, len(block_counts) - len(counts))))
+        counts[: len(block_counts)] += block_counts
+    return np.rint(counts).astype(np.int64)
+
+
+def _delay_distance_counts(times, ids, distance, dt, cross=None, verbose=False):
+    """
+    Count the couples of events by temporal delay and topological distance, in a single pass over the events.
+
+    Args:
+        times: The sorted timestamps of the events.
+        ids: The index of the hyperedge of every event.
+        distance: Matrix of hyperedge distances.
+        dt: Increasing time delays.
+        cross: Boolean array (optional). If given, only the couples of events with different values are counted.
+        verbose: If True, print progress information.
+
+    Returns:
+        counts: Array of shape (len(dt), D) with counts[k, d] the number of couples of events at topological
+        distance d and with temporal delay smaller than dt[k].
+    """
+    n = len(times)
+    # Couples of events are (i, j) with i < j < stop[i], so that each couple is counted once
+    stop = np.searchsorted(times, times + dt[-1], side="left")
+    num_pairs = stop - np.arange(1, n + 1)
+    cum_pairs = np.cumsum(num_pairs)
+    bounds = [0]
+    while bounds[-1] < n:
+        done = cum_pairs[bounds[-1] - 1] if bounds[-1] else 0
+        bounds.append(
+            max(
+                bounds[-1] + 1,
+                int(np.searchsorted(cum_pairs, done + _CHUNK_SIZE, side="right")),
+            )
+        )
+    chunks = zip(bounds[:-1], bounds[1:])
+    if verbose:
+        chunks = tqdm(list(chunks), position=0, leave=True)
+
+    counts = np.zeros((len(dt), 1), dtype=np.int64)
+    for start, end in chunks:
+        sizes = num_pairs[start:end]
+        first = np.repeat(np.arange(start, end), sizes)
+        second = (
+            first
+            + 1
+            + np.arange(len(first))
+            - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        )
+        if cross is not None:
+            keep = cross[first] != cross[second]
+            first, second = first[keep], second[keep]
+        if not len(first):
+            continue
+        # The first delay in dt larger than the one of the couple
+        delay = np.searchsorted(dt, times[second] - times[first], side="right")
+        d = np.asarray(distance[ids[first], ids[second]]).astype(np.int64)
+        width = max(counts.shape[1], int(d.max()) + 1)
+        counts = np.pad(counts, ((0, 0), (0, width - counts.shape[1])))
+        counts += np.bincount(delay * width + d, minlength=len(dt) * width).reshape(
+            len(dt), width
+        )
+    return np.cumsum(counts, axis=0)
+
+
+def _conditional_distances(
+    times, ids, distance, dt_list, overall, cross=None, skip_inf=True, verbose=False
+):
+    """
+    Assemble the overall topological distance and its distribution conditioned to the temporal delays.
+    """
+    dt = np.asarray(dt_list)
+    if len(dt) and (np.any(dt <= 0) or np.any(np.diff(dt) <= 0)):
+        raise ValueError("dt_list must contain increasing positive delays.")
+
+    tot_dic_dst_counter_gen = {
+        "overall_avg_dist": np.average(np.arange(len(overall)), weights=overall)
+    }
+    tot_dic_dst_counter = {}
+    if len(dt):
+        counts = _delay_distance_counts(
+            times, ids, distance, dt, cross=cross, verbose=verbose
+        )
+        for delta_t, row in zip(dt_list, counts):
+            tot_dic_dst_counter[delta_t] = _to_counter(row)
+    if not skip_inf:
+        # Introduce t_inf, for which E[eta|t_inf] = E[eta]
+        t_inf = (np.max(times) - np.min(times)) + 100
+        tot_dic_dst_counter[t_inf] = _to_counter(overall)
+    tot_dic_dst_counter_gen["cond_dist"] = tot_dic_dst_counter
+    return tot_dic_dst_counter_gen
+
+
 def topological_temporal_distance_diff_order(
     H, df, order, distance_dict, dt_list, skip_inf=True, verbose=False
 ):
@@ -179,8 +404,9 @@ def topological_temporal_distance_diff_order(
         H: The input Temporal HyperGraph.
         df: DataFrame representation of the temporal hypergraph.
         order: The reference order.
-        distance_dict: Dictionary containing hyperlink topological distance information.
-        dt_list: List of time delays.
+        distance_dict: Hyperlink topological distances, either as a dictionary or as the pair (edges, distance)
+            returned by edge_distance_matrix.
+        dt_list: List of increasing time delays.
         skip_inf: If False, include the overall topological distribution of events.
         verbose: If True, print progress information.
 
@@ -188,141 +414,26 @@ def topological_temporal_distance_diff_order(
         tot_dic_dst_counter_gen: A dictionary containing the overall topological distances among events of different orders,
         and the one conditioned to their temporal delays.
     """
-    # Introduce t_inf to check convergence to 1 of E[eta| delta t]
-    t_inf = (np.max(df.timestamp) - np.min(df.timestamp)) + 100
-    dt_list = dt_list + [t_inf]
-
-    # Initialize dictionaries to store distances and counters
-    tot_dic_dst_counter = {}
-    tot_dic_dst_counter_gen = {}
-
-    # Compute average topological distance of events of reference order with events of different orders
-    cnt_ev1 = get_mean_distance_events(H, order, distance_dict, cross_order=True)
-    tot_dic_dst_counter_gen["overall_avg_dist"] = np.average(
-        list(cnt_ev1.keys()), weights=list(cnt_ev1.values())
+    edges, distance = _as_distance_matrix(distance_dict)
+    times, ids, sort = _event_arrays(df, edges)
+    reference = df.order.to_numpy()[sort] == order
+
+    # All the couples of events of the reference order with events of different orders
+    overall = _pair_distance_counts(
+        distance,
+        np.bincount(ids[reference], minlength=len(edges)),
+        np.bincount(ids[~reference], minlength=len(edges)),
+    )
+    return _conditional_distances(
+        times,
+        ids,
+        distance,
+        dt_list,
+        overall,
+        cross=reference,
+        skip_inf=skip_inf,
+        verbose=verbose,
     )
-    n5 = df.shape[0]
-
-    # Divide the events into those with reference order and those with different orders
-    n2 = df[df.order == order].shape[0]
-    n_other = df[df.order != order].shape[0]
-    assert n2 * n_other == sum(list(cnt_ev1.values()))
-
-    cnt_dst = Counter()
-    cnt_spk = Counter()
-    n0 = 0
-    n_tot = 0
-
-    # Iterate over time intervals
-    for p, delta_t in enumerate(dt_list):
-        # Use tqdm to check the progress
-        if verbose:
-            tqdm.write(str(delta_t))
-            sleep(0.5)
-        max_time = max(df.timestamp)
-        index_set = set()
-        t_cnt = 0
-        e_cnt = 0
-        i = 0
-
-        if verbose:
-            ref_list = tqdm(list(df.timestamp.unique()), position=0, leave=True)
-        else:
-            ref_list = list(df.timestamp.unique())
-
-        # Iterate over reference times
-        for ref_time in ref_list:
-            # Introduce delta_t_low as the previous element in dt_list.
-            # If delta_t is the first element, then delta_t_low=0
-            if p == 0:
-                delta_t_low = 0
-            else:
-                delta_t_low = dt_list[p - 1]
-            t_cnt += 1
-
-            # To speed up computation, update the cnt_dist dynamically.
-            # At each consecutive delta_t in dt_list, update the counter including the couples of events
-            # with temporal delay delta_t', such that delta_t_low <= delta_t' < delta_t. Each couple is computed once.
-
-            # The original set of events includes events at time t and those with delay delta_t',
-            # such that delta_t_low <= delta_t' < delta_t.
-            df_rest = df[
-                (df.timestamp == ref_time)
-                | (
-                    (df.timestamp >= ref_time + delta_t_low)
-                    & (df.timestamp < ref_time + delta_t)
-                )
-            ]
-
-            # Divide events into reference order and other orders
-            df_rest_order = df_rest[df_rest.order == order]
-            df_rest_other_order = df_rest[df_rest.order != order]
-
-            # Divide events according to order and time in which they occur
-
-            # 1)Events occurring at the reference time
-            ref_nodes_order = df_rest_order[df_rest_order.timestamp == ref_time].nodes
-            ref_nodes_other_order = df_rest_other_order[
-                df_rest_other_order.timestamp == ref_time
-            ].nodes
-
-            # 2)Events occurring with delay delta_t' where delta_t_low <= delta_t' < delta_t
-            df_rest_order = df_rest_order[df_rest_order.timestamp > ref_time]
-            df_rest_other_order = df_rest_other_order[
-                df_rest_other_order.timestamp > ref_time
-            ]
-
-            # Speed up the process by counting the number of events associated with the same hyperlink
-            size_n_order = df_rest_order.groupby(df_rest_order.nodes).size()
-            size_n_other_order = df_rest_other_order.groupby(
-                df_rest_other_order.nodes
-            ).size()
-            # Concatenate sizes since no events in size_n_order are included in size_n_other_order
-            size = pd.concat([size_n_order, size_n_other_order]).to_dict()
-
-            # Check the total number of couples of events where one has the reference order
-            # and the other has a different order for consistency checks
-            n_tot += ref_nodes_order.shape[0] * df_rest_other_order.shape[0]
-            n_tot += ref_nodes_other_order.shape[0] * df_rest_order.shape[0]
-            # If delta_t_low is the smallest in the list, include also events occurring at the same timestamp
-            if p == 0:
-                n_tot += ref_nodes_order.shape[0] * (ref_nodes_other_order.shape[0])
-                for x, y in itertools.product(ref_nodes_order, ref_nodes_other_order):
-                    cnt_dst.update({distance_dict[(x, y)]: 1})
-
-            # Update distance dict adding to each distance value the number of corresponding couples of events
-            for x, y in itertools.product(
-                ref_nodes_order, df_rest_other_order.nodes.unique()
-            ):
-                cnt_dst.update({distance_dict[(x, y)]: size[y]})
-            for x, y in itertools.product(
-                ref_nodes_other_order, df_rest_order.nodes.unique()
-            ):
-                cnt_dst.update({distance_dict[(x, y)]: size[y]})
-
-            e_cnt += 1
-            i += 1
-
-        # Check the number of couples of events
-        assert sum(list(cnt_dst.values())) == n_tot
-
-        # Check convergence: lim delta_t -> inf E[eta|delta_t] = E[eta]
-        if delta_t == t_inf:
-            assert (
-                np.average(list(cnt_dst.keys()), weights=list(cnt_dst.values()))
-                == tot_dic_dst_counter_gen["overall_avg_dist"]
-            )
-            if skip_inf:
-                continue
-
-        tot_dic_dst_counter[delta_t] = cnt_dst.copy()
-
-        assert e_cnt == df.timestamp.unique().shape[0]
-        assert t_cnt == e_cnt
-
-    tot_dic_dst_counter_gen["cond_dist"] = tot_dic_dst_counter.copy()
-
-    return tot_dic_dst_counter_gen
 
 
 def topological_temporal_distance_same_order(
@@ -335,8 +446,9 @@ def topological_temporal_distance_same_order(
         H: The input Temporal HyperGraph.
         df: DataFrame representation of the temporal hypergraph.
         order: The reference order.
-        distance_dict: Dictionary containing hyperlink topological distance information.
-        dt_list: List of time delays.
+        distance_dict: Hyperlink topological distances, either as a dictionary or as the pair (edges, distance)
+            returned by edge_distance_matrix.
+        dt_list: List of increasing time delays.
         skip_inf: If False, include the overall topological distribution of events.
         verbose: If True, print progress information.
 
@@ -344,118 +456,23 @@ def topological_temporal_distance_same_order(
         tot_dic_dst_counter_gen: A dictionary containing the overall topological distances among events of the same order,
         and the one conditioned to their temporal delays.
     """
-    tot_dic_dst_counter = {}
-    tot_dic_dst_counter_gen = {}
-
-    # Filter the DataFrame to retain events of the specified order
-    df = df[df.order == order]
-
-    # Introduce t_inf to check convergence to 1 of E[tau]
-    t_inf = (np.max(df.timestamp) - np.min(df.timestamp)) + 100
-    dt_list = dt_list + [t_inf]
-
-    # Compute average topological distance of events of the same order with each other
-    cnt_ev1 = get_mean_distance_events(H, order, distance_dict, cross_order=False)
-    tot_dic_dst_counter_gen["overall_avg_dist"] = np.average(
-        list(cnt_ev1.keys()), weights=list(cnt_ev1.values())
+    edges, distance = _as_distance_matrix(distance_dict)
+    times, ids, _ = _event_arrays(df[df.order == order], edges)
+
+    # All the couples of events of the same order: the couples of events of the same hyperlink are at distance 0
+    size = np.bincount(ids, minlength=len(edges))
+    overall = _pair_distance_counts(distance, size, size)
+    overall[0] -= size.sum()
+    overall //= 2
+    return _conditional_distances(
+        times,
+        ids,
+        distance,
+        dt_list,
+        overall,
+        skip_inf=skip_inf,
+        verbose=verbose,
     )
-    n5 = df.shape[0]
-
-    # Check that the total number of pairs of contacts is equal to the total number of possible pairs of a set of df.shape[0] elements
-    assert (n5 * (n5 - 1)) / 2 == sum(list(cnt_ev1.values()))
-
-    cnt_dst = Counter()
-    cnt_spk = Counter()
-    n0 = 0
-    n_tot = 0
-
-    for p, delta_t in enumerate(dt_list):
-        if verbose:
-            tqdm.write(str(delta_t))
-            sleep(0.5)
-        max_time = max(df.timestamp)
-        index_set = set()
-        t_cnt = 0
-        e_cnt = 0
-        i = 0
-
-        if verbose:
-            ref_list = tqdm(list(df.timestamp.unique()), position=0, leave=True)
-        else:
-            ref_list = list(df.timestamp.unique())
-
-        for ref_time in ref_list:
-            # Introduce delta_t_low as the previous element in dt_list.
-            # If delta_t is the first element, then delta_t_low=0
-            if p == 0:
-                delta_t_low = 0
-            else:
-                delta_t_low = dt_list[p - 1]
-            t_cnt += 1
-
-            if ref_time <= max_time:
-                # To speed up computation, update the cnt_dist dynamically.
-                # At each consecutive delta_t in dt_list, update the counter including the couples of events
-                # with temporal delay delta_t', such that delta_t_low <= delta_t' < delta_t. Each couple is computed once.
-
-                # The original set of events includes events at time t and those with delay delta_t',
-                # such that delta_t_low <= delta_t' < delta_t.
-                df_rest = df[
-                    (df.timestamp == ref_time)
-                    | (
-                        (df.timestamp >= ref_time + delta_t_low)
-                        & (df.timestamp < ref_time + delta_t)
-                    )
-                ]
-
-                # Divide events according to the time in which they occur
-
-                # 1)Events occurring at the reference time
-                ref_nodes = df_rest[df_rest.timestamp == ref_time].nodes
-
-                # 2)Events occurring with delay delta_t' where delta_t_low <= delta_t' < delta_t
-                df_rest = df_rest[df_rest.timestamp > ref_time]
-
-                # Speed up the process by counting the number of events associated with the same hyperlink
-
-                size_n = df_rest.groupby(df.nodes).size()
-                size = size_n.to_dict()
-                # Compute the total number of couples of events with same reference order
-                n_tot += ref_nodes.shape[0] * (sum(size_n.values))
-
-                # If delta_t_low is the smallest in the list, include also events occurring at the same timestamp
-                if p == 0:
-                    n_tot += ((ref_nodes.shape[0] * (ref_nodes.shape[0] - 1))) / 2.0
-                    for x, y in itertools.combinations(ref_nodes, 2):
-                        cnt_dst.update({distance_dict[(x, y)]: 1})
-
-                # Update distance dict adding to each distance value the number of corresponding couples of events
-                for x, y in itertools.product(ref_nodes, df_rest.nodes.unique()):
-                    cnt_dst.update({distance_dict[(x, y)]: size[y]})
-
-                e_cnt += 1
-                i += 1
-
-        # Check the number of couples of events
-        assert sum(list(cnt_dst.values())) == n_tot
-
-        # Check convergence: lim delta_t -> inf E[eta|delta_t] = E[eta]
-        if delta_t == t_inf:
-            assert (
-                np.average(list(cnt_dst.keys()), weights=list(cnt_dst.values()))
-                == tot_dic_dst_counter_gen["overall_avg_dist"]
-            )
-            assert cnt_dst == cnt_ev1
-            if skip_inf:
-                continue
-
-        tot_dic_dst_counter[delta_t] = cnt_dst.copy()
-        assert e_cnt == df.timestamp.unique().shape[0]
-        assert t_cnt == e_cnt
-
-    tot_dic_dst_counter_gen["cond_dist"] = tot_dic_dst_counter.copy()
-
-    return tot_dic_dst_counter_gen
 
 
 def topological_temporal_cond_distance(
@@ -475,11 +492,12 @@ def topological_temporal_cond_distance(
     Args:
         H: The input Temporal HyperGraph.
         order: The reference order.
-        distance_dict: Dictionary containing hyperlink topological distance information.
+        distance_dict: Hyperlink topological distances, either as a dictionary or as the pair (edges, distance)
+            returned by edge_distance_matrix. If None, it is computed with edge_distance_matrix.
         same_order: If True, compute distances among events of the same order; otherwise, compute distances among events of different orders.
         fit_correlation: If True, compute the fit of the increasing trend of the avg normalized conditional topological distance.
         drop_duplicates: If True, remove duplicate entries in the DataFrame.
-        dt_list: List of time delays.
+        dt_list: List of increasing time delays.
         skip_inf: If False, include the overall topological distribution of events.
         verbose: If True, print progress information.
 
@@ -505,7 +523,7 @@ def topological_temporal_cond_distance(
     # If distance_dict is not provided, compute it
     gen_dict = {}
     if distance_dict is None:
-        distance_dict = compute_all_edges_shortest_path(H, verbose=verbose)
+        distance_dict = edge_distance_matrix(H, verbose=verbose)
 
     # Create a DataFrame from the input Temporal HyperGraph and sort it by timestamp
     df = (
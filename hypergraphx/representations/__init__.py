@@ -20,6 +20,22 @@ def clique_projection(*args, **kwargs):
     return _impl(*args, **kwargs)
 
 
+def clique_projection_matrix(*args, **kwargs):
+    from hypergraphx.representations.projections import (
+        clique_projection_matrix as _impl,
+    )
+
+    return _impl(*args, **kwargs)
+
+
+def clique_projection_blocks(*args, **kwargs):
+    from hypergraphx.representations.projections import (
+        clique_projection_blocks as _impl,
+    )
+
+    return _impl(*args, **kwargs)
+
+
 def line_graph(*args, **kwargs):
     from hypergraphx.representations.projections import line_graph as _impl
 
@@ -43,6 +59,8 @@ def simplicial_complex(*args, **kwargs):
 __all__ = [
     "bipartite_projection",
     "clique_projection",
+    "clique_projection_matrix",
+    "clique_projection_blocks",
     "line_graph",
     "directed_line_graph",
     "simplicial_complex",
@@ -1,15 +1,25 @@
+from itertools import chain
+from typing import Any, Dict, Iterator, Tuple
+
 import networkx as nx
+import numpy as np
+from scipy import sparse
+
 from hypergraphx import Hypergraph, DirectedHypergraph
+from hypergraphx.exceptions import InvalidParameterError
+from hypergraphx.linalg.linalg import binary_incidence_matrix
 from hypergraphx.measures.edge_similarity import intersection, jaccard_similarity
 
+PROJECTION_WEIGHTS = ("count", "inverse_size", "weight")
+
 
 def bipartite_projection(
-        h: Hypergraph | DirectedHypergraph,
-        *,
-        mode: str = "bipartite",  # "bipartite" o "extra_node"
-        node_order=None,
-        edge_order=None,
-        return_obj_to_id: bool = False,
+    h: Hypergraph | DirectedHypergraph,
+    *,
+    mode: str = "bipartite",  # "bipartite" o "extra_node"
+    node_order=None,
+    edge_order=None,
+    return_obj_to_id: bool = False,
 ):
     """
     Returns a bipartite or extra-node graph representation of the hypergraph.
@@ -151,7 +161,128 @@ def bipartite_projection(
     return g, id_to_obj
 
 
-def clique_projection(h: Hypergraph, keep_isolated=False):
+def _projection_factors(
+    h: Hypergraph, weight: str
+) -> Tuple[sparse.csr_array, sparse.csr_array, Dict[int, Any]]:
+    """The binary incidence matrix B and the matrix W B^T, where W is the diagonal
+    matrix of the contributions of the hyperedges to the projection.
+    """
+    if weight not in PROJECTION_WEIGHTS:
+        raise InvalidParameterError(
+            f"weight must be one of {PROJECTION_WEIGHTS}, got {weight!r}."
+        )
+    incidence, mapping = binary_incidence_matrix(h, return_mapping=True, format="csc")
+    if weight == "count":
+        incidence = incidence.astype(np.int64)
+        factors = np.ones(incidence.shape[1], dtype=np.int64)
+    elif weight == "inverse_size":
+        incidence = incidence.astype(np.float64)
+        sizes = np.diff(incidence.indptr)
+        # Hyperedges with a single node do not contribute to the projection
+        factors = np.zeros(len(sizes))
+        np.divide(1.0, sizes - 1, out=factors, where=sizes > 1)
+    else:
+        incidence = incidence.astype(np.float64)
+        factors = np.asarray(h.get_weights(), dtype=np.float64)
+    weighted_transpose = sparse.csr_array((incidence * factors).T)
+    return sparse.csr_array(incidence), weighted_transpose, mapping
+
+
+def _drop_diagonal(block: sparse.csr_array, offset: int) -> sparse.csr_array:
+    """Remove the entries (i, i + offset) of a block of rows starting at offset."""
+    rows = np.repeat(np.arange(block.shape[0]), np.diff(block.indptr))
+    keep = block.indices != rows + offset
+    indptr = np.zeros(block.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows[keep], minlength=block.shape[0]), out=indptr[1:])
+    return sparse.csr_array(
+        (block.data[keep], block.indices[keep], indptr), shape=block.shape
+    )
+
+
+def clique_projection_blocks(
+    h: Hypergraph, weight: str = "count", chunk_size: int = 10000
+) -> Iterator[Tuple[int, sparse.csr_array]]:
+    """
+    Yields the weighted clique projection of the hypergraph by blocks of rows.
+
+    Only one block of the projection is in memory at a time, so that the projection
+    of large hypergraphs can be processed or stored block by block.
+
+    Parameters
+    ----------
+    h : Hypergraph
+        The hypergraph to be projected.
+    weight : str
+        The weighting of the projected edges, see clique_projection_matrix.
+    chunk_size : int
+        The number of rows of every block.
+
+    Yields
+    ------
+    tuple
+        `(start, block)`, where `block` is the CSR matrix of the rows
+        `start, ..., start + chunk_size - 1` of the projection.
+    """
+    if chunk_size < 1:
+        raise InvalidParameterError("chunk_size must be positive.")
+    incidence, weighted_transpose, _ = _projection_factors(h, weight)
+    for start in range(0, incidence.shape[0], chunk_size):
+        block = incidence[start : start + chunk_size] @ weighted_transpose
+        yield start, _drop_diagonal(sparse.csr_array(block), start)
+
+
+def clique_projection_matrix(
+    h: Hypergraph,
+    weight: str = "count",
+    chunk_size: int | None = None,
+    return_mapping: bool = False,
+):
+    """
+    Returns the weighted clique projection of the hypergraph as a sparse matrix.
+
+    The projection is B W B^T with the diagonal removed, where B is the binary
+    incidence matrix and W the diagonal matrix of the contributions of the hyperedges.
+
+    Parameters
+    ----------
+    h : Hypergraph
+        The hypergraph to be projected.
+    weight : str
+        The contribution of every hyperedge e to the pairs of its nodes:
+        - "count": 1, so that the entries count the hyperedges shared by two nodes;
+        - "inverse_size": 1 / (s_e - 1), so that the strength of every node in the
+          projection is its degree in the hypergraph;
+        - "weight": the weight of the hyperedge.
+    chunk_size : int, optional
+        If given, compute the projection by blocks of chunk_size rows, which bounds
+        the memory of the intermediate products.
+    return_mapping : bool
+        If True, also return the dictionary mapping the indices to the nodes.
+
+    Returns
+    -------
+    scipy.sparse.csr_array
+        The N x N projection, with the nodes in the order of `h.get_nodes()`.
+    dict
+        Only if return_mapping is True, the dictionary {i: node}.
+    """
+    incidence, weighted_transpose, mapping = _projection_factors(h, weight)
+    num_nodes = incidence.shape[0]
+    if chunk_size is None:
+        projection = _drop_diagonal(sparse.csr_array(incidence @ weighted_transpose), 0)
+    else:
+        blocks = [block for _, block in clique_projection_blocks(h, weight, chunk_size)]
+        projection = (
+            sparse.csr_array(sparse.vstack(blocks, format="csr"))
+            if blocks
+            else sparse.csr_array((num_nodes, num_nodes), dtype=incidence.dtype)
+        )
+    if return_mapping:
+        return projection, mapping
+    return projection
+
+
+def clique_projection(h: Hypergraph, keep_isolated=False, weight=None):
     """
     Returns a clique projection of the hypergraph.
 
@@ -161,6 +292,10 @@ def clique_projection(h: Hypergraph, keep_isolated=False):
         The hypergraph to be projected.
     keep_isolated : bool
         Whether to keep isolated nodes or not.
+    weight : str, optional
+        If given, the "weight" attribute of the edges, one of "count", "inverse_size"
+        and "weight" (see clique_projection_matrix). If None, the edges have no
+        attributes, as in the unweighted projection.
 
     Returns
     -------
@@ -169,7 +304,12 @@ def clique_projection(h: Hypergraph, keep_isolated=False):
 
     Notes
     -----
-    Computing the clique projection can be very expensive for large hypergraphs.
+    Without weight, the pairs of every hyperedge are added to the graph one at a
+    time, which is the fastest way to build a networkx graph when the hyperedges
+    share few pairs of nodes. With a weight, the projection is computed as a sparse
+    matrix and its edges are added to the graph in bulk, once per pair of nodes.
+    For large hypergraphs, use clique_projection_matrix or clique_projection_blocks,
+    which do not build a networkx graph.
 
     Example
     -------
@@ -184,20 +324,45 @@ def clique_projection(h: Hypergraph, keep_isolated=False):
     >>> g.edges()
     EdgeView([(1, 2), (1, 3), (2,3), (3, 4), (3, 5), (4, 5)])
     """
-    g = nx.Graph()
+    if weight is None:
+        g = nx.Graph()
 
-    if keep_isolated:
-        for node in h.get_nodes():
-            g.add_node(node)
+        if keep_isolated:
+            for node in h.get_nodes():
+                g.add_node(node)
 
-    for edge in h.get_edges():
-        for i in range(len(edge) - 1):
-            for j in range(i + 1, len(edge)):
-                g.add_edge(edge[i], edge[j])
+        for edge in h.get_edges():
+            for i in range(len(edge) - 1):
+                for j in range(i + 1, len(edge)):
+                    g.add_edge(edge[i], edge[j])
 
+        return g
+
+    projection, mapping = clique_projection_matrix(
+        h, weight=weight, return_mapping=True
+    )
+    if keep_isolated:
+        nodes = list(mapping.values())
+    else:
+        # Nodes in order of first appearance in the hyperedges with at least two nodes
+        nodes = list(
+            dict.fromkeys(
+                chain.from_iterable(edge for edge in h.get_edges() if len(edge) > 1)
+            )
+        )
+
+    # Every edge is inserted once, from the upper triangle of the projection
+    upper = sparse.triu(projection, k=1, format="coo")
+    labels = np.fromiter(mapping.values(), dtype=object, count=len(mapping))
+    sources = labels[upper.row].tolist()
+    targets = labels[upper.col].tolist()
+    g = nx.Graph()
+    g.add_nodes_from(nodes)
+    g.add_weighted_edges_from(zip(sources, targets, upper.data.tolist()))
     return g
 
-def set_projection(h: Hypergraph) -> [nx.Graph,list]:
+
+def set_projection(h: Hypergraph) -> [nx.Graph, list]:
     """
     Returns a graph representation of the hypergraph using the extra-node projection method.
     Parameters
@@ -214,37 +379,37 @@ def set_projection(h: Hypergraph) -> [nx.Graph,list]:
     obj_to_id = {}
     idx = 0
 
-    #Add normal nodes
+    # Add normal nodes
     for node in h.get_nodes():
         id_to_obj[idx] = node
         obj_to_id[node] = idx
         idx += 1
-        g.add_node(node,is_edge = "node")
+        g.add_node(node, is_edge="node")
 
     idx = 0
-    #Manage Hyperedges
+    # Manage Hyperedges
     for edge in h.get_edges():
-        #Manage binary relations
+        # Manage binary relations
         if len(edge) == 2:
             weight = 1
             if h.is_weighted():
                 weight = h.get_weight(edge)
             g.add_edge(edge[0], edge[1], weight=weight)
-        #Any other type of relation
+        # Any other type of relation
         else:
-            obj_to_id[tuple(edge)] = 'E' + str(idx)
-            id_to_obj['E' + str(idx)] = edge
+            obj_to_id[tuple(edge)] = "E" + str(idx)
+            id_to_obj["E" + str(idx)] = edge
             weight = 1
             if h.is_weighted():
                 weight = h.get_weight(edge)
-            g.add_node(obj_to_id[tuple(edge)], weight=weight, is_edge = "edge")
+            g.add_node(obj_to_id[tuple(edge)], weight=weight, is_edge="edge")
             for node in edge:
                 g.add_edge(node, obj_to_id[tuple(edge)], weight=weight)
             for i in range(len(edge) - 1):
-                    if h.is_weighted():
-                        g.add_edge(edge[i], edge[i+1], weight=h.get_weight(edge))
-                    else:
-                        g.add_edge(edge[i], edge[i+1])
+                if h.is_weighted():
+                    g.add_edge(edge[i], edge[i + 1], weight=h.get_weight(edge))
+                else:
+                    g.add_edge(edge[i], edge[i + 1])
             if h.is_weighted():
                 g.add_edge(edge[-1], edge[0], weight=h.get_weight(edge))
             else:
@@ -1,3 +1,8 @@
+from itertools import combinations
+
+import numpy as np
+
+
 def canon_edge(edge):
     edge = tuple(edge)
 
@@ -8,3 +13,56 @@ def canon_edge(edge):
             return tuple(sorted(edge))
 
     return tuple(sorted(edge))
+
+
+def pack_edges(rows, base):
+    """
+    Pack rows of integer node indices into keys that can be sorted and compared.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Array of shape (E, size) of node indices, between 0 and base - 1.
+    base : int
+        Number of distinct node indices.
+
+    Returns
+    -------
+    np.ndarray
+        One key per row: base-`base` integers if they fit in 64 bits, the raw bytes
+        of the rows, in the smallest unsigned integer type, otherwise. Equal rows have
+        equal keys.
+    """
+    size = rows.shape[1]
+    if base**size < 2**63:
+        return rows @ (base ** np.arange(size - 1, -1, -1, dtype=np.int64))
+    rows = np.ascontiguousarray(rows, dtype=np.min_scalar_type(base - 1))
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * size))).ravel()
+
+
+def edge_combinations(edges, size, chunk_size=1000000):
+    """
+    Stream all the sub-tuples of a given size of hyperedges with the same size.
+
+    Parameters
+    ----------
+    edges : np.ndarray
+        Array of shape (E, k) of node indices, one hyperedge per row.
+    size : int
+        Size of the sub-tuples, at most k.
+    chunk_size : int
+        Approximate number of sub-tuples yielded at once.
+
+    Yields
+    ------
+    tuple
+        (hyperedges, sub_tuples): the indices of a chunk of hyperedges, and the array
+        of shape (len(hyperedges) * comb(k, size), size) of their sub-tuples, grouped
+        by hyperedge. Rows of sorted hyperedges give sorted sub-tuples.
+    """
+    combos = np.array(list(combinations(range(edges.shape[1]), size)), dtype=np.int64)
+    combos = combos.reshape(-1, size)
+    step = max(1, chunk_size // max(1, len(combos)))
+    for start in range(0, len(edges), step):
+        chunk = np.arange(start, min(start + step, len(edges)))
+        yield chunk, edges[chunk][:, combos].reshape(-1, size)
@@ -3,7 +3,7 @@ import multiprocessing
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from hypergraphx import TemporalHypergraph
-from hypergraphx.communities.hy_mmsbm.model import HyMMSBM
+from hypergraphx.communities.hy_mmsbm.model import fit_restarts
 from hypergraphx.communities.hy_sc.model import HySC
 from hypergraphx.communities.hypergraph_mt.model import HypergraphMT
 from hypergraphx.measures.degree import degree_sequence
@@ -165,23 +165,15 @@ def run_community_detection(hypergraph, algorithm, community_options):
         )
         community_model = normalize_array(u, axis=1)
     elif algorithm == "Hy-MMSBM":
-        best_model = None
-        best_loglik = float("-inf")
-        for j in range(community_options["realizations"]):
-            model = HyMMSBM(
-                K=community_options["number_communities"],
-                assortative=community_options["assortative"]
-            )
-            model.fit(
-                hypergraph,
-                n_iter=community_options["max_iterations"],
-            )
-
-            log_lik = model.log_likelihood(hypergraph)
-            if log_lik > best_loglik:
-                best_model = model
-                best_loglik = log_lik
-
+        # This already runs inside a worker process, which cannot spawn its own pool.
+        best_model, _ = fit_restarts(
+            hypergraph,
+            n_restarts=community_options["realizations"],
+            n_jobs=1,
+            n_iter=community_options["max_iterations"],
+            K=community_options["number_communities"],
+            assortative=community_options["assortative"],
+        )
         community_model = normalize_array(best_model.u, axis=1)
     elif algorithm == "None":
         return None
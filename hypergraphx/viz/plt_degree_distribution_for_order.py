@@ -2,6 +2,7 @@ import numpy as np
 from matplotlib import pyplot as plt
 import seaborn as sns
 from hypergraphx import Hypergraph
+from hypergraphx.measures.degree import degree_sequences_all_orders
 from hypergraphx.readwrite import load_hypergraph
 
 
@@ -73,14 +74,16 @@ def compute_binned_degree_distributions(h: Hypergraph) -> dict:
               and values are tuples of (bins, frequency).
     """
     results = {}
+    # Degrees of all the nodes at all the orders, computed once
+    degree_matrix = degree_sequences_all_orders(h)
     for size in range(2, h.max_size() + 1):
         # Determine binning parameters based on the hyperedge size
         logbin = (size != 2)
         n_bin = 8 if size == 2 else 10
 
         # Extract and filter degrees
-        degrees = list(h.degree_sequence(size=size).values())
-        degrees = [d for d in degrees if d > 0]
+        degrees = degree_matrix[:, size - 1]
+        degrees = degrees[degrees > 0].tolist()
 
         # If there are no nodes with degree > 0 for this size, skip
         if not degrees:
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from hypergraphx.communities.core_periphery.model import (
+    core_periphery,
+    local_core_values_array,
+    transition_function,
+)
+
+
+@pytest.mark.parametrize("a, b", [(0.3, 0.6), (0.9, 0.05), (0.5, 0.0)])
+def test_local_core_values_match_transition_function(a, b):
+    expected = [transition_function(i, 17, a, b) for i in range(1, 18)]
+    np.testing.assert_allclose(local_core_values_array(17, a, b), expected)
+
+
+def test_swap_delta_matches_edge_aggregates():
+    # The quality change of a swap only depends on the node strengths.
+    edges = [(0, 1, 2), (1, 2, 3), (3, 4), (0, 4)]
+    weights = dict(zip(edges, [1.0, 2.0, 0.5, 3.0]))
+    strength = np.zeros(5)
+    for e, w in weights.items():
+        strength[list(e)] += w / len(e)
+    values = np.random.default_rng(0).random(5)
+    order = np.array([3, 0, 4, 1, 2])
+
+    def quality(o):
+        return sum(w / len(e) * values[o[list(e)]].sum() for e, w in weights.items())
+
+    for i, j in [(0, 1), (1, 2), (2, 4)]:
+        swapped = order.copy()
+        swapped[[i, j]] = order[[j, i]]
+        delta = (values[order[j]] - values[order[i]]) * (strength[i] - strength[j])
+        assert np.isclose(quality(swapped) - quality(order), delta)
+
+
+def test_core_nodes_have_higher_scores(core_periphery_hypergraph):
+    hg = core_periphery_hypergraph
+    scores = core_periphery(hg, N_ITER=20, seed=0)
+    assert max(scores.values()) == 1.0
+    core = np.mean([scores[n] for n in range(10)])
+    periphery = np.mean([scores[n] for n in range(10, 60)])
+    assert core > periphery + 0.2
+
+
+@pytest.mark.parametrize("greedy_start", [False, True])
+def test_parallel_iterations_match_serial(core_periphery_hypergraph, greedy_start):
+    hg = core_periphery_hypergraph
+    serial = core_periphery(hg, N_ITER=6, seed=1, greedy_start=greedy_start)
+    parallel = core_periphery(hg, N_ITER=6, seed=1, greedy_start=greedy_start, n_jobs=2)
+    assert serial.keys() == parallel.keys()
+    for node in serial:
+        assert np.isclose(serial[node], parallel[node])
@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from hypergraphx.communities.hy_mmsbm.model import HyMMSBM, fit_restarts
+from hypergraphx.communities.hy_mmsbm.streaming import (
+    HyperedgeArrays,
+    save_hyperedge_arrays,
+)
+
+
+def test_fit_infers_max_hye_size(planted_hypergraph):
+    hg = planted_hypergraph
+    model = HyMMSBM(K=2, assortative=True, seed=0)
+    model.fit(hg, n_iter=5)
+    assert model.max_hye_size == 4
+
+
+def test_callback_reports_log_likelihood_and_stops(planted_hypergraph):
+    hg = planted_hypergraph
+    history = []
+
+    def callback(it, log_lik, elapsed):
+        history.append((it, log_lik, elapsed))
+        return it == 9
+
+    model = HyMMSBM(K=2, assortative=False, seed=0)
+    model.fit(hg, n_iter=100, callback=callback)
+
+    assert model.training_iter == 9
+    assert [it for it, _, _ in history] == list(range(10))
+    log_liks = np.array([log_lik for _, log_lik, _ in history])
+    assert np.all(np.diff(log_liks) > -1e-8)
+    assert np.isclose(log_liks[-1], model.log_likelihood(hg))
+
+
+def test_float32_fit_matches_float64(planted_hypergraph):
+    hg = planted_hypergraph
+    model64 = HyMMSBM(K=2, assortative=True, seed=0)
+    model64.fit(hg, n_iter=50)
+    model32 = HyMMSBM(K=2, assortative=True, seed=0)
+    model32.fit(hg, n_iter=50, dtype=np.float32)
+
+    assert model32.u.dtype == np.float32
+    np.testing.assert_allclose(model32.u, model64.u, rtol=1e-3, atol=1e-5)
+    assert np.isclose(model32.log_likelihood(hg), model64.log_likelihood(hg), rtol=1e-5)
+
+
+def test_fit_restarts_keeps_best_log_likelihood(planted_hypergraph):
+    hg = planted_hypergraph
+    best, log_lik = fit_restarts(
+        hg, n_restarts=3, n_iter=30, seed=1, K=2, assortative=False
+    )
+    assert np.isclose(log_lik, best.log_likelihood(hg))
+
+    children = np.random.SeedSequence(1).spawn(3)
+    log_liks = []
+    for child in children:
+        model = HyMMSBM(K=2, assortative=False, seed=child)
+        model.fit(hg, n_iter=30)
+        log_liks.append(model.log_likelihood(hg))
+    assert np.isclose(log_lik, max(log_liks))
+
+
+def test_fit_restarts_parallel_matches_serial(planted_hypergraph):
+    hg = planted_hypergraph
+    _, serial = fit_restarts(hg, n_restarts=2, n_iter=10, seed=3, K=2, assortative=True)
+    _, parallel = fit_restarts(
+        hg, n_restarts=2, n_jobs=2, n_iter=10, seed=3, K=2, assortative=True
+    )
+    assert np.isclose(serial, parallel)
+
+
+def test_fit_restarts_rejects_non_positive_restarts(planted_hypergraph):
+    hg = planted_hypergraph
+    with pytest.raises(ValueError, match="n_restarts"):
+        fit_restarts(hg, n_restarts=0, K=2, assortative=True)
+
+
+def test_fit_stochastic_full_batch_step_is_em_iteration(planted_hypergraph):
+    hg = planted_hypergraph
+    full = HyMMSBM(K=2, assortative=False, seed=0)
+    full.fit(hg, n_iter=1)
+    stochastic = HyMMSBM(K=2, assortative=False, seed=0)
+    stochastic.fit_stochastic(hg, batch_size=hg.num_edges(), step_offset=1.0)
+
+    assert stochastic.training_iter == 1
+    np.testing.assert_allclose(stochastic.u, full.u, rtol=1e-10)
+    np.testing.assert_allclose(stochastic.w, full.w, rtol=1e-10)
+
+
+def test_fit_stochastic_approaches_full_batch_log_likelihood(planted_hypergraph):
+    hg = planted_hypergraph
+    init = HyMMSBM(K=2, assortative=True, seed=0)
+    init.fit(hg, n_iter=1)
+    full = HyMMSBM(K=2, assortative=True, seed=0)
+    full.fit(hg, n_iter=100)
+    stochastic = HyMMSBM(K=2, assortative=True, seed=0)
+    stochastic.fit_stochastic(hg, batch_size=20, n_epochs=20)
+
+    gap = full.log_likelihood(hg) - init.log_likelihood(hg)
+    assert stochastic.log_likelihood(hg) > full.log_likelihood(hg) - 0.1 * abs(gap)
+
+
+def test_fit_stochastic_streams_saved_arrays(planted_hypergraph, tmp_path):
+    hg = planted_hypergraph
+    save_hyperedge_arrays(hg, tmp_path / "arrays", seed=4)
+    arrays = HyperedgeArrays.load(tmp_path / "arrays")
+    assert isinstance(arrays.nodes, np.memmap)
+    assert arrays.num_edges == hg.num_edges()
+    assert arrays.max_hye_size == 4
+
+    from_disk = HyMMSBM(K=2, assortative=False, seed=0)
+    from_disk.fit_stochastic(tmp_path / "arrays", batch_size=16, n_epochs=2)
+    in_memory = HyMMSBM(K=2, assortative=False, seed=0)
+    in_memory.fit_stochastic(
+        HyperedgeArrays.from_hypergraph(hg, shuffle=True, seed=4),
+        batch_size=16,
+        n_epochs=2,
+    )
+    np.testing.assert_allclose(from_disk.u, in_memory.u)
+    np.testing.assert_allclose(from_disk.w, in_memory.w)
+
+
+def test_fit_stochastic_resumes_from_checkpoint(planted_hypergraph, tmp_path):
+    hg = planted_hypergraph
+    checkpoint = tmp_path / "state.npz"
+    kwargs = dict(batch_size=16, n_epochs=2)
+
+    reference = HyMMSBM(K=2, assortative=False, seed=0)
+    reference.fit_stochastic(hg, **kwargs)
+
+    interrupted = HyMMSBM(K=2, assortative=False, seed=0)
+    interrupted.fit_stochastic(
+        hg,
+        checkpoint_path=checkpoint,
+        checkpoint_every=5,
+        callback=lambda step, log_lik, elapsed: step == 12,
+        **kwargs,
+    )
+    assert interrupted.training_iter == 13
+
+    resumed = HyMMSBM(K=2, assortative=False, seed=0)
+    resumed.fit_stochastic(hg, checkpoint_path=checkpoint, resume=True, **kwargs)
+    assert resumed.training_iter == reference.training_iter
+    np.testing.assert_allclose(resumed.u, reference.u)
+    np.testing.assert_allclose(resumed.w, reference.w)
+
+
+def test_fit_stochastic_rejects_invalid_step_size(planted_hypergraph):
+    hg = planted_hypergraph
+    with pytest.raises(ValueError, match="step_decay"):
+        HyMMSBM(K=2, assortative=True).fit_stochastic(hg, step_decay=0.4)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from hypergraphx.communities.hy_sc import model as hy_sc_model
+from hypergraphx.communities.hy_sc.model import HySC, minibatch_kmeans
+
+# Three communities of 30 nodes, connected by one edge between consecutive blocks.
+PLANTED = pytest.mark.parametrize(
+    "planted_hypergraph",
+    [dict(n_blocks=3, block_size=30, num_edges=360, bridges=True)],
+    indirect=True,
+)
+
+
+def _partition(u):
+    labels = u.argmax(axis=1)
+    return {frozenset(np.flatnonzero(labels == k)) for k in np.unique(labels)}
+
+
+@pytest.mark.parametrize("solver", ["eigsh", "lobpcg"])
+@PLANTED
+def test_sparse_solvers_match_dense(planted_hypergraph, solver):
+    hg = planted_hypergraph
+    dense = HySC(seed=0, eigen_solver="dense").fit(hg, K=3)
+    model = HySC(seed=0, eigen_solver=solver)
+    u = model.fit(hg, K=3)
+    assert u.shape == (hg.num_nodes(), 3)
+    assert _partition(u) == _partition(dense)
+    assert not hasattr(model, "L")
+
+    # A second fit is warm-started from the previous eigenvectors.
+    assert _partition(model.fit(hg, K=3)) == _partition(dense)
+
+
+@PLANTED
+def test_fit_multiple_reuses_eigenvectors(planted_hypergraph):
+    hg = planted_hypergraph
+    model = HySC(seed=0, eigen_solver="eigsh")
+    memberships = model.fit_multiple(hg, [3, 2])
+    assert sorted(memberships) == [2, 3]
+    assert memberships[2].shape == (hg.num_nodes(), 2)
+    assert _partition(memberships[3]) == _partition(
+        HySC(seed=0, eigen_solver="eigsh").fit(hg, K=3)
+    )
+
+
+@PLANTED
+def test_minibatch_kmeans_fallback(planted_hypergraph, monkeypatch):
+    hg = planted_hypergraph
+    expected = HySC(seed=0, eigen_solver="eigsh").fit(hg, K=3)
+    monkeypatch.setattr(hy_sc_model, "KMeans", None)
+    u = HySC(seed=0, eigen_solver="eigsh").fit(hg, K=3)
+    assert _partition(u) == _partition(expected)
+
+
+def test_minibatch_kmeans_separated_blobs():
+    rng = np.random.default_rng(0)
+    centers = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    X = np.concatenate([c + rng.normal(size=(200, 2)) for c in centers])
+    labels = minibatch_kmeans(X, 3, batch_size=64, seed=0)
+    for block in range(3):
+        assert len(np.unique(labels[200 * block : 200 * (block + 1)])) == 1
+    assert len(np.unique(labels)) == 3
+
+
+def test_invalid_eigen_solver():
+    with pytest.raises(ValueError, match="eigen_solver"):
+        HySC(eigen_solver="qr")
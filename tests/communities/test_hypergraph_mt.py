@@ -0,0 +1,93 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from hypergraphx.communities.hypergraph_mt.model import (
+    HypergraphMT,
+    _lagrange_multipliers,
+    elementary_symmetric_polynomials,
+)
+
+# Two communities of 20 nodes.
+PLANTED = pytest.mark.parametrize(
+    "planted_hypergraph", [dict(block_size=20, num_edges=300)], indirect=True
+)
+
+
+def test_elementary_symmetric_polynomials_match_brute_force():
+    u = np.random.default_rng(0).random((7, 3))
+    expected = [np.ones(3)] + [
+        sum(np.prod(u[list(subset)], axis=0) for subset in combinations(range(7), d))
+        for d in range(1, 5)
+    ]
+    np.testing.assert_allclose(elementary_symmetric_polynomials(u, 4), expected)
+    # Degrees higher than the number of rows are zero.
+    assert np.all(elementary_symmetric_polynomials(u[:2], 4)[3:] == 0)
+
+
+def test_lagrange_multipliers_match_root_finding():
+    rng = np.random.default_rng(1)
+    num, den = rng.random((6, 3)), rng.random((6, 3))
+    num[0, 1] = 0.0
+    num[5] = 0.0
+    lambdas = _lagrange_multipliers(num, den)
+    for i in range(5):
+        assert np.isclose(np.sum(num[i] / (lambdas[i] + den[i])), 1.0)
+        assert np.isclose(lambdas[i], HypergraphMT.enforce_constraint_u(num[i], den[i]))
+    assert lambdas[5] == 0.0
+
+
+@pytest.mark.parametrize("normalizeU", [False, True])
+@PLANTED
+def test_vectorized_updates_match_gauss_seidel(planted_hypergraph, normalizeU):
+    hg = planted_hypergraph
+    results = {}
+    for u_update in ["gauss-seidel", "block", "jacobi"]:
+        model = HypergraphMT(
+            n_realizations=1, max_iter=100, verbose=False, u_update=u_update
+        )
+        u, w, loglik = model.fit(
+            hg, K=2, seed=0, normalizeU=normalizeU, baseline_r0=False
+        )
+        assert u.shape == (hg.num_nodes(), 2)
+        results[u_update] = (u, loglik)
+
+    u_ref, loglik_ref = results["gauss-seidel"]
+    for u_update in ["block", "jacobi"]:
+        u, loglik = results[u_update]
+        assert np.isclose(loglik, loglik_ref, rtol=1e-3)
+        np.testing.assert_array_equal(u.argmax(axis=1), u_ref.argmax(axis=1))
+
+
+@PLANTED
+def test_parallel_realizations_keep_best(planted_hypergraph):
+    hg = planted_hypergraph
+    model = HypergraphMT(
+        n_realizations=3, max_iter=20, verbose=False, u_update="jacobi", n_jobs=2
+    )
+    _, _, max_loglik = model.fit(hg, K=2, seed=0, baseline_r0=False)
+
+    final = model.train_info.groupby("realization").loglik.last()
+    assert len(final) == 3
+    assert model.train_info.groupby("realization").seed.nunique().eq(1).all()
+    assert max_loglik == final.max()
+
+
+def test_invalid_u_update():
+    with pytest.raises(ValueError, match="u_update"):
+        HypergraphMT(u_update="random")
+
+
+@pytest.mark.parametrize("u_update", ["gauss-seidel", "jacobi"])
+@PLANTED
+def test_memberships_clipped_to_max_value_par(planted_hypergraph, u_update):
+    model = HypergraphMT(
+        n_realizations=1,
+        max_iter=20,
+        verbose=False,
+        u_update=u_update,
+        max_value_par=0.5,
+    )
+    u, _, _ = model.fit(planted_hypergraph, K=2, seed=0, baseline_r0=False)
+    assert u.max() <= 0.5
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import scipy.spatial.distance as ssd
+from scipy.cluster.hierarchy import fcluster, linkage
+
+from hypergraphx import Hypergraph
+from hypergraphx.communities.hyperlink_comm import hyperlink_communities as hlc
+from hypergraphx.measures.edge_similarity import jaccard_distance
+
+
+def _random_hypergraph():
+    rng = np.random.default_rng(0)
+    edges = set()
+    while len(edges) < 200:
+        size = int(rng.integers(2, 6))
+        edges.add(tuple(sorted(rng.choice(150, size, replace=False).tolist())))
+    hg = Hypergraph(sorted(edges))
+    return hg.subhypergraph(hg.largest_component())
+
+
+def _dense(distances):
+    X = np.ones(distances.shape)
+    coo = distances.tocoo()
+    X[coo.row, coo.col] = coo.data
+    X[coo.col, coo.row] = coo.data
+    np.fill_diagonal(X, 0.0)
+    return X
+
+
+def _same_clusters(Z, R, t):
+    a = fcluster(Z, t, criterion="distance")
+    b = fcluster(R, t, criterion="distance")
+    return len(set(a)) == len(set(b)) == len(set(zip(a, b)))
+
+
+def test_distances_match_jaccard():
+    hg = _random_hypergraph()
+    edges = [set(e) for e in hg.get_edges()]
+    X = _dense(hlc.hyperlink_distances(hg))
+    for i in range(len(edges)):
+        for j in range(i + 1, len(edges)):
+            assert X[i, j] == min(jaccard_distance(edges[i], edges[j]), 1.0)
+
+
+def test_single_linkage_matches_scipy():
+    hg = _random_hypergraph()
+    X = _dense(hlc.hyperlink_distances(hg))
+    Z = hlc.hyperlink_communities(hg, method="single")
+    R = linkage(ssd.squareform(X), method="single")
+    np.testing.assert_allclose(Z[:, 2], R[:, 2])
+    for t in [0.5, 0.7, 0.8, 0.9]:
+        assert _same_clusters(Z, R, t)
+
+
+def test_sparse_average_linkage_matches_dense():
+    hg = _random_hypergraph()
+    distances = hlc.hyperlink_distances(hg)
+    # Break the ties, whose order is not the same in the two algorithms.
+    distances.data *= 1 + 1e-6 * np.random.default_rng(1).random(distances.nnz)
+    Z = hlc._sparse_average_linkage(distances)
+    R = hlc._dense_average_linkage(distances)
+    np.testing.assert_allclose(Z[:, 2], R[:, 2])
+    for t in [0.5, 0.7, 0.8, 0.9]:
+        assert _same_clusters(Z, R, t)
+
+
+def test_disconnected_clusters_merge_at_distance_one():
+    Z = hlc._single_linkage(hlc.hyperlink_distances(Hypergraph([(0, 1), (2, 3)])))
+    np.testing.assert_array_equal(Z, [[0, 1, 1.0, 2]])
+
+
+def test_distances_cache(tmp_path):
+    hg = _random_hypergraph()
+    path = str(tmp_path / "distances")
+    Z = hlc.hyperlink_communities(hg, save_distances=path)
+    assert (tmp_path / "distances.hlcd.npz").exists()
+    np.testing.assert_array_equal(hlc.hyperlink_communities(hg, load_distances=path), Z)
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError, match="method"):
+        hlc.hyperlink_communities(_random_hypergraph(), method="ward")
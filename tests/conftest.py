@@ -89,3 +89,45 @@ def loaded_hypergraph(
         **justice_dataset,
     }
     return all_data_dict[request.param]
+
+
+def _planted_hypergraph(
+    n_blocks=2, block_size=10, num_edges=150, bridges=False, seed=0
+) -> Hypergraph:
+    """Hyperedges of 2 to 4 nodes drawn inside blocks of consecutive nodes, plus one
+    edge between every pair of consecutive blocks if bridges is True."""
+    rng = np.random.default_rng(seed)
+    edges = set()
+    while len(edges) < num_edges:
+        size = int(rng.integers(2, 5))
+        block = int(rng.integers(0, n_blocks))
+        nodes = rng.choice(
+            np.arange(block_size * block, block_size * (block + 1)), size, replace=False
+        )
+        edges.add(tuple(sorted(int(node) for node in nodes)))
+    if bridges:
+        for block in range(n_blocks - 1):
+            edges.add((block_size * block, block_size * (block + 1)))
+    return Hypergraph(sorted(edges))
+
+
+@pytest.fixture
+def planted_hypergraph(request) -> Hypergraph:
+    """Hypergraph with planted communities. Parametrize it indirectly with keyword
+    arguments of _planted_hypergraph to change the blocks."""
+    return _planted_hypergraph(**getattr(request, "param", {}))
+
+
+@pytest.fixture
+def core_periphery_hypergraph() -> Hypergraph:
+    """Hyperedges of 2 to 4 nodes, each with at least one node of the core 0, ..., 9
+    and the others in the periphery 10, ..., 59."""
+    rng = np.random.default_rng(0)
+    edges = set()
+    while len(edges) < 200:
+        size = int(rng.integers(2, 5))
+        n_core = int(rng.integers(1, size + 1))
+        nodes = list(rng.choice(10, n_core, replace=False))
+        nodes += list(rng.choice(np.arange(10, 60), size - n_core, replace=False))
+        edges.add(tuple(sorted(int(node) for node in nodes)))
+    return Hypergraph(sorted(edges))
@@ -735,3 +735,19 @@ def test_remove_node_keep_edges_updates_edges():
     assert (4,) in hg.get_edges()
     assert hg.get_edge_metadata((1, 3)) == {"kind": "tri"}
     assert hg.get_edge_metadata((4,)) == {"kind": "pair"}
+
+
+def test_incidence_arrays():
+    hg = Hypergraph(weighted=True)
+    hg.add_edge((1, 2, 3), weight=2.0)
+    hg.add_edge((2, 4), weight=0.5)
+    hg.add_node(5)
+
+    positions, orders, weights = hg.incidence_arrays()
+    assert positions == [0, 1, 1, 2, 3]
+    assert orders == [2, 2, 1, 2, 1]
+    assert weights == [2.0, 2.0, 0.5, 2.0, 0.5]
+
+    positions, orders, _ = hg.incidence_arrays(node_order=[4, 1])
+    assert positions == [0, 1]
+    assert orders == [1, 2]
@@ -0,0 +1,120 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from hypergraphx import Hypergraph, TemporalHypergraph
+from hypergraphx.dynamics.epidemics import contagion_sweep, higher_order_contagion
+
+
+def test_discrete_threshold_kernel_needs_all_members():
+    hg = Hypergraph(edge_list=[(0, 1, 2), (2, 3)])
+
+    t, infected, recovered = higher_order_contagion(
+        hg,
+        {0: 1},
+        T=4,
+        infection_rate=1.0,
+        recovery_rate=0.0,
+        kernel="threshold",
+        threshold=1.0,
+        seed=0,
+    )
+
+    # One infected member out of two others is below the threshold.
+    assert np.all(infected == 0.25)
+    assert np.all(recovered == 0.0)
+    assert np.array_equal(t, np.arange(4))
+
+
+def test_temporal_events_switch_hyperedges():
+    th = TemporalHypergraph([(0, (0, 1)), (1, (1, 2)), (2, (2, 3))])
+
+    _, infected, _ = higher_order_contagion(
+        th, {0: 1}, T=5, infection_rate=1.0, recovery_rate=0.0
+    )
+    assert np.allclose(infected, [0.25, 0.5, 0.75, 1.0, 1.0])
+
+    # Reversed order: the chain cannot propagate backwards in time.
+    th = TemporalHypergraph([(0, (2, 3)), (1, (1, 2)), (2, (0, 1))])
+    _, infected, _ = higher_order_contagion(
+        th, {0: 1}, T=5, infection_rate=1.0, recovery_rate=0.0
+    )
+    assert np.allclose(infected, [0.25, 0.25, 0.25, 0.5, 0.5])
+
+
+def test_temporal_certain_infection_ignores_inactive_hyperedges():
+    # With rate 1, inactive hyperedges with infected members must not block the
+    # infection through the active ones.
+    th = TemporalHypergraph([(0, (0, 1)), (3, (1, 2))])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        _, infected, _ = higher_order_contagion(
+            th, {0: 1, 2: 1}, T=3, infection_rate=1.0, recovery_rate=0.0
+        )
+    assert infected[-1] == 1.0
+
+
+def test_gillespie_sir_reaches_absorbing_state():
+    hg = Hypergraph(edge_list=[(0, 1), (1, 2, 3), (3, 4)])
+
+    t, infected, recovered = higher_order_contagion(
+        hg,
+        {0: 1},
+        T=1000.0,
+        infection_rate={2: 1.0, 3: 2.0},
+        recovery_rate=0.5,
+        model="SIR",
+        mode="gillespie",
+        seed=3,
+    )
+
+    assert np.all(np.diff(t) >= 0)
+    assert t[-1] == 1000.0
+    assert infected[-1] == 0.0
+    assert np.all(np.diff(recovered) >= 0)
+    assert np.all(infected + recovered <= 1.0)
+
+
+def test_gillespie_two_node_extinction_time():
+    # From one infected node, E[T_ext] = (1 + lambda / (2 mu)) / mu.
+    hg = Hypergraph(edge_list=[(0, 1)])
+    rng = np.random.default_rng(0)
+    times = [
+        higher_order_contagion(hg, {0: 1}, 100.0, 1.0, 1.0, mode="gillespie", rng=rng)[
+            0
+        ][-2]
+        for _ in range(2000)
+    ]
+    assert np.mean(times) == pytest.approx(1.5, abs=0.1)
+
+
+def test_contagion_sweep_is_reproducible():
+    hg = Hypergraph(edge_list=[(0, 1), (1, 2), (0, 1, 2)])
+    grid = [{"infection_rate": 0.0}, {"infection_rate": 0.8}]
+
+    out1 = contagion_sweep(
+        hg, {0: 1}, 6, grid, n_realizations=2, n_jobs=1, recovery_rate=0.1, seed=1
+    )
+    out2 = contagion_sweep(
+        hg, {0: 1}, 6, grid, n_realizations=2, n_jobs=1, recovery_rate=0.1, seed=1
+    )
+
+    assert len(out1) == 2 and len(out1[0]) == 2
+    assert np.all(out1[0][0][1][1:] <= 1 / 3)
+    for a, b in zip(out1, out2):
+        for (_, i1, _), (_, i2, _) in zip(a, b):
+            assert np.array_equal(i1, i2)
+
+
+def test_invalid_arguments():
+    hg = Hypergraph(edge_list=[(0, 1)])
+    with pytest.raises(ValueError, match="model"):
+        higher_order_contagion(hg, {0: 1}, 3, 0.5, 0.1, model="SEIR")
+    with pytest.raises(ValueError, match="mode"):
+        higher_order_contagion(hg, {0: 1}, 3, 0.5, 0.1, mode="continuous")
+    with pytest.raises(ValueError, match="kernel"):
+        higher_order_contagion(hg, {0: 1}, 3, 0.5, 0.1, kernel="cubic")
+    with pytest.raises(ValueError, match="probability"):
+        higher_order_contagion(hg, {0: 1}, 3, 2.0, 0.1)
@@ -3,10 +3,14 @@ import pytest
 
 from hypergraphx import Hypergraph
 from hypergraphx.dynamics.randwalk import (
+    TransitionOperator,
     transition_matrix,
     random_walk,
     RW_stationary_state,
     random_walk_density,
+    random_walks,
+    hitting_times,
+    cover_times,
 )
 
 
@@ -65,3 +69,119 @@ def test_transition_matrix_large_sparse_chain():
     assert T.nnz == 2 * (N - 1)
     rowsum = np.asarray(T.sum(axis=1)).ravel()
     assert np.allclose(rowsum, 1.0)
+
+
+def test_random_walks_ensemble_follows_transition_matrix():
+    """Test walker ensemble shape and one-step transition frequencies."""
+    hg = Hypergraph(edge_list=[(0, 1), (1, 2), (0, 1, 2), (2, 3)])
+    walks, mapping = random_walks(hg, [1] * 20000, 3, seed=0, return_mapping=True)
+    assert walks.shape == (20000, 4)
+    assert np.all(walks[:, 0] == 1)
+
+    P = transition_matrix(hg).toarray()
+    freq = np.bincount(walks[:, 1], minlength=4) / len(walks)
+    assert np.allclose(freq, P[1], atol=0.02)
+    assert set(mapping.values()) == {0, 1, 2, 3}
+
+
+def test_hitting_and_cover_times_on_path():
+    """On the path 0-1-2 both times from node 0 have expectation 4."""
+    hg = _make_connected_hypergraph()
+    hits = hitting_times(hg, [0] * 5000, [2], max_time=500, seed=1)
+    covers = cover_times(hg, [0] * 5000, max_time=500, seed=1)
+    assert hits.mean() == pytest.approx(4.0, abs=0.2)
+    assert covers.mean() == pytest.approx(4.0, abs=0.2)
+    assert hitting_times(hg, [2, 0], [2], max_time=0, seed=0).tolist() == [0, -1]
+
+
+@pytest.mark.parametrize("method", ["closed_form", "solve", "gmres", "eigs", "power"])
+def test_stationary_state_methods_agree(method):
+    """Test every solver returns the fixed point of the transition matrix."""
+    hg = Hypergraph(edge_list=[(0, 1), (1, 2), (0, 1, 2), (2, 3), (1, 3, 4, 5)])
+    P = transition_matrix(hg).toarray()
+    pi = RW_stationary_state(hg, method=method)
+    assert np.isclose(pi.sum(), 1.0)
+    assert np.allclose(pi @ P, pi, atol=1e-10)
+
+
+def test_stationary_state_periodic_chain():
+    """The closed form handles periodic walks where power iteration oscillates."""
+    hg = _make_connected_hypergraph()
+    assert np.allclose(RW_stationary_state(hg), [0.25, 0.5, 0.25])
+    with pytest.raises(ValueError, match="method"):
+        RW_stationary_state(hg, method="arnoldi")
+
+
+def test_random_walk_density_checkpoints_and_stream():
+    """Test checkpoints and streaming match the full density list."""
+    hg = Hypergraph(edge_list=[(0, 1), (1, 2), (0, 1, 2), (2, 3)])
+    s = np.array([1.0, 0.0, 0.0, 0.0])
+    full = random_walk_density(hg, s, time=6)
+
+    picked = random_walk_density(hg, s, time=6, checkpoints=[6, 2])
+    assert np.allclose(picked[0], full[6])
+    assert np.allclose(picked[1], full[2])
+
+    streamed = list(random_walk_density(hg, s, time=6, stream=True))
+    assert len(streamed) == 7
+    assert np.allclose(streamed[-1], full[-1])
+
+    checkpoints = [6, 2, 4, 2, 0]
+    streamed = random_walk_density(hg, s, time=6, checkpoints=checkpoints, stream=True)
+    for t, density in zip(checkpoints, streamed, strict=True):
+        assert np.allclose(density, full[t])
+
+    batch = random_walk_density(hg, np.eye(4)[:2], time=3, checkpoints=[3])
+    assert batch[0].shape == (2, 4)
+    assert np.allclose(batch[0][0], full[3])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"kernel": "carletti"},
+        {"kernel": "uniform", "laziness": 0.3},
+        {"kernel": "edge_dependent", "weighted": True},
+        {"kernel": "carletti", "teleport": 0.2},
+    ],
+)
+def test_transition_operator_matvecs_match_matrix(kwargs):
+    """Test the factored operator against its dense transition matrix."""
+    hg = Hypergraph(
+        edge_list=[(0, 1), (1, 2), (0, 1, 2), (2, 3), (1, 3, 4, 5)],
+        weights=[1, 2, 1, 3, 1],
+    )
+    op = TransitionOperator(hg, **kwargs)
+    P = op.rmatvec(np.eye(6))
+    assert np.allclose(P.sum(axis=1), 1.0)
+    assert np.allclose(op.matvec(np.eye(6)), P)
+    x = np.linspace(0.0, 1.0, 6)
+    assert np.allclose(op.as_linear_operator().matvec(x), P @ x)
+    if kwargs.get("teleport"):
+        with pytest.raises(ValueError, match="dense"):
+            op.to_sparse()
+    else:
+        assert np.allclose(op.to_sparse().toarray(), P)
+
+    pi = RW_stationary_state(op, method="eigs")
+    assert np.allclose(pi @ P, pi)
+
+
+def test_transition_operator_default_is_carletti():
+    hg = Hypergraph(edge_list=[(0, 1), (1, 2), (0, 1, 2), (2, 3)])
+    op = TransitionOperator(hg)
+    assert np.allclose(op.to_sparse().toarray(), transition_matrix(hg).toarray())
+    assert transition_matrix(op) is op.to_sparse()
+
+
+def test_edge_dependent_vertex_weights_from_metadata():
+    hg = Hypergraph(edge_list=[(0, 1), (0, 1, 2)])
+    hg.set_incidence_metadata((0, 1, 2), 2, {"weight": 3.0})
+    op = TransitionOperator(hg, kernel="edge_dependent")
+    assert np.allclose(op.to_sparse().toarray()[0], [0.35, 0.35, 0.3])
+    # Not reversible: the default falls back to the direct solve.
+    assert np.allclose(RW_stationary_state(op), RW_stationary_state(op, method="solve"))
+
+    walks = random_walks(op, [0] * 20000, 1, seed=0)
+    freq = np.bincount(walks[:, 1], minlength=3) / len(walks)
+    assert np.allclose(freq, [0.35, 0.35, 0.3], atol=0.02)
@@ -1,7 +1,8 @@
 import numpy as np
 
 from hypergraphx import Hypergraph
-from hypergraphx.dynamics.synch import higher_order_MSF
+from hypergraphx.dynamics.synch import MSF, higher_order_MSF
+from hypergraphx.dynamics.utils import sprott_algorithm_multi
 
 
 def test_higher_order_msf_returns_none_when_not_applicable():
@@ -31,3 +32,80 @@ def test_higher_order_msf_returns_none_when_not_applicable():
     )
 
     assert result is None
+
+
+_A = np.array([[0.0, 1.0], [-1.0, 0.0]])
+
+
+def _linear_F(t, x):
+    return _A @ x
+
+
+def _linear_JF(x):
+    return _A
+
+
+def _identity_JH(x):
+    return np.eye(len(x))
+
+
+def test_msf_batched_and_parallel_match_linear_prediction():
+    """For a rotation x' = A x with identity coupling the MSF is -alpha."""
+    alphas = np.array([0.0, 0.25, 0.5, 1.0])
+    common = dict(integration_time=40.0, C=4, verbose=False, seed=0)
+    X0 = np.array([1.0, 0.0])
+
+    serial = MSF(_linear_F, _linear_JF, (), alphas, _identity_JH, X0, **common)
+    batched = MSF(
+        _linear_F, _linear_JF, (), alphas, _identity_JH, X0, batched=True, **common
+    )
+    parallel = MSF(
+        _linear_F, _linear_JF, (), alphas, _identity_JH, X0, n_jobs=2, **common
+    )
+
+    assert np.allclose(serial, -alphas, atol=0.02)
+    assert np.allclose(batched, serial, atol=1e-4)
+    assert np.allclose(parallel, serial)
+
+
+def test_sprott_algorithm_multi_uses_all_to_all_coupling():
+    """With N = 4 and sigmas = [1, 0.5] the effective coupling is 1 + 0.5 * 2 = 2."""
+    value = sprott_algorithm_multi(
+        0.5,
+        4,
+        _linear_F,
+        _linear_JF,
+        [1.0, 0.5],
+        4,
+        [_identity_JH, _identity_JH],
+        np.array([1.0, 0.0, 0.6, 0.8]),
+        (),
+        integration_time=40.0,
+        verbose=False,
+    )
+    assert np.isclose(value, -1.0, atol=0.02)
+
+
+def test_higher_order_msf_extreme_eigenvalues_match_full_spectrum():
+    edges = [(i, (i + 1) % 12) for i in range(12)]
+    edges += [(i, (i + 1) % 12, (i + 2) % 12) for i in range(0, 12, 2)]
+    hg = Hypergraph(edge_list=edges)
+    common = dict(
+        dim=2,
+        F=_linear_F,
+        JF=_linear_JF,
+        params=(),
+        sigmas=[1.0, 0.5],
+        JHs=[_identity_JH, _identity_JH],
+        X0=np.array([1.0, 0.0]),
+        interval=[0.5],
+        integration_time=20.0,
+        C=2,
+        verbose=False,
+        seed=0,
+    )
+
+    _, _, spectrum = higher_order_MSF(hg, **common)
+    _, hon_msf, extremes = higher_order_MSF(hg, n_eigenvalues=4, **common)
+    assert np.allclose(extremes, np.concatenate([spectrum[:2], spectrum[-2:]]))
+    assert len(hon_msf) == len(extremes) - 1
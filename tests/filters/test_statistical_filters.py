@@ -1,4 +1,8 @@
+from itertools import combinations
+
+import numpy as np
 import pandas as pd
+from scipy.stats import hypergeom
 
 from hypergraphx import Hypergraph
 from hypergraphx.filters import statistical_filters
@@ -42,3 +46,82 @@ def test_get_svc_with_dummy_pool(monkeypatch):
 
     assert isinstance(svc, pd.DataFrame)
     assert {"group", "pvalue", "w", "fdr"}.issubset(svc.columns)
+
+
+def _multigraph():
+    edges = [(0, 1), (1, 2), (0, 2), (0, 1, 2), (1, 2, 3), (0, 1, 3), (2, 3)]
+    return Hypergraph(edge_list=edges, weighted=True, weights=[6, 1, 2, 5, 1, 1, 3])
+
+
+def test_get_svh_pvalues_match_pairwise_formula():
+    hg = _multigraph()
+    svh = get_svh(hg, max_order=3)
+
+    pairs = svh[2].set_index("edge").pvalue
+    # 12 pairs with multiplicity, node 0 appears in 8 of them and node 1 in 7.
+    expected = statistical_filters._approximated_pvalue((6, 12, 8, 7))
+    assert np.isclose(pairs[(0, 1)], expected)
+    assert list(svh) == [2, 3]
+    assert list(svh[3].edge) == [(0, 1, 2), (1, 2, 3), (0, 1, 3)]
+
+
+def test_exact_pvalues_match_enumeration():
+    # Intersections of all the subsets of sizes 3, 4 and 5 of 7 observations.
+    counts = np.zeros(4)
+    for a in combinations(range(7), 3):
+        for b in combinations(range(7), 4):
+            for c in combinations(range(7), 5):
+                counts[len(set(a) & set(b) & set(c))] += 1
+    expected = np.cumsum(counts[::-1])[::-1] / counts.sum()
+
+    pvalues = statistical_filters._exact_pvalues(
+        np.arange(4), 7, np.array([[3, 4, 5]] * 4)
+    )
+    np.testing.assert_allclose(pvalues, expected)
+
+    pairs = statistical_filters._exact_pvalues(np.array([2]), 10, np.array([[4, 5]]))
+    assert np.isclose(pairs[0], hypergeom.sf(1, 10, 4, 5))
+
+
+def test_get_svh_chunks_share_one_pool(monkeypatch):
+    hg = _multigraph()
+    pools = []
+
+    class CountingPool(DummyPool):
+        def __init__(self, processes=None):
+            super().__init__(processes)
+            pools.append(self)
+
+    monkeypatch.setattr(statistical_filters, "Pool", CountingPool)
+    expected = get_svh(hg, max_order=3, exact=True)
+    svh = get_svh(hg, max_order=3, exact=True, mp=True, n_jobs=2, chunk_size=2)
+    assert len(pools) == 1
+    for order in expected:
+        pd.testing.assert_frame_equal(svh[order], expected[order])
+
+
+def test_get_svc_counts_and_prunes_validated_cores():
+    edges = [(0, 1, 2, 3), (0, 1), (2, 3), (1, 4), (4, 5)]
+    hg = Hypergraph(edge_list=edges, weighted=True, weights=[8, 1, 1, 2, 1])
+    svc = get_svc(hg, min_order=2, alpha=0.5)
+
+    cores = svc.query("fdr").group.tolist()
+    assert (0, 1, 2, 3) in cores
+    # Subsets of a validated core are not tested anymore.
+    assert dict(zip(svc.group, svc.w)) == {(0, 1, 2, 3): 8, (1, 4): 2, (4, 5): 1}
+
+
+def test_get_svc_uses_a_persistent_pool(monkeypatch):
+    hg = _multigraph()
+    pools = []
+
+    class CountingPool(DummyPool):
+        def __init__(self, processes=None):
+            super().__init__(processes)
+            pools.append(self)
+
+    monkeypatch.setattr(statistical_filters, "Pool", CountingPool)
+    expected = get_svc(hg, alpha=0.5)
+    svc = get_svc(hg, alpha=0.5, mp=True, chunk_size=2)
+    assert len(pools) == 1
+    pd.testing.assert_frame_equal(svc, expected)
@@ -1,3 +1,5 @@
+from collections import Counter
+
 import numpy as np
 import pytest
 
@@ -35,3 +37,63 @@ def test_configuration_model_invalid_args():
     hg = _make_hypergraph()
     with pytest.raises(ValueError, match="Only one"):
         configuration_model(hg, order=1, size=2)
+
+
+def _size_degrees(hg):
+    degrees = Counter()
+    for edge in hg.get_edges():
+        for node in edge:
+            degrees[(node, len(edge))] += hg.get_weight(edge)
+    return degrees
+
+
+@pytest.mark.parametrize("label", ["stub", "vertex"])
+def test_configuration_model_array_preserves_size_degrees(label):
+    """Test the array engine preserves the degree of each node at each size."""
+    rng = np.random.default_rng(0)
+    edges = [
+        tuple(rng.choice(60, size=s, replace=False)) for s in rng.integers(2, 5, 200)
+    ]
+    hg = Hypergraph(edge_list=edges, weighted=False)
+
+    sampled = configuration_model(hg, n_steps=2000, label=label, seed=3, method="array")
+
+    if label == "vertex":
+        # Multi-edges are merged and accumulate their weight.
+        assert _size_degrees(sampled) == _size_degrees(hg)
+    else:
+        # The stub-labeled sampler drops multi-edges, as the legacy one.
+        assert sampled.num_edges() <= hg.num_edges()
+    assert sampled.get_edges() != hg.get_edges()
+
+
+def test_configuration_model_array_reproducible():
+    """Test the array engine is reproducible given a seed."""
+    hg = _make_hypergraph()
+
+    first = configuration_model(hg, n_steps=50, seed=7, method="array")
+    second = configuration_model(hg, n_steps=50, seed=7, method="array")
+
+    assert set(first.get_edges()) == set(second.get_edges())
+
+
+def test_configuration_model_array_vertex_uniform():
+    """Test the vertex-labeled array chain samples multigraphs uniformly."""
+    hg = Hypergraph(edge_list=[(0, 1), (2, 3), (0, 2), (1, 3)], weighted=False)
+
+    counts = Counter()
+    for seed in range(400):
+        sampled = configuration_model(
+            hg, n_steps=40, label="vertex", seed=seed, method="array"
+        )
+        counts[frozenset((e, sampled.get_weight(e)) for e in sampled.get_edges())] += 1
+
+    # Three 4-cycles and three pairs of double edges, all equally likely.
+    assert len(counts) == 6
+    assert min(counts.values()) > 40
+
+
+def test_configuration_model_invalid_method():
+    """Test configuration model rejects unknown methods."""
+    with pytest.raises(ValueError, match="method"):
+        configuration_model(_make_hypergraph(), method="fast")
@@ -194,3 +194,40 @@ def test_random_shuffle_all_orders_multiple_sizes():
         num_replaced = len(set(orig_edges) - set(new_edges))
         expected_replacements = int(p * len(orig_edges))
         _assert_replacement_count(num_replaced, expected_replacements, size=size)
+
+
+def test_sample_without_replacement_rows_are_distinct():
+    import numpy as np
+    from hypergraphx.generation.random import _sample_without_replacement
+
+    rng = np.random.default_rng(0)
+    weights = np.array([5.0, 1.0, 1.0, 1.0, 1.0])
+    samples = _sample_without_replacement(rng, weights, 4, 2000)
+    assert samples.shape == (2000, 4)
+    assert all(len(set(row)) == 4 for row in samples.tolist())
+    # The heavy node is drawn first far more often than the others.
+    assert np.mean(samples[:, 0] == 0) > 0.5
+
+    with pytest.raises(ValueError):
+        _sample_without_replacement(rng, weights, 6, 1)
+
+
+def test_shuffle_keeps_untouched_edges_and_weights():
+    edges = [(0, 1), (1, 2), (2, 3), (3, 4), (0, 1, 2)]
+    hg = Hypergraph(edges, weighted=True, weights=[2, 3, 4, 5, 7])
+    out = random_shuffle_all_orders(hg, p=0.5, seed=3)
+    assert hg.get_weight((0, 1, 2)) == 7
+    assert out.num_edges() <= hg.num_edges()
+    for edge in hg.get_edges():
+        if out.check_edge(edge) and len(edge) == 3:
+            assert out.get_weight(edge) == 7
+
+
+def test_remove_edges_bulk_updates_incidences():
+    hg = Hypergraph([(0, 1), (1, 2), (0, 1, 2)])
+    hg.remove_edges([(1, 0), (0, 1, 2)])
+    assert hg.get_edges() == [(1, 2)]
+    assert hg.get_incident_edges(1) == [(1, 2)]
+    assert hg.get_incident_edges(0) == []
+    with pytest.raises(ValueError, match="not in hypergraph"):
+        hg.remove_edges([(1, 2), (1, 2)])
@@ -4,7 +4,6 @@ from scipy import sparse
 import hypergraphx.linalg as hl
 from hypergraphx import Hypergraph
 
-
 # Fixture loaded_hypergraph defined inside the package-level conftest.py
 
 
@@ -137,3 +136,43 @@ def test_incidence_all_orders(loaded_hypergraph: Hypergraph):
             incidence[hye, i] = weights_arr[i]
 
         assert np.all(inc_arr[order_to_test].todense() == incidence)
+
+
+def test_incidence_blocks_match_incidence_by_order(loaded_hypergraph: Hypergraph):
+    matrix, slices, mapping = hl.incidence_matrix_blocks(
+        loaded_hypergraph, return_mapping=True
+    )
+    assert isinstance(matrix, sparse.csc_array)
+    assert matrix.shape == (
+        loaded_hypergraph.num_nodes(),
+        loaded_hypergraph.num_edges(),
+    )
+    assert sorted(slices) == list(range(1, loaded_hypergraph.max_order() + 1))
+
+    for order, columns in slices.items():
+        inc, order_mapping = hl.incidence_matrix_by_order(
+            loaded_hypergraph,
+            order=order,
+            keep_isolated_nodes=True,
+            return_mapping=True,
+        )
+        assert order_mapping == mapping
+        assert np.all(matrix[:, columns].todense() == inc.todense())
+
+
+def test_incidence_blocks_repeated_nodes_and_weights():
+    hypergraph = Hypergraph(
+        [(0, 1, 1, 2), (2, 3), (0, 1, 2), (3, 4)],
+        weighted=True,
+        weights=[2, 3, 4, 5],
+    )
+    binary, slices = hl.incidence_matrix_blocks(hypergraph, binary=True)
+    assert binary.dtype == np.uint8
+    assert np.all(binary.sum(axis=0) == [2, 2, 3, 3])
+    # The order is given by the size of the hyperedge, repeated nodes included
+    assert slices == {1: slice(0, 2), 2: slice(2, 3), 3: slice(3, 4)}
+
+    matrix, _ = hl.incidence_matrix_blocks(hypergraph)
+    inc = hl.incidence_matrix(hypergraph)
+    assert np.all(inc.sum(axis=0) == [6, 6, 12, 10])
+    assert np.all(matrix[:, slices[1]].todense() == inc[:, [1, 3]].todense())
@@ -0,0 +1,90 @@
+from itertools import combinations
+
+import numpy as np
+from scipy.special import factorial
+
+import hypergraphx.linalg as hl
+from hypergraphx import Hypergraph
+
+# Fixture loaded_hypergraph defined inside the package-level conftest.py
+
+
+def _dense_laplacian(hypergraph: Hypergraph, order: int, weighted: bool = False):
+    inc = hl.incidence_matrix_by_order(
+        hypergraph, order, keep_isolated_nodes=True
+    ).toarray()
+    degree_sequence = hypergraph.degree_sequence(order)
+    degrees = np.array([degree_sequence[node] for node in hypergraph.get_nodes()])
+    laplacian = np.diag((order + 1) * degrees) - inc @ inc.T
+    if weighted:
+        laplacian = laplacian * factorial(order - 1)
+    return laplacian
+
+
+def test_laplacian_operator_by_order(loaded_hypergraph: Hypergraph):
+    rng = np.random.default_rng(0)
+    for order in range(1, loaded_hypergraph.max_order() + 1):
+        for weighted in [False, True]:
+            expected = _dense_laplacian(loaded_hypergraph, order, weighted)
+            operator, mapping = hl.laplacian_operator_by_order(
+                loaded_hypergraph, order, weighted, return_mapping=True
+            )
+            assert mapping == dict(enumerate(loaded_hypergraph.get_nodes()))
+
+            x = rng.standard_normal((expected.shape[0], 3))
+            assert np.allclose(operator @ x, expected @ x)
+            assert np.allclose(operator @ x[:, 0], expected @ x[:, 0])
+            assert np.allclose(operator.diagonal(), np.diag(expected))
+            assert np.allclose(
+                hl.laplacian_matrix_by_order(
+                    loaded_hypergraph, order, weighted
+                ).toarray(),
+                expected,
+            )
+
+
+def test_multiorder_laplacian_operator(loaded_hypergraph: Hypergraph):
+    sigmas = np.linspace(1.0, 0.5, loaded_hypergraph.max_order())
+    for degree_weighted in [False, True]:
+        expected = 0
+        for order, sigma in enumerate(sigmas, start=1):
+            degrees = list(loaded_hypergraph.degree_sequence(order).values())
+            # Orders without hyperedges do not contribute to the degree-weighted sum
+            if degree_weighted and not np.any(degrees):
+                continue
+            scale = 1 / np.mean(degrees) if degree_weighted else 1
+            expected = expected + sigma * scale * _dense_laplacian(
+                loaded_hypergraph, order, weighted=True
+            )
+
+        operator = hl.multiorder_laplacian_operator(
+            loaded_hypergraph,
+            sigmas,
+            order_weighted=True,
+            degree_weighted=degree_weighted,
+        )
+        x = np.random.default_rng(0).standard_normal(operator.shape[0])
+        assert np.allclose(operator @ x, expected @ x)
+        assert np.allclose(
+            hl.compute_multiorder_laplacian(
+                loaded_hypergraph,
+                sigmas,
+                order_weighted=True,
+                degree_weighted=degree_weighted,
+            ).toarray(),
+            expected,
+        )
+
+
+def test_are_commuting():
+    # The Laplacians of an all-to-all hypergraph are multiples of the same matrix
+    edges = list(combinations(range(6), 2)) + list(combinations(range(6), 3))
+    all_to_all = Hypergraph(edges)
+    laplacians = hl.laplacian_matrices_all_orders(all_to_all)
+    assert hl.are_commuting(list(laplacians.values()), verbose=False, seed=0)
+    operators = [hl.laplacian_operator_by_order(all_to_all, order) for order in [1, 2]]
+    assert hl.are_commuting(operators, verbose=False, seed=0)
+
+    hypergraph = Hypergraph([(0, 1), (1, 2), (2, 3), (0, 1, 2), (1, 3, 4)])
+    operators = [hl.laplacian_operator_by_order(hypergraph, order) for order in [1, 2]]
+    assert not hl.are_commuting(operators, verbose=False, seed=0)
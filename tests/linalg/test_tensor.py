@@ -0,0 +1,65 @@
+import string
+
+import numpy as np
+import pytest
+
+import hypergraphx.linalg as hl
+from hypergraphx import Hypergraph
+
+
+def _uniform_hypergraph(size, num_nodes=8, num_edges=12, seed=0):
+    rng = np.random.default_rng(seed)
+    edges = {
+        tuple(sorted(rng.choice(num_nodes, size, replace=False).tolist()))
+        for _ in range(num_edges)
+    }
+    edges.add(tuple(range(size)))
+    return Hypergraph(sorted(edges))
+
+
+def _contract(dense, x, n_vectors):
+    letters = string.ascii_lowercase[: dense.ndim]
+    kept = letters[: dense.ndim - n_vectors]
+    operands = ",".join([letters] + list(letters[len(kept) :]))
+    return np.einsum(f"{operands}->{kept}", dense, *[x] * n_vectors)
+
+
+@pytest.mark.parametrize("size", [2, 3, 4])
+def test_sparse_tensor_matches_dense(size):
+    hypergraph = _uniform_hypergraph(size)
+    tensor, mapping = hl.sparse_adjacency_tensor(hypergraph, return_mapping=True)
+    assert mapping == dict(enumerate(hypergraph.get_nodes()))
+    assert tensor.shape == (hypergraph.num_nodes(),) * size
+    assert tensor.num_edges == hypergraph.num_edges()
+
+    dense = tensor.todense()
+    # The dense tensor is indexed by the node labels 0, ..., N-1
+    labels = [mapping[i] for i in range(hypergraph.num_nodes())]
+    expected = hl.adjacency_tensor(hypergraph)[np.ix_(*[labels] * size)]
+    assert np.array_equal(dense, expected)
+
+    x = np.random.default_rng(1).random(hypergraph.num_nodes())
+    assert np.allclose(tensor.ttv(x), _contract(dense, x, size - 1))
+    assert np.allclose(tensor.ttm(x).toarray(), _contract(dense, x, size - 2))
+    for mode in range(size):
+        unfolding = np.moveaxis(dense, mode, 0).reshape(hypergraph.num_nodes(), -1)
+        assert np.array_equal(tensor.unfold(mode).toarray(), unfolding)
+
+
+def test_sparse_tensor_repeated_nodes_and_values():
+    indices = np.array([[0, 0, 1], [1, 3, 2]])
+    tensor = hl.SymmetricAdjacencyTensor(indices, values=[2.0, 0.5])
+    assert tensor.shape == (4, 4, 4)
+    assert np.array_equal(tensor.indices, [[0, 0, 1], [1, 2, 3]])
+
+    dense = tensor.todense()
+    assert tensor.to_coo().nnz == 3 + 6
+    assert dense[0, 1, 0] == 2.0 and dense[3, 2, 1] == 0.5
+    x = np.arange(1.0, 5.0)
+    assert np.allclose(tensor.ttv(x), _contract(dense, x, 2))
+    assert np.allclose(tensor.ttm().toarray(), _contract(dense, np.ones(4), 1))
+
+
+def test_sparse_tensor_requires_uniform():
+    with pytest.raises(ValueError, match="not uniform"):
+        hl.sparse_adjacency_tensor(Hypergraph([(0, 1), (1, 2, 3)]))
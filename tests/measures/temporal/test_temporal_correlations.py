@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from scipy.sparse import csc_array
 
 from hypergraphx.measures.temporal.temporal_correlations import (
@@ -8,6 +9,8 @@ from hypergraphx.measures.temporal.temporal_correlations import (
     intra_order_correlation_functions_all_orders,
     cross_order_correlation_matrix_two_orders,
     cross_order_correlation_function_two_orders,
+    cross_order_correlation_functions_all_orders,
+    correlation_functions_all_lags,
 )
 
 
@@ -58,3 +61,55 @@ def test_cross_order_correlation_matrix_and_function():
 
     assert mat.shape == (2, 2)
     assert np.isfinite(fun)
+
+
+def _random_temporal_matrices(T=12, n=6):
+    rng = np.random.default_rng(0)
+    adj = {
+        order: {t: csc_array(rng.poisson(0.3, size=(n, n)) * 1.0) for t in range(T)}
+        for order in (1, 2)
+    }
+    annealed = {order: sum(adj[order].values()) / T for order in adj}
+    return adj, annealed
+
+
+def test_correlation_functions_all_lags_match_trace():
+    """Test the batched correlation functions against the trace of the matrices."""
+    adj, annealed = _random_temporal_matrices()
+    functions = correlation_functions_all_lags(adj, annealed)
+
+    assert set(functions) == {(1, 1), (1, 2), (2, 1), (2, 2)}
+    for (order1, order2), values in functions.items():
+        assert values.shape == (12,)
+        for tau in [0, 1, 5, 11]:
+            mat = cross_order_correlation_matrix_two_orders(
+                adj, annealed, order1=order1, order2=order2, tau=tau
+            )
+            assert np.isclose(values[tau], mat.trace())
+
+    # A few lags are computed with elementwise products, with the same result.
+    few = correlation_functions_all_lags(adj, annealed, taus=[3], order_pairs=[(2, 1)])
+    assert np.isclose(few[(2, 1)][0], functions[(2, 1)][3])
+
+    # The default annealed matrices are the averages over time.
+    default = correlation_functions_all_lags(adj, taus=[0, 2])
+    assert np.allclose(default[(1, 2)], functions[(1, 2)][[0, 2]])
+
+
+def test_cross_order_correlation_functions_all_orders_both_directions():
+    """Test that (d1, d2) and (d2, d1) are correlated in the right direction."""
+    adj, annealed = _random_temporal_matrices()
+    functions = cross_order_correlation_functions_all_orders(
+        adj, annealed, max_order=2, tau=2, normalized=True
+    )
+    for order1, order2 in [(1, 2), (2, 1)]:
+        expected = cross_order_correlation_function_two_orders(
+            adj, annealed, order1=order1, order2=order2, tau=2, normalized=True
+        )
+        assert np.isclose(functions[(order1, order2)], expected)
+
+
+def test_correlation_functions_all_lags_invalid_tau():
+    adj, annealed = _random_temporal_matrices()
+    with pytest.raises(ValueError, match="lags"):
+        correlation_functions_all_lags(adj, annealed, taus=[12])
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from hypergraphx import TemporalHypergraph
+from hypergraphx.measures.temporal.temporal_paths import (
+    earliest_arrival_times,
+    fastest_temporal_paths,
+    shortest_temporal_paths,
+    temporal_paths,
+)
+
+
+def _toy_temporal_hypergraph():
+    return TemporalHypergraph(
+        edge_list=[(1, (0, 1)), (2, (1, 2)), (2, (2, 3)), (3, (0, 3)), (5, (2, 3))]
+    )
+
+
+def test_earliest_shortest_fastest():
+    thg = _toy_temporal_hypergraph()
+    assert earliest_arrival_times(thg, sources=[0]) == {0: {1: 1, 2: 2, 3: 3}}
+    assert shortest_temporal_paths(thg, sources=[0]) == {0: {1: 1, 2: 2, 3: 1}}
+    assert fastest_temporal_paths(thg, sources=[0]) == {0: {1: 0, 2: 1, 3: 0}}
+
+    # Events at the same time are not chained: 3 is not reached from 1 at time 2.
+    assert earliest_arrival_times(thg, sources=[1])[1] == {0: 1, 2: 2, 3: 3}
+
+
+def test_waiting_time_constraint():
+    thg = _toy_temporal_hypergraph()
+    assert earliest_arrival_times(thg, sources=[1], max_wait=1) == {1: {0: 1, 2: 2}}
+    assert earliest_arrival_times(thg, sources=[1], max_wait=3)[1][3] == 3
+    # Only the events inside the time window are used.
+    assert earliest_arrival_times(thg, sources=[1], start_time=2) == {1: {2: 2, 3: 5}}
+
+
+def test_returned_paths():
+    thg = _toy_temporal_hypergraph()
+    values, paths = temporal_paths(
+        thg, sources=[0], metric="shortest", return_paths=True
+    )
+    assert paths[0][2] == [(1, (0, 1)), (2, (1, 2))]
+    assert paths[0][3] == [(3, (0, 3))]
+    assert {v: len(path) for v, path in paths[0].items()} == values[0]
+
+
+def test_parallel_sources_match_serial():
+    rng = np.random.default_rng(0)
+    edges = set()
+    while len(edges) < 200:
+        size = int(rng.integers(2, 5))
+        nodes = tuple(sorted(int(x) for x in rng.choice(30, size, replace=False)))
+        edges.add((int(rng.integers(0, 100)), nodes))
+    thg = TemporalHypergraph(sorted(edges))
+    for metric in ["earliest_arrival", "shortest", "fastest"]:
+        serial = temporal_paths(thg, metric=metric, max_wait=10)
+        assert serial == temporal_paths(thg, metric=metric, max_wait=10, n_jobs=2)
+
+
+def test_invalid_arguments():
+    thg = _toy_temporal_hypergraph()
+    with pytest.raises(ValueError, match="metric"):
+        temporal_paths(thg, metric="longest")
+    with pytest.raises(ValueError, match="max_wait"):
+        temporal_paths(thg, max_wait=-1)
+    with pytest.raises(ValueError, match="Source"):
+        temporal_paths(thg, sources=[7])
@@ -1,4 +1,8 @@
+import itertools
+from collections import Counter
+
 import networkx as nx
+import numpy as np
 import pytest
 
 pytest.importorskip("tqdm")
@@ -8,7 +12,9 @@ from hypergraphx.measures.temporal.temporal_topological_correlation import (
     _to_df,
     compute_all_nodes_shortest_path,
     compute_all_edges_shortest_path,
+    edge_distance_matrix,
     get_mean_distance_events,
+    topological_temporal_cond_distance,
 )
 from hypergraphx.representations.projections import clique_projection
 
@@ -57,3 +63,59 @@ def test_get_mean_distance_events_same_order():
 
     counts = get_mean_distance_events(thg, order=2, edge_distance=distances)
     assert sum(counts.values()) == 1
+
+
+def _random_temporal_hypergraph(num_events=80):
+    rng = np.random.default_rng(0)
+    edges = set()
+    while len(edges) < num_events:
+        size = int(rng.integers(2, 5))
+        nodes = tuple(sorted(int(x) for x in rng.choice(10, size, replace=False)))
+        edges.add((int(rng.integers(0, 40)), nodes))
+    return TemporalHypergraph(sorted(edges))
+
+
+def test_edge_distance_matrix_min_plus(tmp_path):
+    """Test the edge distance matrix against the minimum node distance."""
+    thg = _random_temporal_hypergraph()
+    edges, distance = edge_distance_matrix(thg)
+    assert distance.dtype == np.int16
+    assert edges == list(dict.fromkeys(edge for _, edge in thg.get_edges()))
+
+    graph_distance = dict(nx.shortest_path_length(clique_projection(Hypergraph(edges))))
+    for (i, x), (j, y) in itertools.product(enumerate(edges), repeat=2):
+        expected = 0 if i == j else min(graph_distance[u][v] for u in x for v in y) + 1
+        assert distance[i, j] == expected
+
+    _, stored = edge_distance_matrix(thg, path=tmp_path / "distance.npy")
+    assert isinstance(stored, np.memmap)
+    np.testing.assert_array_equal(np.load(tmp_path / "distance.npy"), distance)
+
+
+@pytest.mark.parametrize("same_order", [True, False])
+def test_cond_distance_matches_brute_force(same_order):
+    """Test the delay-conditioned distance counts against all couples of events."""
+    thg = _random_temporal_hypergraph()
+    distances = compute_all_edges_shortest_path(thg)
+    dt_list = [1, 4, 10]
+    result = topological_temporal_cond_distance(
+        thg, 2, same_order=same_order, dt_list=dt_list, fit_correlation=False
+    )
+
+    events = sorted(thg.get_edges())
+    for delta_t in dt_list:
+        expected = Counter()
+        for (t1, x), (t2, y) in itertools.combinations(events, 2):
+            if same_order and not len(x) == len(y) == 2:
+                continue
+            if not same_order and (len(x) == 2) == (len(y) == 2):
+                continue
+            if abs(t1 - t2) < delta_t:
+                expected[distances[x, y]] += 1
+        assert result["cond_top_dist_distribution"][delta_t] == expected
+
+
+def test_cond_distance_rejects_unsorted_delays():
+    thg = _random_temporal_hypergraph()
+    with pytest.raises(ValueError, match="dt_list"):
+        topological_temporal_cond_distance(thg, 2, dt_list=[4, 1])
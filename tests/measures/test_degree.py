@@ -1,12 +1,14 @@
 import numpy as np
 import pytest
 
-from hypergraphx import Hypergraph
+from hypergraphx import DirectedHypergraph, Hypergraph
 from hypergraphx.measures.degree import (
     degree,
     degree_sequence,
     degree_distribution,
     degree_correlation,
+    degree_sequences_all_orders,
+    degree_distributions_all_orders,
 )
 
 
@@ -52,3 +54,39 @@ def test_degree_correlation_matrix_shape_and_values():
     assert np.all(np.isfinite(corr))
     assert np.all(corr <= 1.0 + 1e-8)
     assert np.all(corr >= -1.0 - 1e-8)
+
+
+def test_degree_sequences_all_orders_match_per_order():
+    """Test the degree matrix matches the degree sequences of every order."""
+    hg = Hypergraph(
+        edge_list=[(0, 1), (1, 2), (2, 3), (0, 1, 2), (0, 2, 3), (1, 2, 3, 4)],
+        weighted=True,
+        weights=[1.0, 2.0, 0.5, 1.5, 3.0, 2.5],
+    )
+    hg.add_node(5)
+
+    degrees, mapping = degree_sequences_all_orders(hg, return_mapping=True)
+    assert degrees.shape == (hg.num_nodes(), hg.max_order() + 1)
+    assert list(mapping.values()) == list(hg.get_nodes())
+    for order in range(hg.max_order() + 1):
+        expected = [degree(hg, node, order=order) for node in mapping.values()]
+        assert degrees[:, order].tolist() == expected
+
+    strengths = degree_sequences_all_orders(hg, weighted=True)
+    assert np.allclose(strengths[:, 1], [1.0, 3.0, 2.5, 0.5, 0.0, 0.0])
+    assert np.allclose(strengths.sum(axis=1), [5.5, 7.0, 9.5, 6.0, 2.5, 0.0])
+
+    assert degree_distributions_all_orders(hg) == {
+        order: degree_distribution(hg, order=order) for order in [1, 2, 3]
+    }
+
+
+def test_degree_sequences_all_orders_directed():
+    """Test directed degrees count both the source and the target incidences."""
+    hg = DirectedHypergraph(edge_list=[((0, 1), (2,)), ((2,), (0, 3)), ((1,), (3,))])
+
+    degrees, mapping = degree_sequences_all_orders(hg, return_mapping=True)
+    for order in range(degrees.shape[1]):
+        expected = [degree(hg, node, order=order) for node in mapping.values()]
+        assert degrees[:, order].tolist() == expected
+    assert degree_sequence(hg) == {0: 2, 1: 2, 2: 2, 3: 2}
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from hypergraphx import Hypergraph
+from hypergraphx.linalg import sparse_adjacency_tensor
 from hypergraphx.measures.eigen_centralities import (
     CEC_centrality,
     ZEC_centrality,
@@ -59,3 +60,25 @@ def test_eigen_centralities_require_uniform():
         ZEC_centrality(hg)
     with pytest.raises(Exception, match="not uniform"):
         HEC_centrality(hg)
+
+
+def test_eigen_centralities_accept_adjacency_tensor():
+    """Test eigen centralities of the adjacency tensor match the hypergraph ones."""
+    hg = Hypergraph(edge_list=[("a", "b", "c"), ("b", "c", "d"), ("c", "d", "e")])
+    tensor = sparse_adjacency_tensor(hg)
+
+    for centrality in [CEC_centrality, ZEC_centrality, HEC_centrality]:
+        expected = centrality(hg, seed=0)
+        result = centrality(tensor, seed=0)
+        assert set(result) == set(hg.get_nodes())
+        assert all(np.isclose(result[node], expected[node]) for node in expected)
+
+
+def test_eigen_centralities_require_connected():
+    """Test eigen centralities reject disconnected hypergraphs."""
+    hg = Hypergraph(edge_list=[(0, 1, 2), (3, 4, 5)])
+
+    with pytest.raises(Exception, match="not connected"):
+        ZEC_centrality(hg)
+    with pytest.raises(Exception, match="not connected"):
+        HEC_centrality(sparse_adjacency_tensor(hg))
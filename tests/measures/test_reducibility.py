@@ -1,7 +1,12 @@
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
 import pytest
 
 from hypergraphx import Hypergraph
 from hypergraphx.exceptions import InvalidParameterError
+from hypergraphx.measures import reducibility as red
 from hypergraphx.measures.reducibility import reducibility, layer_reducibility
 
 
@@ -95,3 +100,89 @@ def test_partition_dict_missing_node():
     hg = _small_hypergraph()
     with pytest.raises(InvalidParameterError):
         reducibility(hg, partition={0: 0, 1: 0, 2: 1}, entropy_method="count")
+
+
+def _random_layer(seed, num_edges=12, size=7, num_nodes=12):
+    rng = np.random.default_rng(seed)
+    return np.sort(
+        [rng.choice(num_nodes, size, replace=False) for _ in range(num_edges)], axis=1
+    )
+
+
+@pytest.mark.parametrize("enumeration_limit", [0, 10**6])
+def test_projection_counts_match_sets(monkeypatch, enumeration_limit):
+    monkeypatch.setattr(red, "_ENUMERATION_LIMIT", enumeration_limit)
+    layer = _random_layer(0)
+    lower = _random_layer(1, size=3)
+    blocks = np.arange(12) % 3
+    for l in [2, 3, 5]:
+        sub_tuples = {c for edge in layer.tolist() for c in combinations(edge, l)}
+        counter = red._SubTuples(l)
+        assert red._projection_counts(layer, counter, 12)[0] == len(sub_tuples)
+
+    # Distinct sub-tuples of size 3 by multiset of groups of the lower hyperedges.
+    sub_tuples = {c for edge in layer.tolist() for c in combinations(edge, 3)}
+    counter = red._SubTuples(3, blocks, 3, lower)
+    counts = red._projection_counts(layer, counter, 12)
+    types = Counter(tuple(sorted(blocks[list(c)])) for c in sub_tuples)
+    lower_types = sorted({tuple(sorted(blocks[e])) for e in lower.tolist()})
+    assert list(counts[1:]) == [types[t] for t in lower_types]
+
+
+def test_exact_representatives_match_enumeration():
+    rng = np.random.default_rng(0)
+    sizes = list(range(2, 10))
+    Q = {k: rng.uniform(1, 10) for k in sizes}
+    M = {k: {l: rng.uniform(0, 10) for l in sizes if l < k} for k in sizes}
+
+    def description_length(reps):
+        H = sum(Q[r] for r in reps)
+        for l in set(sizes) - set(reps):
+            H += min(M[r][l] for r in reps if r > l)
+        return H
+
+    candidates = [
+        (9,) + reps for r in range(len(sizes)) for reps in combinations(sizes[:-1], r)
+    ]
+    expected = min(candidates, key=description_length)
+    reps, H = red._exact_representatives(M, Q)
+    assert tuple(sorted(reps)) == tuple(sorted(expected))
+    assert H == pytest.approx(description_length(expected))
+
+
+def test_exact_representatives_break_ties():
+    # (2, 5) and (4, 5) both have description length 4, up to rounding errors.
+    Q = {5: 1.0, 4: 2.0, 2: 2.0}
+    M = {5: {4: 1.0 + 1e-15, 2: 3.0}, 4: {2: 1.0}, 2: {}}
+    for order in [[5, 4, 2], [2, 4, 5]]:
+        reps, H = red._exact_representatives(
+            {k: M[k] for k in order}, {k: Q[k] for k in order}
+        )
+        assert reps == (2, 5)
+        assert H == pytest.approx(4.0)
+
+    # Among tied sets, the one with fewer layers is kept.
+    Q = {5: 1.0, 4: 0.0, 2: 1.0}
+    M = {5: {4: 0.0, 2: 1.0}, 4: {2: 1.0}, 2: {}}
+    assert red._exact_representatives(M, Q) == ((5,), 2.0)
+
+    # Undefined conditional entropies never describe a layer.
+    Q[2] = 1.5
+    M = {5: {4: 0.0, 2: np.nan}, 4: {2: 1.0}, 2: {}}
+    assert red._exact_representatives(M, Q) == ((4, 5), 2.0)
+
+
+def test_reducibility_large_hyperedges():
+    rng = np.random.default_rng(0)
+    edges = {
+        tuple(sorted(rng.choice(60, 25, replace=False).tolist())) for _ in range(4)
+    }
+    edges |= {
+        tuple(sorted(rng.choice(60, 2, replace=False).tolist())) for _ in range(30)
+    }
+    hg = Hypergraph(sorted(edges))
+    eta, reps = reducibility(hg)
+    assert 0.0 <= eta <= 1.0
+    assert reps[-1] == 25
+    project = reducibility(hg, entropy_method="project")
+    assert project[0] == pytest.approx(eta)
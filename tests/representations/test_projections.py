@@ -1,9 +1,14 @@
 import networkx as nx
+import numpy as np
+import pytest
 
 from hypergraphx import Hypergraph, DirectedHypergraph
+from hypergraphx.exceptions import InvalidParameterError
 from hypergraphx.representations.projections import (
     bipartite_projection,
     clique_projection,
+    clique_projection_blocks,
+    clique_projection_matrix,
     line_graph,
     directed_line_graph,
 )
@@ -39,6 +44,70 @@ def test_clique_projection_edges():
     assert g.has_edge(1, 2)
 
 
+def test_clique_projection_matrix_weights():
+    """Test the entries of the projection for every weighting."""
+    hg = Hypergraph(
+        edge_list=[(0, 1), (0, 1, 2), (3,)], weighted=True, weights=[2.0, 3.0, 1.0]
+    )
+    expected = {
+        "count": [[0, 2, 1, 0], [2, 0, 1, 0], [1, 1, 0, 0], [0, 0, 0, 0]],
+        "inverse_size": [[0, 1.5, 0.5, 0], [1.5, 0, 0.5, 0], [0.5, 0.5, 0, 0], [0] * 4],
+        "weight": [[0, 5, 3, 0], [5, 0, 3, 0], [3, 3, 0, 0], [0, 0, 0, 0]],
+    }
+    for weight, matrix in expected.items():
+        projection, mapping = clique_projection_matrix(
+            hg, weight=weight, return_mapping=True
+        )
+        assert mapping == {0: 0, 1: 1, 2: 2, 3: 3}
+        np.testing.assert_allclose(projection.toarray(), matrix)
+
+    # With inverse sizes, the strengths are the degrees of the nodes.
+    strengths = clique_projection_matrix(hg, weight="inverse_size").sum(axis=1)
+    np.testing.assert_allclose(strengths, [2, 2, 1, 0])
+
+
+def test_clique_projection_chunked_matches_full():
+    """Test the projection computed by blocks of rows."""
+    rng = np.random.default_rng(0)
+    edges = {
+        tuple(sorted(rng.choice(30, int(rng.integers(2, 6)), replace=False).tolist()))
+        for _ in range(60)
+    }
+    hg = Hypergraph(sorted(edges))
+    full = clique_projection_matrix(hg)
+    for chunk_size in [1, 7, 100]:
+        chunked = clique_projection_matrix(hg, chunk_size=chunk_size)
+        assert (chunked != full).nnz == 0
+
+    blocks = list(clique_projection_blocks(hg, chunk_size=8))
+    assert [start for start, _ in blocks] == list(range(0, hg.num_nodes(), 8))
+    for start, block in blocks:
+        assert (block != full[start : start + 8]).nnz == 0
+
+
+def test_clique_projection_invalid_weight():
+    hg = Hypergraph(edge_list=[(0, 1, 2)])
+    with pytest.raises(InvalidParameterError, match="weight"):
+        clique_projection_matrix(hg, weight="size")
+    with pytest.raises(InvalidParameterError, match="chunk_size"):
+        next(clique_projection_blocks(hg, chunk_size=0))
+
+
+def test_clique_projection_weight_attribute():
+    """Test the weight attribute and the isolated nodes of the projection."""
+    hg = Hypergraph(edge_list=[(0, 1), (0, 1, 2), (3,)])
+    g = clique_projection(hg, weight="count")
+    assert list(g.nodes) == [0, 1, 2]
+    assert g[0][1]["weight"] == 2
+    assert g[1][2]["weight"] == 1
+    assert not g.has_edge(0, 0)
+
+    g = clique_projection(hg, keep_isolated=True)
+    assert list(g.nodes) == [0, 1, 2, 3]
+    assert g.number_of_edges() == 3
+    assert g[0][1] == {}
+
+
 def test_line_graph_mapping():
     """Test line graph returns mapping of edges."""
     hg = Hypergraph(edge_list=[(0, 1), (1, 2)])
@@ -0,0 +1,24 @@
+from itertools import combinations
+
+import numpy as np
+
+from hypergraphx.utils.edges import edge_combinations, pack_edges
+
+
+def test_pack_edges_falls_back_to_bytes():
+    rows = np.array([[0, 5, 9], [1, 2, 3], [0, 5, 9]])
+    small = pack_edges(rows, 10)
+    large = pack_edges(rows, 2**40)
+    assert small.dtype == np.int64 and large.dtype.kind == "V"
+    for keys in (small, large):
+        assert keys[0] == keys[2] and keys[0] != keys[1]
+    np.testing.assert_array_equal(small, [59, 123, 59])
+
+
+def test_edge_combinations_streams_all_sub_tuples():
+    edges = np.array([[0, 1, 2, 3], [2, 4, 6, 8], [1, 3, 5, 7]])
+    chunks = list(edge_combinations(edges, 2, chunk_size=10))
+    assert [list(chunk) for chunk, _ in chunks] == [[0], [1], [2]]
+    for chunk, rows in chunks:
+        expected = [c for e in edges[chunk] for c in combinations(e, 2)]
+        np.testing.assert_array_equal(rows, expected)